@@ -0,0 +1,125 @@
+import * as fs from 'fs';
+import * as v8 from 'v8';
+import * as vm from 'vm';
+import assert from 'assert';
+import { GameState } from '../src/types/game.types';
+import { toCompact, fromCompact, CompactGameState, serviceTemplateCount } from '../src/engine/compactState';
+import { SCENARIOS } from './scenarios';
+import { playGame } from './replay';
+
+// ============================================================
+// Heap-per-game benchmark: parsed GameState vs CompactGameState
+//
+//   npm run bench:heap                              10000 games, standard
+//   npm run bench:heap -- --games 50000
+//   npm run bench:heap -- --scenario large-map --games 2000
+//   npm run bench:heap -- --json out.json
+//
+// Plays --distinct games to the end with the bench policy, then holds
+// --games independent copies of them (each parsed from its own JSON,
+// as a cache filled from the database would be) in both
+// representations and reports retained heap per game, after a full
+// GC, including typed-array backing stores. Measured with and without
+// the log, since cached games often do not need it.
+// ============================================================
+
+interface CliOptions {
+  scenario: string;
+  games: number;
+  distinct: number;
+  json: string | null;
+}
+
+function parseArgs(argv: string[]): CliOptions {
+  const opts: CliOptions = { scenario: 'standard', games: 10000, distinct: 50, json: null };
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    const next = (): string => {
+      const value = argv[++i];
+      if (value === undefined) throw new Error(`Missing value for ${arg}`);
+      return value;
+    };
+    switch (arg) {
+      case '--scenario': opts.scenario = next(); break;
+      case '--games': opts.games = parseInt(next(), 10); break;
+      case '--distinct': opts.distinct = parseInt(next(), 10); break;
+      case '--json': opts.json = next(); break;
+      default: throw new Error(`Unknown argument: ${arg}`);
+    }
+  }
+  return opts;
+}
+
+// gc() without requiring node --expose-gc on the command line
+v8.setFlagsFromString('--expose-gc');
+const gc = vm.runInNewContext('gc') as () => void;
+
+function retainedBytes(): number {
+  gc();
+  gc();
+  const mem = process.memoryUsage();
+  return mem.heapUsed + mem.arrayBuffers;
+}
+
+interface Row {
+  label: string;
+  parsedBytesPerGame: number;
+  compactBytesPerGame: number;
+  jsonBytesPerGame: number;
+}
+
+function measure<T>(count: number, build: (i: number) => T): { bytesPerGame: number; held: T[] } {
+  const before = retainedBytes();
+  const held: T[] = new Array(count);
+  for (let i = 0; i < count; i++) held[i] = build(i);
+  const after = retainedBytes();
+  return { bytesPerGame: (after - before) / count, held };
+}
+
+function run(label: string, sources: string[], games: number): Row {
+  // Each copy is parsed from its own JSON so nothing is shared between
+  // games except what the representation itself shares
+  const parsed = measure<GameState>(games, (i) => JSON.parse(sources[i % sources.length]));
+  parsed.held.length = 0;
+
+  const compact = measure<CompactGameState>(games, (i) => toCompact(JSON.parse(sources[i % sources.length])));
+  compact.held.length = 0;
+
+  return {
+    label,
+    parsedBytesPerGame: parsed.bytesPerGame,
+    compactBytesPerGame: compact.bytesPerGame,
+    jsonBytesPerGame: sources.reduce((sum, s) => sum + s.length, 0) / sources.length,
+  };
+}
+
+function main(): void {
+  const opts = parseArgs(process.argv.slice(2));
+  const scenario = SCENARIOS.find((s) => s.name === opts.scenario);
+  if (!scenario) throw new Error(`Unknown scenario '${opts.scenario}'`);
+
+  const states = Array.from({ length: opts.distinct }, (_, i) => playGame(scenario.setup(i), scenario.name, null).state);
+  for (const state of states) {
+    const expected = JSON.parse(JSON.stringify(state));
+    assert.deepStrictEqual(fromCompact(toCompact(state)), expected, `round trip differs for ${state.id}`);
+  }
+
+  const withLog = states.map((s) => JSON.stringify(s));
+  const withoutLog = states.map((s) => JSON.stringify({ ...s, log: [] }));
+  const rows = [run('with log', withLog, opts.games), run('without log', withoutLog, opts.games)];
+
+  console.log(`Scenario ${scenario.name}: ${opts.games} games (${opts.distinct} distinct), ${serviceTemplateCount()} service template(s)`);
+  console.log('                 parsed     compact    ratio   JSON');
+  for (const r of rows) {
+    const kb = (bytes: number): string => `${(bytes / 1024).toFixed(1)} KB`.padStart(10);
+    const ratio = `${(r.parsedBytesPerGame / r.compactBytesPerGame).toFixed(1)}x`.padStart(7);
+    console.log(`  ${r.label.padEnd(12)} ${kb(r.parsedBytesPerGame)} ${kb(r.compactBytesPerGame)} ${ratio} ${kb(r.jsonBytesPerGame)}`);
+  }
+
+  if (opts.json) {
+    fs.writeFileSync(opts.json, JSON.stringify({ scenario: scenario.name, games: opts.games, distinct: opts.distinct, rows }, null, 2));
+  }
+}
+
+main();
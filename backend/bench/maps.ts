@@ -0,0 +1,49 @@
+import { Service } from '../src/types/game.types';
+import { createInitialServices } from '../src/data/services';
+import { pick } from './rng';
+
+// ============================================================
+// Generated maps
+// Keeps the standard S1-S12 (cards and down effects reference them by
+// id) and adds X13..Xn services wired to 2-4 random earlier services,
+// plus occasional back-edges so cycles exist like in the real map.
+// Must be called inside withSeededRandom for reproducible maps.
+// ============================================================
+
+export function buildMap(size: number): Record<string, Service> {
+  const services = createInitialServices();
+  const ids = Object.keys(services);
+
+  for (let i = ids.length + 1; i <= size; i++) {
+    const id = `X${i}`;
+    const depCount = 2 + Math.floor(Math.random() * 3);
+    const deps = new Set<string>();
+    while (deps.size < Math.min(depCount, ids.length)) {
+      deps.add(pick(ids));
+    }
+
+    const intMax = 12 + Math.floor(Math.random() * 7);
+    services[id] = {
+      id,
+      name: `Servicio generado ${i}`,
+      crit: (3 + Math.floor(Math.random() * 3)) as Service['crit'],
+      int: intMax,
+      intMax,
+      state: 'OK',
+      dependencies: [...deps],
+      citizenFacing: Math.random() < 0.1,
+    };
+
+    // Back-edge: an earlier generated service starts depending on this one
+    if (Math.random() < 0.15) {
+      const earlier = services[pick(ids)];
+      if (earlier.id.startsWith('X') && !earlier.dependencies.includes(id)) {
+        earlier.dependencies = [...earlier.dependencies, id];
+      }
+    }
+
+    ids.push(id);
+  }
+
+  return services;
+}
@@ -0,0 +1,184 @@
+import { performance } from 'perf_hooks';
+import { GameState, Seat, TemporaryEffect } from '../src/types/game.types';
+import { initializeGame, startGame, playCard, useBasicAction, advancePhase, GameError } from '../src/engine/gameEngine';
+import { getCard } from '../src/data/cards';
+import { withSeededRandom, pick } from './rng';
+import { buildMap } from './maps';
+import { BenchAction, GameSetup } from './scenarios';
+import { Stats } from './stats';
+
+// ============================================================
+// Game replay
+// Plays one game either from a recorded action list or with a simple
+// rules-aware policy, timing every successful engine call. Samples are
+// keyed per action type; ADVANCE_PHASE is split by the phase it leaves
+// because automatic phases (CASCADE_EVAL above all) dominate the cost.
+// ============================================================
+
+const MAX_ACTIONS_PER_GAME = 20000;
+const MAX_PLAYS_PER_PHASE = 4;
+
+const INERT_EFFECT_TYPES = [
+  'damageReductionService',
+  'socMonitoring',
+  'bcpManualOp',
+  'blockIntermittentPropagation',
+  'ignoreCascadeEdge',
+];
+
+export interface GameOutcome {
+  actions: BenchAction[];
+  turns: number;
+  winner: Seat | null;
+  state: GameState;
+}
+
+function actionKey(action: BenchAction, state: GameState): string {
+  if (action.type === 'ADVANCE_PHASE') return `ADVANCE_PHASE:${state.markers.phase}`;
+  return `${action.type}:${action.seat}`;
+}
+
+function setUpGame(setup: GameSetup, name: string): GameState {
+  let state = initializeGame(setup.config, `bench-${name}-${setup.seed}`);
+  if (setup.mapSize > Object.keys(state.services).length) {
+    state = { ...state, services: buildMap(setup.mapSize) };
+  }
+  state = startGame(state);
+
+  if (setup.tempEffects > 0) {
+    // Effects that every scan has to walk past but that never match a
+    // service, so outcomes stay comparable with the plain scenario.
+    const effects: TemporaryEffect[] = [];
+    for (let i = 0; i < setup.tempEffects; i++) {
+      effects.push({
+        id: `bench-effect-${i}`,
+        type: INERT_EFFECT_TYPES[i % INERT_EFFECT_TYPES.length],
+        targetId: 'BENCH_NONE',
+        fromServiceId: 'BENCH_NONE',
+        toServiceId: 'BENCH_NONE',
+        value: 0,
+      });
+    }
+    state = { ...state, temporaryEffects: [...state.temporaryEffects, ...effects] };
+  }
+  return state;
+}
+
+function apply(state: GameState, action: BenchAction): GameState {
+  switch (action.type) {
+    case 'PLAY_CARD':
+      return playCard(state, action.seat, action.cardId, action.targets).newState;
+    case 'USE_BASIC_ACTION':
+      return useBasicAction(state, action.seat, action.target);
+    case 'ADVANCE_PHASE':
+      return advancePhase(state);
+  }
+}
+
+// Times one engine call. Returns null (and records nothing) when the
+// engine rejects the action, which the policy uses to probe legality.
+function timed(state: GameState, action: BenchAction, stats: Stats | null): GameState | null {
+  const heapBefore = stats ? process.memoryUsage().heapUsed : 0;
+  const start = performance.now();
+  let next: GameState;
+  try {
+    next = apply(state, action);
+  } catch (err) {
+    if (err instanceof GameError) return null;
+    throw err;
+  }
+  const elapsed = performance.now() - start;
+  if (stats) {
+    stats.record(actionKey(action, state), elapsed, process.memoryUsage().heapUsed - heapBefore);
+  }
+  return next;
+}
+
+function seatForPhase(state: GameState): Seat | null {
+  switch (state.markers.phase) {
+    case 'MALOSOS_PREP':
+    case 'MALOSOS_ATTACK':
+      return 'MALOSOS';
+    case 'BUENOSOS_RESPONSE':
+      return 'BUENOSOS';
+    default:
+      return null;
+  }
+}
+
+// MalOsos aim at healthy services, BuenOsos at damaged ones
+function chooseTargets(state: GameState, seat: Seat): string[] {
+  const all = Object.values(state.services);
+  const preferred = all.filter((s) => (seat === 'MALOSOS' ? s.state !== 'DOWN' : s.state !== 'OK'));
+  const pool = (preferred.length >= 2 ? preferred : all).map((s) => s.id);
+  const first = pick(pool);
+  let second = pick(pool);
+  if (second === first && pool.length > 1) second = pool[(pool.indexOf(first) + 1) % pool.length];
+  return [first, second];
+}
+
+function policyAction(state: GameState, stats: Stats | null, playsThisPhase: number): { state: GameState; action: BenchAction } {
+  const seat = seatForPhase(state);
+
+  if (seat) {
+    if (!state.seats[seat].basicActionUsed && Math.random() < 0.5) {
+      const action: BenchAction = seat === 'MALOSOS'
+        ? { type: 'USE_BASIC_ACTION', seat }
+        : { type: 'USE_BASIC_ACTION', seat, target: chooseTargets(state, seat)[0] };
+      const next = timed(state, action, stats);
+      if (next) return { state: next, action };
+    }
+
+    if (playsThisPhase < MAX_PLAYS_PER_PHASE) {
+      const budget = state.seats[seat].budgetRemaining;
+      for (const cardId of state.seats[seat].hand) {
+        const card = getCard(cardId);
+        if (!card || card.cost > budget) continue;
+        const action: BenchAction = { type: 'PLAY_CARD', seat, cardId, targets: chooseTargets(state, seat) };
+        const next = timed(state, action, stats);
+        if (next) return { state: next, action };
+      }
+    }
+  }
+
+  const action: BenchAction = { type: 'ADVANCE_PHASE' };
+  const next = timed(state, action, stats);
+  if (!next) throw new Error(`advancePhase rejected in phase ${state.markers.phase}`);
+  return { state: next, action };
+}
+
+// Policy-driven game; the returned action list replays it exactly
+export function playGame(setup: GameSetup, name: string, stats: Stats | null): GameOutcome {
+  return withSeededRandom(setup.seed, () => {
+    let state = setUpGame(setup, name);
+    const actions: BenchAction[] = [];
+    let playsThisPhase = 0;
+
+    while (state.status === 'running' && state.markers.turn <= setup.config.turnLimit) {
+      if (actions.length >= MAX_ACTIONS_PER_GAME) throw new Error(`Game ${name}/${setup.seed} did not terminate`);
+      const phase = state.markers.phase;
+      const step = policyAction(state, stats, playsThisPhase);
+      state = step.state;
+      actions.push(step.action);
+      playsThisPhase = state.markers.phase === phase ? playsThisPhase + (step.action.type === 'PLAY_CARD' ? 1 : 0) : 0;
+    }
+
+    return { actions, turns: state.markers.turn, winner: state.winner ?? null, state };
+  });
+}
+
+// Recorded game; any rejected action means the engine's behaviour
+// changed since the corpus was recorded.
+export function replayGame(setup: GameSetup, actions: BenchAction[], name: string, stats: Stats | null): GameOutcome {
+  return withSeededRandom(setup.seed, () => {
+    let state = setUpGame(setup, name);
+    actions.forEach((action, i) => {
+      const next = timed(state, action, stats);
+      if (!next) {
+        throw new Error(`Recorded game ${name}/${setup.seed} diverged at action ${i} (${action.type})`);
+      }
+      state = next;
+    });
+    return { actions, turns: state.markers.turn, winner: state.winner ?? null, state };
+  });
+}
@@ -0,0 +1,242 @@
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { spawn, ChildProcess } from 'child_process';
+import { performance } from 'perf_hooks';
+import { WebSocket } from 'ws';
+
+// ============================================================
+// Restart benchmark: drain + hot restart with live games
+//
+//   npm run bench:restart                      200 games, 600 sockets
+//   npm run bench:restart -- --games 1000
+//   npm run bench:restart -- --cold            boot without pre-warming
+//   npm run bench:restart -- --spread 2000     clients honour the jittered
+//                                              reconnect hint (default 0:
+//                                              every socket at once)
+//   npm run bench:restart -- --json out.json
+//
+// Runs the real server (ts-node, transpile-only) against a scratch
+// database, provisions running games with three sockets each, sends
+// SIGTERM and measures:
+//   - drain time (signal → exit) and SERVER_RESTART hints received
+//   - restart-to-ready (spawn → /health answers)
+//   - reconnect storm latency (connect → first GAME_STATE/STATE_CURRENT)
+// ============================================================
+
+interface CliOptions {
+  games: number;
+  port: number;
+  cold: boolean;
+  spread: number;
+  json: string | null;
+}
+
+function parseArgs(argv: string[]): CliOptions {
+  const opts: CliOptions = { games: 200, port: 3901, cold: false, spread: 0, json: null };
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    const next = (): string => {
+      const value = argv[++i];
+      if (value === undefined) throw new Error(`Missing value for ${arg}`);
+      return value;
+    };
+    switch (arg) {
+      case '--games': opts.games = parseInt(next(), 10); break;
+      case '--port': opts.port = parseInt(next(), 10); break;
+      case '--cold': opts.cold = true; break;
+      case '--spread': opts.spread = parseInt(next(), 10); break;
+      case '--json': opts.json = next(); break;
+      default: throw new Error(`Unknown argument: ${arg}`);
+    }
+  }
+  return opts;
+}
+
+// ============================================================
+// SERVER PROCESS
+// ============================================================
+
+interface ServerProcess {
+  child: ChildProcess;
+  readyMs: number;
+  exited: Promise<number>;
+}
+
+function sleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+async function startServer(opts: CliOptions, dbDir: string): Promise<ServerProcess> {
+  const start = performance.now();
+  const child = spawn(process.execPath, ['-r', 'ts-node/register/transpile-only', 'src/server.ts'], {
+    cwd: path.join(__dirname, '..'),
+    env: {
+      ...process.env,
+      PORT: String(opts.port),
+      DB_DIR: dbDir,
+      ADMISSION_ENABLED: 'false',
+      PREWARM_ACTIVE_GAMES: opts.cold ? 'false' : 'true',
+      DRAIN_RECONNECT_SPREAD_MS: String(Math.max(1, opts.spread)),
+    },
+    stdio: ['ignore', 'ignore', 'inherit'],
+  });
+  const exited = new Promise<number>((resolve) => child.once('exit', (code) => resolve(code ?? 0)));
+
+  for (;;) {
+    if (child.exitCode !== null) throw new Error('Server exited during startup');
+    try {
+      const res = await fetch(`http://localhost:${opts.port}/health`);
+      if (res.ok) break;
+    } catch {
+      // not listening yet
+    }
+    await sleep(10);
+  }
+  return { child, readyMs: performance.now() - start, exited };
+}
+
+async function post<T>(port: number, urlPath: string, body: unknown, token?: string): Promise<T> {
+  const res = await fetch(`http://localhost:${port}${urlPath}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', ...(token ? { Authorization: `Bearer ${token}` } : {}) },
+    body: JSON.stringify(body),
+  });
+  if (!res.ok) throw new Error(`POST ${urlPath} → ${res.status} ${await res.text()}`);
+  return res.json() as Promise<T>;
+}
+
+// ============================================================
+// CLIENTS
+// ============================================================
+
+interface Client {
+  gameId: string;
+  token: string;
+  ws: WebSocket | null;
+  version: string | null;
+  reconnectAfterMs: number;
+}
+
+// Resolves with the type of the first state message (GAME_STATE or
+// STATE_CURRENT) and the time it took since connecting
+function connect(port: number, client: Client): Promise<{ ms: number; type: string }> {
+  const start = performance.now();
+  const version = client.version ? `&version=${encodeURIComponent(client.version)}` : '';
+  const ws = new WebSocket(`ws://localhost:${port}/ws/games/${client.gameId}?token=${client.token}&view=compact${version}`);
+  client.ws = ws;
+
+  return new Promise((resolve, reject) => {
+    ws.once('error', reject);
+    ws.on('message', (data) => {
+      const msg = JSON.parse(data.toString()) as { type: string; stateVersion?: string | null; reconnectAfterMs?: number };
+      if (msg.type === 'GAME_STATE' || msg.type === 'STATE_CURRENT') {
+        resolve({ ms: performance.now() - start, type: msg.type });
+      } else if (msg.type === 'SERVER_RESTART') {
+        client.version = msg.stateVersion ?? null;
+        client.reconnectAfterMs = msg.reconnectAfterMs ?? 0;
+      } else if (msg.type === 'ERROR') {
+        reject(new Error(JSON.stringify(msg)));
+      }
+    });
+  });
+}
+
+async function provision(port: number, games: number): Promise<Client[]> {
+  const clients: Client[] = [];
+  const config = { turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic' };
+
+  for (let i = 0; i < games; i++) {
+    const created = await post<{ gameId: string; token: string }>(port, '/api/games', { displayName: `F${i}`, config });
+    const mal = await post<{ token: string }>(port, `/api/games/${created.gameId}/join`, { seat: 'MALOSOS', displayName: `M${i}` });
+    const buen = await post<{ token: string }>(port, `/api/games/${created.gameId}/join`, { seat: 'BUENOSOS', displayName: `B${i}` });
+    await post(port, `/api/games/${created.gameId}/start`, {}, created.token);
+
+    for (const token of [created.token, mal.token, buen.token]) {
+      clients.push({ gameId: created.gameId, token, ws: null, version: null, reconnectAfterMs: 0 });
+    }
+  }
+  return clients;
+}
+
+function percentile(sorted: number[], q: number): number {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.ceil(q * sorted.length) - 1)];
+}
+
+// ============================================================
+// MAIN
+// ============================================================
+
+async function main(): Promise<void> {
+  const opts = parseArgs(process.argv.slice(2));
+  const dbDir = fs.mkdtempSync(path.join(os.tmpdir(), 'bvm-restart-'));
+
+  try {
+    const first = await startServer(opts, dbDir);
+    const clients = await provision(opts.port, opts.games);
+    await Promise.all(clients.map((c) => connect(opts.port, c)));
+    console.log(`Provisioned ${opts.games} running games, ${clients.length} sockets`);
+
+    // Drain
+    const closed = Promise.all(
+      clients.map((c) => new Promise<void>((resolve) => c.ws!.once('close', () => resolve())))
+    );
+    const drainStart = performance.now();
+    first.child.kill('SIGTERM');
+    await Promise.all([first.exited, closed]);
+    const drainMs = performance.now() - drainStart;
+    const hinted = clients.filter((c) => c.version !== null).length;
+
+    // Restart and reconnect storm
+    const second = await startServer(opts, dbDir);
+    const results = await Promise.all(
+      clients.map(async (c) => {
+        if (opts.spread > 0) await sleep(c.reconnectAfterMs);
+        return connect(opts.port, c);
+      })
+    );
+    const sorted = results.map((r) => r.ms).sort((a, b) => a - b);
+    const current = results.filter((r) => r.type === 'STATE_CURRENT').length;
+
+    const report = {
+      games: opts.games,
+      sockets: clients.length,
+      prewarm: !opts.cold,
+      spreadMs: opts.spread,
+      drainMs,
+      hinted,
+      restartToReadyMs: second.readyMs,
+      reconnect: {
+        p50Ms: percentile(sorted, 0.5),
+        p95Ms: percentile(sorted, 0.95),
+        p99Ms: percentile(sorted, 0.99),
+        maxMs: sorted[sorted.length - 1] ?? 0,
+        stateCurrent: current,
+        fullState: results.length - current,
+      },
+    };
+
+    console.log(`Drain:             ${drainMs.toFixed(1)} ms (${hinted}/${clients.length} sockets hinted)`);
+    console.log(`Restart-to-ready:  ${second.readyMs.toFixed(1)} ms (${opts.cold ? 'cold' : 'pre-warmed'})`);
+    console.log(
+      `Reconnect storm:   p50 ${report.reconnect.p50Ms.toFixed(1)} ms  p95 ${report.reconnect.p95Ms.toFixed(1)} ms  ` +
+        `p99 ${report.reconnect.p99Ms.toFixed(1)} ms  max ${report.reconnect.maxMs.toFixed(1)} ms`
+    );
+    console.log(`                   ${current} STATE_CURRENT, ${results.length - current} full GAME_STATE`);
+
+    if (opts.json) fs.writeFileSync(opts.json, JSON.stringify(report, null, 2));
+
+    for (const c of clients) c.ws?.close();
+    second.child.kill('SIGTERM');
+    await second.exited;
+  } finally {
+    fs.rmSync(dbDir, { recursive: true, force: true });
+  }
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
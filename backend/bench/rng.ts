@@ -0,0 +1,30 @@
+// ============================================================
+// Seeded randomness
+// The engine shuffles with Math.random, so benchmarks swap in a
+// seeded generator to make every run replay the same game.
+// ============================================================
+
+export function mulberry32(seed: number): () => number {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+export function withSeededRandom<T>(seed: number, fn: () => T): T {
+  const original = Math.random;
+  Math.random = mulberry32(seed);
+  try {
+    return fn();
+  } finally {
+    Math.random = original;
+  }
+}
+
+export function pick<T>(items: T[]): T {
+  return items[Math.floor(Math.random() * items.length)];
+}
@@ -0,0 +1,187 @@
+import * as fs from 'fs';
+import * as path from 'path';
+import { SCENARIOS, Scenario, loadRecordedGames, saveRecordedGame, CORPUS_DIR } from './scenarios';
+import { playGame, replayGame } from './replay';
+import { Stats, BenchReport, ActionSummary, compareReports } from './stats';
+
+// ============================================================
+// Engine benchmark CLI
+//
+//   npm run bench                              all scenarios + recorded corpus
+//   npm run bench -- --scenario standard,long  subset
+//   npm run bench -- --games 20                override games per scenario
+//   npm run bench -- --json out.json           write the full report
+//   npm run bench -- --save-baseline           store report as bench/baseline.json
+//   npm run bench -- --threshold 0.15          regression tolerance (default 0.10)
+//   npm run bench -- --record 5                record 5 games per scenario into bench/corpus
+//
+// Exits with code 1 when a series regresses against the baseline.
+// ============================================================
+
+interface CliOptions {
+  scenarios: string[] | null;
+  games: number | null;
+  warmup: number;
+  json: string | null;
+  baseline: string;
+  saveBaseline: boolean;
+  threshold: number;
+  record: number;
+}
+
+function parseArgs(argv: string[]): CliOptions {
+  const opts: CliOptions = {
+    scenarios: null,
+    games: null,
+    warmup: 3,
+    json: null,
+    baseline: path.join(__dirname, 'baseline.json'),
+    saveBaseline: false,
+    threshold: 0.1,
+    record: 0,
+  };
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    const next = (): string => {
+      const value = argv[++i];
+      if (value === undefined) throw new Error(`Missing value for ${arg}`);
+      return value;
+    };
+    switch (arg) {
+      case '--scenario': opts.scenarios = next().split(',').map((s) => s.trim()).filter(Boolean); break;
+      case '--games': opts.games = parseInt(next(), 10); break;
+      case '--warmup': opts.warmup = parseInt(next(), 10); break;
+      case '--json': opts.json = next(); break;
+      case '--baseline': opts.baseline = next(); break;
+      case '--save-baseline': opts.saveBaseline = true; break;
+      case '--threshold': opts.threshold = parseFloat(next()); break;
+      case '--record': opts.record = parseInt(next(), 10); break;
+      default: throw new Error(`Unknown argument: ${arg}`);
+    }
+  }
+  return opts;
+}
+
+function collectGarbage(): void {
+  const gc = (global as { gc?: () => void }).gc;
+  if (gc) gc();
+}
+
+function runScenario(scenario: Scenario, opts: CliOptions): Record<string, ActionSummary> {
+  const games = opts.games ?? scenario.games;
+
+  // Warm-up games use seeds outside the measured range
+  for (let i = 0; i < opts.warmup; i++) {
+    playGame(scenario.setup(100000 + i), scenario.name, null);
+  }
+  collectGarbage();
+
+  const stats = new Stats();
+  for (let i = 0; i < games; i++) {
+    playGame(scenario.setup(i), scenario.name, stats);
+  }
+  return stats.summarize();
+}
+
+function runRecorded(opts: CliOptions): Record<string, ActionSummary> | null {
+  const recorded = loadRecordedGames();
+  if (recorded.length === 0) return null;
+
+  for (const game of recorded.slice(0, opts.warmup)) {
+    replayGame(game, game.actions, game.scenario, null);
+  }
+  collectGarbage();
+
+  const stats = new Stats();
+  for (const game of recorded) {
+    replayGame(game, game.actions, game.scenario, stats);
+  }
+  return stats.summarize();
+}
+
+function formatTable(name: string, summary: Record<string, ActionSummary>): string {
+  const rows = Object.entries(summary).map(([action, s]) =>
+    [
+      action.padEnd(32),
+      String(s.ops).padStart(8),
+      s.opsPerSec.toFixed(0).padStart(12),
+      s.p50Ms.toFixed(4).padStart(10),
+      s.p99Ms.toFixed(4).padStart(10),
+      String(s.allocBytesPerOp).padStart(12),
+    ].join(' ')
+  );
+  const header = ['action'.padEnd(32), 'ops'.padStart(8), 'ops/sec'.padStart(12), 'p50 ms'.padStart(10), 'p99 ms'.padStart(10), 'alloc B/op'.padStart(12)].join(' ');
+  return [`\n== ${name}`, header, ...rows].join('\n');
+}
+
+function record(opts: CliOptions, selected: Scenario[]): void {
+  for (const scenario of selected) {
+    for (let i = 0; i < opts.record; i++) {
+      const setup = scenario.setup(i);
+      const outcome = playGame(setup, scenario.name, null);
+      const file = saveRecordedGame({ ...setup, scenario: scenario.name, actions: outcome.actions }, i);
+      console.log(`recorded ${path.relative(process.cwd(), file)} (${outcome.actions.length} actions)`);
+    }
+  }
+}
+
+function main(): void {
+  const opts = parseArgs(process.argv.slice(2));
+  const selected = opts.scenarios
+    ? SCENARIOS.filter((s) => opts.scenarios!.includes(s.name))
+    : SCENARIOS;
+
+  if (opts.record > 0) {
+    record(opts, selected);
+    return;
+  }
+
+  const report: BenchReport = { node: process.version, createdAt: new Date().toISOString(), scenarios: {} };
+
+  for (const scenario of selected) {
+    const summary = runScenario(scenario, opts);
+    report.scenarios[scenario.name] = summary;
+    console.log(formatTable(`${scenario.name} — ${scenario.description}`, summary));
+  }
+
+  if (!opts.scenarios || opts.scenarios.includes('recorded')) {
+    const summary = runRecorded(opts);
+    if (summary) {
+      report.scenarios.recorded = summary;
+      console.log(formatTable(`recorded — corpus in ${path.relative(process.cwd(), CORPUS_DIR)}`, summary));
+    }
+  }
+
+  if (opts.json) {
+    fs.writeFileSync(opts.json, JSON.stringify(report, null, 2) + '\n');
+  }
+
+  if (opts.saveBaseline) {
+    fs.writeFileSync(opts.baseline, JSON.stringify(report, null, 2) + '\n');
+    console.log(`\nBaseline written to ${opts.baseline}`);
+    return;
+  }
+
+  if (!fs.existsSync(opts.baseline)) {
+    console.log(`\nNo baseline at ${opts.baseline}; run with --save-baseline to create one.`);
+    return;
+  }
+
+  const baseline = JSON.parse(fs.readFileSync(opts.baseline, 'utf8')) as BenchReport;
+  const regressions = compareReports(report, baseline, opts.threshold);
+  if (regressions.length === 0) {
+    console.log(`\nNo regressions against baseline (threshold ${(opts.threshold * 100).toFixed(0)}%).`);
+    return;
+  }
+
+  console.log(`\n${regressions.length} regression(s) against baseline (threshold ${(opts.threshold * 100).toFixed(0)}%):`);
+  for (const r of regressions) {
+    console.log(
+      `  ${r.scenario} ${r.action} ${r.metric}: ${r.baseline.toFixed(4)} -> ${r.current.toFixed(4)} (+${(r.change * 100).toFixed(1)}% worse)`
+    );
+  }
+  process.exitCode = 1;
+}
+
+main();
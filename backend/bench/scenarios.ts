@@ -0,0 +1,97 @@
+import * as fs from 'fs';
+import * as path from 'path';
+import { GameConfig, Seat } from '../src/types/game.types';
+
+// ============================================================
+// Bench scenarios and recorded corpora
+// A scenario describes how to set up a game; the policy in replay.ts
+// then plays it. A recorded game additionally carries the exact action
+// list, which is replayed verbatim (same seed => same shuffles).
+// ============================================================
+
+export type BenchAction =
+  | { type: 'PLAY_CARD'; seat: Seat; cardId: string; targets: string[] }
+  | { type: 'USE_BASIC_ACTION'; seat: Seat; target?: string }
+  | { type: 'ADVANCE_PHASE' };
+
+export interface GameSetup {
+  seed: number;
+  config: GameConfig;
+  mapSize: number; // 12 = standard map
+  tempEffects: number; // inert never-expiring effects injected at start
+}
+
+export interface Scenario {
+  name: string;
+  description: string;
+  games: number;
+  setup: (index: number) => GameSetup;
+}
+
+export interface RecordedGame extends GameSetup {
+  scenario: string;
+  actions: BenchAction[];
+}
+
+const STANDARD_CONFIG: GameConfig = {
+  turnLimit: 8,
+  budgetPerTurn: 8,
+  intermittenceMode: 'deterministic',
+  mapId: 'standard',
+};
+
+export const SCENARIOS: Scenario[] = [
+  {
+    name: 'standard',
+    description: 'Standard 12-service map, 8-turn games',
+    games: 200,
+    setup: (i) => ({ seed: 1000 + i, config: STANDARD_CONFIG, mapSize: 12, tempEffects: 0 }),
+  },
+  {
+    name: 'random-intermittence',
+    description: 'Standard map with random intermittence',
+    games: 200,
+    setup: (i) => ({
+      seed: 2000 + i,
+      config: { ...STANDARD_CONFIG, intermittenceMode: 'random' },
+      mapSize: 12,
+      tempEffects: 0,
+    }),
+  },
+  {
+    name: 'long',
+    description: 'Standard map, 40-turn games',
+    games: 30,
+    setup: (i) => ({ seed: 3000 + i, config: { ...STANDARD_CONFIG, turnLimit: 40 }, mapSize: 12, tempEffects: 0 }),
+  },
+  {
+    name: 'large-map',
+    description: 'Generated 200-service map, 8-turn games',
+    games: 20,
+    setup: (i) => ({ seed: 4000 + i, config: STANDARD_CONFIG, mapSize: 200, tempEffects: 0 }),
+  },
+  {
+    name: 'temp-effects',
+    description: 'Standard map with 500 active temporary effects',
+    games: 50,
+    setup: (i) => ({ seed: 5000 + i, config: STANDARD_CONFIG, mapSize: 12, tempEffects: 500 }),
+  },
+];
+
+export const CORPUS_DIR = path.join(__dirname, 'corpus');
+
+export function loadRecordedGames(dir = CORPUS_DIR): RecordedGame[] {
+  if (!fs.existsSync(dir)) return [];
+  return fs
+    .readdirSync(dir)
+    .filter((f) => f.endsWith('.json'))
+    .sort()
+    .map((f) => JSON.parse(fs.readFileSync(path.join(dir, f), 'utf8')) as RecordedGame);
+}
+
+export function saveRecordedGame(game: RecordedGame, index: number, dir = CORPUS_DIR): string {
+  fs.mkdirSync(dir, { recursive: true });
+  const file = path.join(dir, `${game.scenario}-${String(index).padStart(3, '0')}.json`);
+  fs.writeFileSync(file, JSON.stringify(game) + '\n');
+  return file;
+}
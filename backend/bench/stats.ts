@@ -0,0 +1,108 @@
+// ============================================================
+// Sample aggregation and baseline comparison
+// Allocation figures are heapUsed deltas around each call: they are
+// approximate (a GC during the call shows up as a negative delta, which
+// is dropped) but stable enough to spot an extra copy per action.
+// ============================================================
+
+export interface ActionSummary {
+  ops: number;
+  opsPerSec: number;
+  meanMs: number;
+  p50Ms: number;
+  p99Ms: number;
+  allocBytesPerOp: number;
+}
+
+export interface BenchReport {
+  node: string;
+  createdAt: string;
+  scenarios: Record<string, Record<string, ActionSummary>>;
+}
+
+export interface Regression {
+  scenario: string;
+  action: string;
+  metric: 'opsPerSec' | 'p99Ms';
+  baseline: number;
+  current: number;
+  change: number; // relative, positive = worse
+}
+
+interface Series {
+  times: number[];
+  allocTotal: number;
+  allocSamples: number;
+}
+
+export class Stats {
+  private series = new Map<string, Series>();
+
+  record(key: string, ms: number, heapDelta: number): void {
+    let s = this.series.get(key);
+    if (!s) {
+      s = { times: [], allocTotal: 0, allocSamples: 0 };
+      this.series.set(key, s);
+    }
+    s.times.push(ms);
+    if (heapDelta >= 0) {
+      s.allocTotal += heapDelta;
+      s.allocSamples++;
+    }
+  }
+
+  summarize(): Record<string, ActionSummary> {
+    const out: Record<string, ActionSummary> = {};
+    for (const key of [...this.series.keys()].sort()) {
+      const s = this.series.get(key)!;
+      const sorted = Float64Array.from(s.times).sort();
+      const total = sorted.reduce((a, b) => a + b, 0);
+      out[key] = {
+        ops: sorted.length,
+        opsPerSec: total > 0 ? (sorted.length / total) * 1000 : 0,
+        meanMs: total / sorted.length,
+        p50Ms: percentile(sorted, 0.5),
+        p99Ms: percentile(sorted, 0.99),
+        allocBytesPerOp: s.allocSamples > 0 ? Math.round(s.allocTotal / s.allocSamples) : 0,
+      };
+    }
+    return out;
+  }
+}
+
+function percentile(sorted: Float64Array, q: number): number {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.ceil(q * sorted.length) - 1)];
+}
+
+// Series with fewer samples than this are too noisy to gate on
+const MIN_OPS_FOR_COMPARISON = 50;
+
+export function compareReports(current: BenchReport, baseline: BenchReport, threshold: number): Regression[] {
+  const regressions: Regression[] = [];
+
+  for (const [scenario, actions] of Object.entries(current.scenarios)) {
+    const base = baseline.scenarios[scenario];
+    if (!base) continue;
+
+    for (const [action, cur] of Object.entries(actions)) {
+      const b = base[action];
+      if (!b || cur.ops < MIN_OPS_FOR_COMPARISON || b.ops < MIN_OPS_FOR_COMPARISON) continue;
+
+      if (b.opsPerSec > 0) {
+        const change = (b.opsPerSec - cur.opsPerSec) / b.opsPerSec;
+        if (change > threshold) {
+          regressions.push({ scenario, action, metric: 'opsPerSec', baseline: b.opsPerSec, current: cur.opsPerSec, change });
+        }
+      }
+      if (b.p99Ms > 0) {
+        const change = (cur.p99Ms - b.p99Ms) / b.p99Ms;
+        if (change > threshold) {
+          regressions.push({ scenario, action, metric: 'p99Ms', baseline: b.p99Ms, current: cur.p99Ms, change });
+        }
+      }
+    }
+  }
+
+  return regressions;
+}
@@ -0,0 +1,208 @@
+import { Request, Response, NextFunction } from 'express';
+import { performance } from 'perf_hooks';
+import { KeyedBuckets } from './tokenBucket';
+import { registerCounter, registerGauge } from '../observability/metrics';
+
+// ============================================================
+// ADMISSION CONTROL
+// Every REST request and WS action passes through admit() before any
+// SQLite read or engine work happens:
+//
+//   1. Load shedding by priority, driven by event-loop lag. Bulk reads
+//      (export, analytics, traces, tournament provisioning) give way
+//      first, then lobby traffic, and in-game actions ('game') only
+//      when the loop is far behind. REST and WS handlers run
+//      synchronously, so a count of requests in flight stays near zero
+//      and says nothing about load; lag is what grows when the process
+//      falls behind.
+//   2. Token buckets per player token and per room, shared by REST
+//      and WS, so one client spamming ADVANCE_PHASE or PLAY_CARD is
+//      throttled without touching other games.
+//
+// Anonymous requests (create/join/list) are not bucketed per IP: a
+// whole classroom usually sits behind one address.
+// ============================================================
+
+export type Priority = 'game' | 'lobby' | 'bulk';
+
+export interface Rejection {
+  code: 'RATE_LIMITED' | 'OVERLOADED';
+  message: string;
+  retryAfterMs: number;
+}
+
+export interface AdmissionOptions {
+  tokenRate: number; // requests/s per player token
+  tokenBurst: number;
+  roomRate: number; // requests/s per game, all players together
+  roomBurst: number;
+  lagMs: number; // event-loop lag at which bulk traffic is shed
+  now?: () => number;
+  loopLagMs?: () => number;
+}
+
+// Multiple of lagMs above which each priority is shed
+const LAG_FACTOR: Record<Priority, number> = { game: 4, lobby: 2, bulk: 1 };
+
+const SHED_RETRY_MS = 1000;
+
+export class AdmissionController {
+  private readonly tokens: KeyedBuckets;
+  private readonly roomBuckets: KeyedBuckets;
+  private readonly now: () => number;
+  private readonly loopLagMs: () => number;
+
+  rateLimited = 0;
+  readonly shed: Record<Priority, number> = { game: 0, lobby: 0, bulk: 0 };
+
+  constructor(private readonly options: AdmissionOptions) {
+    this.tokens = new KeyedBuckets(options.tokenBurst, options.tokenRate);
+    this.roomBuckets = new KeyedBuckets(options.roomBurst, options.roomRate);
+    this.now = options.now ?? Date.now;
+    this.loopLagMs = options.loopLagMs ?? (() => 0);
+  }
+
+  admit(priority: Priority, token: string | null, gameId: string | null): Rejection | null {
+    // Shedding first: a refused request should not spend rate tokens
+    if (this.loopLagMs() >= this.options.lagMs * LAG_FACTOR[priority]) {
+      this.shed[priority]++;
+      return { code: 'OVERLOADED', message: `Server is overloaded; ${priority} requests are being shed.`, retryAfterMs: SHED_RETRY_MS };
+    }
+
+    const now = this.now();
+    if (token) {
+      const wait = this.tokens.take(token, now);
+      if (wait > 0) {
+        this.rateLimited++;
+        return { code: 'RATE_LIMITED', message: 'Too many requests for this player.', retryAfterMs: wait };
+      }
+    }
+    if (gameId && priority === 'game') {
+      const wait = this.roomBuckets.take(gameId, now);
+      if (wait > 0) {
+        this.rateLimited++;
+        return { code: 'RATE_LIMITED', message: 'Too many requests for this game.', retryAfterMs: wait };
+      }
+    }
+    return null;
+  }
+
+  get trackedKeys(): number {
+    return this.tokens.size + this.roomBuckets.size;
+  }
+}
+
+// ============================================================
+// EVENT-LOOP LAG SAMPLER
+// A timer that measures how late it fires, smoothed so a single slow
+// tick does not flip shedding on and off.
+// ============================================================
+
+const LAG_SAMPLE_MS = 50;
+let loopLag = 0;
+let lagTimer: NodeJS.Timeout | null = null;
+
+function startLagSampler(): void {
+  if (lagTimer) return;
+  let expected = performance.now() + LAG_SAMPLE_MS;
+  lagTimer = setInterval(() => {
+    const now = performance.now();
+    loopLag = loopLag * 0.7 + Math.max(0, now - expected) * 0.3;
+    expected = now + LAG_SAMPLE_MS;
+  }, LAG_SAMPLE_MS);
+  lagTimer.unref();
+}
+
+// ============================================================
+// PROCESS-WIDE CONTROLLER
+// ============================================================
+
+function envNumber(name: string, fallback: number): number {
+  const value = parseFloat(process.env[name] ?? '');
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+const ENABLED = process.env.ADMISSION_ENABLED !== 'false';
+
+export const admission = new AdmissionController({
+  tokenRate: envNumber('ADMISSION_TOKEN_RATE', 20),
+  tokenBurst: envNumber('ADMISSION_TOKEN_BURST', 40),
+  roomRate: envNumber('ADMISSION_ROOM_RATE', 40),
+  roomBurst: envNumber('ADMISSION_ROOM_BURST', 80),
+  lagMs: envNumber('ADMISSION_LAG_MS', 100),
+  loopLagMs: () => loopLag,
+});
+
+if (ENABLED) startLagSampler();
+
+registerGauge('admission_loop_lag_seconds', 'Smoothed event-loop lag used for shedding', () => loopLag / 1000);
+registerCounter('admission_rate_limited_total', 'Requests refused by a token or room bucket', () => admission.rateLimited);
+registerCounter('admission_shed_game_total', 'In-game requests shed under overload', () => admission.shed.game);
+registerCounter('admission_shed_lobby_total', 'Lobby requests shed under overload', () => admission.shed.lobby);
+registerCounter('admission_shed_bulk_total', 'Bulk requests shed under overload', () => admission.shed.bulk);
+registerGauge('admission_tracked_keys', 'Token and room buckets currently held', () => admission.trackedKeys);
+
+export function admitAction(token: string, gameId: string): Rejection | null {
+  return ENABLED ? admission.admit('game', token, gameId) : null;
+}
+
+// ============================================================
+// HTTP
+// ============================================================
+
+const GAME_ROUTE = /^\/api\/games\/([^/]+)(?:\/([^/]+))?\/?$/;
+
+// null means the route is never shed or limited
+export function classifyRequest(method: string, path: string): { priority: Priority; gameId: string | null } | null {
+  if (path === '/health' || path === '/metrics') return null;
+
+  if (path.startsWith('/api/export') || path.startsWith('/api/analytics') || path.startsWith('/api/traces')) {
+    return { priority: 'bulk', gameId: null };
+  }
+  if (path.startsWith('/api/tournaments')) {
+    return { priority: method === 'POST' && /^\/api\/tournaments\/?$/.test(path) ? 'bulk' : 'lobby', gameId: null };
+  }
+
+  const match = GAME_ROUTE.exec(path);
+  if (match) {
+    const [, gameId, action] = match;
+    if (action === 'export') return { priority: 'bulk', gameId };
+    if (action !== 'join') return { priority: 'game', gameId };
+  }
+  return { priority: 'lobby', gameId: null };
+}
+
+function bearerToken(req: Request): string | null {
+  const header = req.headers.authorization;
+  return header?.startsWith('Bearer ') ? header.slice(7) : null;
+}
+
+export function sendRejection(res: Response, rejection: Rejection): void {
+  res.setHeader('Retry-After', Math.max(1, Math.ceil(rejection.retryAfterMs / 1000)));
+  res.status(rejection.code === 'RATE_LIMITED' ? 429 : 503).json({
+    error: rejection.code,
+    message: rejection.message,
+    retryAfterMs: rejection.retryAfterMs,
+  });
+}
+
+export function admissionMiddleware(req: Request, res: Response, next: NextFunction): void {
+  if (!ENABLED) {
+    next();
+    return;
+  }
+
+  const route = classifyRequest(req.method, req.path);
+  if (!route) {
+    next();
+    return;
+  }
+
+  const rejection = admission.admit(route.priority, bearerToken(req), route.gameId);
+  if (rejection) {
+    sendRejection(res, rejection);
+    return;
+  }
+
+  next();
+}
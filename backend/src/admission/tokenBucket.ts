@@ -0,0 +1,78 @@
+// ============================================================
+// TOKEN BUCKETS
+// Lazily refilled: a bucket only does arithmetic when it is asked for
+// a token, so idle keys cost nothing but their map entry.
+// ============================================================
+
+export class TokenBucket {
+  private tokens: number;
+  private updatedAt: number;
+
+  constructor(
+    readonly capacity: number,
+    readonly ratePerSec: number,
+    now = Date.now()
+  ) {
+    this.tokens = capacity;
+    this.updatedAt = now;
+  }
+
+  private refill(now: number): void {
+    if (now > this.updatedAt) {
+      this.tokens = Math.min(this.capacity, this.tokens + ((now - this.updatedAt) * this.ratePerSec) / 1000);
+      this.updatedAt = now;
+    }
+  }
+
+  // Returns 0 when the token was taken, otherwise the milliseconds
+  // until one will be available
+  take(now = Date.now()): number {
+    this.refill(now);
+    if (this.tokens >= 1) {
+      this.tokens -= 1;
+      return 0;
+    }
+    return Math.ceil(((1 - this.tokens) * 1000) / this.ratePerSec);
+  }
+
+  isFull(now = Date.now()): boolean {
+    this.refill(now);
+    return this.tokens >= this.capacity;
+  }
+}
+
+// One bucket per key (player token, room). Buckets that have refilled
+// completely are indistinguishable from new ones, so a periodic sweep
+// drops them and the map only holds recently active keys.
+export class KeyedBuckets {
+  private buckets = new Map<string, TokenBucket>();
+  private takesSinceSweep = 0;
+
+  constructor(
+    readonly capacity: number,
+    readonly ratePerSec: number,
+    private readonly sweepEvery = 10_000
+  ) {}
+
+  take(key: string, now = Date.now()): number {
+    if (++this.takesSinceSweep >= this.sweepEvery) this.sweep(now);
+
+    let bucket = this.buckets.get(key);
+    if (!bucket) {
+      bucket = new TokenBucket(this.capacity, this.ratePerSec, now);
+      this.buckets.set(key, bucket);
+    }
+    return bucket.take(now);
+  }
+
+  sweep(now = Date.now()): void {
+    this.takesSinceSweep = 0;
+    for (const [key, bucket] of this.buckets) {
+      if (bucket.isFull(now)) this.buckets.delete(key);
+    }
+  }
+
+  get size(): number {
+    return this.buckets.size;
+  }
+}
@@ -0,0 +1,39 @@
+import { Request, Response, NextFunction, RequestHandler } from 'express';
+import { timingSafeEqual } from 'crypto';
+
+// ============================================================
+// AUTH MIDDLEWARE — operator endpoints (bulk export, traces)
+//
+// These routes span every game, so no player or tournament token can
+// grant access. They stay disabled (404) until ADMIN_TOKEN is set, and
+// then require `Authorization: Bearer <ADMIN_TOKEN>`.
+// ============================================================
+
+function sameToken(a: string, b: string): boolean {
+  const left = Buffer.from(a);
+  const right = Buffer.from(b);
+  return left.length === right.length && timingSafeEqual(left, right);
+}
+
+export function adminTokenGuard(adminToken: string | undefined): RequestHandler {
+  return (req: Request, res: Response, next: NextFunction): void => {
+    if (!adminToken) {
+      res.status(404).json({ error: 'NOT_FOUND', message: 'Set ADMIN_TOKEN to enable this endpoint.' });
+      return;
+    }
+
+    const auth = req.headers.authorization;
+    const token = auth && auth.startsWith('Bearer ') ? auth.slice(7).trim() : null;
+    if (!token) {
+      res.status(401).json({ error: 'NOT_AUTHORIZED', message: 'Missing Authorization header.' });
+      return;
+    }
+    if (!sameToken(token, adminToken)) {
+      res.status(403).json({ error: 'NOT_AUTHORIZED', message: 'Invalid admin token.' });
+      return;
+    }
+    next();
+  };
+}
+
+export const requireAdminToken = adminTokenGuard(process.env.ADMIN_TOKEN || undefined);
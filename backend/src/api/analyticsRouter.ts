@@ -0,0 +1,89 @@
+import { Router, Request, Response } from 'express';
+import {
+  getTurnMarkerAverages,
+  getServiceDownCounts,
+  getCardPlayCounts,
+  getDownPrecursors,
+  getGameStatusCounts,
+} from '../db/analytics';
+import { requireSqliteStorage } from './storageGuard';
+
+const router = Router();
+
+// All endpoints read the precomputed aggregate tables maintained by the
+// logging path, so their cost does not grow with the number of games.
+// Those tables live in the main database, so other storage backends
+// get an explicit 501 rather than empty aggregates.
+router.use(requireSqliteStorage);
+
+// ============================================================
+// GET /api/analytics/summary — Games by status
+// ============================================================
+
+router.get('/summary', (_req: Request, res: Response) => {
+  try {
+    res.status(200).json({ games: getGameStatusCounts() });
+  } catch (err) {
+    console.error('[GET /api/analytics/summary]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to load summary.' });
+  }
+});
+
+// ============================================================
+// GET /api/analytics/turns — Average stability/trust change per turn
+// ============================================================
+
+router.get('/turns', (_req: Request, res: Response) => {
+  try {
+    res.status(200).json({ turns: getTurnMarkerAverages() });
+  } catch (err) {
+    console.error('[GET /api/analytics/turns]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to load turn aggregates.' });
+  }
+});
+
+// ============================================================
+// GET /api/analytics/services/downs — Times each service went DOWN
+// ============================================================
+
+router.get('/services/downs', (_req: Request, res: Response) => {
+  try {
+    res.status(200).json({ services: getServiceDownCounts() });
+  } catch (err) {
+    console.error('[GET /api/analytics/services/downs]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to load service aggregates.' });
+  }
+});
+
+// ============================================================
+// GET /api/analytics/cards — Play counts per card
+// ============================================================
+
+router.get('/cards', (_req: Request, res: Response) => {
+  try {
+    res.status(200).json({ cards: getCardPlayCounts() });
+  } catch (err) {
+    console.error('[GET /api/analytics/cards]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to load card aggregates.' });
+  }
+});
+
+// ============================================================
+// GET /api/analytics/down-precursors?serviceId=S5&limit=10
+// Cards played in the same turn before a service went DOWN
+// ============================================================
+
+router.get('/down-precursors', (req: Request, res: Response) => {
+  try {
+    const serviceId = typeof req.query.serviceId === 'string' ? req.query.serviceId : undefined;
+    const limitParam = typeof req.query.limit === 'string' ? parseInt(req.query.limit, 10) : 20;
+    const limit = Number.isNaN(limitParam) || limitParam <= 0 ? 20 : Math.min(limitParam, 500);
+
+    res.status(200).json({ serviceId: serviceId ?? null, precursors: getDownPrecursors(serviceId, limit) });
+  } catch (err) {
+    console.error('[GET /api/analytics/down-precursors]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to load precursor aggregates.' });
+  }
+});
+
+export default router;
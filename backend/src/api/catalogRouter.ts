@@ -0,0 +1,97 @@
+import { Router, Request, Response } from 'express';
+import { CARDS_ASSET, MAP_ASSETS, MANIFEST_ASSET, StaticAsset } from '../data/catalog';
+
+const router = Router();
+
+// ============================================================
+// ASSET DELIVERY
+// Bodies are precompressed (data/catalog.ts); a request only picks an
+// encoding and compares ETags. Versioned URLs are immutable; the
+// unversioned ones are revalidated and answered with 304s.
+// ============================================================
+
+const IMMUTABLE = 'public, max-age=31536000, immutable';
+const REVALIDATE = 'no-cache';
+
+function pickEncoding(acceptEncoding: string | undefined): 'br' | 'gzip' | null {
+  if (!acceptEncoding) return null;
+  const accepted = new Set<string>();
+  for (const part of acceptEncoding.split(',')) {
+    const [coding, ...params] = part.trim().toLowerCase().split(';');
+    const q = params.find((p) => p.trim().startsWith('q='));
+    if (q && parseFloat(q.trim().slice(2)) === 0) continue;
+    accepted.add(coding.trim());
+  }
+  if (accepted.has('br')) return 'br';
+  if (accepted.has('gzip') || accepted.has('*')) return 'gzip';
+  return null;
+}
+
+function etagMatches(ifNoneMatch: string | undefined, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  return ifNoneMatch.split(',').some((tag) => {
+    const t = tag.trim();
+    return t === '*' || t === etag || t === `W/${etag}`;
+  });
+}
+
+export function sendAsset(req: Request, res: Response, asset: StaticAsset, immutable: boolean): void {
+  res.setHeader('ETag', asset.etag);
+  res.setHeader('Cache-Control', immutable ? IMMUTABLE : REVALIDATE);
+  res.setHeader('Vary', 'Accept-Encoding');
+
+  if (etagMatches(req.headers['if-none-match'], asset.etag)) {
+    res.status(304).end();
+    return;
+  }
+
+  const encoding = pickEncoding(req.headers['accept-encoding']);
+  const body = encoding === 'br' ? asset.br : encoding === 'gzip' ? asset.gzip : asset.body;
+  res.setHeader('Content-Type', 'application/json; charset=utf-8');
+  if (encoding) res.setHeader('Content-Encoding', encoding);
+  res.setHeader('Content-Length', body.length);
+  res.status(200).end(body);
+}
+
+function sendVersioned(req: Request, res: Response, asset: StaticAsset | undefined, version: string): void {
+  if (!asset || asset.version !== version) {
+    res.status(404).json({ error: 'NOT_FOUND', message: `Catalog version '${version}' not found.` });
+    return;
+  }
+  sendAsset(req, res, asset, true);
+}
+
+// ============================================================
+// GET /api/catalog — Current versions and their immutable URLs
+// ============================================================
+
+router.get('/', (req: Request, res: Response) => {
+  sendAsset(req, res, MANIFEST_ASSET, false);
+});
+
+// ============================================================
+// GET /api/catalog/cards/:version — Card catalog (immutable)
+// ============================================================
+
+router.get('/cards/:version', (req: Request, res: Response) => {
+  sendVersioned(req, res, CARDS_ASSET, req.params.version);
+});
+
+// ============================================================
+// GET /api/catalog/maps/:mapId[/:version] — Map definition
+// ============================================================
+
+router.get('/maps/:mapId', (req: Request, res: Response) => {
+  const asset = MAP_ASSETS[req.params.mapId];
+  if (!asset) {
+    res.status(404).json({ error: 'NOT_FOUND', message: `Map '${req.params.mapId}' not found.` });
+    return;
+  }
+  sendAsset(req, res, asset, false);
+});
+
+router.get('/maps/:mapId/:version', (req: Request, res: Response) => {
+  sendVersioned(req, res, MAP_ASSETS[req.params.mapId], req.params.version);
+});
+
+export default router;
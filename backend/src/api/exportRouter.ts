@@ -0,0 +1,56 @@
+import { Router, Request, Response } from 'express';
+import { openReadOnlyDb } from '../db/database';
+import { parseExportOptions, streamExport } from '../db/bulkExport';
+import { requireAdminToken } from './adminAuth';
+import { requireSqliteStorage } from './storageGuard';
+
+const router = Router();
+
+// Every route here spans all games: operator token only
+router.use(requireAdminToken);
+router.use(requireSqliteStorage);
+
+// ============================================================
+// GET /api/export/games — Bulk export of many games
+// Query: format=ndjson|columnar, from, to (ISO date or epoch ms),
+//        status=running,finished, cursor, limit, batchSize
+// ============================================================
+
+router.get('/games', async (req: Request, res: Response) => {
+  let db: ReturnType<typeof openReadOnlyDb> | null = null;
+  try {
+    const parsed = parseExportOptions(req.query as Record<string, unknown>);
+    if ('error' in parsed) {
+      res.status(400).json({ error: 'BAD_REQUEST', message: parsed.error });
+      return;
+    }
+
+    const { options } = parsed;
+    try {
+      db = openReadOnlyDb();
+    } catch (err) {
+      console.error('[GET /api/export/games]', err);
+      res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to open database for export.' });
+      return;
+    }
+
+    res.status(200);
+    res.setHeader('Content-Type', 'application/x-ndjson; charset=utf-8');
+    res.setHeader('Content-Disposition', `attachment; filename="games-export.${options.format}.ndjson"`);
+    await streamExport(db, options, res);
+    res.end();
+  } catch (err) {
+    console.error('[GET /api/export/games]', err);
+    if (!res.headersSent) {
+      res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Export failed.' });
+      return;
+    }
+    // Headers are already on the wire — abort the stream so the client
+    // sees a truncated export (no 'end' record) instead of a silent success.
+    res.destroy(err as Error);
+  } finally {
+    db?.close();
+  }
+});
+
+export default router;
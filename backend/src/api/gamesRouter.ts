@@ -8,13 +8,21 @@ import {
   getPlayerByToken,
   getPlayersByGame,
   getLogsByGame,
+  saveLogs,
+  saveSpectatorToken,
 } from '../db/migrations';
 import {
   initializeGame,
   startGame,
   GameError,
 } from '../engine/gameEngine';
+import { getCascadePreview, normalizeChanges, stateVersion } from '../engine/previewCache';
+import { parsePhaseSeconds, syncPhaseDeadline } from '../scheduler/phaseScheduler';
+import { parseStateView, toWireState } from '../data/catalog';
 import { GameConfig, GameState, Player } from '../types/game.types';
+import { parseJson } from '../observability/metrics';
+import { traceCommand, withSpan } from '../observability/tracing';
+import { rejectWhileDraining } from '../lifecycle/drain';
 
 const router = Router();
 
@@ -69,7 +77,7 @@ function loadGameState(gameId: string): { state: GameState; configJson: string }
   const row = loadGame(gameId);
   if (!row) return null;
 
-  const state = JSON.parse(row.state_json) as GameState;
+  const state = parseJson<GameState>('game_state', row.state_json);
   return { state, configJson: row.config_json };
 }
 
@@ -77,7 +85,7 @@ function loadGameState(gameId: string): { state: GameState; configJson: string }
 // POST /api/games — Create a new game
 // ============================================================
 
-router.post('/', (req: Request, res: Response) => {
+router.post('/', rejectWhileDraining, (req: Request, res: Response) => {
   try {
     const body = req.body as {
       displayName?: string;
@@ -87,12 +95,14 @@ router.post('/', (req: Request, res: Response) => {
       budgetPerTurn?: number;
       intermittenceMode?: 'deterministic' | 'random';
       mapId?: string;
+      phaseSeconds?: Record<string, number>;
       // Nested config (also accepted)
       config?: {
         turnLimit?: number;
         budgetPerTurn?: number;
         intermittenceMode?: 'deterministic' | 'random';
         mapId?: string;
+        phaseSeconds?: Record<string, number>;
       };
     };
 
@@ -105,6 +115,8 @@ router.post('/', (req: Request, res: Response) => {
       intermittenceMode: cfg.intermittenceMode ?? body.intermittenceMode ?? 'deterministic',
       mapId:             cfg.mapId             ?? body.mapId             ?? 'standard',
     };
+    const phaseSeconds = parsePhaseSeconds(cfg.phaseSeconds ?? body.phaseSeconds);
+    if (phaseSeconds) config.phaseSeconds = phaseSeconds;
 
     const gameId = uuidv4();
     const state = initializeGame(config, gameId);
@@ -121,7 +133,7 @@ router.post('/', (req: Request, res: Response) => {
     };
     savePlayer(player);
 
-    res.status(201).json({ gameId, token: playerToken, player, state });
+    res.status(201).json({ gameId, token: playerToken, player, state: toWireState(state, parseStateView(req.query.view)) });
   } catch (err) {
     console.error('[POST /api/games]', err);
     res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to create game.' });
@@ -181,6 +193,7 @@ router.post('/:gameId/join', (req: Request, res: Response) => {
 
 // ============================================================
 // GET /api/games/:gameId — Get game state
+// ?view=compact omits static service fields (see data/catalog.ts)
 // ============================================================
 
 router.get('/:gameId', requireGameAccess, (req: Request, res: Response) => {
@@ -192,7 +205,7 @@ router.get('/:gameId', requireGameAccess, (req: Request, res: Response) => {
       return;
     }
 
-    res.status(200).json({ state: loaded.state });
+    res.status(200).json({ state: toWireState(loaded.state, parseStateView(req.query.view)) });
   } catch (err) {
     console.error('[GET /api/games/:gameId]', err);
     res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to load game.' });
@@ -217,10 +230,17 @@ router.post('/:gameId/start', requireGameAccess, (req: Request, res: Response) =
       return;
     }
 
-    const newState = startGame(loaded.state);
-    saveGame(gameId, newState.status, loaded.configJson, JSON.stringify(newState));
-
-    res.status(200).json({ state: newState });
+    const newState = traceCommand('rest.start', gameId, () => {
+      const started = startGame(loaded.state);
+      withSpan('db.save', () => {
+        saveGame(gameId, started.status, loaded.configJson, JSON.stringify(started));
+        saveLogs(gameId, started.log.slice(loaded.state.log.length));
+      });
+      return started;
+    });
+    syncPhaseDeadline(newState);
+
+    res.status(200).json({ state: toWireState(newState, parseStateView(req.query.view)) });
   } catch (err) {
     if (err instanceof GameError) {
       res.status(400).json({ error: err.code, message: err.message });
@@ -251,8 +271,9 @@ router.post('/:gameId/pause', requireGameAccess, (req: Request, res: Response) =
 
     const newState: GameState = { ...loaded.state, status: 'paused', updatedAt: Date.now() };
     saveGame(gameId, 'paused', loaded.configJson, JSON.stringify(newState));
+    syncPhaseDeadline(newState);
 
-    res.status(200).json({ state: newState });
+    res.status(200).json({ state: toWireState(newState, parseStateView(req.query.view)) });
   } catch (err) {
     console.error('[POST /api/games/:gameId/pause]', err);
     res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to pause game.' });
@@ -279,14 +300,70 @@ router.post('/:gameId/resume', requireGameAccess, (req: Request, res: Response)
 
     const newState: GameState = { ...loaded.state, status: 'running', updatedAt: Date.now() };
     saveGame(gameId, 'running', loaded.configJson, JSON.stringify(newState));
+    syncPhaseDeadline(newState);
 
-    res.status(200).json({ state: newState });
+    res.status(200).json({ state: toWireState(newState, parseStateView(req.query.view)) });
   } catch (err) {
     console.error('[POST /api/games/:gameId/resume]', err);
     res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to resume game.' });
   }
 });
 
+// ============================================================
+// POST /api/games/:gameId/preview — What-if CASCADE_EVAL dry run
+// Body: { changes: [{ serviceId, state?, int?, damage? }] }
+// Nothing is saved; results are memoized per state version.
+// ============================================================
+
+router.post('/:gameId/preview', requireGameAccess, (req: Request, res: Response) => {
+  try {
+    const { gameId } = req.params;
+    const loaded = loadGameState(gameId);
+    if (!loaded) {
+      res.status(404).json({ error: 'NOT_FOUND', message: `Game '${gameId}' not found.` });
+      return;
+    }
+
+    const changes = normalizeChanges((req.body as { changes?: unknown } | undefined)?.changes);
+    const { preview, cached } = traceCommand('rest.preview', gameId, () =>
+      getCascadePreview(gameId, loaded.state, changes)
+    );
+
+    res.status(200).json({ stateVersion: stateVersion(loaded.state), cached, changes, preview });
+  } catch (err) {
+    if (err instanceof GameError) {
+      res.status(400).json({ error: err.code, message: err.message });
+      return;
+    }
+    console.error('[POST /api/games/:gameId/preview]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to preview cascade.' });
+  }
+});
+
+// ============================================================
+// POST /api/games/:gameId/spectators — Issue a read-only spectator token
+// Facilitator only. The token opens /ws/spectate/:gameId.
+// ============================================================
+
+router.post('/:gameId/spectators', requireGameAccess, (req: Request, res: Response) => {
+  try {
+    const { gameId } = req.params;
+    const player = (req as Request & { player: Player }).player;
+    if (player.seat !== 'FACILITATOR') {
+      res.status(403).json({ error: 'NOT_AUTHORIZED', message: 'Only the facilitator can invite spectators.' });
+      return;
+    }
+
+    const token = uuidv4();
+    saveSpectatorToken(gameId, token);
+
+    res.status(201).json({ token, url: `/ws/spectate/${gameId}?token=${token}` });
+  } catch (err) {
+    console.error('[POST /api/games/:gameId/spectators]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to create spectator token.' });
+  }
+});
+
 // ============================================================
 // GET /api/games/:gameId/export — Export game log as JSON
 // ============================================================
@@ -0,0 +1,26 @@
+import { Request, Response, NextFunction, RequestHandler } from 'express';
+import { StorageKind, parseStorageKind } from '../db/storage';
+
+// ============================================================
+// STORAGE GUARD — endpoints that read the main database directly
+//
+// Analytics aggregates and the bulk export query data/game.db. Under
+// STORAGE_BACKEND=sharded or memory, games and their logs live
+// elsewhere, so those queries would return empty results that look
+// like real ones. These routes answer 501 instead.
+// ============================================================
+
+export function sqliteStorageGuard(kind: StorageKind): RequestHandler {
+  return (_req: Request, res: Response, next: NextFunction): void => {
+    if (kind === 'sqlite') {
+      next();
+      return;
+    }
+    res.status(501).json({
+      error: 'UNSUPPORTED_STORAGE',
+      message: `This endpoint reads the sqlite store; STORAGE_BACKEND is '${kind}'.`,
+    });
+  };
+}
+
+export const requireSqliteStorage = sqliteStorageGuard(parseStorageKind(process.env.STORAGE_BACKEND));
@@ -0,0 +1,268 @@
+import { Router, Request, Response, NextFunction } from 'express';
+import { v4 as uuidv4 } from 'uuid';
+import {
+  createTournament,
+  advanceBracket,
+  getTournamentByToken,
+  getMatches,
+  MatchRow,
+  ProvisionedMatch,
+  TournamentRow,
+} from '../db/tournaments';
+import { getDb } from '../db/database';
+import { initializeGame, startGame } from '../engine/gameEngine';
+import { firstRoundPairings, nextPairings, champion, BracketMatch, Pairing } from '../engine/bracket';
+import { parsePhaseSeconds, syncPhaseDeadline } from '../scheduler/phaseScheduler';
+import { GameConfig, GameState, Player } from '../types/game.types';
+import { rejectWhileDraining } from '../lifecycle/drain';
+
+const router = Router();
+
+const MAX_GAMES = 1000;
+
+// Compact roster: one row per created match, tokens included
+const ROSTER_COLUMNS = [
+  'round',
+  'slot',
+  'gameId',
+  'malosos',
+  'malososToken',
+  'buenosos',
+  'buenososToken',
+  'facilitatorToken',
+] as const;
+
+type RosterRow = (string | number | null)[];
+
+// ============================================================
+// AUTH MIDDLEWARE — organizer token of the tournament
+// ============================================================
+
+function requireOrganizer(req: Request, res: Response, next: NextFunction): void {
+  const auth = req.headers.authorization;
+  const token = auth && auth.startsWith('Bearer ') ? auth.slice(7).trim() : null;
+  if (!token) {
+    res.status(401).json({ error: 'NOT_AUTHORIZED', message: 'Missing Authorization header.' });
+    return;
+  }
+
+  const tournament = getTournamentByToken(token);
+  if (!tournament || tournament.id !== req.params.tournamentId) {
+    res.status(403).json({ error: 'NOT_AUTHORIZED', message: 'Token does not belong to this tournament.' });
+    return;
+  }
+
+  (req as Request & { tournament: TournamentRow }).tournament = tournament;
+  next();
+}
+
+// ============================================================
+// HELPERS
+// ============================================================
+
+function provision(
+  pairings: Pairing[],
+  config: GameConfig,
+  facilitatorName: string,
+  autoStart: boolean
+): { matches: ProvisionedMatch[]; roster: RosterRow[]; started: GameState[] } {
+  const now = Date.now();
+  const matches: ProvisionedMatch[] = [];
+  const roster: RosterRow[] = [];
+  const started: GameState[] = [];
+
+  for (const p of pairings) {
+    if (p.teamB === null) {
+      matches.push({ ...p, state: null, players: [] });
+      roster.push([p.round, p.slot, null, p.teamA, null, null, null, null]);
+      continue;
+    }
+
+    const gameId = uuidv4();
+    let state = initializeGame(config, gameId);
+    if (autoStart) {
+      state = startGame(state);
+      started.push(state);
+    }
+
+    const seat = (seatName: Player['seat'], displayName: string): Player => ({
+      id: uuidv4(),
+      gameId,
+      seat: seatName,
+      displayName,
+      token: uuidv4(),
+      createdAt: now,
+    });
+    const facilitator = seat('FACILITATOR', facilitatorName);
+    const malosos = seat('MALOSOS', p.teamA);
+    const buenosos = seat('BUENOSOS', p.teamB);
+
+    matches.push({ ...p, state, players: [facilitator, malosos, buenosos] });
+    roster.push([p.round, p.slot, gameId, p.teamA, malosos.token, p.teamB, buenosos.token, facilitator.token]);
+  }
+
+  return { matches, roster, started };
+}
+
+// Arms phase timers for pre-started timed games in one write transaction
+function armTimers(started: GameState[]): void {
+  if (started.length === 0 || !started[0].config.phaseSeconds) return;
+  getDb().transaction(() => started.forEach(syncPhaseDeadline))();
+}
+
+function decidedWinner(m: MatchRow): string | null {
+  if (m.winnerTeam) return m.winnerTeam;
+  if (m.gameStatus !== 'finished') return null;
+  if (m.winnerSeat === 'MALOSOS') return m.teamA;
+  if (m.winnerSeat === 'BUENOSOS') return m.teamB;
+  return null;
+}
+
+function parseTeams(body: { teams?: unknown; games?: unknown }): string[] | string {
+  if (body.teams !== undefined) {
+    if (!Array.isArray(body.teams) || body.teams.some((t) => typeof t !== 'string' || t.trim() === '')) {
+      return 'teams must be an array of non-empty names.';
+    }
+    const teams = (body.teams as string[]).map((t) => t.trim());
+    if (new Set(teams).size !== teams.length) return 'Team names must be unique.';
+    if (teams.length < 2 || teams.length > MAX_GAMES * 2) return `Between 2 and ${MAX_GAMES * 2} teams are required.`;
+    return teams;
+  }
+
+  const games = body.games;
+  if (typeof games !== 'number' || !Number.isInteger(games) || games < 1 || games > MAX_GAMES) {
+    return `Either teams or games (1-${MAX_GAMES}) is required.`;
+  }
+  return Array.from({ length: games * 2 }, (_, i) => `Equipo ${i + 1}`);
+}
+
+// ============================================================
+// POST /api/tournaments — Provision round 1 of a bracket
+// Body: { teams: string[] } or { games: N }, plus optional name,
+// facilitatorName, start (pre-start every game) and config.
+// ============================================================
+
+router.post('/', rejectWhileDraining, (req: Request, res: Response) => {
+  try {
+    const body = req.body as {
+      name?: string;
+      teams?: unknown;
+      games?: unknown;
+      facilitatorName?: string;
+      start?: boolean;
+      config?: {
+        turnLimit?: number;
+        budgetPerTurn?: number;
+        intermittenceMode?: 'deterministic' | 'random';
+        mapId?: string;
+        phaseSeconds?: Record<string, number>;
+      };
+    };
+
+    const teams = parseTeams(body);
+    if (typeof teams === 'string') {
+      res.status(400).json({ error: 'BAD_REQUEST', message: teams });
+      return;
+    }
+
+    const cfg = body.config ?? {};
+    const config: GameConfig = {
+      turnLimit:         cfg.turnLimit         ?? 8,
+      budgetPerTurn:     cfg.budgetPerTurn     ?? 8,
+      intermittenceMode: cfg.intermittenceMode ?? 'deterministic',
+      mapId:             cfg.mapId             ?? 'standard',
+    };
+    const phaseSeconds = parsePhaseSeconds(cfg.phaseSeconds);
+    if (phaseSeconds) config.phaseSeconds = phaseSeconds;
+
+    const tournament = {
+      id: uuidv4(),
+      createdAt: Date.now(),
+      name: body.name ?? 'Torneo',
+      configJson: JSON.stringify(config),
+      facilitatorName: body.facilitatorName ?? 'Facilitador',
+      autoStart: body.start === true,
+      organizerToken: uuidv4(),
+    };
+
+    const { matches, roster, started } = provision(
+      firstRoundPairings(teams),
+      config,
+      tournament.facilitatorName,
+      tournament.autoStart
+    );
+    createTournament(tournament, matches);
+    armTimers(started);
+
+    res.status(201).json({
+      tournamentId: tournament.id,
+      organizerToken: tournament.organizerToken,
+      columns: ROSTER_COLUMNS,
+      roster,
+    });
+  } catch (err) {
+    console.error('[POST /api/tournaments]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to create tournament.' });
+  }
+});
+
+// ============================================================
+// GET /api/tournaments/:tournamentId — Bracket status
+// ============================================================
+
+router.get('/:tournamentId', requireOrganizer, (req: Request, res: Response) => {
+  try {
+    const tournament = (req as Request & { tournament: TournamentRow }).tournament;
+    const matches = getMatches(tournament.id).map((m) => ({
+      round: m.round,
+      slot: m.slot,
+      gameId: m.gameId,
+      malosos: m.teamA,
+      buenosos: m.teamB,
+      status: m.gameId === null ? 'bye' : m.gameStatus,
+      winner: decidedWinner(m),
+    }));
+
+    res.status(200).json({
+      tournament: { id: tournament.id, name: tournament.name, createdAt: tournament.createdAt },
+      matches,
+      champion: champion(matches.map((m) => ({ round: m.round, slot: m.slot, teamA: m.malosos, teamB: m.buenosos, winnerTeam: m.winner }))),
+    });
+  } catch (err) {
+    console.error('[GET /api/tournaments/:tournamentId]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to load tournament.' });
+  }
+});
+
+// ============================================================
+// POST /api/tournaments/:tournamentId/advance — Winners advance
+// Creates every next-round game whose feeder games are finished, so
+// fast tables do not wait for the whole round.
+// ============================================================
+
+router.post('/:tournamentId/advance', requireOrganizer, (req: Request, res: Response) => {
+  try {
+    const tournament = (req as Request & { tournament: TournamentRow }).tournament;
+
+    const decided: { round: number; slot: number; team: string }[] = [];
+    const bracket: BracketMatch[] = getMatches(tournament.id).map((m) => {
+      const winnerTeam = decidedWinner(m);
+      if (winnerTeam && !m.winnerTeam) decided.push({ round: m.round, slot: m.slot, team: winnerTeam });
+      return { round: m.round, slot: m.slot, teamA: m.teamA, teamB: m.teamB, winnerTeam };
+    });
+
+    const pairings = nextPairings(bracket);
+    const config = JSON.parse(tournament.configJson) as GameConfig;
+    const { matches, roster, started } = provision(pairings, config, tournament.facilitatorName, tournament.autoStart);
+    if (decided.length > 0 || matches.length > 0) advanceBracket(tournament.id, decided, matches);
+    armTimers(started);
+
+    const all = [...bracket, ...matches.map((m) => ({ ...m, winnerTeam: m.teamB === null ? m.teamA : null }))];
+    res.status(200).json({ columns: ROSTER_COLUMNS, roster, champion: champion(all) });
+  } catch (err) {
+    console.error('[POST /api/tournaments/:tournamentId/advance]', err);
+    res.status(500).json({ error: 'INTERNAL_ERROR', message: 'Failed to advance tournament.' });
+  }
+});
+
+export default router;
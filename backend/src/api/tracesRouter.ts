@@ -0,0 +1,75 @@
+import { Router, Request, Response } from 'express';
+import {
+  getTraces,
+  getTracingConfig,
+  clearTraces,
+  toChromeTrace,
+  watchGame,
+  unwatchGame,
+} from '../observability/tracing';
+import { requireAdminToken } from './adminAuth';
+
+const router = Router();
+
+// Every route here spans all games: operator token only
+router.use(requireAdminToken);
+
+// ============================================================
+// GET /api/traces — Tracing config and summaries of buffered traces
+// Query: gameId (optional)
+// ============================================================
+
+router.get('/', (req: Request, res: Response) => {
+  const gameId = typeof req.query.gameId === 'string' ? req.query.gameId : undefined;
+  const traces = getTraces(gameId).map((t) => ({
+    id: t.id,
+    gameId: t.gameId,
+    name: t.name,
+    startedAt: t.startedAt,
+    durationMs: t.spans.length > 0 ? t.spans[0].durUs / 1000 : 0,
+    spans: t.spans.length,
+  }));
+  res.status(200).json({ config: getTracingConfig(), traces });
+});
+
+// ============================================================
+// GET /api/traces/chrome — Export in Chrome trace-event format
+// Load the file in chrome://tracing, Perfetto or speedscope.
+// ============================================================
+
+router.get('/chrome', (req: Request, res: Response) => {
+  const gameId = typeof req.query.gameId === 'string' ? req.query.gameId : undefined;
+  const filename = gameId ? `trace-${gameId}.json` : 'trace.json';
+  res.setHeader('Content-Disposition', `attachment; filename="${filename}"`);
+  res.status(200).json(toChromeTrace(getTraces(gameId)));
+});
+
+// ============================================================
+// DELETE /api/traces — Drop all buffered traces
+// ============================================================
+
+router.delete('/', (_req: Request, res: Response) => {
+  clearTraces();
+  res.status(204).end();
+});
+
+// ============================================================
+// POST/DELETE /api/traces/watch/:gameId — Force-trace one game
+// regardless of the sample rate (tracing must be enabled).
+// ============================================================
+
+router.post('/watch/:gameId', (req: Request, res: Response) => {
+  if (!getTracingConfig().enabled) {
+    res.status(409).json({ error: 'TRACING_DISABLED', message: 'Set TRACING_ENABLED=true to record traces.' });
+    return;
+  }
+  watchGame(req.params.gameId);
+  res.status(200).json({ config: getTracingConfig() });
+});
+
+router.delete('/watch/:gameId', (req: Request, res: Response) => {
+  unwatchGame(req.params.gameId);
+  res.status(200).json({ config: getTracingConfig() });
+});
+
+export default router;
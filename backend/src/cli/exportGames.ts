@@ -0,0 +1,71 @@
+import fs from 'fs';
+import { Writable } from 'stream';
+import { openReadOnlyDb } from '../db/database';
+import { parseExportOptions, streamExport } from '../db/bulkExport';
+import { parseStorageKind } from '../db/storage';
+
+// ============================================================
+// Bulk export CLI
+// Usage:
+//   npm run export:games -- [--format ndjson|columnar] [--from DATE]
+//     [--to DATE] [--status running,finished] [--cursor CURSOR]
+//     [--limit N] [--batch-size N] [--out FILE]
+// Writes to stdout unless --out is given.
+// ============================================================
+
+const FLAG_TO_PARAM: Record<string, string> = {
+  '--format': 'format',
+  '--from': 'from',
+  '--to': 'to',
+  '--status': 'status',
+  '--cursor': 'cursor',
+  '--limit': 'limit',
+  '--batch-size': 'batchSize',
+  '--out': 'out',
+};
+
+function parseArgs(argv: string[]): Record<string, string | undefined> {
+  const params: Record<string, string | undefined> = {};
+  for (let i = 0; i < argv.length; i++) {
+    const param = FLAG_TO_PARAM[argv[i]];
+    if (!param || i + 1 >= argv.length) {
+      throw new Error(`Unknown or incomplete argument '${argv[i]}'.`);
+    }
+    params[param] = argv[++i];
+  }
+  return params;
+}
+
+async function main(): Promise<void> {
+  // Games and logs outside data/game.db would silently export as nothing
+  const kind = parseStorageKind(process.env.STORAGE_BACKEND);
+  if (kind !== 'sqlite') {
+    throw new Error(`Bulk export reads the sqlite store; STORAGE_BACKEND is '${kind}'.`);
+  }
+
+  const params = parseArgs(process.argv.slice(2));
+  const parsed = parseExportOptions(params);
+  if ('error' in parsed) {
+    throw new Error(parsed.error);
+  }
+
+  const out: Writable = params.out ? fs.createWriteStream(params.out) : process.stdout;
+  const db = openReadOnlyDb();
+  try {
+    await streamExport(db, parsed.options, out);
+  } finally {
+    db.close();
+  }
+
+  if (out !== process.stdout) {
+    await new Promise<void>((resolve, reject) => {
+      out.on('error', reject);
+      out.end(resolve);
+    });
+  }
+}
+
+main().catch((err: Error) => {
+  console.error(`[export] ${err.message}`);
+  process.exit(1);
+});
@@ -0,0 +1,103 @@
+import { createHash } from 'crypto';
+import { brotliCompressSync, gzipSync, constants as zlibConstants } from 'zlib';
+import { ALL_CARDS } from './cards';
+import { INITIAL_SERVICES } from './services';
+import { GameState, Service } from '../types/game.types';
+
+// ============================================================
+// STATIC CATALOG
+// The card catalog and map definitions never change while the process
+// runs, so each one is serialized and brotli/gzip-compressed once at
+// startup and content-hashed. The hash is both the strong ETag and the
+// version that game-state payloads use to reference static data
+// instead of repeating it.
+// ============================================================
+
+export interface StaticAsset {
+  body: Buffer;
+  gzip: Buffer;
+  br: Buffer;
+  version: string;
+  etag: string;
+}
+
+function buildAsset(value: unknown): StaticAsset {
+  const body = Buffer.from(JSON.stringify(value));
+  const version = createHash('sha256').update(body).digest('base64url').slice(0, 16);
+  return {
+    body,
+    gzip: gzipSync(body, { level: 9 }),
+    br: brotliCompressSync(body, {
+      params: {
+        [zlibConstants.BROTLI_PARAM_QUALITY]: zlibConstants.BROTLI_MAX_QUALITY,
+        [zlibConstants.BROTLI_PARAM_SIZE_HINT]: body.length,
+      },
+    }),
+    version,
+    etag: `"${version}"`,
+  };
+}
+
+const MAPS: Record<string, Record<string, Service>> = {
+  standard: INITIAL_SERVICES,
+};
+
+export const CARDS_ASSET = buildAsset({ cards: ALL_CARDS });
+
+export const MAP_ASSETS: Record<string, StaticAsset> = Object.fromEntries(
+  Object.entries(MAPS).map(([mapId, services]) => [mapId, buildAsset({ mapId, services })])
+);
+
+export const MANIFEST_ASSET = buildAsset({
+  cards: { version: CARDS_ASSET.version, url: `/api/catalog/cards/${CARDS_ASSET.version}` },
+  maps: Object.fromEntries(
+    Object.entries(MAP_ASSETS).map(([mapId, asset]) => [
+      mapId,
+      { version: asset.version, url: `/api/catalog/maps/${mapId}/${asset.version}` },
+    ])
+  ),
+});
+
+// ============================================================
+// GAME-STATE VIEWS
+// 'full' keeps every service field (the original payload); 'compact'
+// sends only the per-game fields of each service and relies on the
+// client having the map definition named by catalog.map.
+// ============================================================
+
+export type StateView = 'full' | 'compact';
+
+export interface CatalogRef {
+  cards: string;
+  mapId: string;
+  map: string | null;
+}
+
+export type ServiceStatus = Pick<Service, 'id' | 'int' | 'state'>;
+
+export type WireGameState = Omit<GameState, 'services'> & {
+  services: Record<string, Service | ServiceStatus>;
+  catalog: CatalogRef;
+};
+
+export function parseStateView(raw: unknown): StateView {
+  return raw === 'compact' ? 'compact' : 'full';
+}
+
+export function toWireState(state: GameState, view: StateView): WireGameState {
+  const mapAsset = MAP_ASSETS[state.config.mapId];
+  const catalog: CatalogRef = {
+    cards: CARDS_ASSET.version,
+    mapId: state.config.mapId,
+    map: mapAsset?.version ?? null,
+  };
+
+  // Unknown maps have no catalog entry to point at, so they stay full
+  if (view === 'full' || !mapAsset) return { ...state, catalog };
+
+  const services: Record<string, ServiceStatus> = {};
+  for (const [id, svc] of Object.entries(state.services)) {
+    services[id] = { id: svc.id, int: svc.int, state: svc.state };
+  }
+  return { ...state, services, catalog };
+}
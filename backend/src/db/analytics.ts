@@ -0,0 +1,344 @@
+import Database from 'better-sqlite3';
+import { getDb } from './database';
+import { getCard } from '../data/cards';
+import { GameMarkers, LogEntry, Service } from '../types/game.types';
+
+// ============================================================
+// LOG INDEXING
+// The logging path extracts the fields analytics needs out of the
+// opaque entry JSON into indexed columns, a per-service side table
+// (log_services) and small precomputed aggregate tables, so dashboard
+// queries never have to parse entry_json.
+// ============================================================
+
+export interface ServiceChange {
+  serviceId: string;
+  beforeState: string;
+  afterState: string;
+  beforeInt: number;
+  afterInt: number;
+}
+
+export interface LogColumns {
+  action: string;
+  actor: string | null;
+  cardId: string | null;
+  category: string | null;
+  stabilityDelta: number | null;
+  trustDelta: number | null;
+  serviceChanges: ServiceChange[];
+}
+
+function asRecord(value: unknown): Record<string, unknown> | null {
+  return typeof value === 'object' && value !== null ? (value as Record<string, unknown>) : null;
+}
+
+function diffServices(before: unknown, after: unknown): ServiceChange[] {
+  const b = asRecord(before) as Record<string, Service> | null;
+  const a = asRecord(after) as Record<string, Service> | null;
+  if (!b || !a) return [];
+
+  const changes: ServiceChange[] = [];
+  for (const [id, svc] of Object.entries(a)) {
+    const prev = b[id];
+    if (!prev || !svc) continue;
+    if (prev.state !== svc.state || prev.int !== svc.int) {
+      changes.push({
+        serviceId: id,
+        beforeState: prev.state,
+        afterState: svc.state,
+        beforeInt: prev.int,
+        afterInt: svc.int,
+      });
+    }
+  }
+  return changes;
+}
+
+export function extractLogColumns(entry: LogEntry): LogColumns {
+  const details = asRecord(entry.details);
+
+  const rawCardId = details?.cardId;
+  const rawCategory = details?.category;
+  const cardId = typeof rawCardId === 'string' ? rawCardId : null;
+  const category =
+    typeof rawCategory === 'string'
+      ? rawCategory
+      : (cardId && getCard(cardId)?.category) || null;
+
+  // CARD_PLAYED carries services in before/after; phase entries
+  // (MAINTENANCE_DONE, CASCADE_EVALUATED) carry them in details.
+  const serviceChanges = details && details.beforeServices && details.afterServices
+    ? diffServices(details.beforeServices, details.afterServices)
+    : diffServices(entry.before, entry.after);
+
+  let stabilityDelta: number | null = null;
+  let trustDelta: number | null = null;
+  const beforeMarkers = asRecord(details?.beforeMarkers) as GameMarkers | null;
+  const afterMarkers = asRecord(details?.afterMarkers) as GameMarkers | null;
+  if (beforeMarkers && afterMarkers) {
+    stabilityDelta = afterMarkers.stability - beforeMarkers.stability;
+    trustDelta = afterMarkers.trust - beforeMarkers.trust;
+  }
+
+  return {
+    action: entry.action ?? 'UNKNOWN',
+    actor: entry.actor ?? null,
+    cardId,
+    category,
+    stabilityDelta,
+    trustDelta,
+    serviceChanges,
+  };
+}
+
+// ============================================================
+// STATEMENTS
+// Prepared once per database handle (game.db, each shard file) and
+// reused by every log write.
+// ============================================================
+
+interface IndexStatements {
+  insertLog: Database.Statement;
+  insertChange: Database.Statement;
+  bumpCardPlay: Database.Statement;
+  selectPrecursors: Database.Statement;
+  bumpDown: Database.Statement;
+  bumpPrecursor: Database.Statement;
+  bumpTurnMarkers: Database.Statement;
+}
+
+const statementCache = new WeakMap<Database.Database, IndexStatements>();
+
+function statements(db: Database.Database): IndexStatements {
+  let stmts = statementCache.get(db);
+  if (stmts) return stmts;
+
+  stmts = {
+    insertLog: db.prepare(
+      `INSERT OR IGNORE INTO logs
+         (id, game_id, turn, phase, timestamp, entry_json, action, actor, card_id, category, stability_delta, trust_delta)
+       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`
+    ),
+    insertChange: db.prepare(
+      `INSERT INTO log_services (log_id, game_id, turn, service_id, before_state, after_state, before_int, after_int)
+       VALUES (?, ?, ?, ?, ?, ?, ?, ?)`
+    ),
+    bumpCardPlay: db.prepare(
+      `INSERT INTO agg_card_plays (card_id, category, plays) VALUES (?, ?, 1)
+       ON CONFLICT(card_id) DO UPDATE SET plays = plays + 1`
+    ),
+    selectPrecursors: db.prepare(
+      `SELECT DISTINCT card_id FROM logs
+       WHERE game_id = ? AND turn = ? AND action = 'CARD_PLAYED' AND timestamp <= ?`
+    ),
+    bumpDown: db.prepare(
+      `INSERT INTO agg_service_downs (service_id, downs) VALUES (?, 1)
+       ON CONFLICT(service_id) DO UPDATE SET downs = downs + 1`
+    ),
+    bumpPrecursor: db.prepare(
+      `INSERT INTO agg_down_precursors (card_id, service_id, occurrences) VALUES (?, ?, 1)
+       ON CONFLICT(card_id, service_id) DO UPDATE SET occurrences = occurrences + 1`
+    ),
+    bumpTurnMarkers: db.prepare(
+      `INSERT INTO agg_turn_markers (turn, samples, stability_delta_sum, trust_delta_sum) VALUES (?, 1, ?, ?)
+       ON CONFLICT(turn) DO UPDATE SET
+         samples = samples + 1,
+         stability_delta_sum = stability_delta_sum + excluded.stability_delta_sum,
+         trust_delta_sum = trust_delta_sum + excluded.trust_delta_sum`
+    ),
+  };
+  statementCache.set(db, stmts);
+  return stmts;
+}
+
+// ============================================================
+// indexLogEntry
+// Writes side-table rows and bumps aggregates for a log row that has
+// already been stored with its extracted columns. Must run inside the
+// same transaction as the log insert.
+// ============================================================
+
+export function indexLogEntry(
+  db: Database.Database,
+  gameId: string,
+  entry: LogEntry,
+  cols: LogColumns
+): void {
+  const stmts = statements(db);
+  for (const c of cols.serviceChanges) {
+    stmts.insertChange.run(entry.id, gameId, entry.turn, c.serviceId, c.beforeState, c.afterState, c.beforeInt, c.afterInt);
+  }
+
+  if (cols.action === 'CARD_PLAYED' && cols.cardId) {
+    stmts.bumpCardPlay.run(cols.cardId, cols.category);
+  }
+
+  const wentDown = cols.serviceChanges.filter((c) => c.afterState === 'DOWN' && c.beforeState !== 'DOWN');
+  if (wentDown.length > 0) {
+    // Cards played by either side earlier in the same turn (including this one)
+    const precursors = stmts.selectPrecursors.all(gameId, entry.turn, entry.timestamp) as { card_id: string }[];
+    for (const c of wentDown) {
+      stmts.bumpDown.run(c.serviceId);
+      for (const p of precursors) {
+        stmts.bumpPrecursor.run(p.card_id, c.serviceId);
+      }
+    }
+  }
+
+  if (cols.stabilityDelta !== null && cols.trustDelta !== null) {
+    stmts.bumpTurnMarkers.run(entry.turn, cols.stabilityDelta, cols.trustDelta);
+  }
+}
+
+// ============================================================
+// insertLogEntry
+// Stores one log row with its extracted columns and indexes it. An
+// entry that is already stored is skipped, so it is never counted twice
+// in the aggregates. Must run inside a transaction.
+// ============================================================
+
+export function insertLogEntry(db: Database.Database, gameId: string, entry: LogEntry): boolean {
+  const cols = extractLogColumns(entry);
+  const info = statements(db).insertLog.run(
+    entry.id, gameId, entry.turn, entry.phase, entry.timestamp, JSON.stringify(entry),
+    cols.action, cols.actor, cols.cardId, cols.category, cols.stabilityDelta, cols.trustDelta
+  );
+  if (info.changes === 0) return false;
+  indexLogEntry(db, gameId, entry, cols);
+  return true;
+}
+
+// ============================================================
+// backfillLogIndex
+// Indexes log history written before the analytics columns existed:
+// rows in logs without extracted columns, and games whose log was only
+// ever kept inside state_json. Processed in (game, timestamp) order
+// and in bounded chunks.
+// ============================================================
+
+const BACKFILL_CHUNK = 1000;
+const BACKFILL_GAME_CHUNK = 50;
+
+export function backfillLogIndex(db: Database.Database): number {
+  const select = db.prepare(
+    'SELECT id, game_id, entry_json FROM logs WHERE action IS NULL ORDER BY game_id, timestamp LIMIT ?'
+  );
+  const update = db.prepare(
+    `UPDATE logs SET action = ?, actor = ?, card_id = ?, category = ?, stability_delta = ?, trust_delta = ?
+     WHERE id = ?`
+  );
+
+  let total = 0;
+  const runChunk = db.transaction((rows: { id: string; game_id: string; entry_json: string }[]) => {
+    for (const row of rows) {
+      const entry = JSON.parse(row.entry_json) as LogEntry;
+      const cols = extractLogColumns(entry);
+      update.run(cols.action, cols.actor, cols.cardId, cols.category, cols.stabilityDelta, cols.trustDelta, row.id);
+      indexLogEntry(db, row.game_id, entry, cols);
+    }
+  });
+
+  for (;;) {
+    const rows = select.all(BACKFILL_CHUNK) as { id: string; game_id: string; entry_json: string }[];
+    if (rows.length === 0) break;
+    runChunk(rows);
+    total += rows.length;
+  }
+
+  // Games with a non-empty state_json.log and no rows in logs
+  const selectGames = db.prepare(
+    `SELECT id, state_json FROM games g
+     WHERE id > ?
+       AND json_array_length(json_extract(state_json, '$.log')) > 0
+       AND NOT EXISTS (SELECT 1 FROM logs l WHERE l.game_id = g.id)
+     ORDER BY id LIMIT ?`
+  );
+  const importGames = db.transaction((games: { id: string; state_json: string }[]) => {
+    let imported = 0;
+    for (const game of games) {
+      const log = (JSON.parse(game.state_json) as { log?: LogEntry[] }).log ?? [];
+      const ordered = [...log].sort((a, b) => a.timestamp - b.timestamp);
+      for (const entry of ordered) {
+        if (insertLogEntry(db, game.id, entry)) imported++;
+      }
+    }
+    return imported;
+  });
+
+  let after = '';
+  for (;;) {
+    const games = selectGames.all(after, BACKFILL_GAME_CHUNK) as { id: string; state_json: string }[];
+    if (games.length === 0) break;
+    total += importGames(games) as number;
+    after = games[games.length - 1].id;
+  }
+  return total;
+}
+
+// ============================================================
+// AGGREGATE QUERIES (facilitator dashboard)
+// ============================================================
+
+export interface TurnMarkerAverage {
+  turn: number;
+  samples: number;
+  avgStabilityDelta: number;
+  avgTrustDelta: number;
+}
+
+export function getTurnMarkerAverages(): TurnMarkerAverage[] {
+  const rows = getDb()
+    .prepare('SELECT turn, samples, stability_delta_sum, trust_delta_sum FROM agg_turn_markers ORDER BY turn ASC')
+    .all() as { turn: number; samples: number; stability_delta_sum: number; trust_delta_sum: number }[];
+
+  return rows.map((r) => ({
+    turn: r.turn,
+    samples: r.samples,
+    avgStabilityDelta: r.stability_delta_sum / r.samples,
+    avgTrustDelta: r.trust_delta_sum / r.samples,
+  }));
+}
+
+export function getServiceDownCounts(): { serviceId: string; downs: number }[] {
+  return getDb()
+    .prepare('SELECT service_id AS serviceId, downs FROM agg_service_downs ORDER BY downs DESC')
+    .all() as { serviceId: string; downs: number }[];
+}
+
+export function getCardPlayCounts(): { cardId: string; category: string | null; plays: number }[] {
+  return getDb()
+    .prepare('SELECT card_id AS cardId, category, plays FROM agg_card_plays ORDER BY plays DESC')
+    .all() as { cardId: string; category: string | null; plays: number }[];
+}
+
+export function getDownPrecursors(
+  serviceId: string | undefined,
+  limit: number
+): { cardId: string; serviceId: string; occurrences: number }[] {
+  const db = getDb();
+  if (serviceId) {
+    return db
+      .prepare(
+        `SELECT card_id AS cardId, service_id AS serviceId, occurrences FROM agg_down_precursors
+         WHERE service_id = ? ORDER BY occurrences DESC LIMIT ?`
+      )
+      .all(serviceId, limit) as { cardId: string; serviceId: string; occurrences: number }[];
+  }
+  return db
+    .prepare(
+      `SELECT card_id AS cardId, service_id AS serviceId, occurrences FROM agg_down_precursors
+       ORDER BY occurrences DESC LIMIT ?`
+    )
+    .all(limit) as { cardId: string; serviceId: string; occurrences: number }[];
+}
+
+export function getGameStatusCounts(): Record<string, number> {
+  const rows = getDb()
+    .prepare('SELECT status, COUNT(*) AS n FROM games GROUP BY status')
+    .all() as { status: string; n: number }[];
+
+  const counts: Record<string, number> = {};
+  for (const r of rows) counts[r.status] = r.n;
+  return counts;
+}
@@ -0,0 +1,463 @@
+import Database from 'better-sqlite3';
+import { Writable } from 'stream';
+import { GameState, GameStatus, LogEntry } from '../types/game.types';
+
+// ============================================================
+// BULK EXPORT
+// Streams many games (plus their players and log entries) straight
+// from SQLite iterators. Games are paged by (created_at, id) so memory
+// stays bounded by one page of game rows regardless of dataset size,
+// and every fully-written game yields a resumable cursor.
+// ============================================================
+
+export type ExportFormat = 'ndjson' | 'columnar';
+
+const EXPORT_FORMATS: ExportFormat[] = ['ndjson', 'columnar'];
+const GAME_STATUSES: GameStatus[] = ['lobby', 'running', 'paused', 'finished'];
+
+const GAME_PAGE_SIZE = 100;
+const DEFAULT_BATCH_SIZE = 500;
+const MAX_BATCH_SIZE = 10000;
+
+export interface ExportFilter {
+  from?: number; // created_at >= from (epoch ms)
+  to?: number; // created_at < to (epoch ms)
+  statuses?: GameStatus[];
+  cursor?: string; // resume after the game encoded in this cursor
+  limit?: number; // max games in this export
+}
+
+export interface ExportOptions {
+  filter: ExportFilter;
+  format: ExportFormat;
+  batchSize: number; // rows per columnar batch
+}
+
+export interface ExportGameRecord {
+  kind: 'game';
+  gameId: string;
+  createdAt: number;
+  status: GameStatus;
+  config: GameState['config'];
+  winner: GameState['winner'] | null;
+  markers: GameState['markers'];
+  services: GameState['services'];
+  campaign: GameState['campaign'];
+  servicesRecovered: string[];
+  servicesThatWentDown: string[];
+}
+
+export interface ExportPlayerRecord {
+  kind: 'player';
+  gameId: string;
+  id: string;
+  seat: string;
+  displayName: string;
+}
+
+export type ExportLogRecord = { kind: 'log'; gameId: string } & LogEntry;
+
+export interface ExportCursorRecord {
+  kind: 'cursor';
+  cursor: string;
+}
+
+export interface ExportEndRecord {
+  kind: 'end';
+  games: number;
+  cursor: string | null;
+  hasMore: boolean;
+}
+
+export type ExportRecord =
+  | ExportGameRecord
+  | ExportPlayerRecord
+  | ExportLogRecord
+  | ExportCursorRecord
+  | ExportEndRecord;
+
+// ============================================================
+// CURSORS
+// Opaque base64url of [created_at, id] of the last exported game.
+// ============================================================
+
+interface CursorPosition {
+  createdAt: number;
+  id: string;
+}
+
+export function encodeCursor(pos: CursorPosition): string {
+  return Buffer.from(JSON.stringify([pos.createdAt, pos.id])).toString('base64url');
+}
+
+export function decodeCursor(cursor: string): CursorPosition | null {
+  try {
+    const parsed = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8')) as unknown;
+    if (
+      Array.isArray(parsed) &&
+      parsed.length === 2 &&
+      typeof parsed[0] === 'number' &&
+      typeof parsed[1] === 'string'
+    ) {
+      return { createdAt: parsed[0], id: parsed[1] };
+    }
+  } catch {
+    // fall through
+  }
+  return null;
+}
+
+// ============================================================
+// OPTION PARSING (shared by the REST endpoint and the CLI)
+// ============================================================
+
+function parseTime(value: string): number | null {
+  if (/^\d+$/.test(value)) return parseInt(value, 10);
+  const ms = Date.parse(value);
+  return Number.isNaN(ms) ? null : ms;
+}
+
+function parsePositiveInt(value: string): number | null {
+  if (!/^\d+$/.test(value)) return null;
+  const n = parseInt(value, 10);
+  return n > 0 ? n : null;
+}
+
+const EXPORT_PARAMS = ['format', 'from', 'to', 'status', 'cursor', 'limit', 'batchSize'];
+
+// Accepts a raw Express query: a repeated parameter arrives as an array
+// (or an object for `a[b]=c`) and is rejected instead of crashing .split
+export function parseExportOptions(
+  query: Record<string, unknown>
+): { options: ExportOptions } | { error: string } {
+  const params: Record<string, string | undefined> = {};
+  for (const key of EXPORT_PARAMS) {
+    const value = query[key];
+    if (value !== undefined && typeof value !== 'string') {
+      return { error: `'${key}' must be given once, as a plain value.` };
+    }
+    params[key] = value;
+  }
+
+  const format = (params.format ?? 'ndjson') as ExportFormat;
+  if (!EXPORT_FORMATS.includes(format)) {
+    return { error: `format must be one of: ${EXPORT_FORMATS.join(', ')}.` };
+  }
+
+  const filter: ExportFilter = {};
+
+  if (params.from) {
+    const from = parseTime(params.from);
+    if (from === null) return { error: `Invalid 'from' date: ${params.from}.` };
+    filter.from = from;
+  }
+
+  if (params.to) {
+    const to = parseTime(params.to);
+    if (to === null) return { error: `Invalid 'to' date: ${params.to}.` };
+    filter.to = to;
+  }
+
+  if (params.status) {
+    const statuses = params.status.split(',').map((s) => s.trim()).filter(Boolean) as GameStatus[];
+    const invalid = statuses.find((s) => !GAME_STATUSES.includes(s));
+    if (invalid) return { error: `Invalid status '${invalid}'.` };
+    filter.statuses = statuses;
+  }
+
+  if (params.cursor) {
+    if (!decodeCursor(params.cursor)) return { error: 'Invalid cursor.' };
+    filter.cursor = params.cursor;
+  }
+
+  if (params.limit) {
+    const limit = parsePositiveInt(params.limit);
+    if (limit === null) return { error: 'limit must be a positive integer.' };
+    filter.limit = limit;
+  }
+
+  let batchSize = DEFAULT_BATCH_SIZE;
+  if (params.batchSize) {
+    const parsed = parsePositiveInt(params.batchSize);
+    if (parsed === null) return { error: 'batchSize must be a positive integer.' };
+    batchSize = Math.min(parsed, MAX_BATCH_SIZE);
+  }
+
+  return { options: { filter, format, batchSize } };
+}
+
+// ============================================================
+// RECORD ITERATOR
+// ============================================================
+
+interface GamePageRow {
+  id: string;
+  status: GameStatus;
+  created_at: number;
+  state_json: string;
+}
+
+export function* iterateExportRecords(
+  db: Database.Database,
+  filter: ExportFilter
+): Generator<ExportRecord> {
+  const where: string[] = [];
+  const baseParams: (string | number)[] = [];
+
+  if (filter.from !== undefined) {
+    where.push('created_at >= ?');
+    baseParams.push(filter.from);
+  }
+  if (filter.to !== undefined) {
+    where.push('created_at < ?');
+    baseParams.push(filter.to);
+  }
+  if (filter.statuses && filter.statuses.length > 0) {
+    where.push(`status IN (${filter.statuses.map(() => '?').join(', ')})`);
+    baseParams.push(...filter.statuses);
+  }
+
+  const keyset = '(created_at > ? OR (created_at = ? AND id > ?))';
+  const pageStmt = db.prepare(
+    `SELECT id, status, created_at, state_json FROM games
+     WHERE ${[keyset, ...where].join(' AND ')}
+     ORDER BY created_at ASC, id ASC
+     LIMIT ?`
+  );
+  const playersStmt = db.prepare(
+    'SELECT id, seat, display_name FROM players WHERE game_id = ? ORDER BY created_at ASC'
+  );
+  const logsStmt = db.prepare(
+    'SELECT entry_json FROM logs WHERE game_id = ? ORDER BY timestamp ASC'
+  );
+
+  let after: CursorPosition = (filter.cursor && decodeCursor(filter.cursor)) || { createdAt: -1, id: '' };
+  let lastCursor: string | null = filter.cursor ?? null;
+  const limit = filter.limit ?? Number.POSITIVE_INFINITY;
+  let exported = 0;
+  let hasMore = false;
+
+  const fetchPage = (size: number): GamePageRow[] =>
+    pageStmt.all(after.createdAt, after.createdAt, after.id, ...baseParams, size) as GamePageRow[];
+
+  for (;;) {
+    const pageSize = Math.min(GAME_PAGE_SIZE, limit - exported);
+    if (pageSize <= 0) {
+      hasMore = fetchPage(1).length > 0;
+      break;
+    }
+
+    const rows = fetchPage(pageSize);
+
+    for (const row of rows) {
+      const state = JSON.parse(row.state_json) as GameState;
+      yield {
+        kind: 'game',
+        gameId: row.id,
+        createdAt: row.created_at,
+        status: row.status,
+        config: state.config,
+        winner: state.winner ?? null,
+        markers: state.markers,
+        services: state.services,
+        campaign: state.campaign,
+        servicesRecovered: state.servicesRecovered,
+        servicesThatWentDown: state.servicesThatWentDown,
+      };
+
+      for (const p of playersStmt.iterate(row.id) as IterableIterator<{ id: string; seat: string; display_name: string }>) {
+        yield { kind: 'player', gameId: row.id, id: p.id, seat: p.seat, displayName: p.display_name };
+      }
+
+      let logRows = 0;
+      for (const l of logsStmt.iterate(row.id) as IterableIterator<{ entry_json: string }>) {
+        logRows++;
+        yield { kind: 'log', gameId: row.id, ...(JSON.parse(l.entry_json) as LogEntry) };
+      }
+      // Games stored before the logs table was written to keep their
+      // log only inside state_json
+      if (logRows === 0) {
+        for (const entry of state.log ?? []) {
+          yield { kind: 'log', gameId: row.id, ...entry };
+        }
+      }
+
+      after = { createdAt: row.created_at, id: row.id };
+      lastCursor = encodeCursor(after);
+      exported++;
+      yield { kind: 'cursor', cursor: lastCursor };
+    }
+
+    if (rows.length < pageSize) break;
+  }
+
+  yield { kind: 'end', games: exported, cursor: lastCursor, hasMore };
+}
+
+// ============================================================
+// ENCODERS
+// Both produce newline-delimited JSON. 'columnar' groups rows into
+// per-table batches of column arrays so analytics tools can load
+// them without per-row object overhead.
+// ============================================================
+
+interface ExportEncoder {
+  push(record: ExportRecord): string[];
+}
+
+class NdjsonEncoder implements ExportEncoder {
+  push(record: ExportRecord): string[] {
+    return [JSON.stringify(record)];
+  }
+}
+
+type ColumnarTable = 'games' | 'players' | 'logs';
+
+const COLUMNAR_COLUMNS: Record<ColumnarTable, string[]> = {
+  games: [
+    'gameId', 'createdAt', 'status', 'winner', 'turn', 'phase', 'stability', 'trust',
+    'turnLimit', 'budgetPerTurn', 'intermittenceMode', 'mapId', 'completedPhases',
+    'servicesRecovered', 'servicesThatWentDown', 'services',
+  ],
+  players: ['gameId', 'id', 'seat', 'displayName'],
+  logs: ['gameId', 'id', 'turn', 'phase', 'timestamp', 'action', 'actor', 'details', 'before', 'after'],
+};
+
+function toColumnarRow(record: ExportRecord): { table: ColumnarTable; row: Record<string, unknown> } | null {
+  switch (record.kind) {
+    case 'game':
+      return {
+        table: 'games',
+        row: {
+          gameId: record.gameId,
+          createdAt: record.createdAt,
+          status: record.status,
+          winner: record.winner,
+          turn: record.markers.turn,
+          phase: record.markers.phase,
+          stability: record.markers.stability,
+          trust: record.markers.trust,
+          turnLimit: record.config.turnLimit,
+          budgetPerTurn: record.config.budgetPerTurn,
+          intermittenceMode: record.config.intermittenceMode,
+          mapId: record.config.mapId,
+          completedPhases: record.campaign.completedPhases,
+          servicesRecovered: record.servicesRecovered,
+          servicesThatWentDown: record.servicesThatWentDown,
+          services: record.services,
+        },
+      };
+    case 'player':
+      return { table: 'players', row: { ...record } };
+    case 'log':
+      return { table: 'logs', row: { ...record } };
+    default:
+      return null;
+  }
+}
+
+class ColumnarEncoder implements ExportEncoder {
+  private columns = {} as Record<ColumnarTable, Record<string, unknown[]>>;
+  private rowCounts = {} as Record<ColumnarTable, number>;
+  private pendingCursor: string | null = null;
+
+  constructor(private batchSize: number) {
+    for (const table of Object.keys(COLUMNAR_COLUMNS) as ColumnarTable[]) {
+      this.resetTable(table);
+    }
+  }
+
+  push(record: ExportRecord): string[] {
+    if (record.kind === 'cursor') {
+      // A cursor may only be emitted once every row before it is on the wire
+      this.pendingCursor = record.cursor;
+      return this.bufferedRows() >= this.batchSize ? this.flushAll() : [];
+    }
+
+    if (record.kind === 'end') {
+      return [...this.flushAll(), JSON.stringify(record)];
+    }
+
+    const mapped = toColumnarRow(record);
+    if (!mapped) return [];
+
+    const cols = this.columns[mapped.table];
+    for (const name of COLUMNAR_COLUMNS[mapped.table]) {
+      cols[name].push(mapped.row[name] ?? null);
+    }
+    this.rowCounts[mapped.table]++;
+
+    return this.rowCounts[mapped.table] >= this.batchSize ? [this.flushTable(mapped.table)] : [];
+  }
+
+  private bufferedRows(): number {
+    return this.rowCounts.games + this.rowCounts.players + this.rowCounts.logs;
+  }
+
+  private resetTable(table: ColumnarTable): void {
+    const cols: Record<string, unknown[]> = {};
+    for (const name of COLUMNAR_COLUMNS[table]) cols[name] = [];
+    this.columns[table] = cols;
+    this.rowCounts[table] = 0;
+  }
+
+  private flushTable(table: ColumnarTable): string {
+    const line = JSON.stringify({
+      kind: 'batch',
+      table,
+      rows: this.rowCounts[table],
+      columns: this.columns[table],
+    });
+    this.resetTable(table);
+    return line;
+  }
+
+  private flushAll(): string[] {
+    const lines: string[] = [];
+    for (const table of Object.keys(COLUMNAR_COLUMNS) as ColumnarTable[]) {
+      if (this.rowCounts[table] > 0) lines.push(this.flushTable(table));
+    }
+    if (this.pendingCursor) {
+      lines.push(JSON.stringify({ kind: 'cursor', cursor: this.pendingCursor }));
+      this.pendingCursor = null;
+    }
+    return lines;
+  }
+}
+
+// ============================================================
+// streamExport
+// Writes the export to any Writable, honouring backpressure.
+// Stops early if the destination is closed (e.g. client abort).
+// ============================================================
+
+function waitForDrain(out: Writable): Promise<void> {
+  return new Promise((resolve) => {
+    const done = (): void => {
+      out.off('drain', done);
+      out.off('close', done);
+      resolve();
+    };
+    out.once('drain', done);
+    out.once('close', done);
+  });
+}
+
+export async function streamExport(
+  db: Database.Database,
+  options: ExportOptions,
+  out: Writable
+): Promise<void> {
+  const encoder: ExportEncoder =
+    options.format === 'columnar' ? new ColumnarEncoder(options.batchSize) : new NdjsonEncoder();
+
+  for (const record of iterateExportRecords(db, options.filter)) {
+    if (out.destroyed) return;
+    for (const line of encoder.push(record)) {
+      if (!out.write(line + '\n')) {
+        await waitForDrain(out);
+        if (out.destroyed) return;
+      }
+    }
+  }
+}
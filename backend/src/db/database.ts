@@ -4,7 +4,8 @@ import fs from 'fs';
 
 let db: Database.Database | null = null;
 
-const DB_DIR = path.resolve(__dirname, '../../data');
+// DB_DIR overrides the location (benchmarks run against a scratch directory)
+const DB_DIR = process.env.DB_DIR ? path.resolve(process.env.DB_DIR) : path.resolve(__dirname, '../../data');
 const DB_PATH = path.join(DB_DIR, 'game.db');
 
 export function getDb(): Database.Database {
@@ -12,20 +13,35 @@ export function getDb(): Database.Database {
     return db;
   }
 
+  db = openDbFile(path.basename(DB_PATH));
+  return db;
+}
+
+// Opens (creating if needed) a database file in the data directory with
+// the shared connection settings. Used for game.db and for the files of
+// the sharded storage backend (db/storage.ts).
+export function openDbFile(fileName: string): Database.Database {
   // Ensure the data directory exists
   if (!fs.existsSync(DB_DIR)) {
     fs.mkdirSync(DB_DIR, { recursive: true });
   }
 
-  db = new Database(DB_PATH);
+  const handle = new Database(path.join(DB_DIR, fileName));
 
   // Enable WAL mode for better concurrency
-  db.pragma('journal_mode = WAL');
+  handle.pragma('journal_mode = WAL');
 
   // Enable foreign key enforcement
-  db.pragma('foreign_keys = ON');
+  handle.pragma('foreign_keys = ON');
 
-  return db;
+  return handle;
+}
+
+// Opens an independent read-only connection. Long-running readers (bulk
+// exports) use their own handle so open iterators never block the shared
+// writer connection returned by getDb().
+export function openReadOnlyDb(): Database.Database {
+  return new Database(DB_PATH, { readonly: true, fileMustExist: true });
 }
 
 export function closeDb(): void {
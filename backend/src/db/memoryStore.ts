@@ -0,0 +1,126 @@
+import { GameStore, GameRow, GameSummary, GameOutcome } from './storage';
+import { GameState, Player, LogEntry } from '../types/game.types';
+
+// ============================================================
+// MEMORY STORE
+// Plain maps, nothing on disk. Values are kept as the same JSON
+// strings SQLite would hold and player/log reads return fresh objects,
+// so callers see the same aliasing behaviour as with the SQLite
+// backends. Analytics aggregates are not maintained.
+// ============================================================
+
+interface StoredLog {
+  id: string;
+  timestamp: number;
+  json: string;
+}
+
+export class MemoryStore implements GameStore {
+  readonly kind = 'memory' as const;
+
+  private readonly games = new Map<string, GameRow>();
+  private readonly players = new Map<string, Player>(); // by id
+  private readonly playersByToken = new Map<string, Player>();
+  private readonly playersByGame = new Map<string, Map<string, Player>>();
+  private readonly logs = new Map<string, StoredLog[]>(); // by game, insertion order
+  private readonly logIds = new Set<string>();
+
+  // ---- Games ----
+
+  saveGame(id: string, status: string, configJson: string, stateJson: string, createdAt: number): void {
+    const existing = this.games.get(id);
+    this.games.set(id, {
+      id,
+      status,
+      config_json: configJson,
+      state_json: stateJson,
+      created_at: existing?.created_at ?? createdAt,
+    });
+  }
+
+  loadGame(id: string): GameRow | undefined {
+    const row = this.games.get(id);
+    return row ? { ...row } : undefined;
+  }
+
+  listGames(): GameSummary[] {
+    return [...this.games.values()]
+      .map(({ id, status, created_at }) => ({ id, status, created_at }))
+      .sort((a, b) => b.created_at - a.created_at);
+  }
+
+  getGameOutcomes(ids: string[]): Map<string, GameOutcome> {
+    const out = new Map<string, GameOutcome>();
+    for (const id of ids) {
+      const row = this.games.get(id);
+      if (!row) continue;
+      const state = JSON.parse(row.state_json) as GameState;
+      out.set(id, { status: row.status, winner: state.winner ?? null });
+    }
+    return out;
+  }
+
+  loadActiveGames(): { games: GameRow[]; players: Player[] } {
+    const games = [...this.games.values()].filter((g) => g.status === 'running' || g.status === 'paused');
+    const players = games.flatMap((g) => this.getPlayersByGame(g.id));
+    return { games: games.map((g) => ({ ...g })), players };
+  }
+
+  // ---- Players ----
+
+  savePlayer(player: Player): void {
+    const previous = this.players.get(player.id);
+    if (previous) {
+      this.playersByToken.delete(previous.token);
+      this.playersByGame.get(previous.gameId)?.delete(previous.id);
+    }
+    const copy = { ...player };
+    this.players.set(player.id, copy);
+    this.playersByToken.set(player.token, copy);
+
+    let seats = this.playersByGame.get(player.gameId);
+    if (!seats) {
+      seats = new Map();
+      this.playersByGame.set(player.gameId, seats);
+    }
+    seats.set(player.id, copy);
+  }
+
+  getPlayerByToken(token: string): Player | undefined {
+    const player = this.playersByToken.get(token);
+    return player ? { ...player } : undefined;
+  }
+
+  getPlayersByGame(gameId: string): Player[] {
+    return [...(this.playersByGame.get(gameId)?.values() ?? [])].map((p) => ({ ...p }));
+  }
+
+  // ---- Logs ----
+
+  saveLogs(gameId: string, entries: LogEntry[]): void {
+    let list = this.logs.get(gameId);
+    if (!list) {
+      list = [];
+      this.logs.set(gameId, list);
+    }
+    for (const entry of entries) {
+      if (this.logIds.has(entry.id)) continue;
+      this.logIds.add(entry.id);
+      list.push({ id: entry.id, timestamp: entry.timestamp, json: JSON.stringify(entry) });
+    }
+  }
+
+  getLogsByGame(gameId: string): LogEntry[] {
+    const list = this.logs.get(gameId) ?? [];
+    return [...list].sort((a, b) => a.timestamp - b.timestamp).map((l) => JSON.parse(l.json) as LogEntry);
+  }
+
+  close(): void {
+    this.games.clear();
+    this.players.clear();
+    this.playersByToken.clear();
+    this.playersByGame.clear();
+    this.logs.clear();
+    this.logIds.clear();
+  }
+}
@@ -1,5 +1,11 @@
 import { getDb } from './database';
-import { Player, GameState, LogEntry } from '../types/game.types';
+import { backfillLogIndex } from './analytics';
+import { createGameTables } from './schema';
+import { getStore, GameRow, GameSummary, GameOutcome } from './storage';
+import { registerGauge, timeSync } from '../observability/metrics';
+import { Player, LogEntry, TurnPhase } from '../types/game.types';
+
+export type { GameRow } from './storage';
 
 // ============================================================
 // MIGRATIONS
@@ -8,78 +14,122 @@ import { Player, GameState, LogEntry } from '../types/game.types';
 export function runMigrations(): void {
   const db = getDb();
 
+  createGameTables(db);
+
+  // ---- Phase scheduler: one pending deadline per timed game ----
   db.exec(`
-    CREATE TABLE IF NOT EXISTS games (
-      id          TEXT PRIMARY KEY,
-      created_at  INTEGER NOT NULL,
-      status      TEXT NOT NULL CHECK(status IN ('lobby','running','paused','finished')),
-      config_json TEXT NOT NULL,
-      state_json  TEXT NOT NULL
+    CREATE TABLE IF NOT EXISTS phase_deadlines (
+      game_id      TEXT PRIMARY KEY REFERENCES games(id),
+      turn         INTEGER NOT NULL,
+      phase        TEXT NOT NULL,
+      deadline_at  INTEGER,
+      remaining_ms INTEGER
     );
+  `);
 
-    CREATE TABLE IF NOT EXISTS players (
-      id           TEXT PRIMARY KEY,
-      game_id      TEXT NOT NULL REFERENCES games(id),
-      seat         TEXT NOT NULL CHECK(seat IN ('BUENOSOS','MALOSOS','FACILITATOR')),
-      display_name TEXT NOT NULL,
-      token        TEXT NOT NULL UNIQUE,
-      created_at   INTEGER NOT NULL
+  // ---- Tournaments (db/tournaments.ts) ----
+  db.exec(`
+    CREATE TABLE IF NOT EXISTS tournaments (
+      id               TEXT PRIMARY KEY,
+      created_at       INTEGER NOT NULL,
+      name             TEXT NOT NULL,
+      config_json      TEXT NOT NULL,
+      facilitator_name TEXT NOT NULL,
+      auto_start       INTEGER NOT NULL,
+      organizer_token  TEXT NOT NULL UNIQUE
     );
 
-    CREATE TABLE IF NOT EXISTS logs (
-      id         TEXT PRIMARY KEY,
-      game_id    TEXT NOT NULL REFERENCES games(id),
-      turn       INTEGER NOT NULL,
-      phase      TEXT NOT NULL,
-      timestamp  INTEGER NOT NULL,
-      entry_json TEXT NOT NULL
+    CREATE TABLE IF NOT EXISTS tournament_matches (
+      tournament_id TEXT NOT NULL REFERENCES tournaments(id),
+      round         INTEGER NOT NULL,
+      slot          INTEGER NOT NULL,
+      game_id       TEXT REFERENCES games(id),
+      team_a        TEXT NOT NULL,
+      team_b        TEXT,
+      winner_team   TEXT,
+      PRIMARY KEY (tournament_id, round, slot)
     );
 
-    CREATE INDEX IF NOT EXISTS idx_players_game_id ON players(game_id);
-    CREATE INDEX IF NOT EXISTS idx_players_token   ON players(token);
-    CREATE INDEX IF NOT EXISTS idx_logs_game_id    ON logs(game_id);
+    CREATE INDEX IF NOT EXISTS idx_tournament_matches_game ON tournament_matches(game_id);
   `);
 
+  // ---- Spectators: read-only tokens for the spectator channel ----
+  db.exec(`
+    CREATE TABLE IF NOT EXISTS spectator_tokens (
+      token      TEXT PRIMARY KEY,
+      game_id    TEXT NOT NULL REFERENCES games(id),
+      created_at INTEGER NOT NULL
+    );
+  `);
+
+  const backfilled = backfillLogIndex(db);
+  if (backfilled > 0) {
+    console.log(`[DB] Indexed ${backfilled} existing log entries for analytics.`);
+  }
+
+  // Opens (and for the sharded backend, migrates) the game store
+  getStore();
+
   console.log('[DB] Migrations applied successfully.');
 }
 
+// ============================================================
+// WARM CACHE
+// Rows of the games that were live at boot (and their players), read
+// in bulk so the reconnect wave after a restart does not cost one
+// storage read per socket. saveGame/savePlayer write through; a game
+// leaves the cache once it finishes.
+// ============================================================
+
+const warmGames = new Map<string, GameRow>();
+const warmPlayers = new Map<string, Player>(); // by token
+
+registerGauge('warm_cache_games', 'Games held in the boot-time warm cache', () => warmGames.size);
+
+export function warmActiveGames(): { games: number; players: number } {
+  const active = getStore().loadActiveGames();
+  for (const row of active.games) warmGames.set(row.id, row);
+  for (const player of active.players) warmPlayers.set(player.token, player);
+  return { games: warmGames.size, players: warmPlayers.size };
+}
+
 // ============================================================
 // GAME PERSISTENCE
+// Backed by the configured GameStore (db/storage.ts)
 // ============================================================
 
 export function saveGame(
   id: string,
   status: string,
   configJson: string,
-  stateJson: string
+  stateJson: string,
+  createdAt = Date.now()
 ): void {
-  const db = getDb();
-  const now = Date.now();
-
-  const existing = db.prepare('SELECT id FROM games WHERE id = ?').get(id);
-
-  if (existing) {
-    db.prepare(
-      'UPDATE games SET status = ?, config_json = ?, state_json = ? WHERE id = ?'
-    ).run(status, configJson, stateJson, id);
-  } else {
-    db.prepare(
-      'INSERT INTO games (id, created_at, status, config_json, state_json) VALUES (?, ?, ?, ?, ?)'
-    ).run(id, now, status, configJson, stateJson);
+  getStore().saveGame(id, status, configJson, stateJson, createdAt);
+
+  const warm = warmGames.get(id);
+  if (warm) {
+    if (status === 'finished') {
+      warmGames.delete(id);
+      for (const [token, player] of warmPlayers) {
+        if (player.gameId === id) warmPlayers.delete(token);
+      }
+    } else {
+      warmGames.set(id, { ...warm, status, config_json: configJson, state_json: stateJson });
+    }
   }
 }
 
-export function loadGame(id: string): { id: string; status: string; config_json: string; state_json: string; created_at: number } | undefined {
-  const db = getDb();
-  const row = db
-    .prepare('SELECT id, status, config_json, state_json, created_at FROM games WHERE id = ?')
-    .get(id) as { id: string; status: string; config_json: string; state_json: string; created_at: number } | undefined;
-  return row;
+export function loadGame(id: string): GameRow | undefined {
+  return warmGames.get(id) ?? getStore().loadGame(id);
 }
 
-export function listGames(): { id: string; status: string; created_at: number }[] {
-  const db = getDb();
-  return db.prepare('SELECT id, status, created_at FROM games ORDER BY created_at DESC').all() as { id: string; status: string; created_at: number }[];
+export function listGames(): GameSummary[] {
+  return getStore().listGames();
+}
+
+export function getGameOutcomes(ids: string[]): Map<string, GameOutcome> {
+  return getStore().getGameOutcomes(ids);
 }
 
 // ============================================================
@@ -87,60 +137,34 @@ export function listGames(): { id: string; status: string; created_at: number }[
 // ============================================================
 
 export function savePlayer(player: Player): void {
-  const db = getDb();
-
-  const existing = db.prepare('SELECT id FROM players WHERE id = ?').get(player.id);
-
-  if (existing) {
-    db.prepare(
-      'UPDATE players SET game_id = ?, seat = ?, display_name = ?, token = ? WHERE id = ?'
-    ).run(player.gameId, player.seat, player.displayName, player.token, player.id);
-  } else {
-    db.prepare(
-      'INSERT INTO players (id, game_id, seat, display_name, token, created_at) VALUES (?, ?, ?, ?, ?, ?)'
-    ).run(
-      player.id,
-      player.gameId,
-      player.seat,
-      player.displayName,
-      player.token,
-      player.createdAt
-    );
-  }
+  getStore().savePlayer(player);
+  if (warmPlayers.has(player.token)) warmPlayers.set(player.token, player);
 }
 
 export function getPlayerByToken(token: string): Player | undefined {
-  const db = getDb();
-  const row = db
-    .prepare('SELECT id, game_id, seat, display_name, token, created_at FROM players WHERE token = ?')
-    .get(token) as { id: string; game_id: string; seat: string; display_name: string; token: string; created_at: number } | undefined;
-
-  if (!row) return undefined;
-
-  return {
-    id: row.id,
-    gameId: row.game_id,
-    seat: row.seat as Player['seat'],
-    displayName: row.display_name,
-    token: row.token,
-    createdAt: row.created_at,
-  };
+  return warmPlayers.get(token) ?? getStore().getPlayerByToken(token);
 }
 
 export function getPlayersByGame(gameId: string): Player[] {
-  const db = getDb();
-  const rows = db
-    .prepare('SELECT id, game_id, seat, display_name, token, created_at FROM players WHERE game_id = ?')
-    .all(gameId) as { id: string; game_id: string; seat: string; display_name: string; token: string; created_at: number }[];
+  return getStore().getPlayersByGame(gameId);
+}
 
-  return rows.map((row) => ({
-    id: row.id,
-    gameId: row.game_id,
-    seat: row.seat as Player['seat'],
-    displayName: row.display_name,
-    token: row.token,
-    createdAt: row.created_at,
-  }));
+// ============================================================
+// SPECTATOR TOKENS
+// Read-only: they only open the spectator channel of one game.
+// ============================================================
+
+export function saveSpectatorToken(gameId: string, token: string): void {
+  getDb()
+    .prepare('INSERT INTO spectator_tokens (token, game_id, created_at) VALUES (?, ?, ?)')
+    .run(token, gameId, Date.now());
+}
+
+export function getSpectatorGameId(token: string): string | undefined {
+  const row = timeSync('db_read_seconds', 'getSpectatorGameId', () =>
+    getDb().prepare('SELECT game_id FROM spectator_tokens WHERE token = ?').get(token)
+  ) as { game_id: string } | undefined;
+  return row?.game_id;
 }
 
 // ============================================================
@@ -153,19 +177,58 @@ export function saveLog(
   phase: string,
   entryJson: string
 ): void {
-  const db = getDb();
   const entry = JSON.parse(entryJson) as LogEntry;
+  getStore().saveLogs(gameId, [{ ...entry, turn, phase: phase as TurnPhase }]);
+}
 
-  db.prepare(
-    'INSERT INTO logs (id, game_id, turn, phase, timestamp, entry_json) VALUES (?, ?, ?, ?, ?, ?)'
-  ).run(entry.id, gameId, turn, phase, entry.timestamp, entryJson);
+// Persists the given entries (typically the ones appended by a single
+// engine call) in one transaction.
+export function saveLogs(gameId: string, entries: LogEntry[]): void {
+  getStore().saveLogs(gameId, entries);
 }
 
 export function getLogsByGame(gameId: string): LogEntry[] {
-  const db = getDb();
-  const rows = db
-    .prepare('SELECT entry_json FROM logs WHERE game_id = ? ORDER BY timestamp ASC')
-    .all(gameId) as { entry_json: string }[];
+  return getStore().getLogsByGame(gameId);
+}
+
+// ============================================================
+// PHASE DEADLINES (scheduler/phaseScheduler.ts)
+// deadline_at is set while the timer runs; remaining_ms while paused.
+// ============================================================
+
+export interface PhaseDeadline {
+  gameId: string;
+  turn: number;
+  phase: TurnPhase;
+  deadlineAt: number | null;
+  remainingMs: number | null;
+}
 
-  return rows.map((row) => JSON.parse(row.entry_json) as LogEntry);
+export function savePhaseDeadline(d: PhaseDeadline): void {
+  getDb()
+    .prepare(
+      `INSERT INTO phase_deadlines (game_id, turn, phase, deadline_at, remaining_ms) VALUES (?, ?, ?, ?, ?)
+       ON CONFLICT(game_id) DO UPDATE SET
+         turn = excluded.turn, phase = excluded.phase,
+         deadline_at = excluded.deadline_at, remaining_ms = excluded.remaining_ms`
+    )
+    .run(d.gameId, d.turn, d.phase, d.deadlineAt, d.remainingMs);
+}
+
+export function deletePhaseDeadline(gameId: string): void {
+  getDb().prepare('DELETE FROM phase_deadlines WHERE game_id = ?').run(gameId);
+}
+
+export function loadPhaseDeadlines(): PhaseDeadline[] {
+  const rows = getDb()
+    .prepare('SELECT game_id, turn, phase, deadline_at, remaining_ms FROM phase_deadlines')
+    .all() as { game_id: string; turn: number; phase: string; deadline_at: number | null; remaining_ms: number | null }[];
+
+  return rows.map((row) => ({
+    gameId: row.game_id,
+    turn: row.turn,
+    phase: row.phase as TurnPhase,
+    deadlineAt: row.deadline_at,
+    remainingMs: row.remaining_ms,
+  }));
 }
@@ -0,0 +1,104 @@
+import Database from 'better-sqlite3';
+
+// ============================================================
+// GAME TABLES
+// games, players and logs plus the analytics columns/tables that
+// insertLogEntry() writes. Created in the main database by
+// runMigrations() and in every file of the sharded storage backend.
+// ============================================================
+
+export function createGameTables(db: Database.Database): void {
+  db.exec(`
+    CREATE TABLE IF NOT EXISTS games (
+      id          TEXT PRIMARY KEY,
+      created_at  INTEGER NOT NULL,
+      status      TEXT NOT NULL CHECK(status IN ('lobby','running','paused','finished')),
+      config_json TEXT NOT NULL,
+      state_json  TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS players (
+      id           TEXT PRIMARY KEY,
+      game_id      TEXT NOT NULL REFERENCES games(id),
+      seat         TEXT NOT NULL CHECK(seat IN ('BUENOSOS','MALOSOS','FACILITATOR')),
+      display_name TEXT NOT NULL,
+      token        TEXT NOT NULL UNIQUE,
+      created_at   INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS logs (
+      id         TEXT PRIMARY KEY,
+      game_id    TEXT NOT NULL REFERENCES games(id),
+      turn       INTEGER NOT NULL,
+      phase      TEXT NOT NULL,
+      timestamp  INTEGER NOT NULL,
+      entry_json TEXT NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_players_game_id ON players(game_id);
+    CREATE INDEX IF NOT EXISTS idx_players_token   ON players(token);
+    CREATE INDEX IF NOT EXISTS idx_logs_game_id    ON logs(game_id);
+    CREATE INDEX IF NOT EXISTS idx_games_created   ON games(created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_games_status    ON games(status);
+  `);
+
+  // ---- Analytics: extracted log columns, side table, aggregates ----
+  addColumnIfMissing(db, 'logs', 'action', 'TEXT');
+  addColumnIfMissing(db, 'logs', 'actor', 'TEXT');
+  addColumnIfMissing(db, 'logs', 'card_id', 'TEXT');
+  addColumnIfMissing(db, 'logs', 'category', 'TEXT');
+  addColumnIfMissing(db, 'logs', 'stability_delta', 'INTEGER');
+  addColumnIfMissing(db, 'logs', 'trust_delta', 'INTEGER');
+
+  db.exec(`
+    CREATE TABLE IF NOT EXISTS log_services (
+      log_id       TEXT NOT NULL REFERENCES logs(id),
+      game_id      TEXT NOT NULL,
+      turn         INTEGER NOT NULL,
+      service_id   TEXT NOT NULL,
+      before_state TEXT NOT NULL,
+      after_state  TEXT NOT NULL,
+      before_int   INTEGER NOT NULL,
+      after_int    INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS agg_card_plays (
+      card_id  TEXT PRIMARY KEY,
+      category TEXT,
+      plays    INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS agg_service_downs (
+      service_id TEXT PRIMARY KEY,
+      downs      INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS agg_down_precursors (
+      card_id     TEXT NOT NULL,
+      service_id  TEXT NOT NULL,
+      occurrences INTEGER NOT NULL,
+      PRIMARY KEY (card_id, service_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS agg_turn_markers (
+      turn                INTEGER PRIMARY KEY,
+      samples             INTEGER NOT NULL,
+      stability_delta_sum INTEGER NOT NULL,
+      trust_delta_sum     INTEGER NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_logs_game_ts          ON logs(game_id, timestamp);
+    CREATE INDEX IF NOT EXISTS idx_logs_game_turn_action ON logs(game_id, turn, action);
+    CREATE INDEX IF NOT EXISTS idx_logs_action           ON logs(action);
+    CREATE INDEX IF NOT EXISTS idx_logs_card_id          ON logs(card_id);
+    CREATE INDEX IF NOT EXISTS idx_log_services_service  ON log_services(service_id, after_state);
+    CREATE INDEX IF NOT EXISTS idx_log_services_game     ON log_services(game_id, turn);
+  `);
+}
+
+function addColumnIfMissing(db: Database.Database, table: string, column: string, type: string): void {
+  const columns = db.prepare(`PRAGMA table_info(${table})`).all() as { name: string }[];
+  if (!columns.some((c) => c.name === column)) {
+    db.exec(`ALTER TABLE ${table} ADD COLUMN ${column} ${type}`);
+  }
+}
@@ -0,0 +1,119 @@
+import Database from 'better-sqlite3';
+import { createGameTables } from './schema';
+import { SqliteStore } from './sqliteStore';
+import { GameStore, GameRow, GameSummary, GameOutcome } from './storage';
+import { registerCounter } from '../observability/metrics';
+import { fnv1a } from '../util/hash';
+import { Player, LogEntry } from '../types/game.types';
+
+// ============================================================
+// SHARDED SQLITE STORE
+// One SqliteStore per file; a game, its players and its logs live in
+// shard fnv1a(gameId) % N, so every per-game operation touches exactly
+// one file. Each file has its own writer lock and WAL, and checkpoints
+// one shard's worth of writes. Lookups by token do not know the game
+// and try each shard (one indexed query per shard); cross-game listings
+// merge all shards.
+// ============================================================
+
+export function shardOf(gameId: string, shards: number): number {
+  return fnv1a(gameId) % shards;
+}
+
+export class ShardedSqliteStore implements GameStore {
+  readonly kind = 'sharded' as const;
+  private readonly shards: SqliteStore[];
+  private readonly writes: number[];
+
+  constructor(files: Database.Database[]) {
+    this.shards = files.map((db) => {
+      createGameTables(db);
+      return new SqliteStore(db);
+    });
+    this.writes = files.map(() => 0);
+
+    this.shards.forEach((_, i) =>
+      registerCounter(`storage_shard_${i}_writes_total`, `Game and log writes routed to shard ${i}`, () => this.writes[i])
+    );
+  }
+
+  private forGame(gameId: string, write = false): SqliteStore {
+    const i = shardOf(gameId, this.shards.length);
+    if (write) this.writes[i]++;
+    return this.shards[i];
+  }
+
+  // ---- Games ----
+
+  saveGame(id: string, status: string, configJson: string, stateJson: string, createdAt: number): void {
+    this.forGame(id, true).saveGame(id, status, configJson, stateJson, createdAt);
+  }
+
+  loadGame(id: string): GameRow | undefined {
+    return this.forGame(id).loadGame(id);
+  }
+
+  listGames(): GameSummary[] {
+    return this.shards.flatMap((s) => s.listGames()).sort((a, b) => b.created_at - a.created_at);
+  }
+
+  getGameOutcomes(ids: string[]): Map<string, GameOutcome> {
+    const byShard = new Map<SqliteStore, string[]>();
+    for (const id of ids) {
+      const shard = this.forGame(id);
+      const list = byShard.get(shard);
+      if (list) list.push(id);
+      else byShard.set(shard, [id]);
+    }
+
+    const out = new Map<string, GameOutcome>();
+    for (const [shard, shardIds] of byShard) {
+      for (const [id, outcome] of shard.getGameOutcomes(shardIds)) out.set(id, outcome);
+    }
+    return out;
+  }
+
+  loadActiveGames(): { games: GameRow[]; players: Player[] } {
+    const games: GameRow[] = [];
+    const players: Player[] = [];
+    for (const shard of this.shards) {
+      const active = shard.loadActiveGames();
+      games.push(...active.games);
+      players.push(...active.players);
+    }
+    return { games, players };
+  }
+
+  // ---- Players ----
+
+  savePlayer(player: Player): void {
+    this.forGame(player.gameId, true).savePlayer(player);
+  }
+
+  getPlayerByToken(token: string): Player | undefined {
+    for (const shard of this.shards) {
+      const player = shard.getPlayerByToken(token);
+      if (player) return player;
+    }
+    return undefined;
+  }
+
+  getPlayersByGame(gameId: string): Player[] {
+    return this.forGame(gameId).getPlayersByGame(gameId);
+  }
+
+  // ---- Logs ----
+
+  saveLogs(gameId: string, entries: LogEntry[]): void {
+    if (entries.length === 0) return;
+    this.forGame(gameId, true).saveLogs(gameId, entries);
+  }
+
+  getLogsByGame(gameId: string): LogEntry[] {
+    return this.forGame(gameId).getLogsByGame(gameId);
+  }
+
+  close(): void {
+    for (const shard of this.shards) shard.close();
+  }
+}
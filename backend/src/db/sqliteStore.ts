@@ -0,0 +1,148 @@
+import Database from 'better-sqlite3';
+import { insertLogEntry } from './analytics';
+import { GameStore, GameRow, GameSummary, GameOutcome } from './storage';
+import { timeSync } from '../observability/metrics';
+import { Player, LogEntry, Seat } from '../types/game.types';
+
+// ============================================================
+// SQLITE STORE
+// Games, players and logs in one SQLite file. Used directly for the
+// default backend (on the main game.db handle) and once per file by
+// the sharded backend. Tables must exist (createGameTables) before
+// construction; statements are prepared once (the log insert and
+// analytics statements once per handle, in analytics.ts).
+// ============================================================
+
+type PlayerRow = { id: string; game_id: string; seat: string; display_name: string; token: string; created_at: number };
+
+const ACTIVE = "('running','paused')";
+
+function toPlayer(row: PlayerRow): Player {
+  return {
+    id: row.id,
+    gameId: row.game_id,
+    seat: row.seat as Player['seat'],
+    displayName: row.display_name,
+    token: row.token,
+    createdAt: row.created_at,
+  };
+}
+
+export class SqliteStore implements GameStore {
+  readonly kind = 'sqlite' as const;
+
+  private readonly upsertGame: Database.Statement;
+  private readonly selectGame: Database.Statement;
+  private readonly selectSummaries: Database.Statement;
+  private readonly selectOutcomes: Database.Statement;
+  private readonly selectActiveGames: Database.Statement;
+  private readonly selectActivePlayers: Database.Statement;
+  private readonly upsertPlayer: Database.Statement;
+  private readonly selectPlayerByToken: Database.Statement;
+  private readonly selectPlayersByGame: Database.Statement;
+  private readonly selectLogs: Database.Statement;
+
+  constructor(readonly db: Database.Database) {
+    this.upsertGame = db.prepare(
+      `INSERT INTO games (id, created_at, status, config_json, state_json) VALUES (?, ?, ?, ?, ?)
+       ON CONFLICT(id) DO UPDATE SET
+         status = excluded.status, config_json = excluded.config_json, state_json = excluded.state_json`
+    );
+    this.selectGame = db.prepare('SELECT id, status, config_json, state_json, created_at FROM games WHERE id = ?');
+    this.selectSummaries = db.prepare('SELECT id, status, created_at FROM games ORDER BY created_at DESC');
+    this.selectOutcomes = db.prepare(
+      `SELECT id, status, json_extract(state_json, '$.winner') AS winner
+       FROM games WHERE id IN (SELECT value FROM json_each(?))`
+    );
+    this.selectActiveGames = db.prepare(
+      `SELECT id, status, config_json, state_json, created_at FROM games WHERE status IN ${ACTIVE}`
+    );
+    this.selectActivePlayers = db.prepare(
+      `SELECT p.id, p.game_id, p.seat, p.display_name, p.token, p.created_at
+       FROM players p JOIN games g ON g.id = p.game_id
+       WHERE g.status IN ${ACTIVE}`
+    );
+    this.upsertPlayer = db.prepare(
+      `INSERT INTO players (id, game_id, seat, display_name, token, created_at) VALUES (?, ?, ?, ?, ?, ?)
+       ON CONFLICT(id) DO UPDATE SET
+         game_id = excluded.game_id, seat = excluded.seat,
+         display_name = excluded.display_name, token = excluded.token`
+    );
+    this.selectPlayerByToken = db.prepare(
+      'SELECT id, game_id, seat, display_name, token, created_at FROM players WHERE token = ?'
+    );
+    this.selectPlayersByGame = db.prepare(
+      'SELECT id, game_id, seat, display_name, token, created_at FROM players WHERE game_id = ?'
+    );
+    this.selectLogs = db.prepare('SELECT entry_json FROM logs WHERE game_id = ? ORDER BY timestamp ASC');
+  }
+
+  // ---- Games ----
+
+  saveGame(id: string, status: string, configJson: string, stateJson: string, createdAt: number): void {
+    timeSync('db_write_seconds', 'saveGame', () => {
+      this.upsertGame.run(id, createdAt, status, configJson, stateJson);
+    });
+  }
+
+  loadGame(id: string): GameRow | undefined {
+    return timeSync('db_read_seconds', 'loadGame', () => this.selectGame.get(id)) as GameRow | undefined;
+  }
+
+  listGames(): GameSummary[] {
+    return this.selectSummaries.all() as GameSummary[];
+  }
+
+  getGameOutcomes(ids: string[]): Map<string, GameOutcome> {
+    const out = new Map<string, GameOutcome>();
+    if (ids.length === 0) return out;
+    const rows = this.selectOutcomes.all(JSON.stringify(ids)) as { id: string; status: string; winner: string | null }[];
+    for (const r of rows) out.set(r.id, { status: r.status, winner: r.winner as Seat | null });
+    return out;
+  }
+
+  loadActiveGames(): { games: GameRow[]; players: Player[] } {
+    return timeSync('db_read_seconds', 'loadActiveGames', () => ({
+      games: this.selectActiveGames.all() as GameRow[],
+      players: (this.selectActivePlayers.all() as PlayerRow[]).map(toPlayer),
+    }));
+  }
+
+  // ---- Players ----
+
+  savePlayer(player: Player): void {
+    this.upsertPlayer.run(player.id, player.gameId, player.seat, player.displayName, player.token, player.createdAt);
+  }
+
+  getPlayerByToken(token: string): Player | undefined {
+    const row = timeSync('db_read_seconds', 'getPlayerByToken', () => this.selectPlayerByToken.get(token)) as
+      | PlayerRow
+      | undefined;
+    return row ? toPlayer(row) : undefined;
+  }
+
+  getPlayersByGame(gameId: string): Player[] {
+    return (this.selectPlayersByGame.all(gameId) as PlayerRow[]).map(toPlayer);
+  }
+
+  // ---- Logs ----
+
+  // Persists the given entries (typically the ones appended by a single
+  // engine call) in one transaction.
+  saveLogs(gameId: string, entries: LogEntry[]): void {
+    if (entries.length === 0) return;
+    timeSync('db_write_seconds', 'saveLogs', () =>
+      this.db.transaction(() => {
+        for (const entry of entries) insertLogEntry(this.db, gameId, entry);
+      })()
+    );
+  }
+
+  getLogsByGame(gameId: string): LogEntry[] {
+    return (this.selectLogs.all(gameId) as { entry_json: string }[]).map((row) => JSON.parse(row.entry_json) as LogEntry);
+  }
+
+  close(): void {
+    this.db.close();
+  }
+}
@@ -0,0 +1,122 @@
+import { getDb, openDbFile } from './database';
+import { SqliteStore } from './sqliteStore';
+import { ShardedSqliteStore } from './shardedStore';
+import { MemoryStore } from './memoryStore';
+import { Player, LogEntry, Seat } from '../types/game.types';
+
+// ============================================================
+// STORAGE BACKENDS
+// Games, players and logs go through a GameStore, selected with
+// STORAGE_BACKEND:
+//
+//   sqlite  (default) everything in data/game.db, as before
+//   sharded games spread over STORAGE_SHARDS files (data/game-shard-N.db)
+//           by gameId hash, so writes and WAL checkpoints of different
+//           games do not contend on one writer
+//   memory  nothing on disk; for benchmarks and tests
+//
+// The main database (getDb()) always holds the rest: tournaments,
+// phase deadlines and spectator tokens. Analytics and bulk export read
+// game tables from the main database, so they only cover the sqlite
+// backend.
+// ============================================================
+
+export type StorageKind = 'sqlite' | 'sharded' | 'memory';
+
+export interface GameRow {
+  id: string;
+  status: string;
+  config_json: string;
+  state_json: string;
+  created_at: number;
+}
+
+export interface GameSummary {
+  id: string;
+  status: string;
+  created_at: number;
+}
+
+export interface GameOutcome {
+  status: string;
+  winner: Seat | null;
+}
+
+export interface GameStore {
+  readonly kind: StorageKind;
+
+  saveGame(id: string, status: string, configJson: string, stateJson: string, createdAt: number): void;
+  loadGame(id: string): GameRow | undefined;
+  listGames(): GameSummary[];
+  // Status and winner of many games without handing full states to JS
+  getGameOutcomes(ids: string[]): Map<string, GameOutcome>;
+  // running/paused games and their players, for the boot-time warm cache
+  loadActiveGames(): { games: GameRow[]; players: Player[] };
+
+  savePlayer(player: Player): void;
+  getPlayerByToken(token: string): Player | undefined;
+  getPlayersByGame(gameId: string): Player[];
+
+  saveLogs(gameId: string, entries: LogEntry[]): void;
+  getLogsByGame(gameId: string): LogEntry[];
+
+  close(): void;
+}
+
+export function parseStorageKind(raw: string | undefined): StorageKind {
+  if (raw === undefined || raw === '' || raw === 'sqlite') return 'sqlite';
+  if (raw === 'sharded' || raw === 'memory') return raw;
+  throw new Error(`Unknown STORAGE_BACKEND '${raw}' (expected sqlite, sharded or memory).`);
+}
+
+// ============================================================
+// PROCESS-WIDE STORE
+// Created on first use, after runMigrations() has prepared the main
+// database.
+// ============================================================
+
+let store: GameStore | null = null;
+
+function createStore(): GameStore {
+  const kind = parseStorageKind(process.env.STORAGE_BACKEND);
+  if (kind === 'sqlite') return new SqliteStore(getDb());
+
+  // Game rows live outside the main database, so its references to
+  // games(id) can no longer be enforced there
+  getDb().pragma('foreign_keys = OFF');
+
+  if (kind === 'memory') return new MemoryStore();
+
+  const shards = parseInt(process.env.STORAGE_SHARDS ?? '', 10) || 4;
+  checkShardCount(shards);
+  return new ShardedSqliteStore(
+    Array.from({ length: shards }, (_, i) => openDbFile(`game-shard-${i}.db`))
+  );
+}
+
+// Changing the shard count would silently hide every existing game
+// behind a different hash, so it is pinned on first use
+function checkShardCount(shards: number): void {
+  const db = getDb();
+  db.exec('CREATE TABLE IF NOT EXISTS storage_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)');
+  const row = db.prepare("SELECT value FROM storage_meta WHERE key = 'shards'").get() as { value: string } | undefined;
+  if (!row) {
+    db.prepare("INSERT INTO storage_meta (key, value) VALUES ('shards', ?)").run(String(shards));
+  } else if (parseInt(row.value, 10) !== shards) {
+    throw new Error(`STORAGE_SHARDS=${shards} but existing data was written with ${row.value} shards.`);
+  }
+}
+
+export function getStore(): GameStore {
+  if (!store) {
+    store = createStore();
+    console.log(`[DB] Storage backend: ${store.kind}`);
+  }
+  return store;
+}
+
+export function closeStore(): void {
+  // The sqlite store shares the main handle; closeDb() closes it
+  if (store && store.kind !== 'sqlite') store.close();
+  store = null;
+}
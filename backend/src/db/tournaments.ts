@@ -0,0 +1,160 @@
+import { getDb } from './database';
+import { saveGame, savePlayer, saveLogs, getGameOutcomes } from './migrations';
+import { timeSync } from '../observability/metrics';
+import { GameState, Player, Seat } from '../types/game.types';
+
+// ============================================================
+// TOURNAMENTS
+// A tournament is a single-elimination bracket of matches. Match
+// (round, slot) is fed by slots 2*slot and 2*slot + 1 of the previous
+// round; team_a plays MALOSOS and team_b BUENOSOS. A match without
+// team_b is a bye and is decided on creation. Tables are created in
+// runMigrations().
+// ============================================================
+
+export interface TournamentRow {
+  id: string;
+  createdAt: number;
+  name: string;
+  configJson: string;
+  facilitatorName: string;
+  autoStart: boolean;
+}
+
+export interface MatchRow {
+  round: number;
+  slot: number;
+  gameId: string | null;
+  teamA: string;
+  teamB: string | null;
+  winnerTeam: string | null;
+  gameStatus: string | null;
+  winnerSeat: Seat | null;
+}
+
+// Everything one provisioned match writes: its game (if not a bye),
+// the three seats and the bracket row.
+export interface ProvisionedMatch {
+  round: number;
+  slot: number;
+  teamA: string;
+  teamB: string | null;
+  state: GameState | null;
+  players: Player[];
+}
+
+// ============================================================
+// WRITES — one transaction per batch, statements prepared once
+// ============================================================
+
+export function createTournament(t: TournamentRow & { organizerToken: string }, matches: ProvisionedMatch[]): void {
+  const db = getDb();
+  db.transaction(() => {
+    db.prepare(
+      `INSERT INTO tournaments (id, created_at, name, config_json, facilitator_name, auto_start, organizer_token)
+       VALUES (?, ?, ?, ?, ?, ?, ?)`
+    ).run(t.id, t.createdAt, t.name, t.configJson, t.facilitatorName, t.autoStart ? 1 : 0, t.organizerToken);
+    insertMatches(t.id, matches);
+  })();
+}
+
+// Records winners decided since the last call and opens the next
+// matches in one transaction
+export function advanceBracket(
+  tournamentId: string,
+  decided: { round: number; slot: number; team: string }[],
+  matches: ProvisionedMatch[]
+): void {
+  const db = getDb();
+  const setWinner = db.prepare(
+    'UPDATE tournament_matches SET winner_team = ? WHERE tournament_id = ? AND round = ? AND slot = ?'
+  );
+  db.transaction(() => {
+    for (const d of decided) setWinner.run(d.team, tournamentId, d.round, d.slot);
+    insertMatches(tournamentId, matches);
+  })();
+}
+
+// Games and players go through the game store; with the default sqlite
+// backend they share the main connection and therefore the caller's
+// transaction.
+function insertMatches(tournamentId: string, matches: ProvisionedMatch[]): void {
+  const db = getDb();
+  const insertMatch = db.prepare(
+    `INSERT INTO tournament_matches (tournament_id, round, slot, game_id, team_a, team_b, winner_team)
+     VALUES (?, ?, ?, ?, ?, ?, ?)`
+  );
+
+  timeSync('db_write_seconds', 'provisionMatches', () => {
+    for (const m of matches) {
+      if (m.state) {
+        const s = m.state;
+        saveGame(s.id, s.status, JSON.stringify(s.config), JSON.stringify(s), s.createdAt);
+        saveLogs(s.id, s.log);
+      }
+      for (const p of m.players) savePlayer(p);
+      insertMatch.run(tournamentId, m.round, m.slot, m.state?.id ?? null, m.teamA, m.teamB, m.teamB === null ? m.teamA : null);
+    }
+  });
+}
+
+// ============================================================
+// READS
+// ============================================================
+
+export function getTournamentByToken(organizerToken: string): TournamentRow | undefined {
+  const row = getDb()
+    .prepare(
+      `SELECT id, created_at, name, config_json, facilitator_name, auto_start
+       FROM tournaments WHERE organizer_token = ?`
+    )
+    .get(organizerToken) as
+    | { id: string; created_at: number; name: string; config_json: string; facilitator_name: string; auto_start: number }
+    | undefined;
+
+  if (!row) return undefined;
+  return {
+    id: row.id,
+    createdAt: row.created_at,
+    name: row.name,
+    configJson: row.config_json,
+    facilitatorName: row.facilitator_name,
+    autoStart: row.auto_start === 1,
+  };
+}
+
+// Game status and winner come from the store in one batch (json_extract
+// on SQLite), so listing a bracket never parses full game states in JS.
+export function getMatches(tournamentId: string): MatchRow[] {
+  const rows = getDb()
+    .prepare(
+      `SELECT round, slot, game_id, team_a, team_b, winner_team
+       FROM tournament_matches
+       WHERE tournament_id = ?
+       ORDER BY round, slot`
+    )
+    .all(tournamentId) as {
+    round: number;
+    slot: number;
+    game_id: string | null;
+    team_a: string;
+    team_b: string | null;
+    winner_team: string | null;
+  }[];
+
+  const outcomes = getGameOutcomes(rows.flatMap((r) => (r.game_id ? [r.game_id] : [])));
+
+  return rows.map((r) => {
+    const outcome = r.game_id ? outcomes.get(r.game_id) : undefined;
+    return {
+      round: r.round,
+      slot: r.slot,
+      gameId: r.game_id,
+      teamA: r.team_a,
+      teamB: r.team_b,
+      winnerTeam: r.winner_team,
+      gameStatus: outcome?.status ?? null,
+      winnerSeat: outcome?.winner ?? null,
+    };
+  });
+}
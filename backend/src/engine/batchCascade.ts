@@ -0,0 +1,345 @@
+import { Service, ServiceState, TemporaryEffect } from '../types/game.types';
+
+// ============================================================
+// BATCHED CASCADE EVALUATION
+// Evaluates resolveCascades + resolveIntermittence for many games at
+// once. Service INT/state live in flat typed arrays (games × services)
+// over a dependency graph compiled once per map, and each wave is a
+// single loop over every game, with no per-node object allocation.
+//
+// Semantics mirror engine/cascade.ts exactly (same wave snapshotting,
+// same tie-breaks, same last-writer-wins in intermittence); the
+// differential tests in test/batchCascade.test.ts hold it to that.
+// ============================================================
+
+const MAX_WAVES = 3;
+
+export const STATE_OK = 0;
+export const STATE_DEGRADED = 1;
+export const STATE_INTERMITTENT = 2;
+export const STATE_DOWN = 3;
+
+export const STATE_CODES: Record<ServiceState, number> = {
+  OK: STATE_OK,
+  DEGRADED: STATE_DEGRADED,
+  INTERMITTENT: STATE_INTERMITTENT,
+  DOWN: STATE_DOWN,
+};
+export const STATE_NAMES: ServiceState[] = ['OK', 'DEGRADED', 'INTERMITTENT', 'DOWN'];
+
+// ============================================================
+// COMPILED MAP
+// Dependencies and dependents in CSR form (offsets + flat indices).
+// Edge e = depIndices[e] is a dependency of the service whose range
+// [depOffsets[i], depOffsets[i + 1]) contains e.
+// ============================================================
+
+export interface CompiledMap {
+  ids: string[];
+  index: Map<string, number>;
+  crit: Uint8Array;
+  depOffsets: Uint32Array;
+  depIndices: Uint32Array;
+  dependentOffsets: Uint32Array;
+  dependentIndices: Uint32Array;
+}
+
+export function compileMap(services: Record<string, Service>): CompiledMap {
+  const ids = Object.keys(services);
+  const index = new Map(ids.map((id, i) => [id, i] as [string, number]));
+  const n = ids.length;
+
+  const crit = new Uint8Array(n);
+  const depOffsets = new Uint32Array(n + 1);
+  const deps: number[] = [];
+  const dependents: number[][] = ids.map(() => []);
+
+  ids.forEach((id, i) => {
+    const svc = services[id];
+    crit[i] = svc.crit;
+    depOffsets[i] = deps.length;
+    for (const depId of svc.dependencies) {
+      const d = index.get(depId);
+      if (d === undefined) continue; // unknown ids are skipped by the engine too
+      deps.push(d);
+      // Dependents are unique and in key order (Object.values order)
+      if (d !== i && !dependents[d].includes(i)) dependents[d].push(i);
+    }
+  });
+  depOffsets[n] = deps.length;
+
+  const dependentOffsets = new Uint32Array(n + 1);
+  const flatDependents: number[] = [];
+  for (let i = 0; i < n; i++) {
+    dependentOffsets[i] = flatDependents.length;
+    for (const j of dependents[i].sort((a, b) => a - b)) flatDependents.push(j);
+  }
+  dependentOffsets[n] = flatDependents.length;
+
+  return {
+    ids,
+    index,
+    crit,
+    depOffsets,
+    depIndices: Uint32Array.from(deps),
+    dependentOffsets,
+    dependentIndices: Uint32Array.from(flatDependents),
+  };
+}
+
+function sameTopology(map: CompiledMap, services: Record<string, Service>): boolean {
+  const ids = Object.keys(services);
+  if (ids.length !== map.ids.length) return false;
+  for (let i = 0; i < ids.length; i++) {
+    if (ids[i] !== map.ids[i]) return false;
+    const svc = services[ids[i]];
+    if (svc.crit !== map.crit[i]) return false;
+    const known = svc.dependencies.filter((d) => map.index.has(d));
+    const start = map.depOffsets[i];
+    if (known.length !== map.depOffsets[i + 1] - start) return false;
+    for (let k = 0; k < known.length; k++) {
+      if (map.index.get(known[k]) !== map.depIndices[start + k]) return false;
+    }
+  }
+  return true;
+}
+
+// ============================================================
+// BATCH
+// ============================================================
+
+export class CascadeBatch {
+  readonly games: number;
+  readonly int: Int16Array;
+  readonly state: Uint8Array;
+
+  // Per-game temp-effect masks; null when no game in the batch needs one
+  private ignoredEdges: Uint8Array | null = null; // games × edges
+  private blockedServices: Uint8Array | null = null; // games × services
+
+  private nextInt: Int16Array;
+  private nextState: Uint8Array;
+
+  constructor(readonly map: CompiledMap, games: number) {
+    const cells = games * map.ids.length;
+    this.games = games;
+    this.int = new Int16Array(cells);
+    this.state = new Uint8Array(cells);
+    this.nextInt = new Int16Array(cells);
+    this.nextState = new Uint8Array(cells);
+  }
+
+  // Builds a batch from per-game service maps that share map's topology
+  static fromServices(
+    map: CompiledMap,
+    servicesPerGame: Record<string, Service>[],
+    effectsPerGame: TemporaryEffect[][] = []
+  ): CascadeBatch {
+    const batch = new CascadeBatch(map, servicesPerGame.length);
+    servicesPerGame.forEach((services, g) => {
+      if (!sameTopology(map, services)) {
+        throw new Error(`Game ${g} does not match the compiled service map.`);
+      }
+      batch.setGame(g, services, effectsPerGame[g] ?? []);
+    });
+    return batch;
+  }
+
+  setGame(g: number, services: Record<string, Service>, tempEffects: TemporaryEffect[]): void {
+    const { ids, index, depOffsets, depIndices } = this.map;
+    const S = ids.length;
+    const base = g * S;
+
+    for (let i = 0; i < S; i++) {
+      const svc = services[ids[i]];
+      this.int[base + i] = svc.int;
+      this.state[base + i] = STATE_CODES[svc.state];
+    }
+
+    this.clearEffects(g);
+    for (const e of tempEffects) {
+      if (e.type === 'ignoreCascadeEdge') {
+        const to = index.get(e.toServiceId as string);
+        const from = index.get(e.fromServiceId as string);
+        if (to === undefined || from === undefined) continue;
+        const edges = this.edgeMask();
+        for (let k = depOffsets[to]; k < depOffsets[to + 1]; k++) {
+          if (depIndices[k] === from) edges[g * depIndices.length + k] = 1;
+        }
+      } else if (e.type === 'blockIntermittentPropagation') {
+        const target = index.get(e.targetId as string);
+        if (target !== undefined) this.blockMask()[base + target] = 1;
+      }
+    }
+  }
+
+  private edgeMask(): Uint8Array {
+    if (!this.ignoredEdges) this.ignoredEdges = new Uint8Array(this.games * this.map.depIndices.length);
+    return this.ignoredEdges;
+  }
+
+  private blockMask(): Uint8Array {
+    if (!this.blockedServices) this.blockedServices = new Uint8Array(this.games * this.map.ids.length);
+    return this.blockedServices;
+  }
+
+  private clearEffects(g: number): void {
+    const E = this.map.depIndices.length;
+    const S = this.map.ids.length;
+    this.ignoredEdges?.fill(0, g * E, (g + 1) * E);
+    this.blockedServices?.fill(0, g * S, (g + 1) * S);
+  }
+
+  // ============================================================
+  // resolveCascades for every game. Returns waves executed per game.
+  // ============================================================
+
+  resolveCascades(): Uint8Array {
+    const { depOffsets, depIndices } = this.map;
+    const S = this.map.ids.length;
+    const E = depIndices.length;
+    const ignored = this.ignoredEdges;
+    const int = this.int;
+    const state = this.state;
+    const nextInt = this.nextInt;
+    const nextState = this.nextState;
+
+    const waves = new Uint8Array(this.games);
+    const active = new Uint8Array(this.games).fill(1);
+    let remaining = this.games;
+
+    for (let wave = 1; wave <= MAX_WAVES && remaining > 0; wave++) {
+      for (let g = 0; g < this.games; g++) {
+        if (!active[g]) continue;
+        waves[g] = wave;
+        const base = g * S;
+        const edgeBase = g * E;
+        let changes = 0;
+
+        // Every service reads the snapshot in int/state and writes to next*
+        for (let i = 0; i < S; i++) {
+          const cur = state[base + i];
+          const curInt = int[base + i];
+          nextInt[base + i] = curInt;
+          nextState[base + i] = cur;
+          if (cur === STATE_DOWN) continue;
+
+          let damage = 0;
+          let affected = 0;
+          let forceDegrade = false;
+          for (let k = depOffsets[i]; k < depOffsets[i + 1]; k++) {
+            if (ignored !== null && ignored[edgeBase + k] === 1) continue;
+            const dep = state[base + depIndices[k]];
+            if (dep === STATE_DEGRADED || dep === STATE_INTERMITTENT) {
+              damage += 1;
+              affected++;
+            } else if (dep === STATE_DOWN) {
+              damage += 2;
+              affected++;
+              if (cur === STATE_OK) forceDegrade = true;
+            }
+          }
+          if (damage === 0 && !forceDegrade && affected < 2) continue;
+
+          let newInt = curInt;
+          let newState = cur;
+          if (damage > 0) {
+            newInt = Math.max(0, curInt - damage);
+            if (newInt === 0) newState = STATE_DOWN;
+          }
+          if (forceDegrade && newState === STATE_OK) newState = STATE_DEGRADED;
+          if (affected >= 2 && newState !== STATE_DOWN) newState = STATE_INTERMITTENT;
+
+          if (newInt !== curInt || newState !== cur) {
+            nextInt[base + i] = newInt;
+            nextState[base + i] = newState;
+            changes++;
+          }
+        }
+
+        if (changes > 0) {
+          int.set(nextInt.subarray(base, base + S), base);
+          state.set(nextState.subarray(base, base + S), base);
+        } else {
+          active[g] = 0;
+          remaining--;
+        }
+      }
+    }
+
+    return waves;
+  }
+
+  // ============================================================
+  // resolveIntermittence for every game (deterministic mode: only on
+  // odd turns). Reads the pre-propagation snapshot, so two intermittent
+  // services picking the same dependent do not stack (as in cascade.ts).
+  // ============================================================
+
+  resolveIntermittence(turns: number | ArrayLike<number>): void {
+    const { crit, dependentOffsets, dependentIndices } = this.map;
+    const S = this.map.ids.length;
+    const blocked = this.blockedServices;
+    const int = this.int;
+    const state = this.state;
+    const nextInt = this.nextInt;
+    const nextState = this.nextState;
+
+    for (let g = 0; g < this.games; g++) {
+      const turn = typeof turns === 'number' ? turns : turns[g];
+      if (turn % 2 === 0) continue;
+
+      const base = g * S;
+      let touched = false;
+
+      for (let i = 0; i < S; i++) {
+        if (state[base + i] !== STATE_INTERMITTENT) continue;
+        if (blocked !== null && blocked[base + i] === 1) continue;
+
+        // Highest criticality, then lowest INT; first in key order on ties
+        let best = -1;
+        for (let k = dependentOffsets[i]; k < dependentOffsets[i + 1]; k++) {
+          const j = dependentIndices[k];
+          if (state[base + j] === STATE_DOWN) continue;
+          if (
+            best === -1 ||
+            crit[j] > crit[best] ||
+            (crit[j] === crit[best] && int[base + j] < int[base + best])
+          ) {
+            best = j;
+          }
+        }
+        if (best === -1) continue;
+
+        if (!touched) {
+          nextInt.set(int.subarray(base, base + S), base);
+          nextState.set(state.subarray(base, base + S), base);
+          touched = true;
+        }
+        const newInt = Math.max(0, int[base + best] - 2);
+        nextInt[base + best] = newInt;
+        nextState[base + best] = newInt === 0 ? STATE_DOWN : state[base + best];
+      }
+
+      if (touched) {
+        int.set(nextInt.subarray(base, base + S), base);
+        state.set(nextState.subarray(base, base + S), base);
+      }
+    }
+  }
+
+  // Materializes one game back into Service records, keeping every
+  // static field from the template (the game's pre-evaluation services).
+  toServices(g: number, template: Record<string, Service>): Record<string, Service> {
+    const S = this.map.ids.length;
+    const base = g * S;
+    const out: Record<string, Service> = {};
+    this.map.ids.forEach((id, i) => {
+      const svc = template[id];
+      const int = this.int[base + i];
+      const state = STATE_NAMES[this.state[base + i]];
+      out[id] = svc.int === int && svc.state === state ? svc : { ...svc, int, state };
+    });
+    return out;
+  }
+}
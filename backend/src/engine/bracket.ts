@@ -0,0 +1,72 @@
+// ============================================================
+// SINGLE-ELIMINATION BRACKET
+// Pure pairing logic for tournaments (db/tournaments.ts persists it).
+// Round 1 pairs teams in order; match (r + 1, k) is fed by the winners
+// of (r, 2k) and (r, 2k + 1). An odd team out gets a bye, i.e. a match
+// with no opponent that it wins immediately.
+// ============================================================
+
+export interface Pairing {
+  round: number;
+  slot: number;
+  teamA: string; // plays MALOSOS
+  teamB: string | null; // plays BUENOSOS; null = bye
+}
+
+export interface BracketMatch extends Pairing {
+  winnerTeam: string | null;
+}
+
+export function firstRoundPairings(teams: string[]): Pairing[] {
+  const pairings: Pairing[] = [];
+  for (let i = 0; i < teams.length; i += 2) {
+    pairings.push({ round: 1, slot: i / 2, teamA: teams[i], teamB: teams[i + 1] ?? null });
+  }
+  return pairings;
+}
+
+function roundSizes(matches: BracketMatch[]): number[] {
+  const first = matches.filter((m) => m.round === 1).length;
+  const sizes = [0, first]; // 1-based
+  while (sizes[sizes.length - 1] > 1) sizes.push(Math.ceil(sizes[sizes.length - 1] / 2));
+  return sizes;
+}
+
+// Returns every match that can be created now: both feeders decided
+// (or one feeder and a bye). Byes are decided on the spot, so one call
+// can open several rounds at once.
+export function nextPairings(matches: BracketMatch[]): Pairing[] {
+  const sizes = roundSizes(matches);
+  const byKey = new Map<string, BracketMatch>(matches.map((m) => [`${m.round}:${m.slot}`, m]));
+  const created: Pairing[] = [];
+
+  let changed = true;
+  while (changed) {
+    changed = false;
+    for (let round = 1; round < sizes.length - 1; round++) {
+      for (let slot = 0; slot < sizes[round + 1]; slot++) {
+        if (byKey.has(`${round + 1}:${slot}`)) continue;
+
+        const a = byKey.get(`${round}:${slot * 2}`);
+        const b = byKey.get(`${round}:${slot * 2 + 1}`);
+        const hasOpponent = slot * 2 + 1 < sizes[round];
+        if (!a?.winnerTeam || (hasOpponent && !b?.winnerTeam)) continue;
+
+        const teamB = hasOpponent ? (b!.winnerTeam as string) : null;
+        const pairing: Pairing = { round: round + 1, slot, teamA: a.winnerTeam, teamB };
+        byKey.set(`${pairing.round}:${slot}`, { ...pairing, winnerTeam: teamB === null ? a.winnerTeam : null });
+        created.push(pairing);
+        changed = true;
+      }
+    }
+  }
+
+  return created;
+}
+
+export function champion(matches: BracketMatch[]): string | null {
+  const sizes = roundSizes(matches);
+  const finalRound = sizes.length - 1;
+  const final = matches.find((m) => m.round === finalRound && m.slot === 0);
+  return final?.winnerTeam ?? null;
+}
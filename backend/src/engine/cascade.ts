@@ -1,4 +1,7 @@
 import { Service, ServiceState, TemporaryEffect } from '../types/game.types';
+import { observe } from '../observability/metrics';
+import { withSpan } from '../observability/tracing';
+import { trackServiceChanges } from './markers';
 
 const MAX_WAVES = 3;
 
@@ -102,6 +105,30 @@ function computeCascadeImpact(
   return updated;
 }
 
+// ============================================================
+// HELPER: Compute one cascade wave against a snapshot of services
+// ============================================================
+
+function computeWave(
+  current: Record<string, Service>,
+  tempEffects: TemporaryEffect[]
+): { next: Record<string, Service>; changesThisWave: { id: string; service: Service }[] } {
+  const next = { ...current };
+  const changesThisWave: { id: string; service: Service }[] = [];
+
+  for (const id of Object.keys(current)) {
+    const svc = current[id];
+    const updated = computeCascadeImpact(svc, current, tempEffects);
+    if (updated) {
+      next[id] = updated;
+      changesThisWave.push({ id, service: updated });
+    }
+  }
+
+  trackServiceChanges(current, next, changesThisWave.map((c) => c.id));
+  return { next, changesThisWave };
+}
+
 // ============================================================
 // MAIN: Resolve cascades by waves (max 3)
 // ============================================================
@@ -111,27 +138,20 @@ export function resolveCascades(
   tempEffects: TemporaryEffect[],
   _turn: number
 ): Record<string, Service> {
-  let current = { ...services };
+  let current = trackServiceChanges(services, { ...services }, []);
   let waveChanges = true;
   let waveCount = 0;
   let pendingCriticalChange: { id: string; service: Service } | null = null;
 
   while (waveChanges && waveCount < MAX_WAVES) {
-    waveChanges = false;
     waveCount++;
 
-    const next = { ...current };
-    const changesThisWave: { id: string; service: Service }[] = [];
-
-    for (const id of Object.keys(current)) {
-      const svc = current[id];
-      const updated = computeCascadeImpact(svc, current, tempEffects);
-      if (updated) {
-        next[id] = updated;
-        waveChanges = true;
-        changesThisWave.push({ id, service: updated });
-      }
-    }
+    const { next, changesThisWave } = withSpan(
+      'resolveCascades.wave',
+      () => computeWave(current, tempEffects),
+      { wave: waveCount }
+    );
+    waveChanges = changesThisWave.length > 0;
 
     if (waveChanges) {
       current = next;
@@ -164,6 +184,8 @@ export function resolveCascades(
   //  pendingCriticalChange is tracked for logging purposes.)
   void pendingCriticalChange; // acknowledge variable for TS
 
+  observe('engine_cascade_waves', waveCount);
+
   return current;
 }
 
@@ -184,6 +206,7 @@ export function resolveIntermittence(
   }
 
   const updated = { ...services };
+  const hit: string[] = [];
 
   for (const id of Object.keys(services)) {
     const svc = services[id];
@@ -213,7 +236,8 @@ export function resolveIntermittence(
     const newState: ServiceState = newInt === 0 ? 'DOWN' : target.state;
 
     updated[target.id] = { ...target, int: newInt, state: newState };
+    hit.push(target.id);
   }
 
-  return updated;
+  return trackServiceChanges(services, updated, hit);
 }
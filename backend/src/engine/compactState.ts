@@ -0,0 +1,430 @@
+import { ALL_CARDS } from '../data/cards';
+import { INITIAL_SERVICES } from '../data/services';
+import {
+  CampaignPhase,
+  GameState,
+  GameStatus,
+  LogEntry,
+  Seat,
+  SeatState,
+  Service,
+  TemporaryEffect,
+  TurnPhase,
+} from '../types/game.types';
+import { STATE_CODES, STATE_NAMES } from './batchCascade';
+
+// ============================================================
+// COMPACT GAME STATE
+// Internal representation for holding many games in memory (caches,
+// simulations, tournament runs). A parsed GameState repeats every card
+// id string in six zones, every service name/dependency list and an
+// arbitrary object per temporary effect; here:
+//
+//   - card and service ids are interned to small integers, and all
+//     zones of a game are packed into one Uint8Array (Uint16Array once
+//     an id or zone length passes 255)
+//   - service INT/state are two typed columns; everything else about a
+//     service (name, crit, dependencies...) lives in a template shared
+//     by every game on the same map
+//   - temporary effects use one fixed-shape record; keys outside the
+//     schema are kept in a per-effect side object
+//   - config is interned by value and the log is kept serialized
+//
+// The round trip is lossless for the public JSON shape:
+//   fromCompact(toCompact(s)) deep-equals JSON.parse(JSON.stringify(s))
+// i.e. keys holding undefined are dropped, as they would be on the wire
+// or in the database.
+// ============================================================
+
+// ============================================================
+// INTERN TABLES
+// Process-wide and append-only, so an id means the same string for
+// every compact game. Catalog ids are seeded first; ids outside the
+// catalog (generated maps, bench effects) are added on first use.
+// ============================================================
+
+export class InternTable {
+  private readonly index = new Map<string, number>();
+  private readonly values: string[] = [];
+
+  constructor(seed: Iterable<string> = []) {
+    for (const value of seed) this.intern(value);
+  }
+
+  get size(): number {
+    return this.values.length;
+  }
+
+  intern(value: string): number {
+    let id = this.index.get(value);
+    if (id === undefined) {
+      id = this.values.length;
+      if (id > 0xffff) throw new RangeError('Intern table is full (65536 ids).');
+      this.values.push(value);
+      this.index.set(value, id);
+    }
+    return id;
+  }
+
+  lookup(id: number): string {
+    const value = this.values[id];
+    if (value === undefined) throw new RangeError(`Unknown interned id ${id}.`);
+    return value;
+  }
+}
+
+export const CARD_IDS = new InternTable(ALL_CARDS.map((c) => c.id));
+export const SERVICE_IDS = new InternTable(Object.keys(INITIAL_SERVICES));
+const EFFECT_TYPES = new InternTable();
+const CONFIGS = new InternTable(); // config JSON, identical across most games
+
+const STATUSES: GameStatus[] = ['lobby', 'running', 'paused', 'finished'];
+const SEATS: Seat[] = ['BUENOSOS', 'MALOSOS'];
+const TURN_PHASES: TurnPhase[] = [
+  'MAINTENANCE',
+  'EVENT',
+  'MALOSOS_PREP',
+  'MALOSOS_ATTACK',
+  'BUENOSOS_RESPONSE',
+  'CASCADE_EVAL',
+  'TURN_END',
+];
+const CAMPAIGN_PHASES: CampaignPhase[] = ['RECON', 'ACCESS', 'PERSISTENCE', 'LATERAL_MOVEMENT', 'IMPACT'];
+
+function codeOf<T>(names: readonly T[], value: T, what: string): number {
+  const code = names.indexOf(value);
+  if (code < 0) throw new RangeError(`Unknown ${what} '${String(value)}'.`);
+  return code;
+}
+
+function cloneJson<T>(value: T): T {
+  return typeof value === 'object' && value !== null ? (JSON.parse(JSON.stringify(value)) as T) : value;
+}
+
+// ============================================================
+// SCALARS
+// Every numeric/boolean/enum field of the state in one Float64Array,
+// so fractional or large values (timestamps) survive unchanged.
+// ============================================================
+
+const SC_STATUS = 0;
+const SC_WINNER = 1; // SEATS index, -1 when there is no winner
+const SC_STABILITY = 2;
+const SC_TRUST = 3;
+const SC_TURN = 4;
+const SC_PHASE = 5;
+const SC_RECON_THIS_TURN = 6;
+const SC_PHASES_THIS_TURN = 7;
+const SC_BACKUPS_VERIFIED = 8;
+const SC_CREATED_AT = 9;
+const SC_UPDATED_AT = 10;
+const SC_SEATS = 11; // per seat: budgetRemaining, basicActionUsed
+const SCALAR_COUNT = SC_SEATS + 2 * SEATS.length;
+
+// ============================================================
+// ZONES
+// Layout: ZONE_COUNT lengths, then each zone's ids in ZONE order.
+// ============================================================
+
+const ZONE_HAND = 0;
+const ZONE_DECK = 1;
+const ZONE_DISCARD = 2;
+const ZONES_PER_SEAT = 3;
+const ZONE_EVENT_DECK = ZONES_PER_SEAT * SEATS.length;
+const ZONE_EVENT_DISCARD = ZONE_EVENT_DECK + 1;
+const ZONE_RECOVERED = ZONE_EVENT_DECK + 2;
+const ZONE_WENT_DOWN = ZONE_EVENT_DECK + 3;
+const ZONE_CAMPAIGN = ZONE_EVENT_DECK + 4;
+const ZONE_COUNT = ZONE_EVENT_DECK + 5;
+
+export type ZoneArray = Uint8Array | Uint16Array;
+
+function packZones(zones: number[][]): ZoneArray {
+  let total = zones.length;
+  let max = 0;
+  for (const zone of zones) {
+    total += zone.length;
+    max = Math.max(max, zone.length);
+    for (const id of zone) if (id > max) max = id;
+  }
+  if (max > 0xffff) throw new RangeError(`Zone value ${max} does not fit in 16 bits.`);
+
+  const out = max > 0xff ? new Uint16Array(total) : new Uint8Array(total);
+  let offset = zones.length;
+  zones.forEach((zone, z) => {
+    out[z] = zone.length;
+    out.set(zone, offset);
+    offset += zone.length;
+  });
+  return out;
+}
+
+function unpackZones(packed: ZoneArray): number[][] {
+  const zones: number[][] = [];
+  let offset = ZONE_COUNT;
+  for (let z = 0; z < ZONE_COUNT; z++) {
+    const length = packed[z];
+    zones.push(Array.from(packed.subarray(offset, offset + length)));
+    offset += length;
+  }
+  return zones;
+}
+
+// ============================================================
+// SERVICE TEMPLATES
+// The static part of a map: ids, key order and every field except
+// int/state. Shared by all games whose services differ only in
+// int/state, and keyed by their JSON so equal maps built separately
+// (generated maps, states parsed from the database) still share one.
+// ============================================================
+
+export interface ServiceTemplate {
+  ids: string[];
+  keys: string[][]; // per service, field order including int/state
+  statics: Record<string, unknown>[];
+}
+
+const TEMPLATES = new Map<string, ServiceTemplate>();
+
+function templateKey(services: Record<string, Service>): string {
+  const parts: unknown[] = [];
+  for (const [id, svc] of Object.entries(services)) {
+    const fields: unknown[] = [id];
+    for (const [key, value] of Object.entries(svc)) {
+      if (value === undefined) continue;
+      fields.push(key, key === 'int' || key === 'state' ? null : value);
+    }
+    parts.push(fields);
+  }
+  return JSON.stringify(parts);
+}
+
+function templateFor(services: Record<string, Service>): ServiceTemplate {
+  const key = templateKey(services);
+  let template = TEMPLATES.get(key);
+  if (template) return template;
+
+  template = { ids: [], keys: [], statics: [] };
+  for (const fields of JSON.parse(key) as unknown[][]) {
+    const keys: string[] = [];
+    const statics: Record<string, unknown> = {};
+    for (let i = 1; i < fields.length; i += 2) {
+      const field = fields[i] as string;
+      keys.push(field);
+      if (field !== 'int' && field !== 'state') statics[field] = fields[i + 1];
+    }
+    template.ids.push(fields[0] as string);
+    template.keys.push(keys);
+    template.statics.push(statics);
+  }
+  TEMPLATES.set(key, template);
+  return template;
+}
+
+export function serviceTemplateCount(): number {
+  return TEMPLATES.size;
+}
+
+// ============================================================
+// TEMPORARY EFFECTS
+// Fixed schema for the fields the engine reads on every effect; any
+// field whose value does not fit its column goes to `extra` instead.
+// ============================================================
+
+const NO_CODE = -1;
+
+export class CompactEffect {
+  constructor(
+    readonly id: string,
+    readonly type: number, // EFFECT_TYPES id
+    readonly target: number, // SERVICE_IDS id or NO_CODE
+    readonly expiresAtTurn: number, // NO_CODE when absent
+    readonly expiresAtPhase: number, // TURN_PHASES index or NO_CODE
+    readonly value: number, // NaN when absent
+    readonly extra: Record<string, unknown> | null
+  ) {}
+}
+
+const EFFECT_SCHEMA_KEYS = new Set(['id', 'type', 'targetId', 'expiresAtTurn', 'expiresAtPhase', 'value']);
+
+function compactEffect(effect: TemporaryEffect): CompactEffect {
+  let extra: Record<string, unknown> | null = null;
+  const keep = (key: string, value: unknown): void => {
+    if (value === undefined) return;
+    extra ??= {};
+    extra[key] = cloneJson(value);
+  };
+
+  const { targetId, expiresAtTurn, expiresAtPhase, value } = effect;
+
+  let target = NO_CODE;
+  if (typeof targetId === 'string') target = SERVICE_IDS.intern(targetId);
+  else keep('targetId', targetId);
+
+  let turn = NO_CODE;
+  if (typeof expiresAtTurn === 'number' && Number.isInteger(expiresAtTurn) && expiresAtTurn >= 0) turn = expiresAtTurn;
+  else keep('expiresAtTurn', expiresAtTurn);
+
+  let phase = NO_CODE;
+  if (expiresAtPhase !== undefined && TURN_PHASES.includes(expiresAtPhase)) phase = TURN_PHASES.indexOf(expiresAtPhase);
+  else keep('expiresAtPhase', expiresAtPhase);
+
+  let amount = NaN;
+  if (typeof value === 'number' && Number.isFinite(value)) amount = value;
+  else keep('value', value);
+
+  for (const [key, v] of Object.entries(effect)) {
+    if (!EFFECT_SCHEMA_KEYS.has(key)) keep(key, v);
+  }
+
+  return new CompactEffect(effect.id, EFFECT_TYPES.intern(effect.type), target, turn, phase, amount, extra);
+}
+
+function expandEffect(c: CompactEffect): TemporaryEffect {
+  const effect: TemporaryEffect = { id: c.id, type: EFFECT_TYPES.lookup(c.type) };
+  if (c.target !== NO_CODE) effect.targetId = SERVICE_IDS.lookup(c.target);
+  if (c.expiresAtTurn !== NO_CODE) effect.expiresAtTurn = c.expiresAtTurn;
+  if (c.expiresAtPhase !== NO_CODE) effect.expiresAtPhase = TURN_PHASES[c.expiresAtPhase];
+  if (!Number.isNaN(c.value)) effect.value = c.value;
+  if (c.extra) Object.assign(effect, cloneJson(c.extra));
+  return effect;
+}
+
+// ============================================================
+// CONVERSION
+// ============================================================
+
+export interface CompactGameState {
+  readonly id: string;
+  readonly config: number; // CONFIGS id
+  readonly scalars: Float64Array;
+  readonly services: ServiceTemplate;
+  readonly serviceInt: Int16Array;
+  readonly serviceState: Uint8Array;
+  readonly zones: ZoneArray;
+  readonly effects: CompactEffect[];
+  readonly logJson: string;
+}
+
+const NO_EFFECTS: CompactEffect[] = [];
+
+export function toCompact(state: GameState): CompactGameState {
+  const scalars = new Float64Array(SCALAR_COUNT);
+  scalars[SC_STATUS] = codeOf(STATUSES, state.status, 'status');
+  scalars[SC_WINNER] = state.winner === undefined ? NO_CODE : codeOf(SEATS, state.winner, 'seat');
+  scalars[SC_STABILITY] = state.markers.stability;
+  scalars[SC_TRUST] = state.markers.trust;
+  scalars[SC_TURN] = state.markers.turn;
+  scalars[SC_PHASE] = codeOf(TURN_PHASES, state.markers.phase, 'turn phase');
+  scalars[SC_RECON_THIS_TURN] = state.campaign.reconThisTurn ? 1 : 0;
+  scalars[SC_PHASES_THIS_TURN] = state.campaign.phasesCompletedThisTurn;
+  scalars[SC_BACKUPS_VERIFIED] = state.backupsVerified ? 1 : 0;
+  scalars[SC_CREATED_AT] = state.createdAt;
+  scalars[SC_UPDATED_AT] = state.updatedAt;
+
+  const zones: number[][] = new Array(ZONE_COUNT);
+  SEATS.forEach((seat, i) => {
+    const s = state.seats[seat];
+    scalars[SC_SEATS + 2 * i] = s.budgetRemaining;
+    scalars[SC_SEATS + 2 * i + 1] = s.basicActionUsed ? 1 : 0;
+    const base = i * ZONES_PER_SEAT;
+    zones[base + ZONE_HAND] = s.hand.map((id) => CARD_IDS.intern(id));
+    zones[base + ZONE_DECK] = s.deck.map((id) => CARD_IDS.intern(id));
+    zones[base + ZONE_DISCARD] = s.discard.map((id) => CARD_IDS.intern(id));
+  });
+  zones[ZONE_EVENT_DECK] = state.eventDeck.map((id) => CARD_IDS.intern(id));
+  zones[ZONE_EVENT_DISCARD] = state.eventDiscard.map((id) => CARD_IDS.intern(id));
+  zones[ZONE_RECOVERED] = state.servicesRecovered.map((id) => SERVICE_IDS.intern(id));
+  zones[ZONE_WENT_DOWN] = state.servicesThatWentDown.map((id) => SERVICE_IDS.intern(id));
+  zones[ZONE_CAMPAIGN] = state.campaign.completedPhases.map((p) => codeOf(CAMPAIGN_PHASES, p, 'campaign phase'));
+
+  const template = templateFor(state.services);
+  const n = template.ids.length;
+  const serviceInt = new Int16Array(n);
+  const serviceState = new Uint8Array(n);
+  for (let i = 0; i < n; i++) {
+    const svc = state.services[template.ids[i]];
+    if (!Number.isInteger(svc.int) || svc.int < -0x8000 || svc.int > 0x7fff) {
+      throw new RangeError(`Service ${svc.id} INT ${svc.int} does not fit in 16 bits.`);
+    }
+    const code = STATE_CODES[svc.state];
+    if (code === undefined) throw new RangeError(`Unknown service state '${svc.state}'.`);
+    serviceInt[i] = svc.int;
+    serviceState[i] = code;
+  }
+
+  return {
+    id: state.id,
+    config: CONFIGS.intern(JSON.stringify(state.config)),
+    scalars,
+    services: template,
+    serviceInt,
+    serviceState,
+    zones: packZones(zones),
+    effects: state.temporaryEffects.length > 0 ? state.temporaryEffects.map(compactEffect) : NO_EFFECTS,
+    logJson: JSON.stringify(state.log),
+  };
+}
+
+function expandServices(c: CompactGameState): Record<string, Service> {
+  const { ids, keys, statics } = c.services;
+  const services: Record<string, Service> = {};
+  for (let i = 0; i < ids.length; i++) {
+    const svc: Record<string, unknown> = {};
+    for (const key of keys[i]) {
+      if (key === 'int') svc.int = c.serviceInt[i];
+      else if (key === 'state') svc.state = STATE_NAMES[c.serviceState[i]];
+      else svc[key] = cloneJson(statics[i][key]);
+    }
+    services[ids[i]] = svc as unknown as Service;
+  }
+  return services;
+}
+
+export function fromCompact(c: CompactGameState): GameState {
+  const { scalars } = c;
+  const zones = unpackZones(c.zones);
+  const cards = (zone: number[]): string[] => zone.map((id) => CARD_IDS.lookup(id));
+
+  const seats = {} as Record<Seat, SeatState>;
+  SEATS.forEach((seat, i) => {
+    const base = i * ZONES_PER_SEAT;
+    seats[seat] = {
+      budgetRemaining: scalars[SC_SEATS + 2 * i],
+      hand: cards(zones[base + ZONE_HAND]),
+      deck: cards(zones[base + ZONE_DECK]),
+      discard: cards(zones[base + ZONE_DISCARD]),
+      basicActionUsed: scalars[SC_SEATS + 2 * i + 1] === 1,
+    };
+  });
+
+  const state: GameState = {
+    id: c.id,
+    status: STATUSES[scalars[SC_STATUS]],
+    config: JSON.parse(CONFIGS.lookup(c.config)),
+    services: expandServices(c),
+    seats,
+    eventDeck: cards(zones[ZONE_EVENT_DECK]),
+    eventDiscard: cards(zones[ZONE_EVENT_DISCARD]),
+    markers: {
+      stability: scalars[SC_STABILITY],
+      trust: scalars[SC_TRUST],
+      turn: scalars[SC_TURN],
+      phase: TURN_PHASES[scalars[SC_PHASE]],
+    },
+    campaign: {
+      completedPhases: zones[ZONE_CAMPAIGN].map((p) => CAMPAIGN_PHASES[p]),
+      reconThisTurn: scalars[SC_RECON_THIS_TURN] === 1,
+      phasesCompletedThisTurn: scalars[SC_PHASES_THIS_TURN],
+    },
+    temporaryEffects: c.effects.map(expandEffect),
+    backupsVerified: scalars[SC_BACKUPS_VERIFIED] === 1,
+    servicesRecovered: zones[ZONE_RECOVERED].map((id) => SERVICE_IDS.lookup(id)),
+    servicesThatWentDown: zones[ZONE_WENT_DOWN].map((id) => SERVICE_IDS.lookup(id)),
+    log: JSON.parse(c.logJson) as LogEntry[],
+    createdAt: scalars[SC_CREATED_AT],
+    updatedAt: scalars[SC_UPDATED_AT],
+  };
+  if (scalars[SC_WINNER] !== NO_CODE) state.winner = SEATS[scalars[SC_WINNER]];
+  return state;
+}
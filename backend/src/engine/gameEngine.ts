@@ -12,6 +12,8 @@ import {
   TemporaryEffect,
   CampaignPhase,
   ErrorCode,
+  Card,
+  GameMarkers,
 } from '../types/game.types';
 import { MALOSOS_DECK, BUENOSOS_DECK, EVENT_DECK, getCard } from '../data/cards';
 import { createInitialServices } from '../data/services';
@@ -26,11 +28,15 @@ import { resolveCascades, resolveIntermittence } from './cascade';
 import {
   calculateTurnMarkers,
   applyMarkerUpdate,
+  MarkerUpdate,
   modifyTrust,
   modifyStability,
   getEffectiveDamageReduction,
+  trackServiceChanges,
 } from './markers';
 import { checkVictory } from './victory';
+import { timeSync } from '../observability/metrics';
+import { isTracing, withSpan } from '../observability/tracing';
 
 // ============================================================
 // GAME ENGINE ERROR
@@ -154,7 +160,8 @@ function applyDamageToService(
     newState = 'DOWN';
   }
 
-  return { ...services, [targetId]: { ...svc, int: newInt, state: newState } };
+  const next = { ...services, [targetId]: { ...svc, int: newInt, state: newState } };
+  return trackServiceChanges(services, next, [targetId]);
 }
 
 function setServiceState(
@@ -164,7 +171,8 @@ function setServiceState(
 ): Record<string, Service> {
   const svc = services[targetId];
   if (!svc) return services;
-  return { ...services, [targetId]: { ...svc, state } };
+  const next = { ...services, [targetId]: { ...svc, state } };
+  return trackServiceChanges(services, next, [targetId]);
 }
 
 function healService(
@@ -186,7 +194,8 @@ function healService(
     newState = 'DEGRADED'; // Healing a DOWN service brings it to DEGRADED
   }
 
-  return { ...services, [targetId]: { ...svc, int: newInt, state: newState } };
+  const next = { ...services, [targetId]: { ...svc, int: newInt, state: newState } };
+  return trackServiceChanges(services, next, [targetId]);
 }
 
 // ============================================================
@@ -304,18 +313,23 @@ export function processPhase(state: GameState): GameState {
 
   switch (state.markers.phase) {
     case 'MAINTENANCE':
-      return processMaintenance(state);
+      return runPhase('MAINTENANCE', () => processMaintenance(state));
     case 'EVENT':
-      return processEvent(state);
+      return runPhase('EVENT', () => processEvent(state));
     case 'CASCADE_EVAL':
-      return processCascadeEval(state);
+      return runPhase('CASCADE_EVAL', () => processCascadeEval(state));
     case 'TURN_END':
-      return processTurnEnd(state);
+      return runPhase('TURN_END', () => processTurnEnd(state));
     default:
       return state;
   }
 }
 
+// Instrumentation wrapper for each automatic phase branch
+function runPhase(phase: TurnPhase, fn: () => GameState): GameState {
+  return timeSync('engine_process_phase_seconds', phase, () => withSpan(`processPhase.${phase}`, fn));
+}
+
 // ---- MAINTENANCE (Phase 0) ----
 function processMaintenance(state: GameState): GameState {
   let s = { ...state };
@@ -323,11 +337,13 @@ function processMaintenance(state: GameState): GameState {
 
   // 0.0 Degraded services lose -1 INT
   const updated: Record<string, Service> = {};
+  const decayed: string[] = [];
   for (const [id, svc] of Object.entries(s.services)) {
     if (svc.state === 'DEGRADED') {
       const newInt = Math.max(0, svc.int - 1);
       const newState: ServiceState = newInt === 0 ? 'DOWN' : 'DEGRADED';
       updated[id] = { ...svc, int: newInt, state: newState };
+      decayed.push(id);
 
       // Track services going DOWN
       if (newState === 'DOWN' && !s.servicesThatWentDown.includes(id)) {
@@ -337,7 +353,7 @@ function processMaintenance(state: GameState): GameState {
       updated[id] = svc;
     }
   }
-  s.services = updated;
+  s.services = trackServiceChanges(s.services, updated, decayed);
 
   // 0.1 Reset budgets
   s.seats = {
@@ -419,8 +435,37 @@ function processEvent(state: GameState): GameState {
 
 // ---- CASCADE EVAL (Phase 5) ----
 function processCascadeEval(state: GameState): GameState {
+  const { state: evaluated, markerUpdate, beforeServices, beforeMarkers } = evaluateCascade(state);
+  const s = { ...evaluated, updatedAt: Date.now() };
+
+  const logEntry = makeLogEntry(
+    s.markers.turn, 'CASCADE_EVAL', 'CASCADE_EVALUATED', undefined,
+    {
+      markerUpdate,
+      beforeServices,
+      afterServices: s.services,
+      beforeMarkers,
+      afterMarkers: s.markers,
+    }
+  );
+  s.log = [...s.log, logEntry];
+
+  return s;
+}
+
+interface CascadeEvaluation {
+  state: GameState;
+  markerUpdate: MarkerUpdate;
+  beforeServices: Record<string, Service>;
+  beforeMarkers: GameMarkers;
+}
+
+// Pure CASCADE_EVAL step shared by the real phase and previewCascadeEval:
+// cascades, intermittence, markers, down effects and the victory check.
+// Does not touch updatedAt or the log.
+function evaluateCascade(state: GameState): CascadeEvaluation {
   let s = { ...state };
-  const beforeServices = JSON.parse(JSON.stringify(s.services));
+  const beforeServices = JSON.parse(JSON.stringify(s.services)) as Record<string, Service>;
   const beforeMarkers = { ...s.markers };
 
   // Apply cascades
@@ -439,19 +484,18 @@ function processCascadeEval(state: GameState): GameState {
   s.services = cascadedServices;
 
   // Calculate and apply markers
-  const markerUpdate = calculateTurnMarkers(s);
+  const markerUpdate = withSpan('calculateTurnMarkers', () => calculateTurnMarkers(s));
   s = applyMarkerUpdate(s, markerUpdate);
 
   // Check for downEffect triggers
   for (const [id, svc] of Object.entries(s.services)) {
-    const prevSvc = (beforeServices as Record<string, Service>)[id];
+    const prevSvc = beforeServices[id];
     if (svc.state === 'DOWN' && prevSvc.state !== 'DOWN') {
       s = applyDownEffect(s, id);
     }
   }
 
   s.markers = { ...s.markers, phase: 'TURN_END' };
-  s.updatedAt = Date.now();
 
   // Check victory
   const winner = checkVictory(s);
@@ -460,19 +504,7 @@ function processCascadeEval(state: GameState): GameState {
     s.status = 'finished';
   }
 
-  const logEntry = makeLogEntry(
-    s.markers.turn, 'CASCADE_EVAL', 'CASCADE_EVALUATED', undefined,
-    {
-      markerUpdate,
-      beforeServices,
-      afterServices: s.services,
-      beforeMarkers,
-      afterMarkers: s.markers,
-    }
-  );
-  s.log = [...s.log, logEntry];
-
-  return s;
+  return { state: s, markerUpdate, beforeServices, beforeMarkers };
 }
 
 // ---- TURN END ----
@@ -516,6 +548,74 @@ export function playCard(
   cardId: string,
   targets: string[]
 ): PlayCardResult {
+  return timeSync('engine_play_card_seconds', '', () =>
+    withSpan('playCard', () => playCardUntimed(state, seat, cardId, targets), { cardId, seat })
+  );
+}
+
+function playCardUntimed(
+  state: GameState,
+  seat: Seat,
+  cardId: string,
+  targets: string[]
+): PlayCardResult {
+  const { card, effectiveCost } = withSpan('playCard.validate', () => validatePlayCard(state, seat, cardId));
+
+  let s = { ...state };
+  const beforeState = JSON.parse(JSON.stringify(s));
+
+  // Deduct budget and remove card from hand
+  s.seats = {
+    ...s.seats,
+    [seat]: {
+      ...s.seats[seat],
+      budgetRemaining: s.seats[seat].budgetRemaining - effectiveCost,
+      hand: s.seats[seat].hand.filter((id) => id !== cardId),
+      discard: [...s.seats[seat].discard, cardId],
+    },
+  };
+
+  // Apply effects
+  s = applyCardEffects(s, card.effects, seat, targets);
+
+  // Handle campaign phase advancement for MalOsos campaign cards
+  if (seat === 'MALOSOS') {
+    const campaignPhase = getCampaignPhaseFromCard(card);
+    if (campaignPhase) {
+      s.campaign = completeCampaignPhase(s.campaign, campaignPhase);
+    }
+  }
+
+  // Check victory after card play
+  const winner = checkVictory(s);
+  if (winner) {
+    s.winner = winner;
+    s.status = 'finished';
+  }
+
+  s.updatedAt = Date.now();
+
+  const logEntry = makeLogEntry(
+    s.markers.turn,
+    s.markers.phase,
+    'CARD_PLAYED',
+    seat,
+    { cardId, cardName: card.name, category: card.category, targets, effectiveCost },
+    beforeState.services,
+    s.services
+  );
+  s.log = [...s.log, logEntry];
+
+  return { newState: s, logEntry };
+}
+
+// Checks every precondition for playing a card and returns the card
+// with its effective cost (after temp-effect modifiers).
+function validatePlayCard(
+  state: GameState,
+  seat: Seat,
+  cardId: string
+): { card: Card; effectiveCost: number } {
   if (state.status !== 'running') {
     throw new GameError('GAME_NOT_RUNNING', 'Game is not running.');
   }
@@ -611,52 +711,7 @@ export function playCard(
     }
   }
 
-  let s = { ...state };
-  const beforeState = JSON.parse(JSON.stringify(s));
-
-  // Deduct budget and remove card from hand
-  s.seats = {
-    ...s.seats,
-    [seat]: {
-      ...s.seats[seat],
-      budgetRemaining: s.seats[seat].budgetRemaining - effectiveCost,
-      hand: s.seats[seat].hand.filter((id) => id !== cardId),
-      discard: [...s.seats[seat].discard, cardId],
-    },
-  };
-
-  // Apply effects
-  s = applyCardEffects(s, card.effects, seat, targets);
-
-  // Handle campaign phase advancement for MalOsos campaign cards
-  if (seat === 'MALOSOS') {
-    const campaignPhase = getCampaignPhaseFromCard(card);
-    if (campaignPhase) {
-      s.campaign = completeCampaignPhase(s.campaign, campaignPhase);
-    }
-  }
-
-  // Check victory after card play
-  const winner = checkVictory(s);
-  if (winner) {
-    s.winner = winner;
-    s.status = 'finished';
-  }
-
-  s.updatedAt = Date.now();
-
-  const logEntry = makeLogEntry(
-    s.markers.turn,
-    s.markers.phase,
-    'CARD_PLAYED',
-    seat,
-    { cardId, cardName: card.name, category: card.category, targets, effectiveCost },
-    beforeState.services,
-    s.services
-  );
-  s.log = [...s.log, logEntry];
-
-  return { newState: s, logEntry };
+  return { card, effectiveCost };
 }
 
 // ============================================================
@@ -792,6 +847,94 @@ export function advancePhase(
   return s;
 }
 
+// ============================================================
+// CASCADE PREVIEW (what-if, never persisted)
+// ============================================================
+
+export interface HypotheticalChange {
+  serviceId: string;
+  state?: ServiceState; // forced state ('DOWN' sets INT to 0, any other state keeps INT >= 1)
+  int?: number; // absolute INT (0 means DOWN)
+  damage?: number; // damage applied like a card, honoring damage reductions
+}
+
+export interface CascadePreview {
+  turn: number;
+  services: Record<string, Service>;
+  markers: GameMarkers;
+  markerUpdate: MarkerUpdate;
+  newlyDown: string[]; // DOWN after evaluation but not in the current state
+  changed: string[]; // services whose INT or state differ from the current state
+  winner: Seat | null;
+}
+
+function applyHypothetical(state: GameState, changes: HypotheticalChange[]): GameState {
+  let s = { ...state };
+
+  for (const change of changes) {
+    const svc = s.services[change.serviceId];
+    if (!svc) {
+      throw new GameError('INVALID_TARGET', `Service '${change.serviceId}' does not exist.`);
+    }
+
+    if (change.int !== undefined) {
+      const int = Math.max(0, Math.min(svc.intMax, Math.floor(change.int)));
+      // Same transitions as damage (0 -> DOWN) and healing (DOWN -> DEGRADED)
+      let state: ServiceState = svc.state;
+      if (int === 0) state = 'DOWN';
+      else if (state === 'DOWN') state = 'DEGRADED';
+      s.services = trackServiceChanges(
+        s.services, { ...s.services, [change.serviceId]: { ...svc, int, state } }, [change.serviceId]
+      );
+    }
+    if (change.state !== undefined) {
+      s.services = setServiceState(s.services, change.serviceId, change.state);
+      // Keep the DOWN <=> INT 0 invariant the engine relies on
+      const forced = s.services[change.serviceId];
+      const int = change.state === 'DOWN' ? 0 : Math.max(1, forced.int);
+      s.services = trackServiceChanges(
+        s.services, { ...s.services, [change.serviceId]: { ...forced, int } }, [change.serviceId]
+      );
+    }
+    if (change.damage !== undefined && change.damage > 0) {
+      s.services = applyDamageToService(s.services, change.serviceId, change.damage, s.temporaryEffects);
+    }
+
+    s = trackDownTransition(s, change.serviceId);
+  }
+
+  return s;
+}
+
+// Dry-runs CASCADE_EVAL on the current state with the given hypothetical
+// service changes applied first. The input state is never modified.
+export function previewCascadeEval(state: GameState, changes: HypotheticalChange[]): CascadePreview {
+  if (state.status !== 'running') {
+    throw new GameError('GAME_NOT_RUNNING', 'Game is not running.');
+  }
+
+  const hypothetical = applyHypothetical(state, changes);
+  const { state: projected, markerUpdate } = evaluateCascade(hypothetical);
+
+  const newlyDown: string[] = [];
+  const changed: string[] = [];
+  for (const [id, svc] of Object.entries(projected.services)) {
+    const current = state.services[id];
+    if (svc.state === 'DOWN' && current.state !== 'DOWN') newlyDown.push(id);
+    if (svc.state !== current.state || svc.int !== current.int) changed.push(id);
+  }
+
+  return {
+    turn: state.markers.turn,
+    services: projected.services,
+    markers: projected.markers,
+    markerUpdate,
+    newlyDown,
+    changed,
+    winner: projected.winner ?? null,
+  };
+}
+
 // ============================================================
 // APPLY CARD EFFECTS
 // ============================================================
@@ -816,6 +959,16 @@ function applyEffect(
   effect: CardEffect,
   actor: Seat | undefined,
   targets: string[]
+): GameState {
+  if (!isTracing()) return applyEffectUntraced(state, effect, actor, targets);
+  return withSpan(`applyEffect.${effect.type}`, () => applyEffectUntraced(state, effect, actor, targets));
+}
+
+function applyEffectUntraced(
+  state: GameState,
+  effect: CardEffect,
+  actor: Seat | undefined,
+  targets: string[]
 ): GameState {
   let s = { ...state };
   const target = targets[0];
@@ -883,7 +1036,8 @@ function applyEffect(
       const value = (effect.value as number) ?? 0;
       const tId = (effect.targetId as string | undefined) ?? target;
       if (tId && s.services[tId]) {
-        s.services = { ...s.services, [tId]: { ...s.services[tId], int: value } };
+        const next = { ...s.services, [tId]: { ...s.services[tId], int: value } };
+        s.services = trackServiceChanges(s.services, next, [tId]);
       }
       break;
     }
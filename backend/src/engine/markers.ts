@@ -1,4 +1,4 @@
-import { GameState, Service, TemporaryEffect } from '../types/game.types';
+import { GameState, Service, ServiceState, TemporaryEffect } from '../types/game.types';
 
 // ============================================================
 // CONSTANTS
@@ -22,6 +22,8 @@ const CRITICALITY_BONUS: Record<number, number> = {
 
 // ============================================================
 // MARKER UPDATE RESULT
+// `details` is built on first read (typically when the log entry that
+// embeds the update is serialized), not during evaluation.
 // ============================================================
 
 export interface MarkerUpdate {
@@ -30,6 +32,93 @@ export interface MarkerUpdate {
   details: string[];
 }
 
+class LazyMarkerUpdate implements MarkerUpdate {
+  private built: string[] | null = null;
+
+  constructor(
+    readonly stabilityDelta: number,
+    readonly trustDelta: number,
+    private describe: (() => string[]) | null
+  ) {}
+
+  get details(): string[] {
+    if (!this.built) {
+      this.built = this.describe!();
+      this.describe = null; // release the captured services
+    }
+    return this.built;
+  }
+
+  toJSON(): MarkerUpdate {
+    return { stabilityDelta: this.stabilityDelta, trustDelta: this.trustDelta, details: this.details };
+  }
+}
+
+// ============================================================
+// RUNNING AGGREGATES
+// Per services record: counts by raw state, summed criticality
+// penalties of non-OK services and citizen-facing DOWN services.
+// Records are never mutated once built, so the aggregates are cached
+// by record identity; the engine helpers that derive a record from
+// another (setServiceState, applyDamageToService, cascade waves...)
+// call trackServiceChanges to derive its aggregates from the old ones
+// in O(changed services). A record with no tracked ancestor (e.g.
+// freshly parsed from the database) is scanned once on first use.
+// ============================================================
+
+export interface MarkerAggregates {
+  degraded: number;
+  intermittent: number;
+  down: number;
+  critPenalty: number; // sum of CRITICALITY_BONUS over non-OK services
+  citizenDown: number;
+}
+
+const AGGREGATES = new WeakMap<Record<string, Service>, MarkerAggregates>();
+
+function addService(agg: MarkerAggregates, svc: Service, sign: 1 | -1): void {
+  if (svc.state === 'OK') return;
+  if (svc.state === 'DEGRADED') agg.degraded += sign;
+  else if (svc.state === 'INTERMITTENT') agg.intermittent += sign;
+  else if (svc.state === 'DOWN') {
+    agg.down += sign;
+    if (svc.citizenFacing === true) agg.citizenDown += sign;
+  }
+  agg.critPenalty += sign * (CRITICALITY_BONUS[svc.crit] ?? 0);
+}
+
+export function getMarkerAggregates(services: Record<string, Service>): MarkerAggregates {
+  let agg = AGGREGATES.get(services);
+  if (!agg) {
+    agg = { degraded: 0, intermittent: 0, down: 0, critPenalty: 0, citizenDown: 0 };
+    for (const svc of Object.values(services)) addService(agg, svc, 1);
+    AGGREGATES.set(services, agg);
+  }
+  return agg;
+}
+
+// Carries prev's aggregates over to next, a copy of prev in which only
+// the given ids may differ. No-op when prev has none yet.
+export function trackServiceChanges(
+  prev: Record<string, Service>,
+  next: Record<string, Service>,
+  changedIds: string[]
+): Record<string, Service> {
+  const base = AGGREGATES.get(prev);
+  if (!base || prev === next) return next;
+
+  const agg = { ...base };
+  for (const id of changedIds.length > 1 ? new Set(changedIds) : changedIds) {
+    const before = prev[id];
+    const after = next[id];
+    if (before === after) continue;
+    if (before) addService(agg, before, -1);
+    if (after) addService(agg, after, 1);
+  }
+  AGGREGATES.set(next, agg);
+  return next;
+}
+
 // ============================================================
 // calculateTurnMarkers
 // Computes stability and trust deltas at end of turn.
@@ -38,108 +127,106 @@ export interface MarkerUpdate {
 // 2. Criticality multiplier (crit=4: -2 extra, crit=5: -4 extra)
 // 3. Trust (citizen DOWN: -3 each, cap -15; trust=0: -5 stability)
 // 4. BCP reductions (bcpManualOp, bcpPrioritization temp effects)
+// Reads the running aggregates plus one pass over temporaryEffects.
 // ============================================================
 
 export function calculateTurnMarkers(state: GameState): MarkerUpdate {
-  const details: string[] = [];
+  const { services } = state;
+  const agg = getMarkerAggregates(services);
+
+  // ---- Temp effects, one pass ----
+  const manualOp: string[] = []; // DOWN services treated as DEGRADED
+  const prioritization: TemporaryEffect[] = [];
+  let trustIgnored = false;
+  for (const e of state.temporaryEffects) {
+    if (e.type === 'bcpManualOp') {
+      if (e.targetId !== undefined && !manualOp.includes(e.targetId)) manualOp.push(e.targetId);
+    } else if (e.type === 'bcpPrioritization') prioritization.push(e);
+    else if (e.type === 'ignoreTrustPenalty') trustIgnored = true;
+  }
+  const effectiveState = (svc: Service): ServiceState =>
+    svc.state === 'DOWN' && manualOp.includes(svc.id) ? 'DEGRADED' : svc.state;
+
   let stabilityDelta = 0;
   let trustDelta = 0;
 
   // ---- STEP 1: Base penalties with cap ----
-  let basePenalty = 0;
-  for (const svc of Object.values(state.services)) {
-    if (svc.state === 'OK') continue;
-
-    // Check if this service is treated as DEGRADED due to bcpManualOp
-    const manualOp = state.temporaryEffects.find(
-      (e) => e.type === 'bcpManualOp' && e.targetId === svc.id
-    );
-    const effectiveState = manualOp && svc.state === 'DOWN' ? 'DEGRADED' : svc.state;
-
-    const penalty = STABILITY_BASE_PENALTY[effectiveState] ?? 0;
-    basePenalty += penalty;
-    details.push(`${svc.id} (${effectiveState}): ${penalty} stability`);
+  let manualOpDown = 0;
+  for (const id of manualOp) {
+    const svc = services[id];
+    if (svc && svc.id === id && svc.state === 'DOWN') manualOpDown++;
   }
-
-  // Apply tope (cap)
-  if (basePenalty < BASE_PENALTY_CAP) {
-    details.push(`Base penalty capped at ${BASE_PENALTY_CAP} (was ${basePenalty})`);
-    basePenalty = BASE_PENALTY_CAP;
-  }
-  stabilityDelta += basePenalty;
+  const uncappedBase =
+    (agg.degraded + manualOpDown) * STABILITY_BASE_PENALTY.DEGRADED +
+    agg.intermittent * STABILITY_BASE_PENALTY.INTERMITTENT +
+    (agg.down - manualOpDown) * STABILITY_BASE_PENALTY.DOWN;
+  stabilityDelta += Math.max(BASE_PENALTY_CAP, uncappedBase);
 
   // ---- STEP 2: Criticality multiplier ----
-  for (const svc of Object.values(state.services)) {
-    if (svc.state === 'OK') continue;
-
-    const critPenalty = CRITICALITY_BONUS[svc.crit] ?? 0;
-    if (critPenalty !== 0) {
-      stabilityDelta += critPenalty;
-      details.push(`${svc.id} crit=${svc.crit}: ${critPenalty} stability`);
-    }
-  }
+  stabilityDelta += agg.critPenalty;
 
   // ---- STEP 3: Trust penalties ----
-  let trustPenalty = 0;
-  const citizenServices = Object.values(state.services).filter((s) => s.citizenFacing === true);
-  for (const svc of citizenServices) {
-    if (svc.state === 'DOWN') {
-      trustPenalty += TRUST_CITIZEN_DOWN_PENALTY;
-      details.push(`${svc.id} (citizen, DOWN): ${TRUST_CITIZEN_DOWN_PENALTY} trust`);
-    }
-  }
-
-  // Cap trust penalty
-  if (trustPenalty < TRUST_PENALTY_CAP) {
-    details.push(`Trust penalty capped at ${TRUST_PENALTY_CAP} (was ${trustPenalty})`);
-    trustPenalty = TRUST_PENALTY_CAP;
-  }
-  trustDelta += trustPenalty;
+  const uncappedTrust = agg.citizenDown * TRUST_CITIZEN_DOWN_PENALTY;
+  trustDelta += Math.max(TRUST_PENALTY_CAP, uncappedTrust);
 
   // If trust would reach 0 this turn or is already 0, apply stability penalty
-  const newTrust = Math.max(0, state.markers.trust + trustDelta);
-  if (newTrust === 0) {
-    // Check for ignoreTrustPenalty temp effect (from Comunicacion de crisis)
-    const trustIgnored = state.temporaryEffects.some(
-      (e) => e.type === 'ignoreTrustPenalty'
-    );
-    if (!trustIgnored) {
-      stabilityDelta += TRUST_ZERO_STABILITY_PENALTY;
-      details.push(`Trust=0: ${TRUST_ZERO_STABILITY_PENALTY} stability (panic effect)`);
-    } else {
-      details.push('Trust=0 stability penalty ignored by Comunicacion de crisis');
-    }
+  const trustZero = Math.max(0, state.markers.trust + trustDelta) === 0;
+  if (trustZero && !trustIgnored) {
+    stabilityDelta += TRUST_ZERO_STABILITY_PENALTY;
   }
 
   // ---- STEP 4: BCP reductions ----
-  // bcpPrioritization: two targeted services have their stability penalties halved
-  const prioritization = state.temporaryEffects.filter((e) => e.type === 'bcpPrioritization');
-  if (prioritization.length > 0) {
-    for (const eff of prioritization) {
-      const targets = (eff.targets as string[] | undefined) ?? [];
-      for (const targetId of targets) {
-        const svc = state.services[targetId];
-        if (!svc || svc.state === 'OK') continue;
-
-        const effectiveState = (() => {
-          const manualOp = state.temporaryEffects.find(
-            (e) => e.type === 'bcpManualOp' && e.targetId === svc.id
-          );
-          return manualOp && svc.state === 'DOWN' ? 'DEGRADED' : svc.state;
-        })();
-
-        const basePen = STABILITY_BASE_PENALTY[effectiveState] ?? 0;
-        const critPen = CRITICALITY_BONUS[svc.crit] ?? 0;
-        const totalPen = basePen + critPen;
-        // Reduce by half (rounding down toward 0)
-        const reduction = Math.floor(Math.abs(totalPen) / 2);
-        stabilityDelta += reduction; // Adds back half of the negative penalty
-        details.push(`BCP Priorizacion on ${targetId}: +${reduction} stability (half reduction)`);
-      }
+  // bcpPrioritization: targeted services have their stability penalties halved
+  const reductions: [string, number][] = [];
+  for (const eff of prioritization) {
+    const targets = (eff.targets as string[] | undefined) ?? [];
+    for (const targetId of targets) {
+      const svc = services[targetId];
+      if (!svc || svc.state === 'OK') continue;
+
+      const basePen = STABILITY_BASE_PENALTY[effectiveState(svc)] ?? 0;
+      const critPen = CRITICALITY_BONUS[svc.crit] ?? 0;
+      // Reduce by half (rounding down toward 0)
+      const reduction = Math.floor(Math.abs(basePen + critPen) / 2);
+      stabilityDelta += reduction; // Adds back half of the negative penalty
+      reductions.push([targetId, reduction]);
     }
   }
 
-  return { stabilityDelta, trustDelta, details };
+  return new LazyMarkerUpdate(stabilityDelta, trustDelta, () => {
+    const details: string[] = [];
+    const affected = Object.values(services).filter((svc) => svc.state !== 'OK');
+    for (const svc of affected) {
+      const eff = effectiveState(svc);
+      details.push(`${svc.id} (${eff}): ${STABILITY_BASE_PENALTY[eff] ?? 0} stability`);
+    }
+    if (uncappedBase < BASE_PENALTY_CAP) {
+      details.push(`Base penalty capped at ${BASE_PENALTY_CAP} (was ${uncappedBase})`);
+    }
+    for (const svc of affected) {
+      const critPenalty = CRITICALITY_BONUS[svc.crit] ?? 0;
+      if (critPenalty !== 0) details.push(`${svc.id} crit=${svc.crit}: ${critPenalty} stability`);
+    }
+    for (const svc of Object.values(services)) {
+      if (svc.citizenFacing === true && svc.state === 'DOWN') {
+        details.push(`${svc.id} (citizen, DOWN): ${TRUST_CITIZEN_DOWN_PENALTY} trust`);
+      }
+    }
+    if (uncappedTrust < TRUST_PENALTY_CAP) {
+      details.push(`Trust penalty capped at ${TRUST_PENALTY_CAP} (was ${uncappedTrust})`);
+    }
+    if (trustZero) {
+      details.push(
+        trustIgnored
+          ? 'Trust=0 stability penalty ignored by Comunicacion de crisis'
+          : `Trust=0: ${TRUST_ZERO_STABILITY_PENALTY} stability (panic effect)`
+      );
+    }
+    for (const [targetId, reduction] of reductions) {
+      details.push(`BCP Priorizacion on ${targetId}: +${reduction} stability (half reduction)`);
+    }
+    return details;
+  });
 }
 
 // ============================================================
@@ -0,0 +1,101 @@
+import { GameState, ServiceState } from '../types/game.types';
+import { previewCascadeEval, CascadePreview, HypotheticalChange, GameError } from './gameEngine';
+import { registerCounter, registerGauge } from '../observability/metrics';
+
+// ============================================================
+// CASCADE PREVIEW MEMO
+// What-if previews are pure functions of (game state, hypothetical), so
+// results are memoized by (game id, state version, canonical
+// hypothetical). Any committed command bumps updatedAt and appends to
+// the log, which changes the version and leaves old entries to age out
+// of the bounded LRU. A room full of students asking the same question
+// costs one evaluation.
+// ============================================================
+
+const MAX_ENTRIES = parseInt(process.env.PREVIEW_CACHE_SIZE ?? '', 10) || 500;
+const MAX_CHANGES = 32;
+const SERVICE_STATES: ServiceState[] = ['OK', 'DEGRADED', 'INTERMITTENT', 'DOWN'];
+
+const cache = new Map<string, CascadePreview>(); // insertion order = LRU order
+let hits = 0;
+let misses = 0;
+
+registerGauge('preview_cache_entries', 'Memoized cascade previews', () => cache.size);
+registerCounter('preview_cache_hits_total', 'Cascade previews served from the memo', () => hits);
+registerCounter('preview_cache_misses_total', 'Cascade previews computed', () => misses);
+
+export function stateVersion(state: GameState): string {
+  return `${state.updatedAt}.${state.log.length}`;
+}
+
+// Validates a request body's `changes` and returns them in canonical
+// form (known fields only, sorted by service id), so equivalent
+// hypotheticals share a memo key.
+export function normalizeChanges(raw: unknown): HypotheticalChange[] {
+  if (!Array.isArray(raw) || raw.length === 0 || raw.length > MAX_CHANGES) {
+    throw new GameError('INVALID_TARGET', `changes must be an array of 1-${MAX_CHANGES} service changes.`);
+  }
+
+  const changes = raw.map((item): HypotheticalChange => {
+    const c = (typeof item === 'object' && item !== null ? item : {}) as Record<string, unknown>;
+    if (typeof c.serviceId !== 'string') {
+      throw new GameError('INVALID_TARGET', 'Each change needs a serviceId.');
+    }
+    const change: HypotheticalChange = { serviceId: c.serviceId };
+    if (c.state !== undefined) {
+      if (!SERVICE_STATES.includes(c.state as ServiceState)) {
+        throw new GameError('INVALID_TARGET', `Invalid state '${String(c.state)}'.`);
+      }
+      change.state = c.state as ServiceState;
+    }
+    for (const field of ['int', 'damage'] as const) {
+      if (c[field] === undefined) continue;
+      if (typeof c[field] !== 'number' || !Number.isFinite(c[field]) || (c[field] as number) < 0) {
+        throw new GameError('INVALID_TARGET', `${field} must be a non-negative number.`);
+      }
+      change[field] = Math.floor(c[field] as number);
+    }
+    if (change.state === undefined && change.int === undefined && change.damage === undefined) {
+      throw new GameError('INVALID_TARGET', `Change for '${change.serviceId}' has no state, int or damage.`);
+    }
+    return change;
+  });
+
+  // Stable sort: several changes to one service keep their relative order
+  return changes.sort((a, b) => (a.serviceId < b.serviceId ? -1 : a.serviceId > b.serviceId ? 1 : 0));
+}
+
+function memoKey(gameId: string, state: GameState, changes: HypotheticalChange[]): string {
+  const parts = changes.map((c) => `${c.serviceId}:${c.state ?? ''}:${c.int ?? ''}:${c.damage ?? ''}`);
+  return `${gameId}|${stateVersion(state)}|${parts.join(',')}`;
+}
+
+// `changes` must already be normalized (see normalizeChanges)
+export function getCascadePreview(
+  gameId: string,
+  state: GameState,
+  changes: HypotheticalChange[]
+): { preview: CascadePreview; cached: boolean } {
+  const key = memoKey(gameId, state, changes);
+  const hit = cache.get(key);
+  if (hit) {
+    hits++;
+    cache.delete(key);
+    cache.set(key, hit);
+    return { preview: hit, cached: true };
+  }
+
+  misses++;
+  const preview = previewCascadeEval(state, changes);
+  cache.set(key, preview);
+  if (cache.size > MAX_ENTRIES) {
+    cache.delete(cache.keys().next().value as string);
+  }
+  return { preview, cached: false };
+}
+
+export function clearPreviewCache(): void {
+  cache.clear();
+  hits = 0;
+  misses = 0;
+}
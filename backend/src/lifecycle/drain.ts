@@ -0,0 +1,64 @@
+import { Request, Response, NextFunction } from 'express';
+import { registerGauge } from '../observability/metrics';
+
+// ============================================================
+// DRAIN STATE
+// Set on SIGTERM/SIGINT (see server.ts). While draining, existing
+// games keep being served until their sockets are told to reconnect,
+// but no new rooms or connections are accepted.
+// ============================================================
+
+let draining = false;
+let inflight = 0;
+
+registerGauge('http_inflight', 'HTTP requests currently in flight', () => inflight);
+
+export function isDraining(): boolean {
+  return draining;
+}
+
+export function beginDrain(): void {
+  draining = true;
+}
+
+// Guards the routes that create rooms (games, tournaments)
+export function rejectWhileDraining(_req: Request, res: Response, next: NextFunction): void {
+  if (!draining) {
+    next();
+    return;
+  }
+  res.setHeader('Retry-After', 5);
+  res.status(503).json({ error: 'DRAINING', message: 'Server is restarting; try again in a few seconds.' });
+}
+
+// Counts every HTTP request until its response ends, whatever the
+// admission settings, so the drain knows what it would cut off
+export function trackInflight(_req: Request, res: Response, next: NextFunction): void {
+  inflight++;
+  let done = false;
+  const release = () => {
+    if (done) return;
+    done = true;
+    inflight--;
+  };
+  res.on('finish', release);
+  res.on('close', release);
+  next();
+}
+
+export function inflightRequests(): number {
+  return inflight;
+}
+
+// Resolves once no HTTP request is in flight, or after timeoutMs
+export function waitForInflight(timeoutMs: number): Promise<boolean> {
+  const deadline = Date.now() + timeoutMs;
+  return new Promise((resolve) => {
+    const poll = () => {
+      if (inflight <= 0) resolve(true);
+      else if (Date.now() >= deadline) resolve(false);
+      else setTimeout(poll, 25);
+    };
+    poll();
+  });
+}
@@ -0,0 +1,197 @@
+import { performance, monitorEventLoopDelay, IntervalHistogram } from 'perf_hooks';
+
+// ============================================================
+// METRICS
+// Minimal Prometheus-style registry (text exposition format 0.0.4).
+// Enabled with METRICS_ENABLED=true. When disabled every helper is a
+// single boolean check before calling straight through, so the
+// instrumented hot paths cost next to nothing.
+// ============================================================
+
+const LATENCY_BUCKETS = [0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1];
+const BYTE_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576];
+const COUNT_BUCKETS = [0, 1, 2, 3, 5, 10, 25, 50, 100, 250, 500];
+
+interface HistogramDef {
+  help: string;
+  buckets: number[];
+  label?: string;
+}
+
+const HISTOGRAMS = {
+  engine_play_card_seconds: { help: 'Time spent in playCard', buckets: LATENCY_BUCKETS },
+  engine_process_phase_seconds: { help: 'Time spent processing an automatic phase', buckets: LATENCY_BUCKETS, label: 'phase' },
+  engine_cascade_waves: { help: 'Cascade waves executed per resolveCascades call', buckets: [0, 1, 2, 3] },
+  db_read_seconds: { help: 'SQLite read latency', buckets: LATENCY_BUCKETS, label: 'op' },
+  db_write_seconds: { help: 'SQLite write latency', buckets: LATENCY_BUCKETS, label: 'op' },
+  json_parse_seconds: { help: 'JSON.parse time', buckets: LATENCY_BUCKETS, label: 'kind' },
+  json_parse_bytes: { help: 'JSON.parse input size', buckets: BYTE_BUCKETS, label: 'kind' },
+  json_serialize_seconds: { help: 'JSON.stringify time', buckets: LATENCY_BUCKETS, label: 'kind' },
+  json_serialize_bytes: { help: 'JSON.stringify output size', buckets: BYTE_BUCKETS, label: 'kind' },
+  ws_broadcast_seconds: { help: 'Time to fan a message out to a room', buckets: LATENCY_BUCKETS },
+  ws_broadcast_recipients: { help: 'Open sockets reached per broadcast', buckets: COUNT_BUCKETS },
+  spectator_fanout_seconds: { help: 'Time to send one shared frame to every viewer of a room', buckets: LATENCY_BUCKETS },
+  spectator_frame_lag_seconds: { help: 'Delay from the first coalesced update to its frame being sent', buckets: LATENCY_BUCKETS },
+  spectator_frame_bytes: { help: 'Encoded spectator frame size', buckets: BYTE_BUCKETS },
+  spectator_coalesced_updates: { help: 'State updates merged into one spectator frame', buckets: COUNT_BUCKETS },
+  scheduler_fire_lag_seconds: { help: 'Delay between a phase deadline and its auto-advance', buckets: LATENCY_BUCKETS },
+} satisfies Record<string, HistogramDef>;
+
+export type HistogramName = keyof typeof HISTOGRAMS;
+
+interface HistogramSeries {
+  counts: number[]; // per bucket, non-cumulative; last slot is +Inf
+  sum: number;
+  count: number;
+}
+
+interface SampledDef {
+  help: string;
+  type: 'gauge' | 'counter';
+  collect: () => number;
+}
+
+let enabled = process.env.METRICS_ENABLED === 'true';
+
+const series = new Map<HistogramName, Map<string, HistogramSeries>>();
+const sampled = new Map<string, SampledDef>();
+let loopDelay: IntervalHistogram | null = null;
+
+export function isMetricsEnabled(): boolean {
+  return enabled;
+}
+
+export function setMetricsEnabled(value: boolean): void {
+  enabled = value;
+  if (enabled && !loopDelay) {
+    loopDelay = monitorEventLoopDelay({ resolution: 20 });
+    loopDelay.enable();
+  } else if (!enabled && loopDelay) {
+    loopDelay.disable();
+    loopDelay = null;
+  }
+}
+
+// ============================================================
+// RECORDING
+// ============================================================
+
+export function observe(name: HistogramName, value: number, label = ''): void {
+  if (!enabled) return;
+
+  let byLabel = series.get(name);
+  if (!byLabel) {
+    byLabel = new Map();
+    series.set(name, byLabel);
+  }
+
+  const buckets = (HISTOGRAMS[name] as HistogramDef).buckets;
+  let s = byLabel.get(label);
+  if (!s) {
+    s = { counts: new Array(buckets.length + 1).fill(0), sum: 0, count: 0 };
+    byLabel.set(label, s);
+  }
+
+  let i = 0;
+  while (i < buckets.length && value > buckets[i]) i++;
+  s.counts[i]++;
+  s.sum += value;
+  s.count++;
+}
+
+export function timeSync<T>(name: HistogramName, label: string, fn: () => T): T {
+  if (!enabled) return fn();
+  const start = performance.now();
+  try {
+    return fn();
+  } finally {
+    observe(name, (performance.now() - start) / 1000, label);
+  }
+}
+
+export function parseJson<T>(kind: string, text: string): T {
+  if (!enabled) return JSON.parse(text) as T;
+  const start = performance.now();
+  const value = JSON.parse(text) as T;
+  observe('json_parse_seconds', (performance.now() - start) / 1000, kind);
+  observe('json_parse_bytes', text.length, kind);
+  return value;
+}
+
+export function stringifyJson(kind: string, value: unknown): string {
+  if (!enabled) return JSON.stringify(value);
+  const start = performance.now();
+  const text = JSON.stringify(value);
+  observe('json_serialize_seconds', (performance.now() - start) / 1000, kind);
+  observe('json_serialize_bytes', text.length, kind);
+  return text;
+}
+
+// Gauges are sampled lazily at scrape time, so registering one is free.
+export function registerGauge(name: string, help: string, collect: () => number): void {
+  sampled.set(name, { help, type: 'gauge', collect });
+}
+
+// Same, for cumulative totals that only go up (Prometheus `rate()` needs
+// the counter type); by convention the name ends in _total.
+export function registerCounter(name: string, help: string, collect: () => number): void {
+  sampled.set(name, { help, type: 'counter', collect });
+}
+
+function nanosToSeconds(ns: number | undefined): number {
+  return ns !== undefined && Number.isFinite(ns) ? ns / 1e9 : 0;
+}
+
+registerGauge('nodejs_eventloop_lag_mean_seconds', 'Mean event-loop delay since last scrape', () =>
+  nanosToSeconds(loopDelay?.mean)
+);
+registerGauge('nodejs_eventloop_lag_p99_seconds', 'p99 event-loop delay since last scrape', () =>
+  nanosToSeconds(loopDelay?.percentile(99))
+);
+
+// ============================================================
+// EXPOSITION
+// ============================================================
+
+function formatLabels(labelName: string | undefined, labelValue: string, extra?: string): string {
+  const parts: string[] = [];
+  if (labelName && labelValue !== '') parts.push(`${labelName}="${labelValue.replace(/["\\\n]/g, '_')}"`);
+  if (extra) parts.push(extra);
+  return parts.length > 0 ? `{${parts.join(',')}}` : '';
+}
+
+export function renderMetrics(): string {
+  const lines: string[] = [];
+
+  for (const [name, def] of Object.entries(HISTOGRAMS) as [HistogramName, HistogramDef][]) {
+    lines.push(`# HELP ${name} ${def.help}`);
+    lines.push(`# TYPE ${name} histogram`);
+    const byLabel = series.get(name);
+    if (!byLabel) continue;
+
+    for (const [labelValue, s] of byLabel) {
+      let cumulative = 0;
+      def.buckets.forEach((le, i) => {
+        cumulative += s.counts[i];
+        lines.push(`${name}_bucket${formatLabels(def.label, labelValue, `le="${le}"`)} ${cumulative}`);
+      });
+      lines.push(`${name}_bucket${formatLabels(def.label, labelValue, 'le="+Inf"')} ${s.count}`);
+      lines.push(`${name}_sum${formatLabels(def.label, labelValue)} ${s.sum}`);
+      lines.push(`${name}_count${formatLabels(def.label, labelValue)} ${s.count}`);
+    }
+  }
+
+  for (const [name, g] of sampled) {
+    lines.push(`# HELP ${name} ${g.help}`);
+    lines.push(`# TYPE ${name} ${g.type}`);
+    lines.push(`${name} ${g.collect()}`);
+  }
+
+  // Event-loop delay is reported per scrape interval
+  loopDelay?.reset();
+
+  return lines.join('\n') + '\n';
+}
+
+// Start the event-loop monitor when enabled via the environment
+setMetricsEnabled(enabled);
@@ -0,0 +1,199 @@
+import { performance } from 'perf_hooks';
+import { fnv1a } from '../util/hash';
+
+// ============================================================
+// TRACING
+// Opt-in per-command span trees (TRACING_ENABLED=true). A command
+// (one WS message or REST call) opens a trace; engine, persistence and
+// broadcast code add nested spans with withSpan(). Finished traces go
+// into a bounded in-memory ring and can be exported in Chrome
+// trace-event format (chrome://tracing, Perfetto, speedscope).
+//
+// Games are sampled deterministically by id (TRACE_SAMPLE_RATE, 0-1),
+// and individual games can be force-traced with watchGame().
+// All engine code is synchronous, so a single "current trace" slot is
+// enough to thread context without passing it through every call.
+// ============================================================
+
+export interface SpanRecord {
+  name: string;
+  startUs: number; // epoch microseconds
+  durUs: number;
+  depth: number;
+  args?: Record<string, unknown>;
+}
+
+export interface Trace {
+  id: number;
+  gameId: string;
+  name: string;
+  startedAt: number; // epoch ms
+  spans: SpanRecord[];
+}
+
+let enabled = process.env.TRACING_ENABLED === 'true';
+let sampleRate = parseSampleRate(process.env.TRACE_SAMPLE_RATE);
+let ringSize = parseInt(process.env.TRACE_RING_SIZE ?? '', 10) || 500;
+
+const ring: Trace[] = [];
+let ringHead = 0; // next slot to overwrite once the ring is full
+let nextTraceId = 1;
+const watchedGames = new Set<string>();
+
+let current: { trace: Trace; depth: number } | null = null;
+
+function parseSampleRate(raw: string | undefined): number {
+  const rate = raw === undefined ? 1 : parseFloat(raw);
+  return Number.isNaN(rate) ? 1 : Math.max(0, Math.min(1, rate));
+}
+
+function nowUs(): number {
+  return (performance.timeOrigin + performance.now()) * 1000;
+}
+
+function isSampled(gameId: string): boolean {
+  if (watchedGames.has(gameId)) return true;
+  if (sampleRate >= 1) return true;
+  if (sampleRate <= 0) return false;
+  // Hashed, so a game is either always or never sampled
+  return fnv1a(gameId) % 10000 < sampleRate * 10000;
+}
+
+// ============================================================
+// CONFIGURATION
+// ============================================================
+
+export interface TracingConfig {
+  enabled: boolean;
+  sampleRate: number;
+  ringSize: number;
+  watchedGames: string[];
+}
+
+export function getTracingConfig(): TracingConfig {
+  return { enabled, sampleRate, ringSize, watchedGames: [...watchedGames] };
+}
+
+export function configureTracing(config: Partial<Omit<TracingConfig, 'watchedGames'>>): void {
+  if (config.enabled !== undefined) enabled = config.enabled;
+  if (config.sampleRate !== undefined) sampleRate = Math.max(0, Math.min(1, config.sampleRate));
+  if (config.ringSize !== undefined && config.ringSize > 0) {
+    ringSize = config.ringSize;
+    clearTraces();
+  }
+}
+
+export function watchGame(gameId: string): void {
+  watchedGames.add(gameId);
+}
+
+export function unwatchGame(gameId: string): void {
+  watchedGames.delete(gameId);
+}
+
+// ============================================================
+// RECORDING
+// ============================================================
+
+export function isTracing(): boolean {
+  return current !== null;
+}
+
+// Opens a trace around one command. Nested calls (e.g. a command that
+// internally triggers another) simply become spans of the outer trace.
+export function traceCommand<T>(
+  name: string,
+  gameId: string,
+  fn: () => T,
+  args?: Record<string, unknown>
+): T {
+  if (current) return withSpan(name, fn, args);
+  if (!enabled || !isSampled(gameId)) return fn();
+
+  const trace: Trace = { id: nextTraceId++, gameId, name, startedAt: Date.now(), spans: [] };
+  current = { trace, depth: 0 };
+  try {
+    return withSpan(name, fn, args);
+  } finally {
+    current = null;
+    pushTrace(trace);
+  }
+}
+
+export function withSpan<T>(name: string, fn: () => T, args?: Record<string, unknown>): T {
+  if (!current) return fn();
+
+  const span: SpanRecord = { name, startUs: nowUs(), durUs: 0, depth: current.depth, args };
+  current.trace.spans.push(span);
+  current.depth++;
+  const ctx = current;
+  try {
+    return fn();
+  } finally {
+    ctx.depth--;
+    span.durUs = nowUs() - span.startUs;
+  }
+}
+
+function pushTrace(trace: Trace): void {
+  if (ring.length < ringSize) {
+    ring.push(trace);
+  } else {
+    ring[ringHead] = trace;
+    ringHead = (ringHead + 1) % ringSize;
+  }
+}
+
+// ============================================================
+// QUERY / EXPORT
+// ============================================================
+
+export function getTraces(gameId?: string): Trace[] {
+  const ordered = [...ring.slice(ringHead), ...ring.slice(0, ringHead)];
+  return gameId ? ordered.filter((t) => t.gameId === gameId) : ordered;
+}
+
+export function clearTraces(): void {
+  ring.length = 0;
+  ringHead = 0;
+}
+
+interface ChromeTraceEvent {
+  name: string;
+  cat?: string;
+  ph: 'X' | 'M';
+  ts?: number;
+  dur?: number;
+  pid: number;
+  tid: number;
+  args?: Record<string, unknown>;
+}
+
+// One Chrome "thread" per game so concurrent games don't interleave
+export function toChromeTrace(traces: Trace[]): { traceEvents: ChromeTraceEvent[]; displayTimeUnit: 'ms' } {
+  const events: ChromeTraceEvent[] = [];
+  const tids = new Map<string, number>();
+
+  for (const trace of traces) {
+    let tid = tids.get(trace.gameId);
+    if (tid === undefined) {
+      tid = tids.size + 1;
+      tids.set(trace.gameId, tid);
+      events.push({ name: 'thread_name', ph: 'M', pid: 1, tid, args: { name: `game ${trace.gameId}` } });
+    }
+    for (const span of trace.spans) {
+      events.push({
+        name: span.name,
+        cat: trace.name,
+        ph: 'X',
+        ts: Math.round(span.startUs),
+        dur: Math.max(1, Math.round(span.durUs)),
+        pid: 1,
+        tid,
+        args: { traceId: trace.id, ...(span.args ?? {}) },
+      });
+    }
+  }
+
+  return { traceEvents: events, displayTimeUnit: 'ms' };
+}
@@ -0,0 +1,197 @@
+import { GameState, TurnPhase, WsGameState, WsPhaseTimer } from '../types/game.types';
+import {
+  loadGame,
+  saveGame,
+  saveLogs,
+  savePhaseDeadline,
+  deletePhaseDeadline,
+  loadPhaseDeadlines,
+  PhaseDeadline,
+} from '../db/migrations';
+import { advancePhase } from '../engine/gameEngine';
+import { observe, parseJson, stringifyJson, registerGauge } from '../observability/metrics';
+import { traceCommand, withSpan } from '../observability/tracing';
+import { TimerWheel } from './timerWheel';
+
+// ============================================================
+// PHASE SCHEDULER
+// Games created with config.phaseSeconds get a deadline per phase.
+// All deadlines live in one hierarchical timer wheel turned by a
+// single interval; an expired phase is advanced through the engine
+// exactly like an ADVANCE_PHASE from a client, then persisted and
+// broadcast. Deadlines are mirrored to the phase_deadlines table, so a
+// restart reschedules them (phases that expired while down advance on
+// the first tick).
+//
+// Countdowns are not ticked over the wire: each phase change sends one
+// PHASE_TIMER message with the absolute deadline and the server clock,
+// and clients count down locally.
+// ============================================================
+
+const TICK_MS = parseInt(process.env.PHASE_TICK_MS ?? '', 10) || 250;
+
+const TIMED_PHASES: TurnPhase[] = [
+  'MAINTENANCE',
+  'EVENT',
+  'MALOSOS_PREP',
+  'MALOSOS_ATTACK',
+  'BUENOSOS_RESPONSE',
+  'CASCADE_EVAL',
+  'TURN_END',
+];
+
+const wheel = new TimerWheel<string>(TICK_MS);
+const deadlines = new Map<string, PhaseDeadline>();
+let interval: NodeJS.Timeout | null = null;
+let broadcast: (gameId: string, message: unknown) => void = () => undefined;
+
+registerGauge('phase_timers_active', 'Games with a running phase timer', () => wheel.size);
+
+// Keeps only known phases with a positive duration
+export function parsePhaseSeconds(raw: unknown): Partial<Record<TurnPhase, number>> | undefined {
+  if (typeof raw !== 'object' || raw === null) return undefined;
+  const out: Partial<Record<TurnPhase, number>> = {};
+  for (const phase of TIMED_PHASES) {
+    const seconds = (raw as Record<string, unknown>)[phase];
+    if (typeof seconds === 'number' && Number.isFinite(seconds) && seconds > 0) out[phase] = seconds;
+  }
+  return Object.keys(out).length > 0 ? out : undefined;
+}
+
+// ============================================================
+// LIFECYCLE
+// ============================================================
+
+export function startPhaseScheduler(options: { broadcast: (gameId: string, message: unknown) => void }): void {
+  broadcast = options.broadcast;
+
+  for (const d of loadPhaseDeadlines()) {
+    deadlines.set(d.gameId, d);
+    if (d.deadlineAt !== null) wheel.schedule(d.gameId, d.deadlineAt);
+  }
+  if (deadlines.size > 0) {
+    console.log(`[Scheduler] Restored ${deadlines.size} phase deadline(s).`);
+  }
+
+  if (!interval) {
+    interval = setInterval(tick, TICK_MS);
+    interval.unref();
+  }
+}
+
+export function stopPhaseScheduler(): void {
+  if (interval) clearInterval(interval);
+  interval = null;
+}
+
+export function getPhaseTimer(gameId: string): WsPhaseTimer | null {
+  const d = deadlines.get(gameId);
+  return d ? timerMessage(d) : null;
+}
+
+function timerMessage(d: PhaseDeadline): WsPhaseTimer {
+  return {
+    type: 'PHASE_TIMER',
+    gameId: d.gameId,
+    turn: d.turn,
+    phase: d.phase,
+    deadlineAt: d.deadlineAt,
+    remainingMs: d.remainingMs,
+    serverTime: Date.now(),
+  };
+}
+
+// ============================================================
+// syncPhaseDeadline
+// Called after every committed state change. Starts a timer when the
+// game enters a timed phase, freezes it on pause, resumes it with the
+// remaining time and drops it when the game stops being timed.
+// ============================================================
+
+export function syncPhaseDeadline(state: GameState): void {
+  const current = deadlines.get(state.id);
+  const seconds = state.config.phaseSeconds?.[state.markers.phase];
+  const samePhase =
+    current !== undefined && current.turn === state.markers.turn && current.phase === state.markers.phase;
+
+  if (state.status === 'paused') {
+    if (current && current.deadlineAt !== null) {
+      setDeadline({ ...current, deadlineAt: null, remainingMs: Math.max(0, current.deadlineAt - Date.now()) });
+    }
+    return;
+  }
+
+  if (state.status !== 'running' || !seconds) {
+    if (current) clearDeadline(state.id, current);
+    return;
+  }
+
+  if (samePhase && current.deadlineAt !== null) return; // e.g. a card played mid-phase
+
+  const now = Date.now();
+  const deadlineAt = samePhase && current.remainingMs !== null ? now + current.remainingMs : now + seconds * 1000;
+  setDeadline({ gameId: state.id, turn: state.markers.turn, phase: state.markers.phase, deadlineAt, remainingMs: null });
+}
+
+function setDeadline(d: PhaseDeadline): void {
+  deadlines.set(d.gameId, d);
+  savePhaseDeadline(d);
+  if (d.deadlineAt !== null) wheel.schedule(d.gameId, d.deadlineAt);
+  else wheel.cancel(d.gameId);
+  broadcast(d.gameId, timerMessage(d));
+}
+
+function clearDeadline(gameId: string, current: PhaseDeadline): void {
+  deadlines.delete(gameId);
+  deletePhaseDeadline(gameId);
+  wheel.cancel(gameId);
+  broadcast(gameId, timerMessage({ ...current, deadlineAt: null, remainingMs: null }));
+}
+
+// ============================================================
+// EXPIRY
+// ============================================================
+
+function tick(): void {
+  const now = Date.now();
+  for (const gameId of wheel.advance(now)) {
+    const d = deadlines.get(gameId);
+    if (!d || d.deadlineAt === null) continue;
+    observe('scheduler_fire_lag_seconds', Math.max(0, now - d.deadlineAt) / 1000);
+    try {
+      traceCommand('scheduler.advance', gameId, () => expire(d));
+    } catch (err) {
+      // Drop the timer; the next committed change re-arms it
+      console.error(`[Scheduler] Failed to advance game ${gameId}:`, err);
+      deadlines.delete(gameId);
+      deletePhaseDeadline(gameId);
+    }
+  }
+}
+
+function expire(d: PhaseDeadline): void {
+  const row = withSpan('db.load', () => loadGame(d.gameId));
+  if (!row) {
+    deadlines.delete(d.gameId);
+    deletePhaseDeadline(d.gameId);
+    return;
+  }
+
+  const state = parseJson<GameState>('game_state', row.state_json);
+
+  // Someone advanced (or paused) the game after the deadline was set
+  if (state.status !== 'running' || state.markers.turn !== d.turn || state.markers.phase !== d.phase) {
+    syncPhaseDeadline(state);
+    return;
+  }
+
+  const newState = advancePhase(state);
+  withSpan('db.save', () => {
+    saveGame(newState.id, newState.status, JSON.stringify(newState.config), stringifyJson('game_state', newState));
+    saveLogs(newState.id, newState.log.slice(state.log.length));
+  });
+
+  const stateMsg: WsGameState = { type: 'GAME_STATE', state: newState };
+  broadcast(d.gameId, stateMsg);
+  syncPhaseDeadline(newState);
+}
@@ -0,0 +1,124 @@
+// ============================================================
+// HIERARCHICAL TIMER WHEEL
+// Keyed one-shot timers for many games without one setTimeout each.
+// Level 0 has `slots` buckets of one tick; every higher level covers
+// `slots` times the span of the one below. Timers far in the future
+// sit in a coarse bucket and are re-placed into finer levels as the
+// wheel turns, so advancing one tick only touches the timers that are
+// due (plus an occasional cascade of one coarse bucket).
+//
+// The wheel keeps no clock of its own: the owner calls advance(now)
+// from a single interval and gets back the keys that expired.
+// ============================================================
+
+interface WheelEntry<K> {
+  key: K;
+  deadline: number; // ms
+  tick: number; // absolute tick at which it fires
+}
+
+export class TimerWheel<K> {
+  private readonly spans: number[]; // ticks covered by one bucket of each level
+  private readonly wheels: Set<WheelEntry<K>>[][];
+  private readonly entries = new Map<K, WheelEntry<K>>();
+  private due: WheelEntry<K>[] = [];
+  private current: number;
+
+  constructor(
+    readonly tickMs = 100,
+    readonly slots = 64,
+    readonly levels = 4,
+    now = Date.now()
+  ) {
+    this.spans = Array.from({ length: levels + 1 }, (_, l) => Math.pow(slots, l));
+    this.wheels = Array.from({ length: levels }, () => Array.from({ length: slots }, () => new Set<WheelEntry<K>>()));
+    this.current = Math.floor(now / tickMs);
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  has(key: K): boolean {
+    return this.entries.has(key);
+  }
+
+  deadlineOf(key: K): number | undefined {
+    return this.entries.get(key)?.deadline;
+  }
+
+  // Schedules (or reschedules) `key` to fire at `deadline` (epoch ms)
+  schedule(key: K, deadline: number): void {
+    this.cancel(key);
+    const entry: WheelEntry<K> = { key, deadline, tick: Math.ceil(deadline / this.tickMs) };
+    this.entries.set(key, entry);
+    this.place(entry);
+  }
+
+  cancel(key: K): boolean {
+    const entry = this.entries.get(key);
+    if (!entry) return false;
+    this.entries.delete(key);
+    // Buckets are swept lazily: stale entries are skipped when reached
+    return true;
+  }
+
+  // Turns the wheel up to `now` and returns the keys that expired, in
+  // deadline order.
+  advance(now: number): K[] {
+    const target = Math.floor(now / this.tickMs);
+    const fired: WheelEntry<K>[] = [];
+
+    this.collect(this.due, fired);
+    this.due = [];
+
+    while (this.current < target) {
+      this.current++;
+
+      // Cascade every coarser level whose bucket boundary was crossed
+      for (let l = 1; l < this.levels; l++) {
+        if (this.current % this.spans[l] !== 0) break;
+        const index = Math.floor(this.current / this.spans[l]) % this.slots;
+        const bucket = this.wheels[l][index];
+        this.wheels[l][index] = new Set();
+        for (const entry of bucket) {
+          if (this.entries.get(entry.key) === entry) this.place(entry);
+        }
+      }
+
+      const index = this.current % this.slots;
+      const bucket = this.wheels[0][index];
+      this.wheels[0][index] = new Set();
+      this.collect(bucket, fired);
+      this.collect(this.due, fired);
+      this.due = [];
+    }
+
+    fired.sort((a, b) => a.deadline - b.deadline);
+    return fired.map((e) => e.key);
+  }
+
+  private collect(bucket: Iterable<WheelEntry<K>>, fired: WheelEntry<K>[]): void {
+    for (const entry of bucket) {
+      if (this.entries.get(entry.key) !== entry) continue; // cancelled or rescheduled
+      this.entries.delete(entry.key);
+      fired.push(entry);
+    }
+  }
+
+  private place(entry: WheelEntry<K>): void {
+    const delta = entry.tick - this.current;
+    if (delta <= 0) {
+      this.due.push(entry);
+      return;
+    }
+
+    // Beyond the top level's range: park in the farthest top bucket and
+    // let the cascade re-place it later
+    const tick = delta < this.spans[this.levels] ? entry.tick : this.current + this.spans[this.levels] - 1;
+    let level = 0;
+    while (tick - this.current >= this.spans[level + 1]) level++;
+    const index = Math.floor(tick / this.spans[level]) % this.slots;
+    this.wheels[level][index].add(entry);
+  }
+}
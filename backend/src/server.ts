@@ -2,10 +2,23 @@ import express from 'express';
 import http from 'http';
 import cors from 'cors';
 import { WebSocketServer } from 'ws';
-import { runMigrations } from './db/migrations';
+import { performance } from 'perf_hooks';
+import { runMigrations, warmActiveGames } from './db/migrations';
+import { closeDb } from './db/database';
+import { closeStore } from './db/storage';
 import gamesRouter from './api/gamesRouter';
-import { setupWebSocket } from './ws/wsHandler';
-import { ALL_CARDS } from './data/cards';
+import exportRouter from './api/exportRouter';
+import analyticsRouter from './api/analyticsRouter';
+import tracesRouter from './api/tracesRouter';
+import tournamentsRouter from './api/tournamentsRouter';
+import catalogRouter, { sendAsset } from './api/catalogRouter';
+import { setupWebSocket, broadcastToGame, drainConnections } from './ws/wsHandler';
+import { closeSpectators } from './ws/spectatorHub';
+import { startPhaseScheduler, stopPhaseScheduler } from './scheduler/phaseScheduler';
+import { CARDS_ASSET } from './data/catalog';
+import { admissionMiddleware } from './admission/admission';
+import { beginDrain, isDraining, trackInflight, waitForInflight } from './lifecycle/drain';
+import { isMetricsEnabled, renderMetrics } from './observability/metrics';
 
 // ============================================================
 // CONFIGURATION
@@ -13,6 +26,9 @@ import { ALL_CARDS } from './data/cards';
 
 const PORT = process.env.PORT ? parseInt(process.env.PORT, 10) : 3001;
 const FRONTEND_ORIGIN = process.env.FRONTEND_ORIGIN ?? 'http://localhost:5173';
+const PREWARM_ACTIVE_GAMES = process.env.PREWARM_ACTIVE_GAMES !== 'false';
+const DRAIN_TIMEOUT_MS = parseInt(process.env.DRAIN_TIMEOUT_MS ?? '', 10) || 10000;
+const DRAIN_RECONNECT_SPREAD_MS = parseInt(process.env.DRAIN_RECONNECT_SPREAD_MS ?? '', 10) || 2000;
 
 // ============================================================
 // EXPRESS APP
@@ -30,6 +46,12 @@ app.use(
   })
 );
 
+// Counted for the graceful drain, whether or not admission is enabled
+app.use(trackInflight);
+
+// Rate limits and load shedding run before the body is parsed
+app.use(admissionMiddleware);
+
 app.use(express.json());
 
 // Health check
@@ -37,12 +59,27 @@ app.get('/health', (_req, res) => {
   res.json({ status: 'ok', timestamp: new Date().toISOString() });
 });
 
+// Prometheus scrape endpoint (METRICS_ENABLED=true)
+app.get('/metrics', (_req, res) => {
+  if (!isMetricsEnabled()) {
+    res.status(404).json({ error: 'NOT_FOUND', message: 'Metrics are disabled.' });
+    return;
+  }
+  res.setHeader('Content-Type', 'text/plain; version=0.0.4; charset=utf-8');
+  res.send(renderMetrics());
+});
+
 // REST API
 app.use('/api/games', gamesRouter);
-
-// Card catalog (static game data)
-app.get('/api/cards', (_req, res) => {
-  res.json({ cards: ALL_CARDS });
+app.use('/api/export', exportRouter);
+app.use('/api/analytics', analyticsRouter);
+app.use('/api/traces', tracesRouter);
+app.use('/api/tournaments', tournamentsRouter);
+app.use('/api/catalog', catalogRouter);
+
+// Card catalog (static game data, precompressed; revalidated via ETag)
+app.get('/api/cards', (req, res) => {
+  sendAsset(req, res, CARDS_ASSET, false);
 });
 
 // ============================================================
@@ -72,14 +109,29 @@ setupWebSocket(wss);
 // ============================================================
 
 function main(): void {
+  const bootStart = performance.now();
+
   // Run DB migrations before starting
   runMigrations();
 
+  // Load live games in bulk so reconnecting clients hit a warm cache
+  if (PREWARM_ACTIVE_GAMES) {
+    const warmStart = performance.now();
+    const warmed = warmActiveGames();
+    console.log(
+      `[Server] Pre-warmed ${warmed.games} active games (${warmed.players} players) in ${(performance.now() - warmStart).toFixed(1)} ms`
+    );
+  }
+
+  // Resume persisted phase deadlines and start the timer wheel
+  startPhaseScheduler({ broadcast: broadcastToGame });
+
   server.listen(PORT, () => {
     console.log(`[Server] BuenOsos vs MalOsos backend running on port ${PORT}`);
     console.log(`[Server] REST API: http://localhost:${PORT}/api`);
     console.log(`[Server] WebSocket: ws://localhost:${PORT}/ws/games/:gameId?token=<token>`);
     console.log(`[Server] CORS origin: ${FRONTEND_ORIGIN}`);
+    console.log(`[Server] Ready in ${(performance.now() - bootStart).toFixed(1)} ms`);
   });
 
   server.on('error', (err) => {
@@ -88,6 +140,45 @@ function main(): void {
   });
 }
 
+// ============================================================
+// GRACEFUL DRAIN (SIGTERM / SIGINT)
+// 1. Refuse new rooms and WS connections (lifecycle/drain.ts).
+// 2. Stop the phase scheduler; deadlines are already persisted and the
+//    next process resumes them.
+// 3. Send every socket SERVER_RESTART with its state version and a
+//    jittered reconnect delay, then close it with 1012.
+// 4. Let in-flight HTTP requests finish (up to DRAIN_TIMEOUT_MS) and
+//    close SQLite, which checkpoints the WAL.
+// Game state is written synchronously on every action, so there is no
+// buffered state to lose.
+// ============================================================
+
+async function shutdown(signal: string): Promise<void> {
+  if (isDraining()) return;
+  beginDrain();
+  const start = performance.now();
+  console.log(`[Server] ${signal} received, draining`);
+
+  stopPhaseScheduler();
+  server.close();
+  server.closeIdleConnections();
+
+  const players = drainConnections(DRAIN_RECONNECT_SPREAD_MS);
+  const spectators = closeSpectators();
+  const settled = await waitForInflight(DRAIN_TIMEOUT_MS);
+  closeStore();
+  closeDb();
+
+  console.log(
+    `[Server] Drained ${players} players and ${spectators} spectators in ${(performance.now() - start).toFixed(1)} ms` +
+      (settled ? '' : ' (timed out waiting for HTTP requests)')
+  );
+  process.exit(0);
+}
+
+process.once('SIGTERM', () => void shutdown('SIGTERM'));
+process.once('SIGINT', () => void shutdown('SIGINT'));
+
 main();
 
 export { app, server, wss };
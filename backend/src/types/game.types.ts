@@ -79,6 +79,7 @@ export interface GameConfig {
   budgetPerTurn: number; // default 8
   intermittenceMode: 'deterministic' | 'random'; // default deterministic
   mapId: string; // 'standard'
+  phaseSeconds?: Partial<Record<TurnPhase, number>>; // timed phases, auto-advanced on expiry
 }
 
 export interface GameMarkers {
@@ -143,7 +144,11 @@ export type ErrorCode =
   | 'INVALID_TARGET'
   | 'CARD_REQUIREMENTS_NOT_MET'
   | 'GAME_NOT_RUNNING'
-  | 'NOT_AUTHORIZED';
+  | 'NOT_AUTHORIZED'
+  | 'ROOM_FULL'
+  | 'RATE_LIMITED'
+  | 'OVERLOADED'
+  | 'DRAINING';
 
 // WebSocket messages
 export interface WsPlayCard {
@@ -182,6 +187,36 @@ export interface WsError {
   type: 'ERROR';
   code: ErrorCode;
   message: string;
+  retryAfterMs?: number; // set for RATE_LIMITED / OVERLOADED
+}
+
+// Sent once per phase change (and on connect); clients count down
+// locally against serverTime. deadlineAt null means no running timer.
+export interface WsPhaseTimer {
+  type: 'PHASE_TIMER';
+  gameId: string;
+  turn: number;
+  phase: TurnPhase;
+  deadlineAt: number | null;
+  remainingMs: number | null; // set while paused
+  serverTime: number;
+}
+
+// Sent to every socket when the server drains for a restart. Clients
+// reconnect after reconnectAfterMs passing ?version=<stateVersion>.
+export interface WsServerRestart {
+  type: 'SERVER_RESTART';
+  gameId: string;
+  stateVersion: string | null;
+  reconnectAfterMs: number;
+}
+
+// Reply on connect when the client's ?version still matches, instead
+// of the full GAME_STATE
+export interface WsStateCurrent {
+  type: 'STATE_CURRENT';
+  gameId: string;
+  stateVersion: string;
 }
 
 export type WsIncomingMessage = WsPlayCard | WsUseBasicAction | WsAdvancePhase;
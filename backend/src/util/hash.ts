@@ -0,0 +1,15 @@
+// ============================================================
+// HASHING
+// 32-bit FNV-1a over a string's UTF-16 code units. Stable across
+// processes and releases, so anything keyed on it (shard placement,
+// trace sampling) keeps mapping a game id to the same place.
+// ============================================================
+
+export function fnv1a(text: string): number {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+}
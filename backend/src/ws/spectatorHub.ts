@@ -0,0 +1,239 @@
+import { WebSocket } from 'ws';
+import { performance } from 'perf_hooks';
+import { GameState, LogEntry, Seat, WsError } from '../types/game.types';
+import { getSpectatorGameId, loadGame } from '../db/migrations';
+import { toWireState, WireGameState } from '../data/catalog';
+import { observe, isMetricsEnabled, parseJson, registerGauge } from '../observability/metrics';
+
+// ============================================================
+// SPECTATOR HUB
+// Read-only channel for large audiences: GET /ws/spectate/:gameId
+// with a spectator token. Viewers get a public projection of the
+// state (no hands or decks, compact services) instead of the players'
+// payload.
+//
+// Updates are coalesced per room: at most SPECTATOR_UPDATES_PER_SEC
+// frames go out, each carrying the latest state. A frame is encoded
+// once into a Buffer that every viewer socket shares, so fan-out cost
+// does not grow with JSON.stringify per viewer. Viewers that fall
+// behind (large bufferedAmount) skip frames; the next one supersedes
+// anything they missed.
+// ============================================================
+
+const UPDATES_PER_SEC = parseFloat(process.env.SPECTATOR_UPDATES_PER_SEC ?? '') || 2;
+const MAX_VIEWERS_PER_ROOM = parseInt(process.env.SPECTATOR_MAX_PER_ROOM ?? '', 10) || 500;
+const SLOW_VIEWER_BYTES = 1024 * 1024;
+const LOG_TAIL = 10;
+
+const MIN_INTERVAL_MS = 1000 / UPDATES_PER_SEC;
+
+interface SpectatorRoom {
+  viewers: Set<WebSocket>;
+  pending: GameState | null;
+  pendingCount: number;
+  pendingSince: number;
+  timer: NodeJS.Timeout | null;
+  lastSentAt: number;
+  lastFrame: Buffer | null; // sent to viewers as they join
+  seq: number;
+}
+
+const rooms = new Map<string, SpectatorRoom>();
+let viewerCount = 0;
+
+registerGauge('spectator_rooms', 'Rooms with at least one spectator', () => rooms.size);
+registerGauge('spectator_viewers', 'Connected spectator sockets', () => viewerCount);
+
+// ============================================================
+// PUBLIC PROJECTION
+// ============================================================
+
+export interface PublicSeat {
+  budgetRemaining: number;
+  handSize: number;
+  deckSize: number;
+  discardSize: number;
+  basicActionUsed: boolean;
+}
+
+export type PublicGameState = Omit<WireGameState, 'seats' | 'eventDeck' | 'log'> & {
+  seats: Record<Seat, PublicSeat>;
+  eventDeckSize: number;
+  recentLog: Pick<LogEntry, 'id' | 'turn' | 'phase' | 'timestamp' | 'action' | 'actor'>[];
+};
+
+export function toPublicState(state: GameState): PublicGameState {
+  const { seats, eventDeck, log, ...rest } = toWireState(state, 'compact');
+
+  const publicSeats = {} as Record<Seat, PublicSeat>;
+  for (const [seat, s] of Object.entries(seats) as [Seat, GameState['seats'][Seat]][]) {
+    publicSeats[seat] = {
+      budgetRemaining: s.budgetRemaining,
+      handSize: s.hand.length,
+      deckSize: s.deck.length,
+      discardSize: s.discard.length,
+      basicActionUsed: s.basicActionUsed,
+    };
+  }
+
+  return {
+    ...rest,
+    seats: publicSeats,
+    eventDeckSize: eventDeck.length,
+    recentLog: log.slice(-LOG_TAIL).map((e) => ({
+      id: e.id,
+      turn: e.turn,
+      phase: e.phase,
+      timestamp: e.timestamp,
+      action: e.action,
+      actor: e.actor,
+    })),
+  };
+}
+
+function encodeFrame(room: SpectatorRoom, state: GameState): Buffer {
+  room.seq++;
+  return Buffer.from(JSON.stringify({ type: 'SPECTATOR_STATE', seq: room.seq, state: toPublicState(state) }));
+}
+
+// ============================================================
+// FAN-OUT
+// ============================================================
+
+function sendFrame(room: SpectatorRoom, frame: Buffer): void {
+  const start = isMetricsEnabled() ? performance.now() : 0;
+  for (const viewer of room.viewers) {
+    if (viewer.readyState !== WebSocket.OPEN || viewer.bufferedAmount > SLOW_VIEWER_BYTES) continue;
+    viewer.send(frame, { binary: false });
+  }
+  if (isMetricsEnabled()) {
+    observe('spectator_fanout_seconds', (performance.now() - start) / 1000);
+    observe('spectator_frame_bytes', frame.length);
+  }
+}
+
+function flush(room: SpectatorRoom): void {
+  room.timer = null;
+  if (!room.pending) return;
+
+  const state = room.pending;
+  if (isMetricsEnabled()) {
+    observe('spectator_coalesced_updates', room.pendingCount);
+    observe('spectator_frame_lag_seconds', (Date.now() - room.pendingSince) / 1000);
+  }
+  room.pending = null;
+  room.pendingCount = 0;
+  room.lastSentAt = Date.now();
+
+  room.lastFrame = encodeFrame(room, state);
+  sendFrame(room, room.lastFrame);
+}
+
+// Called for every committed state of a game. Rooms without viewers
+// cost one map lookup.
+export function publishSpectatorState(gameId: string, state: GameState): void {
+  const room = rooms.get(gameId);
+  if (!room) return;
+
+  if (!room.pending) room.pendingSince = Date.now();
+  room.pending = state;
+  room.pendingCount++;
+  if (room.timer) return;
+
+  const wait = Math.max(0, room.lastSentAt + MIN_INTERVAL_MS - Date.now());
+  room.timer = setTimeout(() => flush(room), wait);
+}
+
+// Small, infrequent messages (e.g. PHASE_TIMER) skip coalescing
+export function forwardToSpectators(gameId: string, message: unknown): void {
+  const room = rooms.get(gameId);
+  if (!room) return;
+  sendFrame(room, Buffer.from(JSON.stringify(message)));
+}
+
+// ============================================================
+// CONNECTION
+// ============================================================
+
+function reject(ws: WebSocket, code: WsError['code'], message: string): void {
+  const err: WsError = { type: 'ERROR', code, message };
+  ws.send(JSON.stringify(err));
+  ws.close();
+}
+
+export function handleSpectatorConnection(ws: WebSocket, gameId: string, token: string): void {
+  if (getSpectatorGameId(token) !== gameId) {
+    reject(ws, 'NOT_AUTHORIZED', 'Invalid spectator token.');
+    return;
+  }
+
+  let room = rooms.get(gameId);
+  if (room && room.viewers.size >= MAX_VIEWERS_PER_ROOM) {
+    reject(ws, 'ROOM_FULL', `This game already has ${MAX_VIEWERS_PER_ROOM} spectators.`);
+    return;
+  }
+
+  if (!room) {
+    room = {
+      viewers: new Set(),
+      pending: null,
+      pendingCount: 0,
+      pendingSince: 0,
+      timer: null,
+      lastSentAt: 0,
+      lastFrame: null,
+      seq: 0,
+    };
+    rooms.set(gameId, room);
+  }
+  const joined = room;
+  joined.viewers.add(ws);
+  viewerCount++;
+
+  // Late joiners share the last frame; only the first viewer of an
+  // idle room pays for loading and encoding the state
+  if (!joined.lastFrame) {
+    const row = loadGame(gameId);
+    if (row) joined.lastFrame = encodeFrame(joined, parseJson<GameState>('game_state', row.state_json));
+  }
+  if (joined.lastFrame) ws.send(joined.lastFrame, { binary: false });
+
+  ws.on('message', () => {
+    const err: WsError = { type: 'ERROR', code: 'NOT_AUTHORIZED', message: 'Spectators are read-only.' };
+    ws.send(JSON.stringify(err));
+  });
+
+  // 'close' also follows an 'error', so removal must run once
+  const leave = (): void => {
+    if (!joined.viewers.delete(ws)) return;
+    viewerCount--;
+    if (joined.viewers.size === 0) {
+      if (joined.timer) clearTimeout(joined.timer);
+      if (rooms.get(gameId) === joined) rooms.delete(gameId);
+    }
+  };
+
+  ws.on('close', leave);
+
+  // A bad frame from one viewer (invalid UTF-8, oversized payload) must
+  // not become an unhandled 'error' that takes the server down
+  ws.on('error', (err) => {
+    console.error(`[WS] Error for spectator in game ${gameId}:`, err);
+    leave();
+    ws.terminate();
+  });
+}
+
+// Drain: spectators simply reconnect; the next process sends them a
+// fresh frame
+export function closeSpectators(): number {
+  let closed = 0;
+  for (const room of rooms.values()) {
+    if (room.timer) clearTimeout(room.timer);
+    for (const viewer of room.viewers) {
+      viewer.close(1012, 'Server restart');
+      closed++;
+    }
+  }
+  return closed;
+}
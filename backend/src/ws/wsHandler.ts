@@ -1,21 +1,38 @@
 import { WebSocket, WebSocketServer } from 'ws';
 import { IncomingMessage } from 'http';
 import { URL } from 'url';
+import { performance } from 'perf_hooks';
 import {
   WsIncomingMessage,
   WsGameState,
   WsActionResult,
   WsError,
+  WsServerRestart,
+  WsStateCurrent,
   GameState,
 } from '../types/game.types';
 import { getPlayerByToken } from '../db/migrations';
-import { saveGame, loadGame } from '../db/migrations';
+import { saveGame, loadGame, saveLogs } from '../db/migrations';
 import {
   playCard,
   useBasicAction,
   advancePhase,
   GameError,
 } from '../engine/gameEngine';
+import {
+  observe,
+  isMetricsEnabled,
+  parseJson,
+  stringifyJson,
+  registerGauge,
+} from '../observability/metrics';
+import { traceCommand, withSpan } from '../observability/tracing';
+import { getPhaseTimer, syncPhaseDeadline } from '../scheduler/phaseScheduler';
+import { parseStateView, toWireState, StateView } from '../data/catalog';
+import { handleSpectatorConnection, publishSpectatorState, forwardToSpectators } from './spectatorHub';
+import { admitAction } from '../admission/admission';
+import { isDraining } from '../lifecycle/drain';
+import { stateVersion } from '../engine/previewCache';
 
 // ============================================================
 // Room management: Map<gameId, Set<WebSocket>>
@@ -26,25 +43,63 @@ const rooms = new Map<string, Set<WebSocket>>();
 // Map each WebSocket to its player token for auth
 const clientTokens = new Map<WebSocket, string>();
 
+// Game-state view requested on connect (?view=compact)
+const clientViews = new Map<WebSocket, StateView>();
+
 // ============================================================
 // BROADCAST helpers
 // ============================================================
 
+registerGauge('ws_rooms', 'Rooms with at least one connected socket', () => rooms.size);
+registerGauge('ws_sockets', 'Connected WebSocket clients', () => clientTokens.size);
+
 function broadcast(gameId: string, message: unknown): void {
+  withSpan('ws.broadcast', () => broadcastUntraced(gameId, message));
+
+  // Spectators get their own coalesced, public frames
+  const msg = message as { type?: string; state?: GameState };
+  if (msg.type === 'GAME_STATE' && msg.state) publishSpectatorState(gameId, msg.state);
+  else if (msg.type === 'PHASE_TIMER') forwardToSpectators(gameId, message);
+}
+
+function broadcastUntraced(gameId: string, message: unknown): void {
   const room = rooms.get(gameId);
   if (!room) return;
 
-  const payload = JSON.stringify(message);
+  const start = isMetricsEnabled() ? performance.now() : 0;
+  // Serialized at most once per view, however many sockets share it
+  const payloads = new Map<StateView, string>();
+  let recipients = 0;
   for (const client of room) {
     if (client.readyState === WebSocket.OPEN) {
+      const view = clientViews.get(client) ?? 'full';
+      let payload = payloads.get(view);
+      if (payload === undefined) {
+        payload = stringifyJson('ws_message', forView(message, view));
+        payloads.set(view, payload);
+      }
       client.send(payload);
+      recipients++;
     }
   }
+
+  if (isMetricsEnabled()) {
+    observe('ws_broadcast_seconds', (performance.now() - start) / 1000);
+    observe('ws_broadcast_recipients', recipients);
+  }
+}
+
+// GAME_STATE messages carry catalog versions; compact clients also get
+// services without their static fields
+function forView(message: unknown, view: StateView): unknown {
+  const msg = message as { type?: string; state?: GameState };
+  if (msg.type !== 'GAME_STATE' || !msg.state) return message;
+  return { ...msg, state: toWireState(msg.state, view) };
 }
 
 function sendToClient(ws: WebSocket, message: unknown): void {
   if (ws.readyState === WebSocket.OPEN) {
-    ws.send(JSON.stringify(message));
+    ws.send(stringifyJson('ws_message', forView(message, clientViews.get(ws) ?? 'full')));
   }
 }
 
@@ -58,36 +113,60 @@ function sendError(ws: WebSocket, code: string, message: string): void {
 // ============================================================
 
 function loadGameState(gameId: string): { state: GameState; configJson: string } | null {
-  const row = loadGame(gameId);
-  if (!row) return null;
-  return { state: JSON.parse(row.state_json) as GameState, configJson: row.config_json };
+  return withSpan('db.load', () => {
+    const row = loadGame(gameId);
+    if (!row) return null;
+    return { state: parseJson<GameState>('game_state', row.state_json), configJson: row.config_json };
+  });
 }
 
-function persistState(state: GameState): void {
-  saveGame(state.id, state.status, JSON.stringify(state.config), JSON.stringify(state));
+// Saves the state plus the log entries appended since `prevLogLength`
+function persistState(state: GameState, prevLogLength: number): void {
+  withSpan('db.save', () => {
+    saveGame(state.id, state.status, JSON.stringify(state.config), stringifyJson('game_state', state));
+    saveLogs(state.id, state.log.slice(prevLogLength));
+  });
 }
 
 // ============================================================
 // UPGRADE HANDLER — called from HTTP server for WS upgrades
 // Channel: GET /ws/games/:gameId?token=<token>
+// Spectators: GET /ws/spectate/:gameId?token=<spectator token>
+// After a SERVER_RESTART hint clients add &version=<stateVersion>
 // ============================================================
 
 export function setupWebSocket(wss: WebSocketServer): void {
   wss.on('connection', (ws: WebSocket, req: IncomingMessage) => {
+    if (isDraining()) {
+      sendError(ws, 'DRAINING', 'Server is restarting; reconnect in a few seconds.');
+      ws.close(1012, 'Server restart');
+      return;
+    }
+
     // Parse URL to get gameId and token
     const rawUrl = req.url ?? '';
     let gameId: string | null = null;
     let token: string | null = null;
+    let view: StateView = 'full';
+    let spectating = false;
+    let knownVersion: string | null = null;
 
     try {
       const url = new URL(rawUrl, 'http://localhost');
       const pathParts = url.pathname.split('/');
-      // Expected path: /ws/games/:gameId
+
+      // Expected path: /ws/games/:gameId (or /ws/spectate/:gameId)
       const gamesIdx = pathParts.indexOf('games');
+      const spectateIdx = pathParts.indexOf('spectate');
       if (gamesIdx !== -1 && pathParts.length > gamesIdx + 1) {
         gameId = pathParts[gamesIdx + 1];
+      } else if (spectateIdx !== -1 && pathParts.length > spectateIdx + 1) {
+        gameId = pathParts[spectateIdx + 1];
+        spectating = true;
       }
       token = url.searchParams.get('token');
+      view = parseStateView(url.searchParams.get('view'));
+      knownVersion = url.searchParams.get('version');
     } catch {
       sendError(ws, 'NOT_AUTHORIZED', 'Invalid connection URL.');
       ws.close();
@@ -100,6 +179,11 @@ export function setupWebSocket(wss: WebSocketServer): void {
       return;
     }
 
+    if (spectating) {
+      handleSpectatorConnection(ws, gameId, token);
+      return;
+    }
+
     // Authenticate player
     const player = getPlayerByToken(token);
     if (!player) {
@@ -120,15 +204,25 @@ export function setupWebSocket(wss: WebSocketServer): void {
     }
     rooms.get(gameId)!.add(ws);
     clientTokens.set(ws, token);
+    clientViews.set(ws, view);
 
     console.log(`[WS] Player '${player.displayName}' (${player.seat}) connected to game ${gameId}`);
 
-    // Send current game state on connect
+    // Send current game state on connect, unless the client reconnects
+    // after a restart still holding the current version
     const loaded = loadGameState(gameId);
     if (loaded) {
-      const stateMsg: WsGameState = { type: 'GAME_STATE', state: loaded.state };
-      sendToClient(ws, stateMsg);
+      const version = stateVersion(loaded.state);
+      if (knownVersion === version) {
+        const current: WsStateCurrent = { type: 'STATE_CURRENT', gameId, stateVersion: version };
+        sendToClient(ws, current);
+      } else {
+        const stateMsg: WsGameState = { type: 'GAME_STATE', state: loaded.state };
+        sendToClient(ws, stateMsg);
+      }
     }
+    const timer = getPhaseTimer(gameId);
+    if (timer) sendToClient(ws, timer);
 
     // ---- MESSAGE HANDLER ----
     ws.on('message', (data) => {
@@ -140,6 +234,13 @@ export function setupWebSocket(wss: WebSocketServer): void {
         return;
       }
 
+      const rejection = admitAction(token!, gameId!);
+      if (rejection) {
+        const err: WsError = { type: 'ERROR', ...rejection };
+        sendToClient(ws, err);
+        return;
+      }
+
       handleMessage(ws, gameId!, player.seat, msg);
     });
 
@@ -153,6 +254,7 @@ export function setupWebSocket(wss: WebSocketServer): void {
         }
       }
       clientTokens.delete(ws);
+      clientViews.delete(ws);
       console.log(`[WS] Player '${player.displayName}' disconnected from game ${gameId}`);
     });
 
@@ -173,19 +275,21 @@ function handleMessage(
   msg: WsIncomingMessage
 ): void {
   try {
-    switch (msg.type) {
-      case 'PLAY_CARD':
-        handlePlayCard(ws, gameId, playerSeat, msg);
-        break;
-      case 'USE_BASIC_ACTION':
-        handleUseBasicAction(ws, gameId, playerSeat, msg);
-        break;
-      case 'ADVANCE_PHASE':
-        handleAdvancePhase(ws, gameId, msg);
-        break;
-      default:
-        sendError(ws, 'NOT_AUTHORIZED', 'Unknown message type.');
-    }
+    traceCommand(`ws.${msg.type}`, gameId, () => {
+      switch (msg.type) {
+        case 'PLAY_CARD':
+          handlePlayCard(ws, gameId, playerSeat, msg);
+          break;
+        case 'USE_BASIC_ACTION':
+          handleUseBasicAction(ws, gameId, playerSeat, msg);
+          break;
+        case 'ADVANCE_PHASE':
+          handleAdvancePhase(ws, gameId, msg);
+          break;
+        default:
+          sendError(ws, 'NOT_AUTHORIZED', 'Unknown message type.');
+      }
+    });
   } catch (err) {
     if (err instanceof GameError) {
       sendError(ws, err.code, err.message);
@@ -222,11 +326,12 @@ function handlePlayCard(
     msg.targets ?? []
   );
 
-  persistState(newState);
+  persistState(newState, loaded.state.log.length);
 
   // Broadcast new state to all room members
   const stateMsg: WsGameState = { type: 'GAME_STATE', state: newState };
   broadcast(gameId, stateMsg);
+  syncPhaseDeadline(newState);
 
   // Send action result to actor
   const result: WsActionResult = { type: 'ACTION_RESULT', logEntry, diff: {} };
@@ -253,10 +358,11 @@ function handleUseBasicAction(
 
   const newState = useBasicAction(loaded.state, msg.side, msg.target);
 
-  persistState(newState);
+  persistState(newState, loaded.state.log.length);
 
   const stateMsg: WsGameState = { type: 'GAME_STATE', state: newState };
   broadcast(gameId, stateMsg);
+  syncPhaseDeadline(newState);
 }
 
 // ---- ADVANCE_PHASE ----
@@ -273,10 +379,11 @@ function handleAdvancePhase(
 
   const newState = advancePhase(loaded.state, msg.requestedPhase);
 
-  persistState(newState);
+  persistState(newState, loaded.state.log.length);
 
   const stateMsg: WsGameState = { type: 'GAME_STATE', state: newState };
   broadcast(gameId, stateMsg);
+  syncPhaseDeadline(newState);
 }
 
 // ============================================================
@@ -286,3 +393,31 @@ function handleAdvancePhase(
 export function broadcastToGame(gameId: string, message: unknown): void {
   broadcast(gameId, message);
 }
+
+// ============================================================
+// DRAIN — tell every player socket to reconnect to the next process
+// Each client gets its game's state version (so an unchanged state is
+// not re-sent on reconnect) and a random delay within spreadMs, so the
+// new process is not hit by every socket in the same millisecond.
+// Closes with 1012 (Service Restart). Returns the sockets hinted.
+// ============================================================
+
+export function drainConnections(spreadMs: number): number {
+  let hinted = 0;
+  for (const [gameId, room] of rooms) {
+    const loaded = loadGameState(gameId);
+    const version = loaded ? stateVersion(loaded.state) : null;
+    for (const ws of room) {
+      const hint: WsServerRestart = {
+        type: 'SERVER_RESTART',
+        gameId,
+        stateVersion: version,
+        reconnectAfterMs: Math.floor(Math.random() * spreadMs),
+      };
+      sendToClient(ws, hint);
+      ws.close(1012, 'Server restart');
+      hinted++;
+    }
+  }
+  return hinted;
+}
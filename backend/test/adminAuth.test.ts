@@ -0,0 +1,32 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { Request, Response } from 'express';
+import { adminTokenGuard } from '../src/api/adminAuth';
+
+// ============================================================
+// Operator endpoints: disabled without ADMIN_TOKEN, and otherwise
+// open only to a matching bearer token.
+// ============================================================
+
+function call(adminToken: string | undefined, authorization?: string): { status: number | null; passed: boolean } {
+  const result = { status: null as number | null, passed: false };
+  const req = { headers: authorization ? { authorization } : {} } as Request;
+  const res = {
+    status(code: number) { result.status = code; return this; },
+    json() { return this; },
+  } as unknown as Response;
+  adminTokenGuard(adminToken)(req, res, () => { result.passed = true; });
+  return result;
+}
+
+test('is disabled until ADMIN_TOKEN is set', () => {
+  assert.deepEqual(call(undefined, 'Bearer anything'), { status: 404, passed: false });
+  assert.deepEqual(call('', 'Bearer '), { status: 404, passed: false });
+});
+
+test('requires the matching bearer token', () => {
+  assert.deepEqual(call('s3cret'), { status: 401, passed: false });
+  assert.deepEqual(call('s3cret', 'Bearer wrong'), { status: 403, passed: false });
+  assert.deepEqual(call('s3cret', 'Bearer s3cre'), { status: 403, passed: false });
+  assert.deepEqual(call('s3cret', 'Bearer s3cret'), { status: null, passed: true });
+});
@@ -0,0 +1,109 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { KeyedBuckets, TokenBucket } from '../src/admission/tokenBucket';
+import { AdmissionController, AdmissionOptions, classifyRequest } from '../src/admission/admission';
+import { renderMetrics } from '../src/observability/metrics';
+
+// ============================================================
+// Admission control: token buckets refill over time, rate limits are
+// per token and per room, and shedding drops bulk before lobby before
+// in-game actions.
+// ============================================================
+
+function controller(overrides: Partial<AdmissionOptions> = {}): { ctl: AdmissionController; clock: { now: number; lag: number } } {
+  const clock = { now: 0, lag: 0 };
+  const ctl = new AdmissionController({
+    tokenRate: 2,
+    tokenBurst: 3,
+    roomRate: 4,
+    roomBurst: 5,
+    lagMs: 100,
+    now: () => clock.now,
+    loopLagMs: () => clock.lag,
+    ...overrides,
+  });
+  return { ctl, clock };
+}
+
+test('token bucket allows a burst, then refills at its rate', () => {
+  const bucket = new TokenBucket(3, 2, 0);
+  assert.equal(bucket.take(0), 0);
+  assert.equal(bucket.take(0), 0);
+  assert.equal(bucket.take(0), 0);
+  assert.equal(bucket.take(0), 500);
+  assert.equal(bucket.take(250), 250);
+  assert.equal(bucket.take(500), 0);
+  assert.ok(!bucket.isFull(500));
+  assert.ok(bucket.isFull(2000));
+});
+
+test('keyed buckets drop keys that have fully refilled', () => {
+  const buckets = new KeyedBuckets(2, 1);
+  buckets.take('a', 0);
+  buckets.take('b', 0);
+  assert.equal(buckets.size, 2);
+  buckets.take('b', 0);
+  buckets.sweep(1500);
+  assert.equal(buckets.size, 1);
+  buckets.sweep(3000);
+  assert.equal(buckets.size, 0);
+});
+
+test('limits a spamming token without affecting other players', () => {
+  const { ctl, clock } = controller({ roomBurst: 100 });
+  for (let i = 0; i < 3; i++) assert.equal(ctl.admit('game', 'spammer', 'g1'), null);
+  const rejected = ctl.admit('game', 'spammer', 'g1');
+  assert.equal(rejected?.code, 'RATE_LIMITED');
+  assert.equal(rejected?.retryAfterMs, 500);
+  assert.equal(ctl.admit('game', 'other', 'g1'), null);
+
+  clock.now = 500;
+  assert.equal(ctl.admit('game', 'spammer', 'g1'), null);
+});
+
+test('limits a room across all of its tokens', () => {
+  const { ctl } = controller();
+  for (let i = 0; i < 5; i++) assert.equal(ctl.admit('game', `p${i}`, 'g1'), null);
+  assert.equal(ctl.admit('game', 'p9', 'g1')?.code, 'RATE_LIMITED');
+  assert.equal(ctl.admit('game', 'p9', 'g2'), null);
+  // Lobby traffic for the game does not use the room bucket
+  assert.equal(ctl.admit('lobby', null, 'g1'), null);
+});
+
+test('sheds bulk, then lobby, and in-game actions last', () => {
+  const { ctl, clock } = controller({ tokenBurst: 100, roomBurst: 100 });
+
+  clock.lag = 150;
+  assert.equal(ctl.admit('bulk', null, null)?.code, 'OVERLOADED');
+  assert.equal(ctl.admit('lobby', null, null), null);
+
+  clock.lag = 250;
+  assert.equal(ctl.admit('lobby', null, null)?.code, 'OVERLOADED');
+  assert.equal(ctl.admit('game', 't', 'g1'), null);
+
+  clock.lag = 400;
+  assert.equal(ctl.admit('game', 't', 'g1')?.code, 'OVERLOADED');
+
+  clock.lag = 0;
+  assert.equal(ctl.admit('bulk', null, null), null);
+  assert.deepEqual(ctl.shed, { game: 1, lobby: 1, bulk: 1 });
+});
+
+test('classifies routes by priority', () => {
+  assert.equal(classifyRequest('GET', '/health'), null);
+  assert.deepEqual(classifyRequest('POST', '/api/games/g1/start'), { priority: 'game', gameId: 'g1' });
+  assert.deepEqual(classifyRequest('GET', '/api/games/g1'), { priority: 'game', gameId: 'g1' });
+  assert.deepEqual(classifyRequest('POST', '/api/games/g1/join'), { priority: 'lobby', gameId: null });
+  assert.deepEqual(classifyRequest('GET', '/api/games'), { priority: 'lobby', gameId: null });
+  assert.deepEqual(classifyRequest('GET', '/api/games/g1/export'), { priority: 'bulk', gameId: 'g1' });
+  assert.deepEqual(classifyRequest('GET', '/api/export/games'), { priority: 'bulk', gameId: null });
+  assert.deepEqual(classifyRequest('POST', '/api/tournaments'), { priority: 'bulk', gameId: null });
+  assert.deepEqual(classifyRequest('GET', '/api/tournaments/t1'), { priority: 'lobby', gameId: null });
+});
+
+test('exports rejection totals as counters', () => {
+  const text = renderMetrics();
+  assert.match(text, /^# TYPE admission_rate_limited_total counter$/m);
+  assert.match(text, /^# TYPE admission_shed_bulk_total counter$/m);
+  assert.match(text, /^# TYPE admission_tracked_keys gauge$/m);
+});
@@ -0,0 +1,65 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import Database from 'better-sqlite3';
+import { GameConfig, LogEntry } from '../src/types/game.types';
+import { initializeGame } from '../src/engine/gameEngine';
+import { createGameTables } from '../src/db/schema';
+import { SqliteStore } from '../src/db/sqliteStore';
+import { backfillLogIndex } from '../src/db/analytics';
+
+// ============================================================
+// Log indexing: the write path reuses its prepared statements, and
+// the startup backfill imports history kept only in state_json.
+// ============================================================
+
+const CONFIG: GameConfig = { turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' };
+
+function tempDb(): Database.Database {
+  const db = new Database(path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'bvm-analytics-')), 'game.db'));
+  createGameTables(db);
+  return db;
+}
+
+function cardPlayed(id: string, timestamp: number, cardId: string): LogEntry {
+  return {
+    id, turn: 1, phase: 'MALOSOS_ATTACK', timestamp, action: 'CARD_PLAYED', actor: 'MALOSOS',
+    details: { cardId, beforeMarkers: { stability: 100, trust: 50 }, afterMarkers: { stability: 97, trust: 49 } },
+  };
+}
+
+test('log writes do not prepare statements after the first', () => {
+  const db = tempDb();
+  const store = new SqliteStore(db);
+  store.saveGame('g', 'running', JSON.stringify(CONFIG), JSON.stringify(initializeGame(CONFIG, 'g')), 1);
+  store.saveLogs('g', [cardPlayed('a', 1, 'M1')]);
+
+  let prepared = 0;
+  const prepare = db.prepare.bind(db);
+  db.prepare = ((sql: string) => { prepared++; return prepare(sql); }) as typeof db.prepare;
+  store.saveLogs('g', [cardPlayed('b', 2, 'M1'), cardPlayed('c', 3, 'M2')]);
+  assert.equal(prepared, 0);
+
+  const plays = db.prepare('SELECT card_id, plays FROM agg_card_plays ORDER BY card_id').all();
+  assert.deepEqual(plays, [{ card_id: 'M1', plays: 2 }, { card_id: 'M2', plays: 1 }]);
+  db.close();
+});
+
+test('backfill imports logs that only exist in state_json, once', () => {
+  const db = tempDb();
+  const store = new SqliteStore(db);
+  const legacy = initializeGame(CONFIG, 'legacy');
+  legacy.log = [cardPlayed('l2', 2, 'M2'), cardPlayed('l1', 1, 'M1')];
+  store.saveGame('legacy', 'finished', JSON.stringify(CONFIG), JSON.stringify(legacy), 1);
+  store.saveGame('empty', 'lobby', JSON.stringify(CONFIG), JSON.stringify(initializeGame(CONFIG, 'empty')), 2);
+
+  assert.equal(backfillLogIndex(db), 2);
+  assert.equal(backfillLogIndex(db), 0);
+
+  assert.deepEqual(store.getLogsByGame('legacy').map((e) => e.id), ['l1', 'l2']);
+  const turns = db.prepare('SELECT turn, samples, stability_delta_sum FROM agg_turn_markers').all();
+  assert.deepEqual(turns, [{ turn: 1, samples: 2, stability_delta_sum: -6 }]);
+  db.close();
+});
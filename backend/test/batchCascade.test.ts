@@ -0,0 +1,116 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { Service, ServiceState, TemporaryEffect } from '../src/types/game.types';
+import { createInitialServices } from '../src/data/services';
+import { resolveCascades, resolveIntermittence } from '../src/engine/cascade';
+import { CascadeBatch, compileMap } from '../src/engine/batchCascade';
+
+// ============================================================
+// Differential tests: the batched evaluator must match
+// resolveCascades / resolveIntermittence game by game on randomized
+// states, temp effects and turns.
+// ============================================================
+
+function mulberry32(seed: number): () => number {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const STATES: ServiceState[] = ['OK', 'OK', 'OK', 'DEGRADED', 'INTERMITTENT', 'DOWN'];
+
+function randomize(template: Record<string, Service>, rand: () => number): Record<string, Service> {
+  const out: Record<string, Service> = {};
+  for (const [id, svc] of Object.entries(template)) {
+    const state = STATES[Math.floor(rand() * STATES.length)];
+    const int = state === 'DOWN' ? 0 : Math.floor(rand() * (svc.intMax + 1));
+    out[id] = { ...svc, int, state };
+  }
+  return out;
+}
+
+function randomEffects(services: Record<string, Service>, rand: () => number): TemporaryEffect[] {
+  const ids = Object.keys(services);
+  const effects: TemporaryEffect[] = [];
+  const count = Math.floor(rand() * 4);
+  for (let i = 0; i < count; i++) {
+    const to = services[ids[Math.floor(rand() * ids.length)]];
+    if (rand() < 0.5 && to.dependencies.length > 0) {
+      const from = to.dependencies[Math.floor(rand() * to.dependencies.length)];
+      effects.push({ id: `e${i}`, type: 'ignoreCascadeEdge', fromServiceId: from, toServiceId: to.id });
+    } else {
+      effects.push({ id: `e${i}`, type: 'blockIntermittentPropagation', targetId: to.id });
+    }
+  }
+  return effects;
+}
+
+// Map with cycles and duplicate / unknown dependency ids
+function generatedMap(size: number, rand: () => number): Record<string, Service> {
+  const services: Record<string, Service> = {};
+  for (let i = 0; i < size; i++) {
+    const deps: string[] = [];
+    const n = Math.floor(rand() * 5);
+    for (let k = 0; k < n; k++) deps.push(`G${Math.floor(rand() * size)}`);
+    if (rand() < 0.05) deps.push('MISSING');
+    const intMax = 10 + Math.floor(rand() * 9);
+    services[`G${i}`] = {
+      id: `G${i}`,
+      name: `G${i}`,
+      crit: (1 + Math.floor(rand() * 5)) as Service['crit'],
+      int: intMax,
+      intMax,
+      state: 'OK',
+      dependencies: deps,
+    };
+  }
+  return services;
+}
+
+function runDifferential(template: Record<string, Service>, games: number, seed: number): void {
+  const rand = mulberry32(seed);
+  const states = Array.from({ length: games }, () => randomize(template, rand));
+  const effects = states.map((s) => randomEffects(s, rand));
+  const turns = states.map(() => 1 + Math.floor(rand() * 8));
+
+  const batch = CascadeBatch.fromServices(compileMap(template), states, effects);
+  batch.resolveCascades();
+  const afterCascade = states.map((s, g) => batch.toServices(g, s));
+
+  batch.resolveIntermittence(turns);
+
+  states.forEach((services, g) => {
+    const cascaded = resolveCascades(services, effects[g], turns[g]);
+    assert.deepStrictEqual(afterCascade[g], cascaded, `resolveCascades differs for game ${g}`);
+
+    const expected = resolveIntermittence(cascaded, turns[g], effects[g]);
+    assert.deepStrictEqual(batch.toServices(g, services), expected, `resolveIntermittence differs for game ${g}`);
+  });
+}
+
+test('matches the per-game functions on the standard map', () => {
+  runDifferential(createInitialServices(), 2000, 1);
+});
+
+test('matches the per-game functions on a generated map with cycles', () => {
+  runDifferential(generatedMap(150, mulberry32(7)), 300, 2);
+});
+
+test('starting from a healthy map nothing changes', () => {
+  const services = createInitialServices();
+  const batch = CascadeBatch.fromServices(compileMap(services), [services, services]);
+  assert.deepStrictEqual([...batch.resolveCascades()], [1, 1]);
+  batch.resolveIntermittence(1);
+  assert.strictEqual(batch.toServices(0, services).S1, services.S1);
+});
+
+test('rejects games whose topology differs from the compiled map', () => {
+  const services = createInitialServices();
+  const other = { ...services, S3: { ...services.S3, dependencies: ['S1'] } };
+  assert.throws(() => CascadeBatch.fromServices(compileMap(services), [services, other]), /does not match/);
+});
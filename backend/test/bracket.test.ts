@@ -0,0 +1,62 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { BracketMatch, champion, firstRoundPairings, nextPairings } from '../src/engine/bracket';
+
+// ============================================================
+// Bracket progression: winners advance as soon as both feeder
+// matches are decided, byes resolve on the spot.
+// ============================================================
+
+function decide(matches: BracketMatch[], winners: Record<string, string>): BracketMatch[] {
+  return matches.map((m) => ({ ...m, winnerTeam: m.winnerTeam ?? winners[`${m.round}:${m.slot}`] ?? null }));
+}
+
+function open(matches: BracketMatch[]): BracketMatch[] {
+  const created = nextPairings(matches).map((p) => ({ ...p, winnerTeam: p.teamB === null ? p.teamA : null }));
+  return [...matches, ...created];
+}
+
+test('pairs teams in order and gives the odd team a bye', () => {
+  assert.deepEqual(firstRoundPairings(['A', 'B', 'C']), [
+    { round: 1, slot: 0, teamA: 'A', teamB: 'B' },
+    { round: 1, slot: 1, teamA: 'C', teamB: null },
+  ]);
+});
+
+test('opens a next-round match once both feeders are decided', () => {
+  let bracket: BracketMatch[] = firstRoundPairings(['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']).map((p) => ({
+    ...p,
+    winnerTeam: null,
+  }));
+
+  bracket = decide(bracket, { '1:0': 'A' });
+  assert.deepEqual(nextPairings(bracket), []);
+
+  bracket = decide(bracket, { '1:1': 'D' });
+  assert.deepEqual(nextPairings(bracket), [{ round: 2, slot: 0, teamA: 'A', teamB: 'D' }]);
+  bracket = open(bracket);
+  assert.deepEqual(nextPairings(bracket), []);
+
+  bracket = open(decide(bracket, { '1:2': 'E', '1:3': 'H' }));
+  bracket = open(decide(bracket, { '2:0': 'D', '2:1': 'H' }));
+  assert.equal(champion(bracket), null);
+  assert.deepEqual(bracket.at(-1), { round: 3, slot: 0, teamA: 'D', teamB: 'H', winnerTeam: null });
+
+  bracket = decide(bracket, { '3:0': 'H' });
+  assert.equal(champion(bracket), 'H');
+});
+
+test('byes carry through several rounds in one call', () => {
+  let bracket: BracketMatch[] = firstRoundPairings(['A', 'B', 'C', 'D', 'E']).map((p) => ({
+    ...p,
+    winnerTeam: p.teamB === null ? p.teamA : null,
+  }));
+
+  // E's bye in round 1 becomes a bye in round 2 as well
+  const created = nextPairings(bracket);
+  assert.deepEqual(created, [{ round: 2, slot: 1, teamA: 'E', teamB: null }]);
+
+  bracket = open(decide(open(bracket), { '1:0': 'B', '1:1': 'C' }));
+  bracket = open(decide(bracket, { '2:0': 'C' }));
+  assert.deepEqual(bracket.at(-1), { round: 3, slot: 0, teamA: 'C', teamB: 'E', winnerTeam: null });
+});
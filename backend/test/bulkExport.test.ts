@@ -0,0 +1,48 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import Database from 'better-sqlite3';
+import { GameConfig, LogEntry } from '../src/types/game.types';
+import { initializeGame } from '../src/engine/gameEngine';
+import { createGameTables } from '../src/db/schema';
+import { SqliteStore } from '../src/db/sqliteStore';
+import { ExportRecord, iterateExportRecords, parseExportOptions } from '../src/db/bulkExport';
+
+// ============================================================
+// Bulk export: query parsing rejects repeated parameters, and games
+// whose log only lives in state_json still export their entries.
+// ============================================================
+
+const CONFIG: GameConfig = { turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' };
+
+function entry(id: string, timestamp: number): LogEntry {
+  return { id, turn: 1, phase: 'EVENT', timestamp, action: 'TEST', details: null };
+}
+
+test('rejects repeated or nested query parameters', () => {
+  assert.ok('error' in parseExportOptions({ status: ['running', 'finished'] }));
+  assert.ok('error' in parseExportOptions({ limit: { gt: '1' } }));
+  const ok = parseExportOptions({ status: 'running,finished', limit: '5' });
+  assert.ok('options' in ok && ok.options.filter.statuses?.length === 2);
+});
+
+test('falls back to state_json.log for games without log rows', () => {
+  const db = new Database(path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'bvm-export-')), 'game.db'));
+  createGameTables(db);
+  const store = new SqliteStore(db);
+
+  const legacy = initializeGame(CONFIG, 'legacy');
+  legacy.log = [entry('old-1', 1), entry('old-2', 2)];
+  store.saveGame('legacy', 'finished', JSON.stringify(CONFIG), JSON.stringify(legacy), 1);
+
+  const current = initializeGame(CONFIG, 'current');
+  current.log = [entry('stale', 3)];
+  store.saveGame('current', 'finished', JSON.stringify(CONFIG), JSON.stringify(current), 2);
+  store.saveLogs('current', [entry('row-1', 4)]);
+
+  const logs = [...iterateExportRecords(db, {})].filter((r): r is Extract<ExportRecord, { kind: 'log' }> => r.kind === 'log');
+  assert.deepEqual(logs.map((r) => [r.gameId, r.id]), [['legacy', 'old-1'], ['legacy', 'old-2'], ['current', 'row-1']]);
+  db.close();
+});
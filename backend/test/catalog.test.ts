@@ -0,0 +1,82 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import http from 'http';
+import { AddressInfo } from 'net';
+import { brotliDecompressSync, gunzipSync } from 'zlib';
+import express from 'express';
+import catalogRouter from '../src/api/catalogRouter';
+import { CARDS_ASSET, MAP_ASSETS, toWireState } from '../src/data/catalog';
+import { ALL_CARDS } from '../src/data/cards';
+import { initializeGame } from '../src/engine/gameEngine';
+
+// ============================================================
+// Static catalog: precompressed bodies match the source data, and the
+// HTTP layer answers with strong ETags, immutable versions and 304s.
+// ============================================================
+
+function request(
+  port: number,
+  path: string,
+  headers: Record<string, string> = {}
+): Promise<{ status: number; headers: http.IncomingHttpHeaders; body: Buffer }> {
+  return new Promise((resolve, reject) => {
+    http
+      .get({ port, path, headers }, (res) => {
+        const chunks: Buffer[] = [];
+        res.on('data', (c: Buffer) => chunks.push(c));
+        res.on('end', () => resolve({ status: res.statusCode ?? 0, headers: res.headers, body: Buffer.concat(chunks) }));
+      })
+      .on('error', reject);
+  });
+}
+
+test('compressed variants decode to the same catalog', () => {
+  const expected = JSON.stringify({ cards: ALL_CARDS });
+  assert.equal(CARDS_ASSET.body.toString(), expected);
+  assert.equal(gunzipSync(CARDS_ASSET.gzip).toString(), expected);
+  assert.equal(brotliDecompressSync(CARDS_ASSET.br).toString(), expected);
+  assert.ok(CARDS_ASSET.br.length < CARDS_ASSET.body.length / 3);
+});
+
+test('compact game state keeps only per-game service fields', () => {
+  const state = initializeGame({ turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' });
+  const compact = toWireState(state, 'compact');
+  const full = toWireState(state, 'full');
+
+  assert.deepEqual(compact.services.S1, { id: 'S1', int: state.services.S1.int, state: 'OK' });
+  assert.deepEqual(full.services, state.services);
+  assert.deepEqual(compact.catalog, { cards: CARDS_ASSET.version, mapId: 'standard', map: MAP_ASSETS.standard.version });
+});
+
+test('serves immutable versions, negotiates encoding and answers 304', async () => {
+  const app = express();
+  app.use('/api/catalog', catalogRouter);
+  const server = app.listen(0);
+  const { port } = server.address() as AddressInfo;
+
+  try {
+    const manifest = await request(port, '/api/catalog');
+    assert.equal(manifest.status, 200);
+    assert.equal(manifest.headers['cache-control'], 'no-cache');
+    const { cards } = JSON.parse(manifest.body.toString()) as { cards: { url: string } };
+
+    const br = await request(port, cards.url, { 'Accept-Encoding': 'gzip, deflate, br' });
+    assert.equal(br.status, 200);
+    assert.equal(br.headers['content-encoding'], 'br');
+    assert.equal(br.headers['cache-control'], 'public, max-age=31536000, immutable');
+    assert.equal(br.headers.etag, CARDS_ASSET.etag);
+    assert.deepEqual(brotliDecompressSync(br.body), CARDS_ASSET.body);
+
+    const gzip = await request(port, cards.url, { 'Accept-Encoding': 'gzip, br;q=0' });
+    assert.equal(gzip.headers['content-encoding'], 'gzip');
+
+    const notModified = await request(port, cards.url, { 'If-None-Match': CARDS_ASSET.etag });
+    assert.equal(notModified.status, 304);
+    assert.equal(notModified.body.length, 0);
+
+    const stale = await request(port, '/api/catalog/cards/not-a-version');
+    assert.equal(stale.status, 404);
+  } finally {
+    server.close();
+  }
+});
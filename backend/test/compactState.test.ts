@@ -0,0 +1,52 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { GameConfig, GameState } from '../src/types/game.types';
+import { initializeGame } from '../src/engine/gameEngine';
+import { toCompact, fromCompact } from '../src/engine/compactState';
+import { playGame } from '../bench/replay';
+import { SCENARIOS } from '../bench/scenarios';
+
+// ============================================================
+// Round trip: the compact form must rebuild exactly what the public
+// JSON shape of the state holds, for lobby games and for games played
+// to the end on every bench scenario (generated maps, temp effects).
+// ============================================================
+
+const CONFIG: GameConfig = { turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' };
+
+function assertRoundTrip(state: GameState): void {
+  const expected = JSON.parse(JSON.stringify(state));
+  assert.deepStrictEqual(fromCompact(toCompact(state)), expected);
+  assert.deepStrictEqual(fromCompact(toCompact(expected)), expected);
+}
+
+test('round-trips a lobby game', () => {
+  assertRoundTrip(initializeGame(CONFIG, 'compact-lobby'));
+});
+
+test('round-trips finished games on every bench scenario', () => {
+  for (const scenario of SCENARIOS) {
+    for (let i = 0; i < 3; i++) {
+      assertRoundTrip(playGame(scenario.setup(i), scenario.name, null).state);
+    }
+  }
+});
+
+test('keeps effect fields that do not fit the fixed schema', () => {
+  const state = initializeGame(CONFIG, 'compact-effects');
+  state.temporaryEffects = [
+    { id: 'a', type: 'latentEvent', activationTurn: 3 },
+    { id: 'b', type: 'bcpPrioritization', targets: ['S1', 'S2'], expiresAtTurn: 2, expiresAtPhase: 'TURN_END' },
+    { id: 'c', type: 'custom', targetId: 'NOT_A_SERVICE', value: -2.5, expiresAtTurn: 1.5, consumed: false },
+    { id: 'd', type: 'custom', expiresAtPhase: 'NOT_A_PHASE' as never, value: null as never },
+  ];
+  assertRoundTrip(state);
+});
+
+test('equal maps share one service template and configs are shared', () => {
+  const a = toCompact(initializeGame(CONFIG, 'compact-a'));
+  const b = toCompact(JSON.parse(JSON.stringify(initializeGame(CONFIG, 'compact-b'))));
+  assert.strictEqual(a.services, b.services);
+  assert.strictEqual(a.config, b.config);
+  assert.ok(a.zones instanceof Uint8Array);
+});
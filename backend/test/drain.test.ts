@@ -0,0 +1,36 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { EventEmitter } from 'events';
+import { Request, Response } from 'express';
+import { inflightRequests, trackInflight, waitForInflight } from '../src/lifecycle/drain';
+
+// ============================================================
+// Graceful drain: every HTTP request is counted until its response
+// ends, with or without admission control, and the drain waits for
+// the count to reach zero or gives up at its timeout.
+// ============================================================
+
+function request(): EventEmitter {
+  const res = new EventEmitter();
+  trackInflight({} as Request, res as unknown as Response, () => {});
+  return res;
+}
+
+test('waits for in-flight requests before resolving', async () => {
+  const res = request();
+  assert.equal(inflightRequests(), 1);
+
+  setTimeout(() => {
+    res.emit('finish');
+    res.emit('close');
+  }, 30);
+  assert.equal(await waitForInflight(1000), true);
+  assert.equal(inflightRequests(), 0);
+});
+
+test('gives up after the timeout while a request is still running', async () => {
+  const res = request();
+  assert.equal(await waitForInflight(50), false);
+  res.emit('close');
+  assert.equal(inflightRequests(), 0);
+});
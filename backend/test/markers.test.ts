@@ -0,0 +1,156 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { GameConfig, GameState, Service, ServiceState, TemporaryEffect } from '../src/types/game.types';
+import { initializeGame } from '../src/engine/gameEngine';
+import { calculateTurnMarkers, getMarkerAggregates, trackServiceChanges, MarkerUpdate } from '../src/engine/markers';
+
+// ============================================================
+// Differential tests: calculateTurnMarkers over running aggregates
+// must match the original three-scan implementation (kept below as
+// the reference), details included, and aggregates carried through
+// trackServiceChanges must match a fresh scan.
+// ============================================================
+
+const STABILITY_BASE_PENALTY: Record<string, number> = { DEGRADED: -2, INTERMITTENT: -3, DOWN: -6 };
+const CRITICALITY_BONUS: Record<number, number> = { 4: -2, 5: -4 };
+
+function referenceTurnMarkers(state: GameState): MarkerUpdate {
+  const details: string[] = [];
+  let stabilityDelta = 0;
+  let trustDelta = 0;
+
+  let basePenalty = 0;
+  for (const svc of Object.values(state.services)) {
+    if (svc.state === 'OK') continue;
+    const manualOp = state.temporaryEffects.find((e) => e.type === 'bcpManualOp' && e.targetId === svc.id);
+    const effectiveState = manualOp && svc.state === 'DOWN' ? 'DEGRADED' : svc.state;
+    const penalty = STABILITY_BASE_PENALTY[effectiveState] ?? 0;
+    basePenalty += penalty;
+    details.push(`${svc.id} (${effectiveState}): ${penalty} stability`);
+  }
+  if (basePenalty < -25) {
+    details.push(`Base penalty capped at -25 (was ${basePenalty})`);
+    basePenalty = -25;
+  }
+  stabilityDelta += basePenalty;
+
+  for (const svc of Object.values(state.services)) {
+    if (svc.state === 'OK') continue;
+    const critPenalty = CRITICALITY_BONUS[svc.crit] ?? 0;
+    if (critPenalty !== 0) {
+      stabilityDelta += critPenalty;
+      details.push(`${svc.id} crit=${svc.crit}: ${critPenalty} stability`);
+    }
+  }
+
+  let trustPenalty = 0;
+  for (const svc of Object.values(state.services).filter((s) => s.citizenFacing === true)) {
+    if (svc.state === 'DOWN') {
+      trustPenalty += -3;
+      details.push(`${svc.id} (citizen, DOWN): -3 trust`);
+    }
+  }
+  if (trustPenalty < -15) {
+    details.push(`Trust penalty capped at -15 (was ${trustPenalty})`);
+    trustPenalty = -15;
+  }
+  trustDelta += trustPenalty;
+
+  if (Math.max(0, state.markers.trust + trustDelta) === 0) {
+    if (!state.temporaryEffects.some((e) => e.type === 'ignoreTrustPenalty')) {
+      stabilityDelta += -5;
+      details.push('Trust=0: -5 stability (panic effect)');
+    } else {
+      details.push('Trust=0 stability penalty ignored by Comunicacion de crisis');
+    }
+  }
+
+  for (const eff of state.temporaryEffects.filter((e) => e.type === 'bcpPrioritization')) {
+    for (const targetId of (eff.targets as string[] | undefined) ?? []) {
+      const svc = state.services[targetId];
+      if (!svc || svc.state === 'OK') continue;
+      const manualOp = state.temporaryEffects.find((e) => e.type === 'bcpManualOp' && e.targetId === svc.id);
+      const effectiveState = manualOp && svc.state === 'DOWN' ? 'DEGRADED' : svc.state;
+      const reduction = Math.floor(Math.abs((STABILITY_BASE_PENALTY[effectiveState] ?? 0) + (CRITICALITY_BONUS[svc.crit] ?? 0)) / 2);
+      stabilityDelta += reduction;
+      details.push(`BCP Priorizacion on ${targetId}: +${reduction} stability (half reduction)`);
+    }
+  }
+
+  return { stabilityDelta, trustDelta, details };
+}
+
+function mulberry32(seed: number): () => number {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const CONFIG: GameConfig = { turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' };
+const STATES: ServiceState[] = ['OK', 'OK', 'DEGRADED', 'INTERMITTENT', 'DOWN', 'DOWN'];
+
+function randomService(svc: Service, rand: () => number): Service {
+  const state = STATES[Math.floor(rand() * STATES.length)];
+  return { ...svc, state, int: state === 'DOWN' ? 0 : 1 + Math.floor(rand() * svc.intMax) };
+}
+
+function randomEffects(ids: string[], rand: () => number): TemporaryEffect[] {
+  const effects: TemporaryEffect[] = [];
+  const pickId = (): string => ids[Math.floor(rand() * ids.length)];
+  for (let i = Math.floor(rand() * 5); i > 0; i--) {
+    const roll = rand();
+    if (roll < 0.4) effects.push({ id: `m${i}`, type: 'bcpManualOp', targetId: pickId() });
+    else if (roll < 0.7) effects.push({ id: `p${i}`, type: 'bcpPrioritization', targets: [pickId(), pickId()] });
+    else if (roll < 0.8) effects.push({ id: `t${i}`, type: 'ignoreTrustPenalty' });
+    else effects.push({ id: `x${i}`, type: 'damageReductionService', targetId: pickId(), value: 1 });
+  }
+  return effects;
+}
+
+test('matches the original implementation on random states', () => {
+  const rand = mulberry32(42);
+  const base = initializeGame(CONFIG, 'markers-diff');
+  const ids = Object.keys(base.services);
+
+  for (let i = 0; i < 3000; i++) {
+    const services: Record<string, Service> = {};
+    for (const id of ids) services[id] = randomService(base.services[id], rand);
+    const state: GameState = {
+      ...base,
+      services,
+      temporaryEffects: randomEffects(ids, rand),
+      markers: { ...base.markers, trust: Math.floor(rand() * 12) },
+    };
+    const actual = calculateTurnMarkers(state);
+    assert.deepStrictEqual(JSON.parse(JSON.stringify(actual)), referenceTurnMarkers(state), `state ${i}`);
+  }
+});
+
+test('aggregates carried through trackServiceChanges match a fresh scan', () => {
+  const rand = mulberry32(7);
+  let services = initializeGame(CONFIG, 'markers-track').services;
+  getMarkerAggregates(services);
+  const ids = Object.keys(services);
+
+  for (let i = 0; i < 2000; i++) {
+    const changed = [ids[Math.floor(rand() * ids.length)], ids[Math.floor(rand() * ids.length)]];
+    const next = { ...services };
+    for (const id of changed) next[id] = randomService(services[id], rand);
+    services = trackServiceChanges(services, next, changed);
+    assert.deepStrictEqual(getMarkerAggregates(services), getMarkerAggregates({ ...services }), `step ${i}`);
+  }
+});
+
+test('details are serialized with the update and built once', () => {
+  const state = initializeGame(CONFIG, 'markers-lazy');
+  state.services = { ...state.services, S1: { ...state.services.S1, state: 'DOWN', int: 0 } };
+  const update = calculateTurnMarkers(state);
+
+  assert.deepStrictEqual(JSON.parse(JSON.stringify(update)).details, referenceTurnMarkers(state).details);
+  assert.strictEqual(update.details, update.details);
+});
@@ -0,0 +1,71 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { GameState } from '../src/types/game.types';
+import { initializeGame, startGame, processPhase, previewCascadeEval, GameError } from '../src/engine/gameEngine';
+import { getCascadePreview, normalizeChanges, clearPreviewCache } from '../src/engine/previewCache';
+
+// ============================================================
+// What-if preview: must match a real CASCADE_EVAL on the same
+// hypothetical state, never mutate the input, and memoize per version.
+// ============================================================
+
+function runningGame(): GameState {
+  return startGame(
+    initializeGame({ turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' })
+  );
+}
+
+test('matches a real CASCADE_EVAL on the modified state', () => {
+  const state = runningGame();
+
+  const preview = previewCascadeEval(state, [{ serviceId: 'S5', state: 'DOWN' }]);
+
+  const modified: GameState = {
+    ...state,
+    services: { ...state.services, S5: { ...state.services.S5, int: 0, state: 'DOWN' } },
+    servicesThatWentDown: [...state.servicesThatWentDown, 'S5'],
+    markers: { ...state.markers, phase: 'CASCADE_EVAL' },
+  };
+  const real = processPhase(modified);
+
+  assert.deepEqual(preview.services, real.services);
+  assert.deepEqual(preview.markers, real.markers);
+  assert.equal(preview.winner, real.winner ?? null);
+  assert.ok(preview.newlyDown.includes('S5'));
+  assert.ok(preview.changed.includes('S6') && preview.changed.includes('S7'));
+});
+
+test('never modifies the current state', () => {
+  const state = runningGame();
+  const snapshot = JSON.stringify(state);
+
+  previewCascadeEval(state, [
+    { serviceId: 'S1', damage: 10 },
+    { serviceId: 'S3', int: 1 },
+  ]);
+
+  assert.equal(JSON.stringify(state), snapshot);
+});
+
+test('rejects unknown services and games that are not running', () => {
+  const state = runningGame();
+  assert.throws(() => previewCascadeEval(state, [{ serviceId: 'NOPE', state: 'DOWN' }]), GameError);
+  assert.throws(() => previewCascadeEval({ ...state, status: 'paused' }, [{ serviceId: 'S5', state: 'DOWN' }]), GameError);
+  assert.throws(() => normalizeChanges([{ serviceId: 'S5' }]), GameError);
+  assert.throws(() => normalizeChanges([{ serviceId: 'S5', state: 'ON_FIRE' }]), GameError);
+});
+
+test('memoizes by state version and canonical hypothetical', () => {
+  clearPreviewCache();
+  const state = runningGame();
+
+  const a = getCascadePreview(state.id, state, normalizeChanges([{ serviceId: 'S5', state: 'DOWN' }, { serviceId: 'S1', damage: 2 }]));
+  const b = getCascadePreview(state.id, state, normalizeChanges([{ damage: 2, serviceId: 'S1' }, { state: 'DOWN', serviceId: 'S5' }]));
+  assert.equal(a.cached, false);
+  assert.equal(b.cached, true);
+  assert.equal(b.preview, a.preview);
+
+  const advanced: GameState = { ...state, updatedAt: state.updatedAt + 1 };
+  const c = getCascadePreview(state.id, advanced, normalizeChanges([{ serviceId: 'S5', state: 'DOWN' }, { serviceId: 'S1', damage: 2 }]));
+  assert.equal(c.cached, false);
+});
@@ -0,0 +1,179 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { EventEmitter } from 'events';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { WebSocket } from 'ws';
+import { GameState } from '../src/types/game.types';
+import { initializeGame, startGame } from '../src/engine/gameEngine';
+
+// ============================================================
+// Spectator hub: the public projection hides hands and decks; rooms
+// coalesce updates into throttled frames encoded once and shared by
+// every viewer, late joiners get the last frame, rooms are capped, and
+// a socket error only drops that viewer.
+// ============================================================
+
+// Read by the hub and the database module at load time
+process.env.DB_DIR = fs.mkdtempSync(path.join(os.tmpdir(), 'bvm-spectators-'));
+process.env.STORAGE_BACKEND = 'sqlite';
+process.env.SPECTATOR_UPDATES_PER_SEC = '20';
+process.env.SPECTATOR_MAX_PER_ROOM = '3';
+
+const FRAME_MS = 50;
+const CONFIG = { turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' } as const;
+
+const loaded = (async () => {
+  const db = await import('../src/db/migrations');
+  const hub = await import('../src/ws/spectatorHub');
+  db.runMigrations();
+  return { db, hub };
+})();
+
+class FakeViewer extends EventEmitter {
+  readyState: number = WebSocket.OPEN;
+  bufferedAmount = 0;
+  sent: (Buffer | string)[] = [];
+  closed = false;
+
+  send(data: Buffer | string): void {
+    this.sent.push(data);
+  }
+
+  close(): void {
+    this.closed = true;
+    this.readyState = WebSocket.CLOSED;
+  }
+
+  terminate(): void {
+    this.close();
+  }
+
+  messages(): { type: string; seq?: number; code?: string; state?: { markers: { turn: number } } }[] {
+    return this.sent.map((m) => JSON.parse(m.toString()));
+  }
+}
+
+let gameCount = 0;
+
+async function openRoom(): Promise<{ gameId: string; state: GameState; join: () => FakeViewer }> {
+  const { db, hub } = await loaded;
+  const gameId = `spectated-${++gameCount}`;
+  const state = startGame(initializeGame(CONFIG, gameId));
+  db.saveGame(gameId, 'running', JSON.stringify(state.config), JSON.stringify(state));
+  db.saveSpectatorToken(gameId, `${gameId}-token`);
+
+  const join = (): FakeViewer => {
+    const viewer = new FakeViewer();
+    hub.handleSpectatorConnection(viewer as unknown as WebSocket, gameId, `${gameId}-token`);
+    return viewer;
+  };
+  return { gameId, state, join };
+}
+
+function atTurn(state: GameState, turn: number): GameState {
+  return { ...state, markers: { ...state.markers, turn } };
+}
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+test('public state hides hands and decks', async () => {
+  const { hub } = await loaded;
+  const state = startGame(initializeGame(CONFIG));
+  const pub = hub.toPublicState(state);
+
+  assert.equal(pub.seats.BUENOSOS.handSize, state.seats.BUENOSOS.hand.length);
+  assert.equal(pub.seats.MALOSOS.deckSize, state.seats.MALOSOS.deck.length);
+  assert.equal(pub.eventDeckSize, state.eventDeck.length);
+  assert.ok(!('hand' in pub.seats.BUENOSOS));
+  assert.ok(!('eventDeck' in pub));
+});
+
+test('public state uses compact services and a short log tail', async () => {
+  const { hub } = await loaded;
+  const state = initializeGame(CONFIG);
+  for (let i = 0; i < 25; i++) {
+    state.log.push({ id: `e${i}`, turn: 1, phase: 'EVENT', timestamp: i, action: 'TEST', details: 'secret details' });
+  }
+  const pub = hub.toPublicState(state);
+
+  assert.deepEqual(Object.keys(pub.services.S1).sort(), ['id', 'int', 'state']);
+  assert.equal(pub.recentLog.length, 10);
+  assert.equal(pub.recentLog[9].id, 'e24');
+  assert.ok(!('details' in pub.recentLog[0]));
+});
+
+test('coalesces updates into throttled frames carrying the latest state', async () => {
+  const { hub } = await loaded;
+  const { gameId, state, join } = await openRoom();
+  const viewer = join();
+  assert.equal(viewer.sent.length, 1, 'joiner gets the stored state');
+
+  hub.publishSpectatorState(gameId, atTurn(state, 2));
+  await sleep(10);
+  assert.equal(viewer.messages()[1].state?.markers.turn, 2);
+
+  for (let turn = 3; turn <= 6; turn++) hub.publishSpectatorState(gameId, atTurn(state, turn));
+  await sleep(10);
+  assert.equal(viewer.sent.length, 2, 'next frame waits for the interval');
+
+  await sleep(FRAME_MS);
+  const frames = viewer.messages();
+  assert.equal(frames.length, 3, 'four updates become one frame');
+  assert.equal(frames[2].state?.markers.turn, 6);
+  assert.equal(frames[2].seq, frames[1].seq! + 1);
+  viewer.emit('close');
+});
+
+test('every viewer shares one encoded frame and late joiners get the last one', async () => {
+  const { hub } = await loaded;
+  const { gameId, state, join } = await openRoom();
+  const a = join();
+  const b = join();
+  assert.strictEqual(a.sent[0], b.sent[0]);
+
+  hub.publishSpectatorState(gameId, atTurn(state, 4));
+  await sleep(10);
+  assert.ok(Buffer.isBuffer(a.sent[1]));
+  assert.strictEqual(a.sent[1], b.sent[1]);
+
+  const late = join();
+  assert.equal(late.sent.length, 1);
+  assert.strictEqual(late.sent[0], a.sent[1]);
+  assert.equal(late.messages()[0].state?.markers.turn, 4);
+  for (const v of [a, b, late]) v.emit('close');
+});
+
+test('rejects viewers beyond the room limit with ROOM_FULL', async () => {
+  const { join } = await openRoom();
+  const viewers = [join(), join(), join()];
+  const extra = join();
+
+  assert.equal(extra.messages()[0].code, 'ROOM_FULL');
+  assert.ok(extra.closed);
+  assert.ok(viewers.every((v) => !v.closed));
+  for (const v of viewers) v.emit('close');
+});
+
+test('a socket error drops only that viewer', async () => {
+  const { hub } = await loaded;
+  const { gameId, state, join } = await openRoom();
+  const broken = join();
+  const healthy = join();
+
+  assert.doesNotThrow(() => broken.emit('error', new Error('Invalid UTF-8 sequence')));
+  broken.emit('close');
+  assert.ok(broken.closed);
+
+  hub.publishSpectatorState(gameId, atTurn(state, 5));
+  await sleep(10);
+  assert.equal(broken.sent.length, 1);
+  assert.equal(healthy.sent.length, 2);
+
+  // The room holds one viewer, not zero or minus one: two more fit
+  const others = [join(), join()];
+  assert.ok(others.every((v) => !v.closed));
+  assert.equal(join().messages()[0].code, 'ROOM_FULL');
+  for (const v of [healthy, ...others]) v.emit('close');
+});
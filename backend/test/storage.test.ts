@@ -0,0 +1,110 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import Database from 'better-sqlite3';
+import { GameStore } from '../src/db/storage';
+import { MemoryStore } from '../src/db/memoryStore';
+import { SqliteStore } from '../src/db/sqliteStore';
+import { ShardedSqliteStore, shardOf } from '../src/db/shardedStore';
+import { createGameTables } from '../src/db/schema';
+import { LogEntry, Player } from '../src/types/game.types';
+
+// ============================================================
+// Storage backends: the same contract runs against the in-memory,
+// single-file and sharded stores.
+// ============================================================
+
+const dirs: string[] = [];
+
+function tempDb(name: string): Database.Database {
+  const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'bvm-store-'));
+  dirs.push(dir);
+  return new Database(path.join(dir, name));
+}
+
+const BACKENDS: Record<string, () => GameStore> = {
+  memory: () => new MemoryStore(),
+  sqlite: () => {
+    const db = tempDb('game.db');
+    createGameTables(db);
+    return new SqliteStore(db);
+  },
+  sharded: () => new ShardedSqliteStore([0, 1, 2].map((i) => tempDb(`game-shard-${i}.db`))),
+};
+
+function player(gameId: string, seat: Player['seat'], token: string): Player {
+  return { id: `${token}-id`, gameId, seat, displayName: seat, token, createdAt: 1 };
+}
+
+function entry(id: string, timestamp: number): LogEntry {
+  return { id, turn: 1, phase: 'EVENT', timestamp, action: 'TEST', details: { n: timestamp } };
+}
+
+for (const [name, create] of Object.entries(BACKENDS)) {
+  test(`${name}: games, players and logs round-trip`, () => {
+    const store = create();
+    try {
+      store.saveGame('g1', 'lobby', '{}', '{"winner":null}', 100);
+      store.saveGame('g2', 'running', '{}', '{"winner":null}', 200);
+      store.saveGame('g1', 'finished', '{"a":1}', '{"winner":"MALOSOS"}', 999);
+
+      assert.deepEqual(store.loadGame('g1'), {
+        id: 'g1', status: 'finished', config_json: '{"a":1}', state_json: '{"winner":"MALOSOS"}', created_at: 100,
+      });
+      assert.equal(store.loadGame('missing'), undefined);
+      assert.deepEqual(store.listGames().map((g) => g.id), ['g2', 'g1']);
+
+      const outcomes = store.getGameOutcomes(['g1', 'g2', 'missing']);
+      assert.deepEqual(outcomes.get('g1'), { status: 'finished', winner: 'MALOSOS' });
+      assert.deepEqual(outcomes.get('g2'), { status: 'running', winner: null });
+      assert.equal(outcomes.has('missing'), false);
+
+      store.savePlayer(player('g1', 'FACILITATOR', 't1'));
+      store.savePlayer(player('g2', 'MALOSOS', 't2'));
+      assert.equal(store.getPlayerByToken('t2')?.gameId, 'g2');
+      assert.equal(store.getPlayerByToken('nope'), undefined);
+      assert.deepEqual(store.getPlayersByGame('g1').map((p) => p.token), ['t1']);
+
+      store.saveLogs('g2', [entry('e2', 20), entry('e1', 10)]);
+      store.saveLogs('g2', [entry('e1', 10), entry('e3', 30)]);
+      assert.deepEqual(store.getLogsByGame('g2').map((e) => e.id), ['e1', 'e2', 'e3']);
+      assert.deepEqual(store.getLogsByGame('g2')[0].details, { n: 10 });
+    } finally {
+      store.close();
+    }
+  });
+
+  test(`${name}: active games come with their players`, () => {
+    const store = create();
+    try {
+      for (const [id, status] of [['a', 'running'], ['b', 'paused'], ['c', 'finished'], ['d', 'lobby']]) {
+        store.saveGame(id, status, '{}', '{}', 1);
+        store.savePlayer(player(id, 'BUENOSOS', `tok-${id}`));
+      }
+      const active = store.loadActiveGames();
+      assert.deepEqual(active.games.map((g) => g.id).sort(), ['a', 'b']);
+      assert.deepEqual(active.players.map((p) => p.token).sort(), ['tok-a', 'tok-b']);
+    } finally {
+      store.close();
+    }
+  });
+}
+
+test('sharded store spreads games over its files', () => {
+  const files = [0, 1, 2, 3].map((i) => tempDb(`game-shard-${i}.db`));
+  const store = new ShardedSqliteStore(files);
+  try {
+    for (let i = 0; i < 64; i++) store.saveGame(`game-${i}`, 'running', '{}', '{}', i);
+
+    const counts = files.map((db) => (db.prepare('SELECT COUNT(*) AS n FROM games').get() as { n: number }).n);
+    assert.equal(counts.reduce((a, b) => a + b, 0), 64);
+    assert.ok(counts.every((n) => n > 0), `uneven shards: ${counts.join(',')}`);
+    assert.equal(counts[shardOf('game-5', 4)] > 0, true);
+    assert.equal(store.listGames().length, 64);
+  } finally {
+    store.close();
+    for (const dir of dirs) fs.rmSync(dir, { recursive: true, force: true });
+  }
+});
@@ -0,0 +1,29 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { Request, Response } from 'express';
+import { sqliteStorageGuard } from '../src/api/storageGuard';
+import { StorageKind } from '../src/db/storage';
+
+// ============================================================
+// Analytics and bulk export read the main database: other storage
+// backends get an explicit error instead of empty results.
+// ============================================================
+
+function call(kind: StorageKind): { status: number | null; error: string | null; passed: boolean } {
+  const result = { status: null as number | null, error: null as string | null, passed: false };
+  const res = {
+    status(code: number) { result.status = code; return this; },
+    json(body: { error: string }) { result.error = body.error; return this; },
+  } as unknown as Response;
+  sqliteStorageGuard(kind)({} as Request, res, () => { result.passed = true; });
+  return result;
+}
+
+test('passes through on the sqlite backend', () => {
+  assert.deepEqual(call('sqlite'), { status: null, error: null, passed: true });
+});
+
+test('refuses sharded and memory backends', () => {
+  assert.deepEqual(call('sharded'), { status: 501, error: 'UNSUPPORTED_STORAGE', passed: false });
+  assert.deepEqual(call('memory'), { status: 501, error: 'UNSUPPORTED_STORAGE', passed: false });
+});
@@ -0,0 +1,62 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { TimerWheel } from '../src/scheduler/timerWheel';
+
+// ============================================================
+// Timer wheel: timers fire once, in deadline order, no earlier than
+// their deadline and within one tick after it, at every level.
+// ============================================================
+
+const T0 = 1_000_000;
+
+test('fires each key once, in deadline order, within one tick', () => {
+  const wheel = new TimerWheel<string>(100, 8, 3, T0);
+  const deadlines: Record<string, number> = {
+    a: T0 + 250,
+    b: T0 + 90,
+    c: T0 + 7_000, // level 1
+    d: T0 + 60_000, // level 2
+    e: T0 + 5_000_000, // beyond the top level's range
+  };
+  for (const [key, at] of Object.entries(deadlines)) wheel.schedule(key, at);
+
+  const fired: [string, number][] = [];
+  for (let now = T0; now <= T0 + 5_100_000; now += 100) {
+    for (const key of wheel.advance(now)) fired.push([key, now]);
+  }
+
+  assert.deepEqual(fired.map(([k]) => k), ['b', 'a', 'c', 'd', 'e']);
+  for (const [key, at] of fired) {
+    assert.ok(at >= deadlines[key], `${key} fired early`);
+    assert.ok(at - deadlines[key] < 200, `${key} fired late`);
+  }
+  assert.equal(wheel.size, 0);
+});
+
+test('cancel and reschedule replace the pending timer', () => {
+  const wheel = new TimerWheel<string>(100, 8, 3, T0);
+  wheel.schedule('a', T0 + 500);
+  wheel.schedule('b', T0 + 500);
+  wheel.cancel('a');
+  wheel.schedule('b', T0 + 2_000);
+
+  assert.deepEqual(wheel.advance(T0 + 1_000), []);
+  assert.deepEqual(wheel.advance(T0 + 2_000), ['b']);
+  assert.deepEqual(wheel.advance(T0 + 10_000), []);
+});
+
+test('overdue timers fire on the next advance', () => {
+  const wheel = new TimerWheel<string>(100, 8, 3, T0);
+  wheel.schedule('late', T0 - 5_000);
+  assert.deepEqual(wheel.advance(T0), ['late']);
+});
+
+test('catches up after a long stall', () => {
+  const wheel = new TimerWheel<number>(50, 16, 4, T0);
+  const keys = Array.from({ length: 500 }, (_, i) => i);
+  for (const k of keys) wheel.schedule(k, T0 + ((k * 7919) % 100_000));
+
+  const fired = wheel.advance(T0 + 100_000);
+  assert.equal(fired.length, keys.length);
+  assert.deepEqual([...fired].sort((a, b) => a - b), keys);
+});
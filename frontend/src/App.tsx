@@ -1,15 +1,16 @@
-import { useEffect, useRef, useState } from 'react';
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
 import './App.css';
 import { getGame } from './api/gameApi';
+import { loadCards } from './api/catalog';
 import { Board } from './components/Board/Board';
 import { Lobby } from './components/Lobby/Lobby';
 import { LogPanel } from './components/LogPanel/LogPanel';
 import { Markers } from './components/Markers/Markers';
 import { PhasePanel } from './components/PhasePanel/PhasePanel';
 import { useGame } from './hooks/useGame';
-import type { Card, GameState, Seat } from './types/game.types';
-
-const BASE_URL = (import.meta.env.VITE_API_URL as string | undefined) ?? 'http://localhost:3001';
+import { useGameField } from './hooks/useGameStore';
+import type { GameStore } from './store/gameStore';
+import type { Card, Seat } from './types/game.types';
 
 type AppScreen = 'lobby' | 'game';
 type MobileTab = 'tablero' | 'mano' | 'log' | 'marcadores';
@@ -20,27 +21,58 @@ interface GameSession {
   seat: Seat | 'FACILITATOR';
 }
 
-const EMPTY_GAME_STATE: GameState = {
-  id: '',
-  status: 'lobby',
-  config: { turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' },
-  services: {},
-  seats: {
-    BUENOSOS: { budgetRemaining: 0, hand: [], deck: [], discard: [], basicActionUsed: false },
-    MALOSOS: { budgetRemaining: 0, hand: [], deck: [], discard: [], basicActionUsed: false },
-  },
-  eventDeck: [],
-  eventDiscard: [],
-  markers: { stability: 100, trust: 50, turn: 1, phase: 'MAINTENANCE' },
-  campaign: { completedPhases: [], reconThisTurn: false, phasesCompletedThisTurn: 0 },
-  temporaryEffects: [],
-  backupsVerified: false,
-  servicesRecovered: [],
-  servicesThatWentDown: [],
-  log: [],
-  createdAt: 0,
-  updatedAt: 0,
-};
+// Store-connected wrappers: each one subscribes to the fields it shows,
+// so a GAME_STATE that only touches services does not re-render them
+function GameMarkers({ store }: { store: GameStore }) {
+  const markers = useGameField(store, 'markers');
+  const config = useGameField(store, 'config');
+  return <Markers markers={markers} turnLimit={config.turnLimit} />;
+}
+
+function GamePhasePanel({
+  store,
+  seat,
+  cardCatalog,
+  onPlayCard,
+  onBasicAction,
+  onAdvancePhase,
+}: {
+  store: GameStore;
+  seat: Seat | 'FACILITATOR';
+  cardCatalog: Record<string, Card>;
+  onPlayCard: (cardId: string) => void;
+  onBasicAction: () => void;
+  onAdvancePhase: () => void;
+}) {
+  const markers = useGameField(store, 'markers');
+  const seats = useGameField(store, 'seats');
+  const seatState = seat !== 'FACILITATOR' ? seats[seat] : null;
+  const handCardIds = seatState?.hand;
+
+  const handCards = useMemo(() => (handCardIds ?? []).map(id =>
+    cardCatalog[id] ?? ({
+      id, name: id, side: 'BUENOSOS' as const, category: 'PREVENTION' as const,
+      cost: 1, effects: [], duration: 'immediate' as const,
+    })
+  ), [handCardIds, cardCatalog]);
+
+  return (
+    <PhasePanel
+      phase={markers.phase}
+      seatState={seatState}
+      seat={seat}
+      cards={handCards}
+      onPlayCard={onPlayCard}
+      onBasicAction={onBasicAction}
+      onAdvancePhase={onAdvancePhase}
+    />
+  );
+}
+
+function GameLog({ store }: { store: GameStore }) {
+  const log = useGameField(store, 'log');
+  return <LogPanel log={log} />;
+}
 
 function GameView({
   session,
@@ -51,7 +83,7 @@ function GameView({
   onExit: () => void;
   cardCatalog: Record<string, Card>;
 }) {
-  const { gameState, connected, error, playCard, useBasicAction, advancePhase } = useGame(
+  const { store, connected, error, playCard, useBasicAction, advancePhase } = useGame(
     session.gameId,
     session.token,
     session.seat
@@ -61,26 +93,15 @@ function GameView({
   const [pendingCard, setPendingCard] = useState<string | null>(null);
   const [mobileTab, setMobileTab] = useState<MobileTab>('tablero');
 
-  const activeState: GameState = gameState ?? EMPTY_GAME_STATE;
-
-  const seatState =
-    session.seat !== 'FACILITATOR' ? activeState.seats[session.seat] : null;
-  const handCardIds = seatState?.hand ?? [];
-  const handCards = handCardIds.map(id =>
-    cardCatalog[id] ?? ({
-      id, name: id, side: 'BUENOSOS' as const, category: 'PREVENTION' as const,
-      cost: 1, effects: [], duration: 'immediate' as const,
-    })
-  );
+  const winner = useGameField(store, 'winner');
 
-  const handlePlayCard = (cardId: string) => {
-    const card = handCards.find(c => c.id === cardId);
-    if (card?.targeting) {
+  const handlePlayCard = useCallback((cardId: string) => {
+    if (cardCatalog[cardId]?.targeting) {
       setPendingCard(cardId);
     } else {
       playCard(cardId, []);
     }
-  };
+  }, [cardCatalog, playCard]);
 
   const handleServiceSelect = (serviceId: string) => {
     if (pendingCard) {
@@ -95,34 +116,32 @@ function GameView({
     }
   };
 
-  const handleBasicAction = () => {
+  const handleBasicAction = useCallback(() => {
     useBasicAction();
-  };
+  }, [useBasicAction]);
 
   const renderBoard = () => (
     <Board
-      gameState={activeState}
+      store={store}
       onServiceSelect={pendingCard ? handleServiceSelect : undefined}
       selectedServices={selectedServices}
     />
   );
 
   const renderPhasePanel = () => (
-    <PhasePanel
-      gameState={activeState}
+    <GamePhasePanel
+      store={store}
       seat={session.seat}
-      cards={handCards}
+      cardCatalog={cardCatalog}
       onPlayCard={handlePlayCard}
       onBasicAction={handleBasicAction}
       onAdvancePhase={advancePhase}
     />
   );
 
-  const renderLog = () => <LogPanel log={activeState.log} />;
+  const renderLog = () => <GameLog store={store} />;
 
-  const renderMarkers = () => (
-    <Markers markers={activeState.markers} turnLimit={activeState.config.turnLimit} />
-  );
+  const renderMarkers = () => <GameMarkers store={store} />;
 
   const TABS: { id: MobileTab; label: string }[] = [
     { id: 'tablero', label: 'Tablero' },
@@ -145,9 +164,9 @@ function GameView({
           <span className="seat-badge seat-{session.seat.toLowerCase()}">{session.seat}</span>
         </div>
         <div className="header-actions">
-          {activeState.winner && (
+          {winner && (
             <span className="winner-banner">
-              Ganador: {activeState.winner === 'BUENOSOS' ? 'BuenOsos' : 'MalOsos'}
+              Ganador: {winner === 'BUENOSOS' ? 'BuenOsos' : 'MalOsos'}
             </span>
           )}
           <button className="exit-btn" onClick={onExit} type="button">
@@ -208,11 +227,10 @@ export default function App() {
   useEffect(() => {
     if (catalogFetched.current) return;
     catalogFetched.current = true;
-    fetch(`${BASE_URL}/api/cards`)
-      .then(r => r.json())
-      .then((data: { cards: Card[] }) => {
+    loadCards()
+      .then(cards => {
         const catalog: Record<string, Card> = {};
-        for (const card of data.cards) catalog[card.id] = card;
+        for (const card of cards) catalog[card.id] = card;
         setCardCatalog(catalog);
       })
       .catch(() => { /* silently ignore — fallback placeholders will show */ });
@@ -0,0 +1,66 @@
+import type { Card, GameState, Service } from '../types/game.types';
+
+const BASE_URL = (import.meta.env.VITE_API_URL as string | undefined) ?? 'http://localhost:3001';
+
+// Static catalog (cards + map definitions). The manifest is revalidated
+// on load; the versioned URLs it points to are immutable, so the
+// browser serves them from cache after the first visit.
+
+interface CatalogManifest {
+  cards: { version: string; url: string };
+  maps: Record<string, { version: string; url: string }>;
+}
+
+let manifestPromise: Promise<CatalogManifest> | null = null;
+let cardsPromise: Promise<Card[]> | null = null;
+const mapPromises = new Map<string, Promise<Record<string, Service>>>();
+
+async function getJson<T>(path: string): Promise<T> {
+  const res = await fetch(`${BASE_URL}${path}`);
+  if (!res.ok) throw new Error(`API error ${res.status}`);
+  return res.json() as Promise<T>;
+}
+
+function loadManifest(): Promise<CatalogManifest> {
+  if (!manifestPromise) {
+    manifestPromise = getJson<CatalogManifest>('/api/catalog');
+    manifestPromise.catch(() => { manifestPromise = null; });
+  }
+  return manifestPromise;
+}
+
+export function loadCards(): Promise<Card[]> {
+  if (!cardsPromise) {
+    cardsPromise = loadManifest()
+      .then(m => getJson<{ cards: Card[] }>(m.cards.url))
+      .then(data => data.cards);
+    cardsPromise.catch(() => { cardsPromise = null; });
+  }
+  return cardsPromise;
+}
+
+function loadMap(mapId: string, version: string): Promise<Record<string, Service>> {
+  const key = `${mapId}/${version}`;
+  let promise = mapPromises.get(key);
+  if (!promise) {
+    promise = getJson<{ services: Record<string, Service> }>(`/api/catalog/maps/${mapId}/${version}`)
+      .then(data => data.services);
+    promise.catch(() => mapPromises.delete(key));
+    mapPromises.set(key, promise);
+  }
+  return promise;
+}
+
+// Compact game states (?view=compact) carry only id/int/state per
+// service; the static fields come from the map version they reference.
+export async function hydrateState(state: GameState): Promise<GameState> {
+  const ref = state.catalog;
+  if (!ref || !ref.map) return state;
+
+  const map = await loadMap(ref.mapId, ref.map);
+  const services: Record<string, Service> = {};
+  for (const [id, svc] of Object.entries(state.services)) {
+    services[id] = { ...map[id], ...svc };
+  }
+  return { ...state, services };
+}
@@ -0,0 +1,267 @@
+import { Profiler, useEffect, useState } from 'react';
+import type { ProfilerOnRenderCallback } from 'react';
+import { flushSync } from 'react-dom';
+import { createRoot } from 'react-dom/client';
+import { Board } from '../components/Board/Board';
+import { LogPanel } from '../components/LogPanel/LogPanel';
+import { Markers } from '../components/Markers/Markers';
+import { PhasePanel } from '../components/PhasePanel/PhasePanel';
+import { useGameField } from '../hooks/useGameStore';
+import { EMPTY_GAME_STATE, GameStore } from '../store/gameStore';
+import type { GameState, Service, ServiceState } from '../types/game.types';
+
+// ============================================================
+// Render-time benchmark for the game view (dev server only)
+//
+//   npm run bench:render          opens /?bench=render
+//   /?bench=render&services=600&log=2000&updates=200
+//
+// Builds a large synthetic map and log, then replays GAME_STATE
+// messages that each change one service and append one log entry,
+// every message parsed from its own JSON as the socket delivers it.
+// Two runs over the same messages:
+//
+//   replace     previous behaviour: the whole state is swapped and
+//               every panel re-renders, log rendered in full
+//   normalized  GameStore with structural sharing, per-entity
+//               subscriptions and the windowed LogPanel
+//
+// Each update is committed with flushSync and timed wall-clock;
+// React Profiler totals per area show where the time goes.
+// ============================================================
+
+interface BenchOptions {
+  services: number;
+  log: number;
+  updates: number;
+}
+
+interface AreaTotals {
+  commits: number;
+  ms: number;
+}
+
+interface BenchResult {
+  mode: string;
+  medianMs: number;
+  p95Ms: number;
+  totalMs: number;
+  areas: Record<string, AreaTotals>;
+  logRows: number;
+}
+
+const STATES: ServiceState[] = ['OK', 'DEGRADED', 'INTERMITTENT', 'DOWN'];
+const AREAS = ['board', 'markers', 'phase', 'log'];
+
+function parseOptions(search: string): BenchOptions {
+  const params = new URLSearchParams(search);
+  const num = (key: string, fallback: number) => {
+    const value = parseInt(params.get(key) ?? '', 10);
+    return Number.isFinite(value) && value > 0 ? value : fallback;
+  };
+  return { services: num('services', 300), log: num('log', 500), updates: num('updates', 100) };
+}
+
+function logEntry(i: number) {
+  return {
+    id: `log-${i}`,
+    turn: 1 + Math.floor(i / 40),
+    phase: 'MALOSOS_ATTACK',
+    timestamp: 1700000000000 + i,
+    action: 'PLAY_CARD',
+    actor: i % 2 === 0 ? 'MALOSOS' : 'BUENOSOS',
+    details: { cardId: `M${i % 30}`, targets: [`S${i % 50}`] },
+  };
+}
+
+function initialState(opts: BenchOptions): GameState {
+  const services: Record<string, Service> = {};
+  for (let i = 0; i < opts.services; i++) {
+    const id = `S${i + 1}`;
+    services[id] = {
+      id, name: `Servicio ${i + 1}`, crit: 1 + (i % 5), int: 4, intMax: 4, state: 'OK',
+      dependencies: i > 0 ? [`S${i}`] : [], citizenFacing: i % 3 === 0,
+    };
+  }
+  return {
+    ...EMPTY_GAME_STATE,
+    id: 'bench',
+    status: 'running',
+    services,
+    seats: {
+      BUENOSOS: { budgetRemaining: 8, hand: ['B1', 'B2', 'B3', 'B4', 'B5'], deck: [], discard: [], basicActionUsed: false },
+      MALOSOS: { budgetRemaining: 8, hand: ['M1', 'M2', 'M3', 'M4', 'M5'], deck: [], discard: [], basicActionUsed: false },
+    },
+    markers: { stability: 100, trust: 50, turn: 1, phase: 'MALOSOS_ATTACK' },
+    log: Array.from({ length: opts.log }, (_, i) => logEntry(i)),
+  };
+}
+
+// Serialized GAME_STATE payloads, one service and one log entry changed each
+function buildMessages(opts: BenchOptions): string[] {
+  let state = initialState(opts);
+  const messages = [JSON.stringify(state)];
+  const ids = Object.keys(state.services);
+  for (let i = 0; i < opts.updates; i++) {
+    const id = ids[(i * 7919) % ids.length];
+    const svc = state.services[id];
+    const next = STATES[(STATES.indexOf(svc.state) + 1) % STATES.length];
+    state = {
+      ...state,
+      services: { ...state.services, [id]: { ...svc, state: next, int: next === 'DOWN' ? 0 : Math.max(1, svc.int - 1) } },
+      log: [...state.log, logEntry(opts.log + i)],
+      updatedAt: state.updatedAt + 1,
+    };
+    messages.push(JSON.stringify(state));
+  }
+  return messages;
+}
+
+// The log as the old LogPanel drew it: one row per entry
+function FullLog({ store }: { store: GameStore }) {
+  const log = useGameField(store, 'log');
+  return (
+    <div style={{ maxHeight: 300, overflowY: 'auto' }}>
+      {log.map((entry, idx) => (
+        <div key={idx} data-log-row="">{idx + 1} {JSON.stringify(entry)}</div>
+      ))}
+    </div>
+  );
+}
+
+function BenchLog({ store }: { store: GameStore }) {
+  const log = useGameField(store, 'log');
+  return <LogPanel log={log} />;
+}
+
+function BenchMarkers({ store }: { store: GameStore }) {
+  const markers = useGameField(store, 'markers');
+  const config = useGameField(store, 'config');
+  return <Markers markers={markers} turnLimit={config.turnLimit} />;
+}
+
+const noop = () => {};
+
+function BenchPhasePanel({ store }: { store: GameStore }) {
+  const markers = useGameField(store, 'markers');
+  const seats = useGameField(store, 'seats');
+  return (
+    <PhasePanel
+      phase={markers.phase}
+      seatState={seats.MALOSOS}
+      seat="MALOSOS"
+      cards={[]}
+      onPlayCard={noop}
+      onBasicAction={noop}
+      onAdvancePhase={noop}
+    />
+  );
+}
+
+function BenchView({ store, fullLog, onRender }: { store: GameStore; fullLog: boolean; onRender: ProfilerOnRenderCallback }) {
+  return (
+    <div style={{ width: 1024 }}>
+      <Profiler id="markers" onRender={onRender}><BenchMarkers store={store} /></Profiler>
+      <Profiler id="board" onRender={onRender}><Board store={store} onServiceSelect={noop} /></Profiler>
+      <Profiler id="phase" onRender={onRender}><BenchPhasePanel store={store} /></Profiler>
+      <Profiler id="log" onRender={onRender}>
+        {fullLog ? <FullLog store={store} /> : <BenchLog store={store} />}
+      </Profiler>
+    </div>
+  );
+}
+
+function percentile(sorted: number[], p: number): number {
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+}
+
+function runMode(mode: string, messages: string[], host: HTMLElement): BenchResult {
+  const store = new GameStore(mode === 'normalized');
+  const areas: Record<string, AreaTotals> = {};
+  for (const id of AREAS) areas[id] = { commits: 0, ms: 0 };
+  let recording = false;
+  const onRender: ProfilerOnRenderCallback = (id, _phase, actualDuration) => {
+    if (!recording) return;
+    areas[id].commits++;
+    areas[id].ms += actualDuration;
+  };
+
+  const container = document.createElement('div');
+  host.appendChild(container);
+  const root = createRoot(container);
+  store.applyState(JSON.parse(messages[0]) as GameState);
+  flushSync(() => root.render(<BenchView store={store} fullLog={mode === 'replace'} onRender={onRender} />));
+
+  recording = true;
+  const times: number[] = [];
+  for (const message of messages.slice(1)) {
+    const start = performance.now();
+    flushSync(() => store.applyState(JSON.parse(message) as GameState));
+    times.push(performance.now() - start);
+  }
+  recording = false;
+
+  // Log rows left in the DOM: every entry for the full list, the window for LogPanel
+  const logRows = container.querySelectorAll('[data-log-row], [role="log"] [title]').length;
+  root.unmount();
+  container.remove();
+
+  const sorted = [...times].sort((a, b) => a - b);
+  return {
+    mode,
+    medianMs: percentile(sorted, 0.5),
+    p95Ms: percentile(sorted, 0.95),
+    totalMs: times.reduce((sum, t) => sum + t, 0),
+    areas,
+    logRows,
+  };
+}
+
+function formatResults(opts: BenchOptions, results: BenchResult[]): string {
+  const lines = [
+    `${opts.services} servicios, ${opts.log} entradas de log, ${opts.updates} actualizaciones`,
+    '',
+    'mode         median    p95     total     log rows   ' + AREAS.map(a => `${a} (commits/ms)`.padEnd(20)).join(''),
+  ];
+  for (const r of results) {
+    lines.push(
+      r.mode.padEnd(12)
+      + `${r.medianMs.toFixed(2)} ms`.padStart(9)
+      + `${r.p95Ms.toFixed(2)} ms`.padStart(10)
+      + `${r.totalMs.toFixed(0)} ms`.padStart(10)
+      + String(r.logRows).padStart(11) + '   '
+      + AREAS.map(a => `${r.areas[a].commits}/${r.areas[a].ms.toFixed(1)}`.padEnd(20)).join('')
+    );
+  }
+  return lines.join('\n');
+}
+
+export function RenderBench() {
+  const [output, setOutput] = useState('Ejecutando benchmark...');
+
+  useEffect(() => {
+    const opts = parseOptions(window.location.search);
+    const messages = buildMessages(opts);
+    const host = document.createElement('div');
+    host.style.cssText = 'position:absolute;left:-10000px;top:0';
+    document.body.appendChild(host);
+    // Let the page paint the placeholder before blocking the main thread
+    const timer = window.setTimeout(() => {
+      const results = ['replace', 'normalized'].map(mode => runMode(mode, messages, host));
+      host.remove();
+      console.table(results.map(({ areas, ...r }) => ({ ...r, ...Object.fromEntries(AREAS.map(a => [a, `${areas[a].commits}/${areas[a].ms.toFixed(1)} ms`])) })));
+      setOutput(formatResults(opts, results));
+    }, 50);
+    return () => {
+      window.clearTimeout(timer);
+      host.remove();
+    };
+  }, []);
+
+  return (
+    <div style={{ padding: '1rem', color: '#e2e8f0' }}>
+      <h2>Benchmark de render</h2>
+      <pre>{output}</pre>
+    </div>
+  );
+}
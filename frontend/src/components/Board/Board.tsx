@@ -1,11 +1,12 @@
-import { useState } from 'react';
-import type { GameState } from '../../types/game.types';
+import { memo, useCallback, useState } from 'react';
+import { useGameField, useService, useServiceIds } from '../../hooks/useGameStore';
+import type { GameStore } from '../../store/gameStore';
 import { CampaignTrack } from '../CampaignTrack/CampaignTrack';
 import { ServiceNode } from '../ServiceNode/ServiceNode';
 import styles from './Board.module.css';
 
 interface BoardProps {
-  gameState: GameState;
+  store: GameStore;
   onServiceSelect?: (serviceId: string) => void;
   selectedServices?: string[];
   targetableServices?: string[];
@@ -34,35 +35,65 @@ const WorldMapSVG = () => (
   </svg>
 );
 
+// One node per service id, subscribed to that service only: a message
+// that changes one service re-renders one node
+const BoardServiceNode = memo(function BoardServiceNode({
+  store,
+  serviceId,
+  selected,
+  targetable,
+  onSelect,
+}: {
+  store: GameStore;
+  serviceId: string;
+  selected: boolean;
+  targetable: boolean;
+  onSelect?: (serviceId: string) => void;
+}) {
+  const service = useService(store, serviceId);
+  const handleClick = useCallback(() => onSelect?.(serviceId), [onSelect, serviceId]);
+  if (!service) return null;
+  return (
+    <ServiceNode
+      service={service}
+      selected={selected}
+      targetable={targetable}
+      onClick={onSelect ? handleClick : undefined}
+    />
+  );
+});
+
 export function Board({
-  gameState,
+  store,
   onServiceSelect,
   selectedServices = [],
   targetableServices = [],
 }: BoardProps) {
   const [_localSelected, setLocalSelected] = useState<string | null>(null);
 
-  const services = Object.values(gameState.services);
+  const serviceIds = useServiceIds(store);
+  const campaign = useGameField(store, 'campaign');
 
-  const handleNodeClick = (serviceId: string) => {
+  const handleNodeClick = useCallback((serviceId: string) => {
     setLocalSelected(serviceId);
     if (onServiceSelect) onServiceSelect(serviceId);
-  };
+  }, [onServiceSelect]);
 
   return (
     <div className={styles.board}>
       <WorldMapSVG />
       <div className={styles.campaignRow}>
-        <CampaignTrack completedPhases={gameState.campaign.completedPhases} />
+        <CampaignTrack completedPhases={campaign.completedPhases} />
       </div>
       <div className={styles.servicesGrid}>
-        {services.map(service => (
-          <ServiceNode
-            key={service.id}
-            service={service}
-            selected={selectedServices.includes(service.id)}
-            targetable={targetableServices.includes(service.id)}
-            onClick={onServiceSelect ? () => handleNodeClick(service.id) : undefined}
+        {serviceIds.map(id => (
+          <BoardServiceNode
+            key={id}
+            store={store}
+            serviceId={id}
+            selected={selectedServices.includes(id)}
+            targetable={targetableServices.includes(id)}
+            onSelect={onServiceSelect ? handleNodeClick : undefined}
           />
         ))}
       </div>
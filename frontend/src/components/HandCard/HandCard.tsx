@@ -1,3 +1,4 @@
+import { memo } from 'react';
 import type { KeyboardEvent } from 'react';
 import { FaShieldAlt, FaSkullCrossbones } from 'react-icons/fa';
 import {
@@ -62,7 +63,7 @@ const CATEGORY_LABEL: Record<CardCategory, string> = {
   TAIL_RISK: 'Riesgo Cola',
 };
 
-export function HandCard({ card, canPlay, onPlay }: HandCardProps) {
+export const HandCard = memo(function HandCard({ card, canPlay, onPlay }: HandCardProps) {
   const handleKeyDown = (e: KeyboardEvent<HTMLDivElement>) => {
     if ((e.key === 'Enter' || e.key === ' ') && canPlay) {
       e.preventDefault();
@@ -104,4 +105,4 @@ export function HandCard({ card, canPlay, onPlay }: HandCardProps) {
       </button>
     </div>
   );
-}
+});
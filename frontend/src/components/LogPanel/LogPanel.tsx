@@ -1,4 +1,5 @@
-import { useEffect, useRef } from 'react';
+import { memo, useLayoutEffect, useRef, useState } from 'react';
+import type { ReactElement } from 'react';
 import styles from './LogPanel.module.css';
 
 interface LogEntry {
@@ -10,6 +11,13 @@ interface LogEntry {
   [key: string]: unknown;
 }
 
+// Windowed list: only the rows in view (plus OVERSCAN on each side) are
+// mounted, inside a spacer as tall as the whole log. Rows have a fixed
+// height; long entries are cut with an ellipsis and shown whole on hover.
+const ROW_HEIGHT = 26;
+const OVERSCAN = 8;
+const DEFAULT_VIEWPORT = 240;
+
 interface LogPanelProps {
   log: unknown[];
 }
@@ -26,31 +34,69 @@ function formatEntry(entry: unknown, idx: number): string {
   return parts.join(' - ');
 }
 
-export function LogPanel({ log }: LogPanelProps) {
-  const bottomRef = useRef<HTMLDivElement | null>(null);
+const LogRow = memo(function LogRow({ entry, idx, last }: { entry: unknown; idx: number; last: boolean }) {
+  const text = formatEntry(entry, idx);
+  return (
+    <div
+      className={[styles.entry, last ? styles.last : ''].filter(Boolean).join(' ')}
+      style={{ top: idx * ROW_HEIGHT, height: ROW_HEIGHT }}
+    >
+      <span className={styles.index}>{idx + 1}</span>
+      <span className={styles.text} title={text}>{text}</span>
+    </div>
+  );
+});
+
+export const LogPanel = memo(function LogPanel({ log }: LogPanelProps) {
+  const viewportRef = useRef<HTMLDivElement | null>(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(DEFAULT_VIEWPORT);
+  // Follow new entries only while the user is already at the bottom
+  const stickToBottom = useRef(true);
 
-  useEffect(() => {
-    if (bottomRef.current) {
-      bottomRef.current.scrollIntoView({ behavior: 'smooth' });
-    }
-  }, [log]);
+  useLayoutEffect(() => {
+    const el = viewportRef.current;
+    if (!el) return;
+    setViewportHeight(el.clientHeight || DEFAULT_VIEWPORT);
+    if (typeof ResizeObserver === 'undefined') return;
+    const observer = new ResizeObserver(() => setViewportHeight(el.clientHeight || DEFAULT_VIEWPORT));
+    observer.observe(el);
+    return () => observer.disconnect();
+  }, []);
+
+  useLayoutEffect(() => {
+    const el = viewportRef.current;
+    if (!el || !stickToBottom.current) return;
+    el.scrollTop = el.scrollHeight;
+    setScrollTop(el.scrollTop);
+  }, [log.length, viewportHeight]);
+
+  const handleScroll = () => {
+    const el = viewportRef.current;
+    if (!el) return;
+    stickToBottom.current = el.scrollTop + el.clientHeight >= el.scrollHeight - ROW_HEIGHT / 2;
+    setScrollTop(el.scrollTop);
+  };
+
+  const first = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+  const last = Math.min(log.length, Math.ceil((scrollTop + viewportHeight) / ROW_HEIGHT) + OVERSCAN);
+  const rows: ReactElement[] = [];
+  for (let idx = first; idx < last; idx++) {
+    rows.push(<LogRow key={idx} entry={log[idx]} idx={idx} last={idx === log.length - 1} />);
+  }
 
   return (
     <div className={styles.panel} aria-label="Log de acciones del juego" role="log" aria-live="polite">
       <h3 className={styles.title}>Registro de acciones</h3>
-      <div className={styles.entries}>
+      <div ref={viewportRef} className={styles.entries} onScroll={handleScroll}>
         {log.length === 0 ? (
           <p className={styles.empty}>Sin eventos registrados</p>
         ) : (
-          log.map((entry, idx) => (
-            <div key={idx} className={styles.entry}>
-              <span className={styles.index}>{idx + 1}</span>
-              <span className={styles.text}>{formatEntry(entry, idx)}</span>
-            </div>
-          ))
+          <div className={styles.spacer} style={{ height: log.length * ROW_HEIGHT }}>
+            {rows}
+          </div>
         )}
-        <div ref={bottomRef} />
       </div>
     </div>
   );
-}
+});
@@ -1,3 +1,4 @@
+import { memo } from 'react';
 import type { GameMarkers, TurnPhase } from '../../types/game.types';
 import styles from './Markers.module.css';
 
@@ -61,7 +62,7 @@ function trustColor(v: number) {
   return styles.red;
 }
 
-export function Markers({ markers, turnLimit }: MarkersProps) {
+export const Markers = memo(function Markers({ markers, turnLimit }: MarkersProps) {
   return (
     <div className={styles.markers}>
       <Bar
@@ -86,4 +87,4 @@ export function Markers({ markers, turnLimit }: MarkersProps) {
       </div>
     </div>
   );
-}
+});
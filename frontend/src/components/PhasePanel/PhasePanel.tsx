@@ -1,9 +1,11 @@
-import type { Card, GameState, Seat, TurnPhase } from '../../types/game.types';
+import { memo } from 'react';
+import type { Card, Seat, SeatState, TurnPhase } from '../../types/game.types';
 import { HandCard } from '../HandCard/HandCard';
 import styles from './PhasePanel.module.css';
 
 interface PhasePanelProps {
-  gameState: GameState;
+  phase: TurnPhase;
+  seatState: SeatState | null;
   seat: Seat | 'FACILITATOR';
   cards: Card[];
   onPlayCard: (cardId: string) => void;
@@ -28,16 +30,15 @@ function canPlayInPhase(phase: TurnPhase, seat: Seat | 'FACILITATOR'): boolean {
   return false;
 }
 
-export function PhasePanel({
-  gameState,
+export const PhasePanel = memo(function PhasePanel({
+  phase,
+  seatState,
   seat,
   cards,
   onPlayCard,
   onBasicAction,
   onAdvancePhase,
 }: PhasePanelProps) {
-  const phase = gameState.markers.phase;
-  const seatState = seat !== 'FACILITATOR' ? gameState.seats[seat] : null;
   const budget = seatState?.budgetRemaining ?? 0;
   const basicUsed = seatState?.basicActionUsed ?? true;
   const canPlay = canPlayInPhase(phase, seat);
@@ -92,4 +93,4 @@ export function PhasePanel({
       </div>
     </div>
   );
-}
+});
@@ -1,3 +1,4 @@
+import { memo } from 'react';
 import { LuNetwork } from 'react-icons/lu';
 import type { Service } from '../../types/game.types';
 import styles from './ServiceNode.module.css';
@@ -16,7 +17,7 @@ const STATE_LABEL: Record<string, string> = {
   DOWN: 'Caido',
 };
 
-export function ServiceNode({ service, selected, onClick, targetable }: ServiceNodeProps) {
+export const ServiceNode = memo(function ServiceNode({ service, selected, onClick, targetable }: ServiceNodeProps) {
   const intPct = service.intMax > 0 ? (service.int / service.intMax) * 100 : 0;
 
   return (
@@ -56,4 +57,4 @@ export function ServiceNode({ service, selected, onClick, targetable }: ServiceN
       {service.citizenFacing && <span className={styles.citizen}>Ciudadanos</span>}
     </button>
   );
-}
+});
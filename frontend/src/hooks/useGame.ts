@@ -1,8 +1,10 @@
+import { useCallback } from 'react';
 import { useWebSocket } from './useWebSocket';
-import type { GameState, Seat } from '../types/game.types';
+import type { GameStore } from '../store/gameStore';
+import type { Seat } from '../types/game.types';
 
 export interface UseGameResult {
-  gameState: GameState | null;
+  store: GameStore;
   connected: boolean;
   error: string | null;
   playCard: (cardId: string, targets?: string[]) => void;
@@ -15,19 +17,20 @@ export function useGame(
   token: string | null,
   seat: Seat | 'FACILITATOR'
 ): UseGameResult {
-  const { gameState, sendMessage, connected, error } = useWebSocket(gameId, token);
+  const { store, sendMessage, connected, error } = useWebSocket(gameId, token);
 
-  const playCard = (cardId: string, targets?: string[]) => {
+  // Stable callbacks, so memoized panels do not re-render on every GameView render
+  const playCard = useCallback((cardId: string, targets?: string[]) => {
     sendMessage({ type: 'PLAY_CARD', side: seat, cardId, targets: targets ?? [] });
-  };
+  }, [sendMessage, seat]);
 
-  const useBasicAction = (target?: string) => {
+  const useBasicAction = useCallback((target?: string) => {
     sendMessage({ type: 'USE_BASIC_ACTION', side: seat, target: target ?? null });
-  };
+  }, [sendMessage, seat]);
 
-  const advancePhase = () => {
+  const advancePhase = useCallback(() => {
     sendMessage({ type: 'ADVANCE_PHASE' });
-  };
+  }, [sendMessage]);
 
-  return { gameState, connected, error, playCard, useBasicAction, advancePhase };
+  return { store, connected, error, playCard, useBasicAction, advancePhase };
 }
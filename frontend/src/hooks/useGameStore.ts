@@ -0,0 +1,23 @@
+import { useCallback, useSyncExternalStore } from 'react';
+import type { GameStore } from '../store/gameStore';
+import type { GameState, Service } from '../types/game.types';
+
+// Per-entity subscriptions to a GameStore: each hook re-renders its
+// component only when its own topic changes.
+
+function useTopic<T>(store: GameStore, topic: string, read: () => T): T {
+  const subscribe = useCallback((listener: () => void) => store.subscribe(topic, listener), [store, topic]);
+  return useSyncExternalStore(subscribe, read);
+}
+
+export function useService(store: GameStore, id: string): Service | undefined {
+  return useTopic(store, `service:${id}`, () => store.getService(id));
+}
+
+export function useServiceIds(store: GameStore): string[] {
+  return useTopic(store, 'services', () => store.getServiceIds());
+}
+
+export function useGameField<K extends keyof GameState>(store: GameStore, key: K): GameState[K] {
+  return useTopic(store, key, () => store.getState()[key]);
+}
@@ -1,21 +1,28 @@
 import { useCallback, useEffect, useRef, useState } from 'react';
 import type { GameState } from '../types/game.types';
+import { hydrateState } from '../api/catalog';
+import { GameStore } from '../store/gameStore';
 
 const WS_BASE = (import.meta.env.VITE_API_URL as string | undefined)
   ? (import.meta.env.VITE_API_URL as string).replace(/^http/, 'ws')
   : 'ws://localhost:3001';
 
+// Shown while an action is rate limited or shed; the next state update clears it
+const BUSY_ERROR = 'Servidor ocupado, intenta de nuevo en unos segundos';
+
 export type WsMessage = Record<string, unknown>;
 
 export interface UseWebSocketResult {
-  gameState: GameState | null;
+  // Every GAME_STATE is merged into this store; components subscribe
+  // to the entities they show instead of re-rendering on each message
+  store: GameStore;
   sendMessage: (msg: WsMessage) => void;
   connected: boolean;
   error: string | null;
 }
 
 export function useWebSocket(gameId: string | null, token: string | null): UseWebSocketResult {
-  const [gameState, setGameState] = useState<GameState | null>(null);
+  const [store] = useState(() => new GameStore());
   const [connected, setConnected] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
@@ -23,11 +30,18 @@ export function useWebSocket(gameId: string | null, token: string | null): UseWe
   const retriesRef = useRef(0);
   const mountedRef = useRef(true);
   const retryTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // Set by a SERVER_RESTART hint: reconnect after the given delay and
+  // send the state version we hold, so an unchanged state is not re-sent
+  const restartRef = useRef<{ version: string | null; delay: number } | null>(null);
 
   const connect = useCallback(() => {
     if (!gameId || !token) return;
 
-    const url = `${WS_BASE}/ws/games/${gameId}?token=${encodeURIComponent(token)}`;
+    const version = restartRef.current?.version;
+    restartRef.current = null;
+    // Compact states omit static service fields; hydrateState fills them in
+    const url = `${WS_BASE}/ws/games/${gameId}?token=${encodeURIComponent(token)}&view=compact`
+      + (version ? `&version=${encodeURIComponent(version)}` : '');
     const ws = new WebSocket(url);
     wsRef.current = ws;
 
@@ -43,7 +57,18 @@ export function useWebSocket(gameId: string | null, token: string | null): UseWe
       try {
         const msg = JSON.parse(event.data as string) as WsMessage;
         if (msg.type === 'GAME_STATE') {
-          setGameState(msg.state as GameState);
+          setError(prev => (prev === BUSY_ERROR ? null : prev));
+          hydrateState(msg.state as GameState)
+            .then(state => { if (mountedRef.current) store.applyState(state); })
+            .catch(() => setError('No se pudo cargar el mapa de servicios'));
+        } else if (msg.type === 'SERVER_RESTART') {
+          restartRef.current = {
+            version: (msg.stateVersion as string | null) ?? null,
+            delay: (msg.reconnectAfterMs as number | undefined) ?? 0,
+          };
+        } else if (msg.type === 'ERROR' && (msg.code === 'RATE_LIMITED' || msg.code === 'OVERLOADED')) {
+          // The action was dropped before reaching the engine; the player retries
+          setError(BUSY_ERROR);
         }
       } catch {
         // ignore parse errors
@@ -58,6 +83,14 @@ export function useWebSocket(gameId: string | null, token: string | null): UseWe
     ws.onclose = () => {
       if (!mountedRef.current) return;
       setConnected(false);
+      // Planned restart: the server picked the delay, and it does not
+      // count against the retry budget
+      if (restartRef.current) {
+        retryTimerRef.current = setTimeout(() => {
+          if (mountedRef.current) connect();
+        }, restartRef.current.delay);
+        return;
+      }
       if (retriesRef.current < 3) {
         const delay = Math.pow(2, retriesRef.current) * 1000;
         retriesRef.current += 1;
@@ -68,7 +101,7 @@ export function useWebSocket(gameId: string | null, token: string | null): UseWe
         setError('No se pudo reconectar al servidor');
       }
     };
-  }, [gameId, token]);
+  }, [gameId, token, store]);
 
   useEffect(() => {
     mountedRef.current = true;
@@ -86,5 +119,5 @@ export function useWebSocket(gameId: string | null, token: string | null): UseWe
     }
   }, []);
 
-  return { gameState, sendMessage, connected, error };
+  return { store, sendMessage, connected, error };
 }
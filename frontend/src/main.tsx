@@ -3,8 +3,21 @@ import { createRoot } from 'react-dom/client'
 import './index.css'
 import App from './App.tsx'
 
-createRoot(document.getElementById('root')!).render(
-  <StrictMode>
-    <App />
-  </StrictMode>,
-)
+const root = createRoot(document.getElementById('root')!)
+
+// Render benchmark, dev server only: npm run bench:render
+if (import.meta.env.DEV && new URLSearchParams(window.location.search).get('bench') === 'render') {
+  import('./bench/RenderBench.tsx').then(({ RenderBench }) => {
+    root.render(
+      <StrictMode>
+        <RenderBench />
+      </StrictMode>,
+    )
+  })
+} else {
+  root.render(
+    <StrictMode>
+      <App />
+    </StrictMode>,
+  )
+}
@@ -0,0 +1,158 @@
+import type { GameState, Service } from '../types/game.types';
+
+// Normalized client copy of the game state. Every GAME_STATE message
+// is merged into the previous one with structural sharing: a service,
+// a top-level field or a log entry that did not change keeps its old
+// object, and only the topics that did change are notified. Components
+// subscribe per entity (one service, the service list, markers, the
+// log...) so a message that touches one service re-renders one
+// ServiceNode.
+//
+// Topics: `service:<id>`, `services` (membership/order), `log`, and
+// one per remaining top-level GameState key (`markers`, `seats`,
+// `campaign`, `winner`...).
+
+export const EMPTY_GAME_STATE: GameState = {
+  id: '',
+  status: 'lobby',
+  config: { turnLimit: 8, budgetPerTurn: 8, intermittenceMode: 'deterministic', mapId: 'standard' },
+  services: {},
+  seats: {
+    BUENOSOS: { budgetRemaining: 0, hand: [], deck: [], discard: [], basicActionUsed: false },
+    MALOSOS: { budgetRemaining: 0, hand: [], deck: [], discard: [], basicActionUsed: false },
+  },
+  eventDeck: [],
+  eventDiscard: [],
+  markers: { stability: 100, trust: 50, turn: 1, phase: 'MAINTENANCE' },
+  campaign: { completedPhases: [], reconThisTurn: false, phasesCompletedThisTurn: 0 },
+  temporaryEffects: [],
+  backupsVerified: false,
+  servicesRecovered: [],
+  servicesThatWentDown: [],
+  log: [],
+  createdAt: 0,
+  updatedAt: 0,
+};
+
+type Listener = () => void;
+
+function sameValue(a: unknown, b: unknown): boolean {
+  if (a === b) return true;
+  if (typeof a !== 'object' || typeof b !== 'object' || a === null || b === null) return false;
+  if (Array.isArray(a)) {
+    if (!Array.isArray(b) || a.length !== b.length) return false;
+    return a.every((item, i) => sameValue(item, b[i]));
+  }
+  if (Array.isArray(b)) return false;
+  const ak = Object.keys(a);
+  const bk = Object.keys(b);
+  if (ak.length !== bk.length) return false;
+  return ak.every(k => sameValue((a as Record<string, unknown>)[k], (b as Record<string, unknown>)[k]));
+}
+
+function entryId(entry: unknown): unknown {
+  return typeof entry === 'object' && entry !== null ? (entry as { id?: unknown }).id : undefined;
+}
+
+// The log only grows: keep the old entry objects and append the new ones
+function shareLog(prev: unknown[], next: unknown[]): unknown[] {
+  if (prev.length === 0 || next.length < prev.length) return next;
+  const last = prev.length - 1;
+  if (entryId(prev[last]) === undefined || entryId(prev[last]) !== entryId(next[last])) return next;
+  if (next.length === prev.length) return prev;
+  return prev.concat(next.slice(prev.length));
+}
+
+export class GameStore {
+  private state: GameState = EMPTY_GAME_STATE;
+  private serviceIds: string[] = [];
+  private readonly listeners = new Map<string, Set<Listener>>();
+  private readonly structuralSharing: boolean;
+
+  // structuralSharing=false replaces and notifies everything on every
+  // message, like the old single useState; only the render bench uses it
+  constructor(structuralSharing = true) {
+    this.structuralSharing = structuralSharing;
+  }
+
+  getState(): GameState {
+    return this.state;
+  }
+
+  getService(id: string): Service | undefined {
+    return this.state.services[id];
+  }
+
+  getServiceIds(): string[] {
+    return this.serviceIds;
+  }
+
+  subscribe(topic: string, listener: Listener): () => void {
+    const set = this.listeners.get(topic) ?? new Set<Listener>();
+    this.listeners.set(topic, set);
+    set.add(listener);
+    return () => {
+      set.delete(listener);
+      if (set.size === 0) this.listeners.delete(topic);
+    };
+  }
+
+  applyState(next: GameState): void {
+    const prev = this.state;
+    const changed: string[] = [];
+
+    if (!this.structuralSharing) {
+      this.state = next;
+      this.serviceIds = Object.keys(next.services);
+      this.emit([...this.listeners.keys()]);
+      return;
+    }
+
+    // Services, one entity each
+    let servicesChanged = false;
+    const services: Record<string, Service> = {};
+    for (const [id, svc] of Object.entries(next.services)) {
+      const old = prev.services[id];
+      if (old && sameValue(old, svc)) {
+        services[id] = old;
+      } else {
+        services[id] = svc;
+        changed.push(`service:${id}`);
+        servicesChanged = true;
+      }
+    }
+    const ids = Object.keys(services);
+    if (!sameValue(ids, this.serviceIds)) {
+      for (const id of this.serviceIds) if (!(id in services)) changed.push(`service:${id}`);
+      this.serviceIds = ids;
+      changed.push('services');
+      servicesChanged = true;
+    }
+
+    // Remaining top-level fields
+    const shared = { ...next, services: servicesChanged ? services : prev.services } as GameState;
+    const fields = shared as unknown as Record<string, unknown>;
+    const before = prev as unknown as Record<string, unknown>;
+    for (const key of new Set([...Object.keys(next), ...Object.keys(prev)])) {
+      if (key === 'services') continue;
+      if (key === 'log') {
+        fields.log = shareLog(prev.log, next.log);
+        if (fields.log !== prev.log) changed.push('log');
+      } else if (sameValue(before[key], fields[key])) {
+        if (key in fields) fields[key] = before[key];
+      } else {
+        changed.push(key);
+      }
+    }
+
+    this.state = shared;
+    this.emit(changed);
+  }
+
+  private emit(topics: string[]): void {
+    for (const topic of topics) {
+      const set = this.listeners.get(topic);
+      if (set) for (const listener of [...set]) listener();
+    }
+  }
+}
@@ -93,6 +93,7 @@ export interface GameState {
   log: unknown[];
   createdAt: number;
   updatedAt: number;
+  catalog?: { cards: string; mapId: string; map: string | null };
 }
 
 export interface Player {
@@ -0,0 +1,24 @@
+"""
+Analítica post-partida vectorizada para exportaciones de fenyflow.
+
+Uso típico:
+    from postgame import load_corpus, cascade_stats, tail_risk, card_impact
+    corpus = load_corpus(['exports/'], cache_dir='.postgame-cache')
+    print(cascade_stats(corpus))
+"""
+
+from .loader import iter_exported_games
+from .corpus import Corpus, build_corpus, STATE_CODES
+from .cache import load_corpus
+from .stats import cascade_stats, tail_risk, card_impact
+
+__all__ = [
+    'iter_exported_games',
+    'Corpus',
+    'build_corpus',
+    'STATE_CODES',
+    'load_corpus',
+    'cascade_stats',
+    'tail_risk',
+    'card_impact',
+]
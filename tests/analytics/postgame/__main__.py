@@ -0,0 +1,85 @@
+"""
+CLI: python -m postgame <exportaciones...> [opciones]
+
+  python -m postgame exports/                       # directorio de exportaciones
+  python -m postgame bulk.ndjson --cache-dir .cache  # corpus mapeado en disco
+  python -m postgame bulk.ndjson --json reporte.json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from .cache import load_corpus
+from .stats import cascade_stats, tail_risk, card_impact
+
+
+def _fmt(value):
+    if value is None:
+        return '-'
+    if isinstance(value, float):
+        return f'{value:.3f}'
+    return str(value)
+
+
+def print_report(report, top):
+    c = report['cascades']
+    print(f"\nPartidas: {report['games']}  turnos evaluados: {c['gameTurns']}  "
+          f"(G×T×S = {report['shape']})  carga: {report['loadSeconds']:.2f}s")
+
+    print('\n== Cascadas')
+    print(f"caídas directas={c['directDowns']}  por cascada={c['cascadeDowns']}  "
+          f"amplificación={_fmt(c['amplification'])}")
+    print(f"caídas por cascada/turno: {json.dumps(c['cascadeDownsPerTurn'])}")
+    for row in c['byService'][:top]:
+        print(f"  {row['serviceId']:>6}  cascada={_fmt(row['cascadeDownRate'])}  "
+              f"directa={_fmt(row['directDownRate'])}  empeora={_fmt(row['worsenedRate'])}")
+
+    print('\n== Riesgo de cola')
+    r = report['tailRisk']
+    for key in ('minStability', 'minTrust', 'stabilityDrawdown', 'maxSimultaneousDown'):
+        if key in r:
+            print(f"  {key:>20}: " + '  '.join(f'{k}={_fmt(v)}' for k, v in r[key].items()))
+    if 'winners' in r:
+        print(f"  {'ganadores':>20}: {r['winners']}")
+
+    print('\n== Impacto por carta')
+    for row in report['cards'][:top]:
+        print(f"  {row['cardId']:>5} {row['side'] or '-':>8}  jugadas={row['plays']:>6}  "
+              f"ΔINT={_fmt(row['meanIntDelta'])}  DOWN={_fmt(row['meanNewDown'])}  "
+              f"Δestab={_fmt(row['attributedStabilityDelta'])}  Δconf={_fmt(row['attributedTrustDelta'])}  "
+              f"lift={_fmt(row['winRateLift'])}")
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(prog='postgame', description='Analítica post-partida de exportaciones fenyflow')
+    p.add_argument('paths', nargs='+', help='archivos o directorios de exportación')
+    p.add_argument('--cache-dir', help='caché mapeada en memoria del corpus parseado')
+    p.add_argument('--rebuild', action='store_true', help='ignorar la caché existente')
+    p.add_argument('--top', type=int, default=15, help='filas por sección en la salida de texto')
+    p.add_argument('--json', help='escribir el reporte completo en este archivo')
+    args = p.parse_args(argv)
+
+    start = time.perf_counter()
+    corpus = load_corpus(args.paths, cache_dir=args.cache_dir, rebuild=args.rebuild)
+    load_seconds = time.perf_counter() - start
+
+    report = {
+        'games': len(corpus.game_ids),
+        'shape': list(corpus.shape),
+        'loadSeconds': load_seconds,
+        'cascades': cascade_stats(corpus),
+        'tailRisk': tail_risk(corpus),
+        'cards': card_impact(corpus),
+    }
+
+    print_report(report, args.top)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Caché del corpus en disco con mapeo en memoria.
+
+La clave es un hash de (ruta, tamaño, mtime) de cada archivo de entrada,
+así que agregar o modificar una exportación invalida la caché. Cada
+arreglo se guarda como .npy y se reabre con mmap_mode='r': cargar un
+corpus ya cacheado no vuelve a parsear JSON ni copia los datos a memoria
+hasta que se leen.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+from .corpus import Corpus, ARRAY_FIELDS, build_corpus
+from .loader import expand_paths, iter_exported_games
+
+CACHE_VERSION = 1
+
+
+def cache_key(paths):
+    h = hashlib.sha1(f'v{CACHE_VERSION}'.encode())
+    for path in expand_paths(paths):
+        st = os.stat(path)
+        h.update(f'{os.path.abspath(path)}\0{st.st_size}\0{st.st_mtime_ns}\n'.encode())
+    return h.hexdigest()[:16]
+
+
+def save_corpus(corpus, directory):
+    tmp = directory + '.tmp'
+    os.makedirs(tmp, exist_ok=True)
+    for name, array in corpus.arrays().items():
+        np.save(os.path.join(tmp, f'{name}.npy'), np.ascontiguousarray(array))
+    meta = {'gameIds': corpus.game_ids, 'serviceIds': corpus.service_ids, 'cardIds': corpus.card_ids}
+    with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    # Renombrado atómico: una caché a medio escribir nunca se usa
+    os.replace(tmp, directory)
+
+
+def _load_array(path):
+    try:
+        return np.load(path, mmap_mode='r')
+    except ValueError:
+        # Arreglos vacíos (p. ej. corpus sin jugadas) no se pueden mapear
+        return np.load(path)
+
+
+def open_corpus(directory):
+    with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+        meta = json.load(f)
+    arrays = {name: _load_array(os.path.join(directory, f'{name}.npy')) for name in ARRAY_FIELDS}
+    return Corpus(meta['gameIds'], meta['serviceIds'], meta['cardIds'], arrays)
+
+
+def load_corpus(paths, cache_dir=None, rebuild=False):
+    """Corpus de las exportaciones indicadas, vía caché si se pasa cache_dir."""
+    if cache_dir is None:
+        return build_corpus(iter_exported_games(paths))
+
+    directory = os.path.join(cache_dir, cache_key(paths))
+    if rebuild or not os.path.exists(os.path.join(directory, 'meta.json')):
+        os.makedirs(cache_dir, exist_ok=True)
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
+        save_corpus(build_corpus(iter_exported_games(paths)), directory)
+    return open_corpus(directory)
@@ -0,0 +1,158 @@
+"""
+Corpus columnar: todas las partidas en arreglos NumPy de forma fija.
+
+Ejes: G partidas × T turnos × S servicios. El turno t (0-based) guarda la
+foto antes (pre_*) y después (post_*) de la evaluación de cascada de ese
+turno, tomada del log CASCADE_EVALUATED. Los turnos que una partida no
+llegó a evaluar quedan con observed=False y marcadores en NaN.
+
+Las jugadas de cartas van en arreglos planos paralelos (play_*), una fila
+por CARD_PLAYED, para agregarlas con bincount/add.at sin bucles Python.
+"""
+
+import numpy as np
+
+STATE_CODES = {'OK': 0, 'DEGRADED': 1, 'INTERMITTENT': 2, 'DOWN': 3}
+STATE_ABSENT = 255  # servicio que no existe en el mapa de esa partida
+DOWN = STATE_CODES['DOWN']
+
+SIDE_CODES = {'MALOSOS': 0, 'BUENOSOS': 1}
+NO_WINNER = -1
+
+ARRAY_FIELDS = (
+    'winner', 'turn_limit', 'observed',
+    'pre_int', 'pre_state', 'post_int', 'post_state',
+    'stability', 'trust', 'went_down',
+    'play_game', 'play_turn', 'play_card', 'play_side', 'play_int_delta', 'play_new_down',
+)
+
+
+class Corpus:
+    """Arreglos del corpus más los ids que dan sentido a cada índice."""
+
+    def __init__(self, game_ids, service_ids, card_ids, arrays):
+        self.game_ids = list(game_ids)
+        self.service_ids = list(service_ids)
+        self.card_ids = list(card_ids)
+        for name in ARRAY_FIELDS:
+            setattr(self, name, arrays[name])
+
+    @property
+    def shape(self):
+        """(partidas, turnos, servicios)"""
+        return self.post_state.shape
+
+    def arrays(self):
+        return {name: getattr(self, name) for name in ARRAY_FIELDS}
+
+    def service_index(self, service_id):
+        return self.service_ids.index(service_id)
+
+
+def _service_sort_key(service_id):
+    # S2 antes que S10; ids no numéricos al final en orden alfabético
+    prefix = service_id.rstrip('0123456789')
+    digits = service_id[len(prefix):]
+    return (prefix, int(digits) if digits else -1, service_id)
+
+
+def _extract(game):
+    """Una pasada por los logs de una partida → tuplas compactas."""
+    turns, plays = [], []
+    for entry in game['logs']:
+        action = entry.get('action')
+        details = entry.get('details') or {}
+        if action == 'CASCADE_EVALUATED':
+            markers = details.get('afterMarkers') or {}
+            turns.append((
+                entry['turn'] - 1,
+                details.get('beforeServices') or {},
+                details.get('afterServices') or {},
+                markers.get('stability', np.nan),
+                markers.get('trust', np.nan),
+            ))
+        elif action == 'CARD_PLAYED' and details.get('cardId'):
+            before = entry.get('before') or {}
+            after = entry.get('after') or {}
+            int_delta, new_down = 0, 0
+            for sid, svc in after.items():
+                prev = before.get(sid)
+                if prev is None:
+                    continue
+                int_delta += svc['int'] - prev['int']
+                new_down += svc['state'] == 'DOWN' and prev['state'] != 'DOWN'
+            plays.append((entry['turn'] - 1, details['cardId'], entry.get('actor'), int_delta, new_down))
+    return turns, plays
+
+
+def build_corpus(games):
+    """Construye el corpus a partir de partidas normalizadas (loader)."""
+    extracted = []
+    service_set, card_set = set(), set()
+    max_turns = 0
+    for game in games:
+        turns, plays = _extract(game)
+        extracted.append((game, turns, plays))
+        service_set.update(game['services'])
+        for _t, before, after, _s, _tr in turns:
+            service_set.update(after)
+        card_set.update(p[1] for p in plays)
+        if turns:
+            max_turns = max(max_turns, max(t[0] for t in turns) + 1)
+
+    service_ids = sorted(service_set, key=_service_sort_key)
+    card_ids = sorted(card_set)
+    s_index = {sid: i for i, sid in enumerate(service_ids)}
+    c_index = {cid: i for i, cid in enumerate(card_ids)}
+    G, T, S = len(extracted), max_turns, len(service_ids)
+    P = sum(len(p) for _g, _t, p in extracted)
+
+    a = {
+        'winner': np.full(G, NO_WINNER, dtype=np.int8),
+        'turn_limit': np.zeros(G, dtype=np.int16),
+        'observed': np.zeros((G, T), dtype=bool),
+        'pre_int': np.zeros((G, T, S), dtype=np.int16),
+        'pre_state': np.full((G, T, S), STATE_ABSENT, dtype=np.uint8),
+        'post_int': np.zeros((G, T, S), dtype=np.int16),
+        'post_state': np.full((G, T, S), STATE_ABSENT, dtype=np.uint8),
+        'stability': np.full((G, T), np.nan, dtype=np.float32),
+        'trust': np.full((G, T), np.nan, dtype=np.float32),
+        'went_down': np.zeros((G, S), dtype=bool),
+        'play_game': np.zeros(P, dtype=np.int32),
+        'play_turn': np.zeros(P, dtype=np.int16),
+        'play_card': np.zeros(P, dtype=np.int16),
+        'play_side': np.zeros(P, dtype=np.int8),
+        'play_int_delta': np.zeros(P, dtype=np.int32),
+        'play_new_down': np.zeros(P, dtype=np.int16),
+    }
+
+    p = 0
+    for g, (game, turns, plays) in enumerate(extracted):
+        a['winner'][g] = SIDE_CODES.get(game['winner'], NO_WINNER)
+        a['turn_limit'][g] = game['config'].get('turnLimit') or 0
+        for sid in game['servicesThatWentDown']:
+            if sid in s_index:
+                a['went_down'][g, s_index[sid]] = True
+
+        for t, before, after, stability, trust in turns:
+            a['observed'][g, t] = True
+            a['stability'][g, t] = stability
+            a['trust'][g, t] = trust
+            for snapshot, int_key, state_key in ((before, 'pre_int', 'pre_state'), (after, 'post_int', 'post_state')):
+                for sid, svc in snapshot.items():
+                    i = s_index[sid] if sid in s_index else None
+                    if i is None:
+                        continue
+                    a[int_key][g, t, i] = svc['int']
+                    a[state_key][g, t, i] = STATE_CODES.get(svc['state'], STATE_ABSENT)
+
+        for turn, card_id, actor, int_delta, new_down in plays:
+            a['play_game'][p] = g
+            a['play_turn'][p] = turn
+            a['play_card'][p] = c_index[card_id]
+            a['play_side'][p] = SIDE_CODES.get(actor, NO_WINNER)
+            a['play_int_delta'][p] = int_delta
+            a['play_new_down'][p] = new_down
+            p += 1
+
+    return Corpus([g['gameId'] for g, _t, _p in extracted], service_ids, card_ids, a)
@@ -0,0 +1,129 @@
+"""
+Lectura de exportaciones.
+
+Formatos aceptados (se detectan por contenido, no por extensión):
+  - GET /api/games/:gameId/export  → un objeto JSON por archivo
+  - Lista JSON de esos objetos
+  - GET /api/export/games?format=ndjson    → registros game/player/log/cursor/end
+  - GET /api/export/games?format=columnar  → lotes {kind:'batch', table, columns}
+
+Todas las variantes se normalizan a un dict por partida con las claves
+gameId, status, winner, config, services, servicesThatWentDown y logs
+(ordenados por timestamp).
+"""
+
+import json
+import os
+
+EXPORT_SUFFIXES = ('.json', '.ndjson', '.jsonl')
+
+
+def expand_paths(paths):
+    """Archivos de entrada en orden estable (los directorios se recorren)."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, names in os.walk(path):
+                files.extend(os.path.join(root, n) for n in names if n.endswith(EXPORT_SUFFIXES))
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def _normalize(game, logs):
+    return {
+        'gameId': game['gameId'],
+        'status': game.get('status'),
+        'winner': game.get('winner'),
+        'config': game.get('config') or {},
+        'services': game.get('services') or {},
+        'servicesThatWentDown': game.get('servicesThatWentDown') or [],
+        'logs': sorted(logs, key=lambda e: e.get('timestamp', 0)),
+    }
+
+
+def _from_records(records):
+    """NDJSON de exportación masiva: los logs siguen a su registro game."""
+    game, logs = None, []
+    for rec in records:
+        kind = rec.get('kind')
+        if kind == 'game':
+            if game is not None:
+                yield _normalize(game, logs)
+            game, logs = rec, []
+        elif kind == 'log' and game is not None and rec.get('gameId') == game['gameId']:
+            logs.append(rec)
+    if game is not None:
+        yield _normalize(game, logs)
+
+
+def _columnar_game(cols, i):
+    return {
+        'gameId': cols['gameId'][i],
+        'status': cols['status'][i],
+        'winner': cols['winner'][i],
+        'config': {
+            'turnLimit': cols['turnLimit'][i],
+            'budgetPerTurn': cols['budgetPerTurn'][i],
+            'intermittenceMode': cols['intermittenceMode'][i],
+            'mapId': cols['mapId'][i],
+        },
+        'services': cols['services'][i],
+        'servicesThatWentDown': cols['servicesThatWentDown'][i],
+    }
+
+
+def _from_batches(batches):
+    """Formato columnar: los lotes de logs pueden llegar antes o después del
+    lote de su partida, así que se agrupa todo antes de emitir."""
+    games, order, logs = {}, [], {}
+    for batch in batches:
+        cols, rows = batch['columns'], batch['rows']
+        if batch['table'] == 'games':
+            for i in range(rows):
+                game = _columnar_game(cols, i)
+                if game['gameId'] not in games:
+                    order.append(game['gameId'])
+                games[game['gameId']] = game
+        elif batch['table'] == 'logs':
+            names = list(cols)
+            for i in range(rows):
+                entry = {name: cols[name][i] for name in names}
+                logs.setdefault(entry['gameId'], []).append(entry)
+    for game_id in order:
+        yield _normalize(games[game_id], logs.get(game_id, []))
+
+
+def _read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def iter_exported_games(paths):
+    """Itera partidas normalizadas de todos los archivos indicados."""
+    for path in expand_paths(paths):
+        with open(path, encoding='utf-8') as f:
+            first_line = f.readline().strip()
+
+        if first_line.startswith('['):
+            with open(path, encoding='utf-8') as f:
+                for game in json.load(f):
+                    yield _normalize(game, game.get('logs') or [])
+            continue
+
+        try:
+            first = json.loads(first_line)
+        except ValueError:
+            first = None  # JSON con sangría: la primera línea no es un objeto completo
+        if not isinstance(first, dict) or 'kind' not in first:
+            # Exportación de una sola partida (JSON con sangría o una línea)
+            with open(path, encoding='utf-8') as f:
+                game = json.load(f)
+            yield _normalize(game, game.get('logs') or [])
+        elif first['kind'] == 'batch':
+            yield from _from_batches(r for r in _read_lines(path) if r.get('kind') == 'batch')
+        else:
+            yield from _from_records(_read_lines(path))
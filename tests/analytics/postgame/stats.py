@@ -0,0 +1,242 @@
+"""
+Estadísticas vectorizadas sobre un Corpus.
+
+Todo se calcula con operaciones de arreglo sobre el corpus completo
+(máscaras booleanas, bincount, add.at, percentiles); el costo no depende
+de bucles Python por partida, así que miles de partidas se procesan en
+milisegundos una vez cargado el corpus.
+"""
+
+import numpy as np
+
+from .corpus import DOWN, STATE_ABSENT, SIDE_CODES, NO_WINNER
+
+INITIAL_STABILITY = 100.0
+INITIAL_TRUST = 50.0
+SIDE_NAMES = {code: name for name, code in SIDE_CODES.items()}
+
+
+def _distribution(values, quantiles=(0.5, 0.9, 0.99)):
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return {'n': 0}
+    out = {'n': int(values.size), 'mean': float(values.mean()), 'max': float(values.max())}
+    for q, v in zip(quantiles, np.quantile(values, quantiles)):
+        out[f'p{round(q * 100):g}'] = float(v)
+    return out
+
+
+def _ratio(num, den):
+    num = np.asarray(num, dtype=np.float64)
+    den = np.asarray(den, dtype=np.float64)
+    return np.divide(num, den, out=np.full_like(num, np.nan), where=den > 0)
+
+
+def _last_observed(observed):
+    """Índice del último turno observado por partida (-1 si ninguno)."""
+    T = observed.shape[1]
+    any_obs = observed.any(axis=1)
+    last = T - 1 - np.argmax(observed[:, ::-1], axis=1)
+    return np.where(any_obs, last, -1)
+
+
+# ─── Propagación de cascadas ─────────────────────────────────────────────────
+
+def cascade_stats(corpus):
+    """
+    Caídas directas (ataques/eventos durante el turno) frente a caídas por
+    cascada (servicio que entra a la evaluación sin estar DOWN y sale DOWN).
+    """
+    obs = np.asarray(corpus.observed)[..., None]
+    pre_state = np.asarray(corpus.pre_state)
+    post_state = np.asarray(corpus.post_state)
+    present = (pre_state != STATE_ABSENT) & (post_state != STATE_ABSENT) & obs
+
+    pre_down = pre_state == DOWN
+    post_down = post_state == DOWN
+    prev_post_down = np.zeros_like(post_down)
+    prev_post_down[:, 1:] = post_down[:, :-1]
+
+    cascade_new = post_down & ~pre_down & present
+    direct_new = pre_down & ~prev_post_down & present
+    worsened = (post_state > pre_state) & present
+    int_loss = np.where(present, np.clip(
+        np.asarray(corpus.pre_int, dtype=np.int32) - np.asarray(corpus.post_int, dtype=np.int32), 0, None), 0)
+
+    observed_turns = np.asarray(corpus.observed)
+    per_turn_cascade = cascade_new.sum(axis=-1)[observed_turns]
+    per_turn_loss = int_loss.sum(axis=-1)[observed_turns]
+
+    service_turns = present.sum(axis=(0, 1))
+    cascade_rate = _ratio(cascade_new.sum(axis=(0, 1)), service_turns)
+    direct_rate = _ratio(direct_new.sum(axis=(0, 1)), service_turns)
+    worsened_rate = _ratio(worsened.sum(axis=(0, 1)), service_turns)
+    order = np.argsort(-np.nan_to_num(cascade_rate, nan=-1.0), kind='stable')
+
+    by_turn = _ratio(cascade_new.sum(axis=(0, 2)), observed_turns.sum(axis=0))
+    direct_total = int(direct_new.sum())
+    cascade_total = int(cascade_new.sum())
+
+    return {
+        'gameTurns': int(observed_turns.sum()),
+        'directDowns': direct_total,
+        'cascadeDowns': cascade_total,
+        'amplification': cascade_total / direct_total if direct_total else None,
+        'cascadeDownsPerTurn': _distribution(per_turn_cascade),
+        'cascadeIntLossPerTurn': _distribution(per_turn_loss),
+        'cascadeDownsByTurn': [None if np.isnan(v) else float(v) for v in by_turn],
+        'byService': [
+            {
+                'serviceId': corpus.service_ids[i],
+                'cascadeDownRate': float(cascade_rate[i]),
+                'directDownRate': float(direct_rate[i]),
+                'worsenedRate': float(worsened_rate[i]),
+            }
+            for i in order if service_turns[i] > 0
+        ],
+    }
+
+
+# ─── Riesgo de cola ──────────────────────────────────────────────────────────
+
+def tail_risk(corpus, quantiles=(0.5, 0.9, 0.95, 0.99), alpha=0.05):
+    """
+    Percentiles por partida de los peores valores alcanzados. Para
+    estabilidad/confianza la cola mala es la baja, así que el "p99" es el
+    percentil 1 de la distribución; expectedShortfall es la media del
+    peor `alpha` de las partidas.
+    """
+    observed = np.asarray(corpus.observed)
+    valid = observed.any(axis=1)
+    if not valid.any():
+        return {'games': 0}
+
+    stability = np.asarray(corpus.stability, dtype=np.float64)[valid]
+    trust = np.asarray(corpus.trust, dtype=np.float64)[valid]
+    min_stability = np.nanmin(stability, axis=1)
+    min_trust = np.nanmin(trust, axis=1)
+
+    last = _last_observed(observed[valid])
+    rows = np.arange(last.size)
+    final_stability = stability[rows, last]
+    final_trust = trust[rows, last]
+
+    post_down = (np.asarray(corpus.post_state)[valid] == DOWN) & observed[valid][..., None]
+    max_down = post_down.sum(axis=-1).max(axis=-1).astype(np.float64)
+    stability_drawdown = INITIAL_STABILITY - min_stability
+
+    def low_tail(values):
+        qs = np.quantile(values, [1 - q for q in quantiles])
+        cutoff = np.quantile(values, alpha)
+        return {
+            **{f'p{round(q * 100):g}': float(v) for q, v in zip(quantiles, qs)},
+            'expectedShortfall': float(values[values <= cutoff].mean()),
+        }
+
+    def high_tail(values):
+        qs = np.quantile(values, quantiles)
+        cutoff = np.quantile(values, 1 - alpha)
+        return {
+            **{f'p{round(q * 100):g}': float(v) for q, v in zip(quantiles, qs)},
+            'expectedShortfall': float(values[values >= cutoff].mean()),
+        }
+
+    winner = np.asarray(corpus.winner)[valid]
+    return {
+        'games': int(valid.sum()),
+        'alpha': alpha,
+        'minStability': low_tail(min_stability),
+        'minTrust': low_tail(min_trust),
+        'finalStability': low_tail(final_stability),
+        'finalTrust': low_tail(final_trust),
+        'stabilityDrawdown': high_tail(stability_drawdown),
+        'maxSimultaneousDown': high_tail(max_down),
+        'winners': {
+            'MALOSOS': int((winner == SIDE_CODES['MALOSOS']).sum()),
+            'BUENOSOS': int((winner == SIDE_CODES['BUENOSOS']).sum()),
+            'none': int((winner == NO_WINNER).sum()),
+        },
+    }
+
+
+# ─── Atribución por carta ────────────────────────────────────────────────────
+
+def card_impact(corpus):
+    """
+    Impacto por carta:
+      - directo: ΔINT total y servicios que pasaron a DOWN en la propia jugada
+      - atribuido: Δestabilidad/Δconfianza del turno repartido en partes
+        iguales entre las cartas jugadas en ese turno
+      - asociación: tasa de victoria del bando cuando la carta se jugó al
+        menos una vez, frente a su tasa base
+    """
+    C = len(corpus.card_ids)
+    if C == 0:
+        return []
+
+    card = np.asarray(corpus.play_card, dtype=np.int64)
+    game = np.asarray(corpus.play_game, dtype=np.int64)
+    turn = np.asarray(corpus.play_turn, dtype=np.int64)
+    side = np.asarray(corpus.play_side)
+    observed = np.asarray(corpus.observed)
+    G, T = observed.shape
+
+    plays = np.bincount(card, minlength=C)
+    int_delta = _ratio(np.bincount(card, weights=corpus.play_int_delta, minlength=C), plays)
+    new_down = _ratio(np.bincount(card, weights=corpus.play_new_down, minlength=C), plays)
+
+    # Δ de marcadores por turno (respecto del turno anterior o del inicio)
+    def turn_delta(series, initial):
+        series = np.asarray(series, dtype=np.float64)
+        prev = np.empty_like(series)
+        prev[:, 0] = initial
+        prev[:, 1:] = series[:, :-1]
+        return series - prev
+
+    stability_delta = turn_delta(corpus.stability, INITIAL_STABILITY)
+    trust_delta = turn_delta(corpus.trust, INITIAL_TRUST)
+
+    in_range = turn < T
+    attributable = np.zeros(card.size, dtype=bool)
+    attributable[in_range] = observed[game[in_range], turn[in_range]]
+    a_game, a_turn, a_card = game[attributable], turn[attributable], card[attributable]
+
+    plays_per_turn = np.zeros((G, T), dtype=np.float64)
+    np.add.at(plays_per_turn, (a_game, a_turn), 1)
+    share = 1.0 / plays_per_turn[a_game, a_turn]
+    attributed_plays = np.bincount(a_card, minlength=C)
+    stability_attr = _ratio(
+        np.bincount(a_card, weights=stability_delta[a_game, a_turn] * share, minlength=C), attributed_plays)
+    trust_attr = _ratio(
+        np.bincount(a_card, weights=trust_delta[a_game, a_turn] * share, minlength=C), attributed_plays)
+
+    # Bando de cada carta (fijo por carta) y partidas en que se jugó
+    card_side = np.full(C, NO_WINNER, dtype=np.int8)
+    card_side[card] = side
+    pairs = np.unique(game * C + card)
+    pair_game, pair_card = pairs // C, pairs % C
+    winner = np.asarray(corpus.winner)
+    won = winner[pair_game] == card_side[pair_card]
+    games_with = np.bincount(pair_card, minlength=C)
+    win_rate = _ratio(np.bincount(pair_card, weights=won, minlength=C), games_with)
+    base_rate = {code: float((winner == code).mean()) if G else np.nan for code in SIDE_CODES.values()}
+
+    result = []
+    for c in np.argsort(-plays, kind='stable'):
+        if plays[c] == 0:
+            continue
+        s = int(card_side[c])
+        base = base_rate.get(s, np.nan)
+        result.append({
+            'cardId': corpus.card_ids[c],
+            'side': SIDE_NAMES.get(s),
+            'plays': int(plays[c]),
+            'games': int(games_with[c]),
+            'meanIntDelta': float(int_delta[c]),
+            'meanNewDown': float(new_down[c]),
+            'attributedStabilityDelta': None if np.isnan(stability_attr[c]) else float(stability_attr[c]),
+            'attributedTrustDelta': None if np.isnan(trust_attr[c]) else float(trust_attr[c]),
+            'winRateWhenPlayed': float(win_rate[c]),
+            'winRateLift': None if np.isnan(base) else float(win_rate[c] - base),
+        })
+    return result
@@ -0,0 +1,160 @@
+"""
+Tests unitarios del paquete postgame con exportaciones sintéticas
+(no requieren backend corriendo).
+
+Ejecutar:
+  cd tests/analytics
+  pytest -v test_postgame.py
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from postgame import build_corpus, cascade_stats, card_impact, iter_exported_games, load_corpus, tail_risk
+from postgame.corpus import DOWN, STATE_CODES
+
+# ─── Fixtures ────────────────────────────────────────────────────────────────
+
+def svc(state='OK', int_=10):
+    return {'state': state, 'int': int_, 'intMax': 10, 'dependencies': []}
+
+
+def services(**states):
+    base = {'S1': svc(), 'S2': svc(), 'S3': svc()}
+    base.update(states)
+    return base
+
+
+def log(turn, action, ts, actor=None, details=None, before=None, after=None):
+    return {'id': f'{action}-{turn}-{ts}', 'turn': turn, 'phase': 'CASCADE_EVAL', 'timestamp': ts,
+            'action': action, 'actor': actor, 'details': details or {}, 'before': before, 'after': after}
+
+
+def game_export(game_id, winner='MALOSOS'):
+    """
+    Turno 1: M01 tira S1 (directa); la cascada tira S2 y degrada S3.
+             Estabilidad 100 → 80.
+    Turno 2: M01 y B01 se juegan; estabilidad 80 → 70 (−5 atribuido a cada una).
+    """
+    t1_pre = services(S1=svc('DOWN', 0))
+    t1_post = services(S1=svc('DOWN', 0), S2=svc('DOWN', 0), S3=svc('DEGRADED', 6))
+    t2_post = services(S1=svc('DOWN', 0), S2=svc('DOWN', 0), S3=svc('DEGRADED', 5))
+    logs = [
+        log(1, 'CARD_PLAYED', 1, 'MALOSOS', {'cardId': 'M01'}, services(), t1_pre),
+        log(1, 'CASCADE_EVALUATED', 2, None, {
+            'beforeServices': t1_pre, 'afterServices': t1_post,
+            'afterMarkers': {'stability': 80, 'trust': 45}}),
+        log(2, 'CARD_PLAYED', 3, 'MALOSOS', {'cardId': 'M01'}, t1_post, t1_post),
+        log(2, 'CARD_PLAYED', 4, 'BUENOSOS', {'cardId': 'B01'}, t1_post, t2_post),
+        log(2, 'CASCADE_EVALUATED', 5, None, {
+            'beforeServices': t2_post, 'afterServices': t2_post,
+            'afterMarkers': {'stability': 70, 'trust': 40}}),
+    ]
+    return {
+        'gameId': game_id, 'status': 'finished', 'winner': winner,
+        'config': {'turnLimit': 8}, 'services': t2_post,
+        'servicesThatWentDown': ['S1', 'S2'], 'logs': logs,
+    }
+
+
+@pytest.fixture
+def exports():
+    return [game_export('g1', 'MALOSOS'), game_export('g2', 'BUENOSOS')]
+
+
+def write_single(tmp_path, exports):
+    for e in exports:
+        (tmp_path / f"game-{e['gameId']}-export.json").write_text(json.dumps(e, indent=2))
+    return [str(tmp_path)]
+
+
+def write_ndjson(tmp_path, exports):
+    lines = []
+    for e in exports:
+        game = {k: v for k, v in e.items() if k != 'logs'}
+        lines.append({'kind': 'game', **game})
+        lines.extend({'kind': 'log', 'gameId': e['gameId'], **entry} for entry in e['logs'])
+        lines.append({'kind': 'cursor', 'cursor': e['gameId']})
+    lines.append({'kind': 'end', 'games': len(exports), 'cursor': None, 'hasMore': False})
+    path = tmp_path / 'bulk.ndjson'
+    path.write_text('\n'.join(json.dumps(l) for l in lines) + '\n')
+    return [str(path)]
+
+
+def write_columnar(tmp_path, exports):
+    game_cols = ['gameId', 'status', 'winner', 'turnLimit', 'budgetPerTurn', 'intermittenceMode',
+                 'mapId', 'servicesThatWentDown', 'services']
+    games = {c: [] for c in game_cols}
+    logs = {c: [] for c in ['gameId', 'id', 'turn', 'phase', 'timestamp', 'action', 'actor', 'details', 'before', 'after']}
+    for e in exports:
+        row = {**e, 'turnLimit': e['config']['turnLimit'], 'budgetPerTurn': 8,
+               'intermittenceMode': 'deterministic', 'mapId': 'standard'}
+        for c in game_cols:
+            games[c].append(row[c])
+        for entry in e['logs']:
+            for c in logs:
+                logs[c].append(e['gameId'] if c == 'gameId' else entry[c])
+    # Logs antes que partidas, como puede ocurrir al vaciar lotes
+    batches = [
+        {'kind': 'batch', 'table': 'logs', 'rows': len(logs['id']), 'columns': logs},
+        {'kind': 'batch', 'table': 'games', 'rows': len(exports), 'columns': games},
+        {'kind': 'end', 'games': len(exports), 'cursor': None, 'hasMore': False},
+    ]
+    path = tmp_path / 'bulk-columnar.ndjson'
+    path.write_text('\n'.join(json.dumps(b) for b in batches) + '\n')
+    return [str(path)]
+
+
+# ─── Tests ───────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize('writer', [write_single, write_ndjson, write_columnar])
+def test_formatos_de_exportacion_producen_el_mismo_corpus(tmp_path, exports, writer):
+    corpus = build_corpus(iter_exported_games(writer(tmp_path, exports)))
+    assert corpus.game_ids == ['g1', 'g2']
+    assert corpus.service_ids == ['S1', 'S2', 'S3']
+    assert corpus.shape == (2, 2, 3)
+    assert corpus.post_state[0, 0].tolist() == [DOWN, DOWN, STATE_CODES['DEGRADED']]
+    assert corpus.stability[1].tolist() == [80, 70]
+    assert corpus.play_card.size == 6
+
+
+def test_cascadas_separan_caidas_directas_de_propagadas(exports):
+    stats = cascade_stats(build_corpus(exports))
+    assert stats['directDowns'] == 2  # S1 en cada partida
+    assert stats['cascadeDowns'] == 2  # S2 en cada partida
+    assert stats['amplification'] == 1.0
+    s2 = next(r for r in stats['byService'] if r['serviceId'] == 'S2')
+    assert s2['cascadeDownRate'] == pytest.approx(0.5)  # 2 de 4 turnos-servicio
+    assert stats['cascadeDownsByTurn'] == [1.0, 0.0]
+
+
+def test_riesgo_de_cola(exports):
+    risk = tail_risk(build_corpus(exports))
+    assert risk['games'] == 2
+    assert risk['minStability']['p50'] == 70
+    assert risk['maxSimultaneousDown']['p99'] == 2
+    assert risk['winners'] == {'MALOSOS': 1, 'BUENOSOS': 1, 'none': 0}
+
+
+def test_atribucion_por_carta(exports):
+    rows = {r['cardId']: r for r in card_impact(build_corpus(exports))}
+    m01, b01 = rows['M01'], rows['B01']
+    assert m01['plays'] == 4 and m01['games'] == 2
+    assert m01['meanNewDown'] == 0.5  # S1 cae en la jugada del turno 1
+    # Turno 1: −20 solo para M01; turno 2: −10 repartido entre M01 y B01
+    assert m01['attributedStabilityDelta'] == pytest.approx((-20 - 5) / 2)
+    assert b01['attributedStabilityDelta'] == pytest.approx(-5)
+    assert b01['meanIntDelta'] == -1
+    assert m01['winRateWhenPlayed'] == 0.5 and m01['winRateLift'] == 0.0
+
+
+def test_cache_mapeada_en_memoria(tmp_path, exports):
+    paths = write_ndjson(tmp_path, exports)
+    cache_dir = str(tmp_path / 'cache')
+    first = load_corpus(paths, cache_dir=cache_dir)
+    again = load_corpus(paths, cache_dir=cache_dir)
+    assert isinstance(again.post_state, np.memmap)
+    assert cascade_stats(again) == cascade_stats(build_corpus(exports))
+    np.testing.assert_array_equal(first.stability, again.stability)
@@ -0,0 +1,523 @@
+"""
+Generador de carga asíncrono — BuenOsos vs MalOsos (fenyflow)
+
+A diferencia de los tests E2E (una conexión WS nueva por acción, una partida
+a la vez), aquí cada partida mantiene conexiones WS persistentes por asiento
+(facilitador, MalOsos, BuenOsos) y se juegan miles de partidas concurrentes
+desde un solo proceso asyncio.
+
+Flujo por partida:
+  1. REST: POST /api/games (facilitador), /join (MALOSOS y BUENOSOS), /start
+  2. WS: una conexión por asiento; cada una recibe el GAME_STATE inicial
+  3. Política con reglas: en las fases de cada equipo se juegan cartas
+     asequibles cuyos requisitos se cumplen; el facilitador avanza las fases
+  4. Termina al superar turnLimit o cuando hay ganador
+
+Latencia acción→broadcast: desde el envío de la acción hasta que el mismo
+socket recibe el GAME_STATE difundido (o el ERROR correspondiente).
+
+Modos:
+  Fijo:   python loadgen.py --games 500 --concurrency 200
+  Rampa:  python loadgen.py --ramp --start 50 --step 50 --stage-seconds 30 \\
+              --slo-p99-ms 250 --slo-error-rate 0.01
+  (la rampa sube la concurrencia por etapas hasta que se rompe el SLO)
+
+Requiere: pip install -r requirements.txt
+Cada partida usa 3 sockets: para miles de partidas subir `ulimit -n`.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import aiohttp
+
+API_URL = os.environ.get('API_URL', 'http://localhost:3001')
+WS_URL = os.environ.get('WS_URL', 'ws://localhost:3001')
+
+MALOSOS_PHASES = ('MALOSOS_PREP', 'MALOSOS_ATTACK')
+BUENOSOS_PHASES = ('BUENOSOS_RESPONSE',)
+CAMPAIGN_PHASES = ('RECON', 'ACCESS', 'PERSISTENCE', 'LATERAL_MOVEMENT', 'IMPACT')
+MAX_PLAYS_PER_PHASE = 3
+MAX_REJECTS_PER_PHASE = 3
+THROTTLE_CODES = ('RATE_LIMITED', 'OVERLOADED')
+MAX_THROTTLE_RETRIES = 5
+
+
+class ActionTimeout(Exception):
+    pass
+
+
+# ─── Métricas ────────────────────────────────────────────────────────────────
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[idx]
+
+
+class Window:
+    """Acumulador de una etapa (o de la corrida completa en modo fijo)."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.latencies_ms = []
+        self.errors = {}
+        self.rejected = 0
+        self.games_finished = 0
+        self.setup_ms = []
+
+    def record_action(self, latency_ms):
+        self.latencies_ms.append(latency_ms)
+
+    def record_error(self, code):
+        self.errors[code] = self.errors.get(code, 0) + 1
+
+    def summary(self, concurrency):
+        elapsed = time.perf_counter() - self.started
+        lat = sorted(self.latencies_ms)
+        setup = sorted(self.setup_ms)
+        actions = len(lat)
+        errors = sum(self.errors.values())
+        return {
+            'concurrency': concurrency,
+            'seconds': round(elapsed, 2),
+            'actions': actions,
+            'actionsPerSec': round(actions / elapsed, 1) if elapsed > 0 else 0.0,
+            'gamesFinished': self.games_finished,
+            'p50Ms': round(percentile(lat, 0.50), 2),
+            'p95Ms': round(percentile(lat, 0.95), 2),
+            'p99Ms': round(percentile(lat, 0.99), 2),
+            'setupP99Ms': round(percentile(setup, 0.99), 2),
+            'rejected': self.rejected,
+            'errors': dict(self.errors),
+            'errorRate': round(errors / (actions + errors), 4) if actions + errors else 0.0,
+        }
+
+
+class Recorder:
+    """Redirige las muestras a la ventana activa (cambia en cada etapa)."""
+
+    def __init__(self):
+        self.window = Window()
+
+    def rotate(self):
+        previous, self.window = self.window, Window()
+        return previous
+
+
+# ─── Conexión WS por asiento ─────────────────────────────────────────────────
+
+class SeatConnection:
+    """
+    Socket persistente de un asiento. Hay una sola acción en vuelo por
+    partida y cada acción exitosa se difunde a los tres sockets, así que la
+    respuesta a una acción es el GAME_STATE número `committed + 1` visto por
+    este socket (los broadcasts atrasados de acciones previas se descartan)
+    o un ERROR, que solo recibe quien actuó.
+    """
+
+    def __init__(self, game, seat, token):
+        self.game = game
+        self.seat = seat
+        self.token = token
+        self.ws = None
+        self.reader = None
+        self.pending = None
+        self.pending_target = 0
+        self.seen = 0  # GAME_STATE recibidos después del inicial
+        self.state = None
+        self.ready = asyncio.get_running_loop().create_future()
+
+    async def connect(self, session):
+        self.ws = await session.ws_connect(
+            f"{WS_URL}/ws/games/{self.game.game_id}?token={self.token}",
+            heartbeat=None,
+            max_msg_size=0,
+        )
+        self.reader = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self):
+        async for msg in self.ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                break
+            data = json.loads(msg.data)
+            kind = data.get('type')
+            if kind == 'GAME_STATE':
+                self.state = data['state']
+                if not self.ready.done():
+                    self.ready.set_result(True)
+                    continue
+                self.seen += 1
+                if self.pending and not self.pending.done() and self.seen >= self.pending_target:
+                    self.pending.set_result(('ok', None, None))
+            elif kind == 'ERROR':
+                if self.pending and not self.pending.done():
+                    self.pending.set_result(('error', data.get('code', 'UNKNOWN'), data.get('retryAfterMs')))
+        if self.pending and not self.pending.done():
+            self.pending.set_exception(ConnectionError('socket closed'))
+        if not self.ready.done():
+            self.ready.set_exception(ConnectionError('socket closed before initial state'))
+
+    async def act(self, message, timeout):
+        """Envía una acción y devuelve (resultado, latencia_ms)."""
+        self.pending = asyncio.get_running_loop().create_future()
+        self.pending_target = self.game.committed + 1
+        start = time.perf_counter()
+        await self.ws.send_str(json.dumps(message))
+        try:
+            result = await asyncio.wait_for(self.pending, timeout)
+        except asyncio.TimeoutError:
+            raise ActionTimeout(message['type'])
+        finally:
+            self.pending = None
+        return result, (time.perf_counter() - start) * 1000
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+        if self.reader is not None:
+            await asyncio.gather(self.reader, return_exceptions=True)
+
+
+# ─── Política con reglas ─────────────────────────────────────────────────────
+
+def requirements_met(card, state):
+    """Réplica cliente (aproximada) de canPlayCard del motor."""
+    campaign = state['campaign']
+    for req in card.get('requirements') or []:
+        if req in CAMPAIGN_PHASES:
+            if req not in campaign['completedPhases'] and not (req == 'RECON' and campaign['reconThisTurn']):
+                return False
+        elif req == 'BACKUPS_VERIFIED' and not state.get('backupsVerified'):
+            return False
+        elif req == '2_SERVICES_DEGRADED_OR_WORSE':
+            hurt = [s for s in state['services'].values() if s['state'] != 'OK']
+            if len(hurt) < 2:
+                return False
+    return True
+
+
+def choose_targets(card, state, rng):
+    services = state['services']
+    targeting = card.get('targeting')
+    if targeting is None:
+        return []
+    if targeting in services:
+        return [targeting]
+
+    ids = list(services)
+    if targeting in ('down', 'digital_down'):
+        pool = [i for i in ids if services[i]['state'] == 'DOWN']
+    elif targeting == 'intermittent':
+        pool = [i for i in ids if services[i]['state'] == 'INTERMITTENT']
+    elif targeting == 'citizen':
+        pool = [i for i in ids if services[i].get('citizenFacing')]
+    elif card['side'] == 'MALOSOS':
+        pool = [i for i in ids if services[i]['state'] != 'DOWN']
+    else:
+        pool = [i for i in ids if services[i]['state'] != 'OK'] or ids
+    if not pool:
+        return None
+
+    if targeting.endswith('_pair'):
+        first = rng.choice(pool)
+        if targeting == 'connected_pair':
+            deps = services[first]['dependencies']
+            return [first, rng.choice(deps)] if deps else None
+        rest = [i for i in ids if i != first]
+        return [first, rng.choice(rest)]
+    return [rng.choice(pool)]
+
+
+def next_play(seat, state, catalog, rng, skip):
+    seat_state = state['seats'][seat]
+    budget = seat_state['budgetRemaining']
+    hand = [c for c in seat_state['hand'] if c not in skip]
+    rng.shuffle(hand)
+    for card_id in hand:
+        card = catalog.get(card_id)
+        if not card or card['cost'] > budget or not requirements_met(card, state):
+            continue
+        targets = choose_targets(card, state, rng)
+        if targets is None:
+            continue
+        return {'type': 'PLAY_CARD', 'side': seat, 'cardId': card_id, 'targets': targets}
+    return None
+
+
+# ─── Partida ────────────────────────────────────────────────────────────────
+
+class SimulatedGame:
+    def __init__(self, index, args, catalog, recorder):
+        self.index = index
+        self.args = args
+        self.catalog = catalog
+        self.recorder = recorder
+        self.rng = random.Random(args.seed + index)
+        self.game_id = None
+        self.state = None
+        self.committed = 0  # acciones aceptadas (= broadcasts emitidos)
+        self.conns = {}
+
+    async def setup(self, session):
+        start = time.perf_counter()
+        body = {
+            'displayName': f'load-{self.index}',
+            'turnLimit': self.args.turn_limit,
+            'budgetPerTurn': 8,
+            'intermittenceMode': 'deterministic',
+            'mapId': 'standard',
+        }
+        async with session.post(f'{API_URL}/api/games', json=body) as r:
+            r.raise_for_status()
+            data = await r.json()
+        self.game_id = data['gameId']
+        tokens = {'FACILITATOR': data['token']}
+
+        for seat in ('MALOSOS', 'BUENOSOS'):
+            async with session.post(
+                f'{API_URL}/api/games/{self.game_id}/join',
+                json={'displayName': f'load-{self.index}-{seat}', 'seat': seat},
+            ) as r:
+                r.raise_for_status()
+                tokens[seat] = (await r.json())['token']
+
+        headers = {'Authorization': f"Bearer {tokens['FACILITATOR']}"}
+        async with session.post(f'{API_URL}/api/games/{self.game_id}/start', headers=headers) as r:
+            r.raise_for_status()
+
+        for seat, token in tokens.items():
+            conn = SeatConnection(self, seat, token)
+            await conn.connect(session)
+            self.conns[seat] = conn
+        await asyncio.gather(*(c.ready for c in self.conns.values()))
+        self.state = self.conns['FACILITATOR'].state
+        self.recorder.window.setup_ms.append((time.perf_counter() - start) * 1000)
+
+    async def send(self, seat, message):
+        conn = self.conns[seat]
+        for _ in range(MAX_THROTTLE_RETRIES + 1):
+            (status, code, retry_after_ms), latency_ms = await conn.act(message, self.args.action_timeout)
+            window = self.recorder.window
+            if status == 'ok':
+                self.committed += 1
+                self.state = conn.state
+                window.record_action(latency_ms)
+                return True
+            if code not in THROTTLE_CODES:
+                window.rejected += 1
+                return False
+            # Control de admisión: se cuenta como error y se reintenta tras la espera indicada
+            window.record_error(code)
+            await asyncio.sleep((retry_after_ms or 500) / 1000)
+        return False
+
+    async def think(self):
+        if self.args.think_ms > 0:
+            await asyncio.sleep(self.rng.uniform(0.5, 1.5) * self.args.think_ms / 1000)
+
+    async def play_turn_phase(self, seat):
+        state = self.state
+        if not state['seats'][seat]['basicActionUsed'] and self.rng.random() < 0.5:
+            msg = {'type': 'USE_BASIC_ACTION', 'side': seat}
+            if seat == 'BUENOSOS':
+                msg['target'] = self.rng.choice(list(state['services']))
+            await self.think()
+            await self.send(seat, msg)
+
+        plays, rejects, skip = 0, 0, set()
+        while plays < MAX_PLAYS_PER_PHASE and rejects < MAX_REJECTS_PER_PHASE:
+            # Una jugada puede dar la victoria (checkVictory en playCard)
+            if self.state['status'] != 'running':
+                break
+            msg = next_play(seat, self.state, self.catalog, self.rng, skip)
+            if msg is None:
+                break
+            await self.think()
+            if await self.send(seat, msg):
+                plays += 1
+            else:
+                rejects += 1
+                skip.add(msg['cardId'])
+
+    async def run(self):
+        limit = self.args.turn_limit
+        while self.state['status'] == 'running' and self.state['markers']['turn'] <= limit:
+            phase = self.state['markers']['phase']
+            if phase in MALOSOS_PHASES:
+                await self.play_turn_phase('MALOSOS')
+            elif phase in BUENOSOS_PHASES:
+                await self.play_turn_phase('BUENOSOS')
+            if self.state['status'] != 'running':
+                break
+            await self.think()
+            if not await self.send('FACILITATOR', {'type': 'ADVANCE_PHASE'}):
+                raise RuntimeError(f'ADVANCE_PHASE rechazado en {phase}')
+
+    async def close(self):
+        await asyncio.gather(*(c.close() for c in self.conns.values()), return_exceptions=True)
+
+
+async def play_one(index, pool, setup_slots):
+    recorder = pool.recorder
+    game = SimulatedGame(index, pool.args, pool.catalog, recorder)
+    try:
+        # Acota las altas REST simultáneas; el juego en sí no se limita
+        async with setup_slots:
+            await game.setup(pool.session)
+        await game.run()
+        recorder.window.games_finished += 1
+    except ActionTimeout:
+        recorder.window.record_error('TIMEOUT')
+    except aiohttp.ClientResponseError as e:
+        recorder.window.record_error(f'HTTP_{e.status}')
+    except (aiohttp.ClientError, ConnectionError, asyncio.TimeoutError):
+        recorder.window.record_error('CONNECTION')
+    except RuntimeError:
+        recorder.window.record_error('STUCK')
+    finally:
+        await game.close()
+
+
+# ─── Orquestación ───────────────────────────────────────────────────────────
+
+class GamePool:
+    """Mantiene `target` partidas en curso; al terminar una se lanza otra."""
+
+    def __init__(self, session, args, catalog, recorder, setup_slots):
+        self.session = session
+        self.args = args
+        self.catalog = catalog
+        self.recorder = recorder
+        self.setup_slots = setup_slots
+        self.target = 0
+        self.started = 0
+        self.running = set()
+        self.limit = None  # total de partidas (modo fijo)
+
+    def fill(self):
+        while len(self.running) < self.target and (self.limit is None or self.started < self.limit):
+            task = asyncio.create_task(play_one(self.started, self, self.setup_slots))
+            self.started += 1
+            self.running.add(task)
+            task.add_done_callback(self._done)
+
+    def _done(self, task):
+        self.running.discard(task)
+        self.fill()
+
+    async def drain(self):
+        while self.running:
+            await asyncio.gather(*list(self.running), return_exceptions=True)
+
+
+def print_stage(s):
+    errors = ', '.join(f'{k}={v}' for k, v in sorted(s['errors'].items())) or '-'
+    print(
+        f"conc={s['concurrency']:>6}  acts/s={s['actionsPerSec']:>9}  "
+        f"p50={s['p50Ms']:>8}ms  p95={s['p95Ms']:>8}ms  p99={s['p99Ms']:>8}ms  "
+        f"partidas={s['gamesFinished']:>6}  rechazos={s['rejected']:>5}  errores={errors}",
+        flush=True,
+    )
+
+
+def breaks_slo(s, args):
+    if s['actions'] == 0:
+        return 'sin acciones completadas'
+    if s['p99Ms'] > args.slo_p99_ms:
+        return f"p99 {s['p99Ms']}ms > {args.slo_p99_ms}ms"
+    if s['errorRate'] > args.slo_error_rate:
+        return f"tasa de error {s['errorRate']} > {args.slo_error_rate}"
+    return None
+
+
+async def run_fixed(pool, args):
+    pool.limit = args.games
+    pool.target = args.concurrency
+    pool.fill()
+    await pool.drain()
+    summary = pool.recorder.rotate().summary(args.concurrency)
+    print_stage(summary)
+    return {'mode': 'fixed', 'stages': [summary]}
+
+
+async def run_ramp(pool, args):
+    stages = []
+    breaking = None
+    concurrency = args.start
+    while concurrency <= args.max_concurrency:
+        pool.target = concurrency
+        pool.fill()
+        pool.recorder.rotate()
+        await asyncio.sleep(args.stage_seconds)
+        summary = pool.recorder.rotate().summary(concurrency)
+        stages.append(summary)
+        print_stage(summary)
+        reason = breaks_slo(summary, args)
+        if reason:
+            breaking = {'concurrency': concurrency, 'reason': reason}
+            print(f'SLO roto con {concurrency} partidas concurrentes: {reason}', flush=True)
+            break
+        concurrency += args.step
+
+    pool.target = 0
+    await pool.drain()
+    sustained = stages[-2]['concurrency'] if breaking and len(stages) > 1 else (None if breaking else stages[-1]['concurrency'])
+    return {'mode': 'ramp', 'stages': stages, 'breakingPoint': breaking, 'maxSustainedConcurrency': sustained}
+
+
+async def main_async(args):
+    timeout = aiohttp.ClientTimeout(total=args.http_timeout)
+    # Sin límite: los WS persistentes también salen de este pool
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        async with session.get(f'{API_URL}/api/cards') as r:
+            r.raise_for_status()
+            catalog = {c['id']: c for c in (await r.json())['cards']}
+
+        pool = GamePool(session, args, catalog, Recorder(), asyncio.Semaphore(args.setup_concurrency))
+        if args.ramp:
+            return await run_ramp(pool, args)
+        return await run_fixed(pool, args)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description='Generador de carga WS para fenyflow')
+    p.add_argument('--games', type=int, default=100, help='partidas totales (modo fijo)')
+    p.add_argument('--concurrency', type=int, default=50, help='partidas simultáneas (modo fijo)')
+    p.add_argument('--ramp', action='store_true', help='subir concurrencia por etapas hasta romper el SLO')
+    p.add_argument('--start', type=int, default=50, help='concurrencia inicial de la rampa')
+    p.add_argument('--step', type=int, default=50, help='incremento por etapa')
+    p.add_argument('--max-concurrency', type=int, default=5000)
+    p.add_argument('--stage-seconds', type=float, default=30)
+    p.add_argument('--slo-p99-ms', type=float, default=250)
+    p.add_argument('--slo-error-rate', type=float, default=0.01)
+    p.add_argument('--turn-limit', type=int, default=8)
+    p.add_argument('--think-ms', type=float, default=0, help='pausa media entre acciones por partida')
+    p.add_argument('--action-timeout', type=float, default=10)
+    p.add_argument('--http-timeout', type=float, default=30)
+    p.add_argument('--setup-concurrency', type=int, default=100, help='altas de partida REST simultáneas')
+    p.add_argument('--seed', type=int, default=1)
+    p.add_argument('--json', help='escribir el reporte completo en este archivo')
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.ramp and report['breakingPoint'] is None:
+        print(f"SLO sostenido hasta {report['maxSustainedConcurrency']} partidas concurrentes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())